@@ -0,0 +1,138 @@
+"""
+Benchmark the DirectSolver factorization backends on a Newton solve with 1e5 unknowns.
+
+The baseline benchmarks run the same Newton solve with backends that call scipy.sparse.linalg.splu
+and scipy.linalg.lu_factor directly on every linearization, as the DirectSolver did before the
+backends were added, so the speedup of reusing the column ordering shows up in the timings.
+"""
+import unittest
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+
+import openmdao.api as om
+from openmdao.solvers.linear.lu_backends import LUBackend
+
+
+class SpluBaseline(LUBackend):
+    """
+    Backend that calls splu from scratch on every factorization.
+    """
+
+    def factor(self, matrix):
+        super().factor(matrix)
+        self._lu = scipy.sparse.linalg.splu(matrix)
+
+    def solve(self, b, trans=False):
+        return self._lu.solve(b, 'T' if trans else 'N')
+
+
+class LUFactorBaseline(LUBackend):
+    """
+    Backend that calls lu_factor on a dense copy of the matrix on every factorization.
+    """
+
+    def factor(self, matrix):
+        super().factor(matrix)
+        self._lup = scipy.linalg.lu_factor(matrix.toarray())
+
+    def solve(self, b, trans=False):
+        return scipy.linalg.lu_solve(self._lup, b, trans=int(trans))
+
+
+class BlockTridiagComp(om.ImplicitComponent):
+    """
+    Nonlinear chain of nodes, each coupled to its neighbors through dense blocks.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int, default=25000)
+        self.options.declare('block_size', types=int, default=4)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        k = self.options['block_size']
+
+        self.add_input('b', np.ones((nn, k)))
+        self.add_output('x', np.ones((nn, k)))
+
+        rng = np.random.default_rng(0)
+        self.diag = rng.random((k, k)) + 2. * k * np.eye(k)
+        self.lower = rng.random((k, k))
+        self.upper = rng.random((k, k))
+
+        # diagonal blocks, then the blocks coupling each node to the previous and next nodes
+        r, c = np.meshgrid(np.arange(k), np.arange(k), indexing='ij')
+        rows = []
+        cols = []
+        for nodes, offset in ((np.arange(nn), 0), (np.arange(1, nn), -1),
+                              (np.arange(nn - 1), 1)):
+            rows.append(((nodes * k)[:, None] + r.ravel()).ravel())
+            cols.append((((nodes + offset) * k)[:, None] + c.ravel()).ravel())
+
+        self.declare_partials('x', 'x', rows=np.concatenate(rows), cols=np.concatenate(cols))
+        self.declare_partials('x', 'b', rows=np.arange(nn * k), cols=np.arange(nn * k),
+                              val=-1.)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        x = outputs['x']
+        r = x.dot(self.diag.T) + x ** 3 - inputs['b']
+        r[1:] += x[:-1].dot(self.lower.T)
+        r[:-1] += x[1:].dot(self.upper.T)
+        residuals['x'] = r
+
+    def linearize(self, inputs, outputs, partials):
+        nn = self.options['num_nodes']
+        k = self.options['block_size']
+        x = outputs['x']
+
+        diag = np.tile(self.diag, (nn, 1, 1))
+        diag[:, np.arange(k), np.arange(k)] += 3. * x ** 2
+        partials['x', 'x'] = np.concatenate((diag.ravel(),
+                                             np.tile(self.lower.ravel(), nn - 1),
+                                             np.tile(self.upper.ravel(), nn - 1)))
+
+
+def _build(num_nodes=25000, baseline=None, **options):
+    prob = om.Problem()
+    prob.model.add_subsystem('comp', BlockTridiagComp(num_nodes=num_nodes), promotes=['*'])
+    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=20,
+                                                  atol=1e-10, rtol=1e-10, iprint=-1)
+    prob.model.linear_solver = om.DirectSolver(**options)
+    prob.setup()
+    prob.set_val('b', 10.)
+    if baseline is not None:
+        prob.final_setup()
+        prob.model.linear_solver._backend = baseline()
+    return prob
+
+
+class BM(unittest.TestCase):
+
+    def benchmark_newton_superlu(self):
+        prob = _build()
+        prob.run_model()
+
+    def benchmark_newton_klu(self):
+        prob = _build(backend='klu')
+        prob.run_model()
+
+    def benchmark_newton_splu_baseline(self):
+        prob = _build(baseline=SpluBaseline)
+        prob.run_model()
+
+    # a dense factorization of the full problem doesn't fit in memory, so the lu_factor baseline
+    # is compared with the superlu backend on a smaller chain
+
+    def benchmark_newton_superlu_small(self):
+        prob = _build(num_nodes=500)
+        prob.run_model()
+
+    def benchmark_newton_lu_factor_baseline_small(self):
+        prob = _build(num_nodes=500, baseline=LUFactorBaseline)
+        prob.run_model()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -95,7 +95,9 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 
 # Recorders
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.checkpoint_recorder import CheckpointRecorder
 from openmdao.recorders.case_reader import CaseReader
+from openmdao.recorders.merge_cases import merge_cases
 
 # Visualizations
 from openmdao.visualization.n2_viewer.n2_viewer import n2
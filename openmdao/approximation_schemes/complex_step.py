@@ -122,15 +122,16 @@ class ComplexStep(ApproximationScheme):
             return
 
         saved_inputs = system._inputs._get_data().copy()
-        system._inputs._data.imag[:] = 0.0
         saved_outputs = system._outputs.asarray(copy=True)
-        system._outputs._data.imag[:] = 0.0
         saved_resids = system._residuals.asarray(copy=True)
-        system._residuals._data.imag[:] = 0.0
 
         # Turn on complex step.
         system._set_complex_step_mode(True)
 
+        system._inputs._data.imag[:] = 0.0
+        system._outputs._data.imag[:] = 0.0
+        system._residuals._data.imag[:] = 0.0
+
         try:
             for tup in self._compute_approx_col_iter(system, under_cs=True):
                 yield tup
@@ -29,7 +29,7 @@ _allowed_meta = {'value', 'val', 'shape', 'units', 'res_units', 'desc',
 # Names that are not allowed for input or output variables (keywords for options)
 _option_names = {'has_diag_partials', 'units', 'shape', 'default_shape', 'shape_by_conn',
                  'run_root_only', 'constant', 'do_coloring', 'assembled_jac_type', 'derivs_method',
-                 'distributed', 'always_opt', 'use_jit'}
+                 'distributed', 'always_opt', 'use_jit', 'assembled_jac_skip_unchanged'}
 
 
 def check_option(option, value):
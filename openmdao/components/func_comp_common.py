@@ -33,7 +33,8 @@ namecheck_rgx = re.compile('[_a-zA-Z][_a-zA-Z0-9]*')
 
 # Names that are not allowed for input or output variables (keywords for options)
 _disallowed_varnames = {
-    'units', 'shape', 'shape_by_conn', 'run_root_only', 'distributed', 'assembled_jac_type'
+    'units', 'shape', 'shape_by_conn', 'run_root_only', 'distributed', 'assembled_jac_type',
+    'assembled_jac_skip_unchanged'
 }
 
 
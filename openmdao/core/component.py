@@ -532,6 +532,20 @@ class Component(System):
                 return True
         return False
 
+    def _supports_deriv_columns(self):
+        """
+        Return whether the linear solves of this System work with several vector columns.
+
+        Matrix free components are not supported because their user defined products expect
+        vectors with a single column.
+
+        Returns
+        -------
+        bool
+            True if this System supports vectorized derivative solves.
+        """
+        return not self.matrix_free and super()._supports_deriv_columns()
+
     def _promoted_wrt_iter(self):
         yield from self._get_partials_wrts()
 
@@ -2083,7 +2097,7 @@ class Component(System):
         #   made and it would just waste time before the user is told there is an error and the
         #   program errs out
         requested_method = method
-        alloc_complex = self._outputs._alloc_complex
+        alloc_complex = self._outputs._can_complex_step()
 
         local_opts = self._get_check_partial_options()
 
@@ -2454,7 +2468,7 @@ class Component(System):
         could_not_cs = False
 
         actual_steps = defaultdict(list)
-        alloc_complex = self._outputs._alloc_complex
+        alloc_complex = self._outputs._can_complex_step()
 
         for step in steps:
             self.run_apply_nonlinear()
@@ -12,7 +12,8 @@ import numpy as np
 from openmdao.core.group import Group
 from openmdao.core.total_jac import _TotalJacInfo
 from openmdao.core.constants import INT_DTYPE, _SetupStatus
-from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.core.nonlinear_warm_start import NonlinearWarmStart
+from openmdao.recorders.recording_manager import RecordingManager, _declare_policy_options
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.utils.record_util import create_local_meta, check_path, has_match
 from openmdao.utils.general_utils import _src_name_iter, DriverMetaclass
@@ -259,6 +260,10 @@ class Driver(object, metaclass=DriverMetaclass):
         If True, scaling has been set for this driver.
     _filtered_vars_to_record : dict or None
         Variables to record based on recording options.
+    _restart_state : dict or None
+        Driver state restored from a checkpoint, to be used by the next run.
+    _nl_warm_start : NonlinearWarmStart or None
+        Object that predicts the starting outputs of the model at each design point.
     """
 
     def __init__(self, **kwargs):
@@ -294,6 +299,15 @@ class Driver(object, metaclass=DriverMetaclass):
                                   'variable to one of the valid options.',
                              default=default_desvar_behavior)
 
+        self.options.declare('nonlinear_warm_start', types=(bool, dict), default=False,
+                             desc="If True, store the converged outputs of the model at recent "
+                                  "design points and start each run of the model from outputs "
+                                  "predicted from them along the design step. If a dict, it "
+                                  "can contain 'history', the maximum number of design points "
+                                  "stored (default 5), and 'tangent', whether to predict with a "
+                                  "linear solve when the total derivatives were computed at the "
+                                  "last design point (default True).")
+
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
 
@@ -325,6 +339,10 @@ class Driver(object, metaclass=DriverMetaclass):
         self.recording_options.declare('record_residuals', types=bool, default=False,
                                        desc='Set True to record residuals at the '
                                             'driver level.')
+        self.recording_options.declare('on_objective_improvement', types=bool, default=False,
+                                       desc='Set True to record only the iterations that improve '
+                                            'on the best objective value recorded so far.')
+        _declare_policy_options(self.recording_options)
 
         # What the driver supports.
         self.supports = OptionsDictionary(parent_name=type(self).__name__)
@@ -357,6 +375,8 @@ class Driver(object, metaclass=DriverMetaclass):
         self.result = DriverResult(self)
         self._has_scaling = False
         self._filtered_vars_to_record = None
+        self._restart_state = None
+        self._nl_warm_start = None
 
     def _get_inst_id(self):
         if self._problem is None:
@@ -442,6 +462,7 @@ class Driver(object, metaclass=DriverMetaclass):
         model = problem.model
 
         self._total_jac = None
+        self._nl_warm_start = NonlinearWarmStart.create(self, self.options['nonlinear_warm_start'])
 
         # Determine if any design variables are discrete.
         self._designvars_discrete = [name for name, meta in self._designvars.items()
@@ -790,6 +811,42 @@ class Driver(object, metaclass=DriverMetaclass):
             self._filtered_vars_to_record = self._get_vars_to_record()
             self._rec_mgr.startup(self, self._problem().comm)
 
+    def _get_restart_state(self):
+        """
+        Return the internal state of the driver to be saved in a checkpoint.
+
+        Returns
+        -------
+        dict
+            The state needed to resume a run of this driver.
+        """
+        return {'iter_count': self.iter_count}
+
+    def _set_restart_state(self, state):
+        """
+        Restore the internal state of the driver from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            The state returned by _get_restart_state when the checkpoint was saved.
+        """
+        self.iter_count = state['iter_count']
+        self._restart_state = state
+
+    def _pop_restart_state(self):
+        """
+        Return the driver state restored from a checkpoint, if any, and clear it.
+
+        Returns
+        -------
+        dict or None
+            The restored state, or None if the driver is not being restarted.
+        """
+        state = self._restart_state
+        self._restart_state = None
+        return state
+
     def _run(self):
         """
         Execute this driver.
@@ -1265,7 +1322,13 @@ class Driver(object, metaclass=DriverMetaclass):
 
     @DriverResult.track_stats(kind='model')
     def _run_solve_nonlinear(self):
-        return self._problem().model.run_solve_nonlinear()
+        warm_start = self._nl_warm_start
+        if warm_start is None:
+            return self._problem().model.run_solve_nonlinear()
+
+        warm_start.predict(self)
+        self._problem().model.run_solve_nonlinear()
+        warm_start.record(self)
 
     @DriverResult.track_stats(kind='deriv')
     def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', driver_scaling=True):
@@ -1338,13 +1401,22 @@ class Driver(object, metaclass=DriverMetaclass):
         """
         status = -1 if self._problem is None else self._problem()._metadata['setup_status']
         if status >= _SetupStatus.POST_FINAL_SETUP:
-            record_iteration(self, self._problem(), self._get_name())
+            rec_mgr = self._rec_mgr
+            if not rec_mgr._recorders or \
+                    rec_mgr._check_policy(self, self._problem().model.comm):
+                self._record_iteration()
         else:
             raise RuntimeError(f'{self.msginfo} attempted to record iteration but '
                                'driver has not been initialized; `run_model()`, '
                                '`run_driver()`, or `final_setup()` must be called '
                                'before recording.')
 
+    def _record_iteration(self):
+        """
+        Gather and record the data for the current iteration of the Driver.
+        """
+        record_iteration(self, self._problem(), self._get_name())
+
     def _get_recorder_metadata(self, case_name):
         """
         Return metadata from the latest iteration for use in the recorder.
@@ -43,6 +43,7 @@ class ExplicitComponent(Component):
 
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
         self.options.undeclare('assembled_jac_type')
+        self.options.undeclare('assembled_jac_skip_unchanged')
         self._vjp_hash = None
         self._vjp_fun = None
 
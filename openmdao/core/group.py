@@ -1254,6 +1254,11 @@ class Group(System):
             if np.any(all_ln_alloc_complex):
                 ln_alloc_complex = True
 
+        # Unless complex vectors are forced, complex storage is only allocated while a system is
+        # in complex step mode, and only for the part of the model under that system.
+        lazy_complex = not (force_alloc_complex or self._vector_class.distributed or
+                            self.comm.size > 1)
+
         for vec_name in vectypes:
             if vec_name == 'nonlinear':
                 alloc_complex = nl_alloc_complex
@@ -1261,8 +1266,9 @@ class Group(System):
                 alloc_complex = ln_alloc_complex
 
             for key in ['input', 'output', 'residual']:
-                root_vectors[key][vec_name] = self._vector_class(vec_name, key, self,
-                                                                 alloc_complex=alloc_complex)
+                root_vectors[key][vec_name] = self._vector_class(
+                    vec_name, key, self, alloc_complex=alloc_complex and not lazy_complex,
+                    lazy_complex=alloc_complex and lazy_complex)
 
         if self._use_derivatives:
             root_vectors['input']['linear']._scaling_nl_vec = \
@@ -345,6 +345,21 @@ class ImplicitComponent(Component):
                 finally:
                     d_outputs.read_only = d_residuals.read_only = False
 
+    def _supports_deriv_columns(self):
+        """
+        Return whether the linear solves of this System work with several vector columns.
+
+        A user defined solve_linear expects vectors with a single column.
+
+        Returns
+        -------
+        bool
+            True if this System supports vectorized derivative solves.
+        """
+        if self._linear_solver is None and self._has_solve_linear:
+            return False
+        return super()._supports_deriv_columns()
+
     def _approx_subjac_keys_iter(self):
         for abs_key, meta in self._subjacs_info.items():
             if 'method' in meta:
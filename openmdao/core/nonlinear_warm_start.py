@@ -0,0 +1,308 @@
+"""
+Define the NonlinearWarmStart class.
+
+NonlinearWarmStart keeps the converged outputs of the model at recent design points and predicts
+the starting outputs of the nonlinear solve at a new design point from them.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class NonlinearWarmStart(object):
+    """
+    Class that predicts the starting outputs of the model at a new design point.
+
+    The prediction is a first order continuation predictor. When the total derivatives were
+    computed at the last converged design point, the change in outputs along the design step
+    is found with one linear solve using the linearization already computed for them (tangent
+    predictor). Otherwise, it is extrapolated from the outputs at the recent design points that
+    are stored (secant predictor).
+
+    Only the outputs that aren't independent variables are set.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver that owns this NonlinearWarmStart.
+    history : int
+        Maximum number of design points whose outputs are stored. Defaults to 5.
+    tangent : bool
+        If True, use the tangent predictor when the linearization of the model at the last
+        design point is available. Defaults to True.
+
+    Attributes
+    ----------
+    stats : dict
+        Number of tangent ('tangent') and secant ('secant') predictions.
+    _history : deque
+        Tuples of the design variable values and the outputs of the stored design points,
+        oldest first.
+    _tangent : bool
+        If True, use the tangent predictor when possible.
+    _ncompute_totals : int
+        Value of the compute_totals count when the last design point was stored.
+    _mask : ndarray or None
+        Boolean mask of the outputs in the local output vector that are predicted.
+    _linear_solvers : list or None
+        The linear solvers of the model, including the linear solvers of nonlinear solvers and
+        preconditioners.
+    """
+
+    options = ('history', 'tangent')
+
+    def __init__(self, driver, history=5, tangent=True):
+        """
+        Initialize the NonlinearWarmStart.
+        """
+        self._history = deque(maxlen=max(history, 1))
+        self._tangent = tangent
+        self._ncompute_totals = -1
+        self._mask = None
+        self._linear_solvers = None
+        self.stats = {'tangent': 0, 'secant': 0}
+
+    @staticmethod
+    def create(driver, opts):
+        """
+        Conditionally create a NonlinearWarmStart instance.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+        opts : dict or bool
+            Options for the NonlinearWarmStart. If True, the NonlinearWarmStart will be created
+            with default options.  If a dict, the values will override the defaults.
+
+        Returns
+        -------
+        NonlinearWarmStart or None
+            A NonlinearWarmStart instance if it was created, None otherwise.
+        """
+        if isinstance(opts, dict):
+            invalid = set(opts).difference(NonlinearWarmStart.options)
+            if invalid:
+                if len(invalid) == 1:
+                    invalid = f" '{invalid.pop()}'"
+                else:
+                    invalid = f"s {sorted(invalid)}"
+                raise ValueError(f"{driver.msginfo}: unrecognized 'nonlinear_warm_start' "
+                                 f"option{invalid}. Valid options are "
+                                 f"{NonlinearWarmStart.options}.")
+            return NonlinearWarmStart(driver, **opts)
+        elif opts:
+            return NonlinearWarmStart(driver)
+
+    def clear(self):
+        """
+        Forget the stored design points.
+        """
+        self._history.clear()
+        self._ncompute_totals = -1
+
+    def _get_design_point(self, driver):
+        """
+        Return the values of the continuous design variables in model units as one array.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+
+        Returns
+        -------
+        ndarray
+            The design variable values.
+        """
+        discrete = driver._designvars_discrete
+        values = [np.ravel(val) for name, val in
+                  driver.get_design_var_values(driver_scaling=False).items()
+                  if name not in discrete]
+        return np.concatenate(values) if values else np.zeros(0)
+
+    def _get_mask(self, model):
+        """
+        Return the mask of the outputs that aren't independent variables.
+
+        Parameters
+        ----------
+        model : Group
+            The model.
+
+        Returns
+        -------
+        ndarray
+            Boolean mask of the outputs in the local output vector that are predicted.
+        """
+        if self._mask is None:
+            abs2meta = model._var_allprocs_abs2meta['output']
+            mask = np.ones(len(model._outputs), dtype=bool)
+            for name, slc in model._outputs.get_slice_dict().items():
+                if 'openmdao:indep_var' in abs2meta[name]['tags']:
+                    mask[slc] = False
+            self._mask = mask
+
+        return self._mask
+
+    def _get_linear_solvers(self, model):
+        """
+        Return the linear solvers of the model.
+
+        Parameters
+        ----------
+        model : Group
+            The model.
+
+        Returns
+        -------
+        list
+            The linear solvers, including the linear solvers of nonlinear solvers and
+            preconditioners.
+        """
+        if self._linear_solvers is None:
+            solvers = {}
+            for system in model.system_iter(include_self=True, recurse=True):
+                stack = [system._linear_solver,
+                         getattr(system._nonlinear_solver, 'linear_solver', None)]
+                while stack:
+                    solver = stack.pop()
+                    if solver is not None and id(solver) not in solvers:
+                        solvers[id(solver)] = solver
+                        stack.append(getattr(solver, 'precon', None))
+            self._linear_solvers = list(solvers.values())
+
+        return self._linear_solvers
+
+    def _can_use_tangent(self, driver):
+        """
+        Return True if the linearization of the model at the last design point is available.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+
+        Returns
+        -------
+        bool
+            True if the tangent predictor can be used.
+        """
+        model = driver._problem().model
+        # compute_totals must have been called since the last design point was stored, and
+        # the model must have been run only at that point since then
+        return (self._tangent and
+                self._ncompute_totals < model._problem_meta['ncompute_totals'] and
+                model._use_derivatives and not model._owns_approx_jac and
+                not driver._dist_driver_vars)
+
+    def _tangent_step(self, driver, dx):
+        """
+        Return the change of the outputs along a design step from the linearized model.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+        dx : ndarray
+            The design step.
+
+        Returns
+        -------
+        ndarray
+            The change of the local outputs.
+        """
+        model = driver._problem().model
+        d_res = model._dresiduals
+        d_out = model._doutputs
+
+        d_res.set_val(0.0)
+        d_out.set_val(0.0)
+
+        start = 0
+        for name, meta in driver._designvars.items():
+            if name in driver._designvars_discrete:
+                continue
+            end = start + meta['global_size']
+            src = meta['source']
+            if src in d_res:
+                indices = meta['indices']
+                idxs = slice(None) if indices is None else indices.flat()
+                # the seeds of independent variables have the same sign as in compute_totals
+                d_res._views_flat[src][idxs] = -dx[start:end]
+            start = end
+
+        # The predictor solve must not change what the linear solvers keep for later solves,
+        # such as recycled Krylov vectors. Warm start solutions and rhs checking are only used
+        # in compute_totals and in rev mode, so they aren't affected.
+        solvers = self._get_linear_solvers(model)
+        states = [solver._get_cache_state() for solver in solvers]
+        try:
+            with model._scaled_context_all():
+                model._solve_linear('fwd')
+        finally:
+            for solver, state in zip(solvers, states):
+                solver._set_cache_state(state)
+
+        return d_out.asarray(copy=True)
+
+    def predict(self, driver):
+        """
+        Set the predicted outputs at the current design point into the model.
+
+        Nothing is done if no design point is stored, or if only one is and the tangent
+        predictor can't be used.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+        """
+        if not self._history:
+            return
+
+        x = self._get_design_point(driver)
+
+        if self._can_use_tangent(driver):
+            x0, u0 = self._history[-1]
+            du = self._tangent_step(driver, x - x0)
+            kind = 'tangent'
+        elif len(self._history) > 1:
+            # extrapolate from the stored design point closest to the current one
+            points = list(self._history)
+            base = np.argmin([np.linalg.norm(xi - x) for xi, _ in points])
+            x0, u0 = points.pop(base)
+            dX = np.array([xi - x0 for xi, _ in points]).T
+            dU = np.array([ui - u0 for _, ui in points]).T
+            # the part of the design step outside of the span of the stored design steps
+            # is ignored
+            coefs = np.linalg.lstsq(dX, x - x0, rcond=None)[0]
+            du = dU.dot(coefs)
+            kind = 'secant'
+        else:
+            return
+
+        u = u0 + du
+        if not np.all(np.isfinite(u)):
+            return
+
+        model = driver._problem().model
+        mask = self._get_mask(model)
+        outputs = model._outputs.asarray()
+        outputs[mask] = u[mask]
+
+        self.stats[kind] += 1
+
+    def record(self, driver):
+        """
+        Store the outputs of the model at the current design point.
+
+        Parameters
+        ----------
+        driver : Driver
+            The driver that owns this NonlinearWarmStart.
+        """
+        model = driver._problem().model
+        self._history.append((self._get_design_point(driver), model._outputs.asarray(copy=True)))
+        self._ncompute_totals = model._problem_meta['ncompute_totals']
@@ -37,7 +37,7 @@ from openmdao.error_checking.check_config import _default_checks, _all_checks, \
     _all_non_redundant_checks
 from openmdao.recorders.recording_iteration_stack import _RecIteration
 from openmdao.recorders.recording_manager import RecordingManager, record_viewer_data, \
-    record_model_options
+    record_model_options, reset_recording_policies, record_pending_iterations
 from openmdao.utils.deriv_display import _print_deriv_table, _deriv_display, _deriv_display_compact
 from openmdao.utils.mpi import MPI, FakeComm, multi_proc_exception_check, check_mpi_env
 from openmdao.utils.name_maps import name2abs_names
@@ -206,6 +206,9 @@ class Problem(object, metaclass=ProblemMetaclass):
         Bool to check if `value` deprecation warning has occured yet
     _computing_coloring : bool
         When True, we are computing coloring.
+    _restarted : bool
+        True when the state of the problem has been restored from a checkpoint and the next run
+        should continue from it rather than reset the iteration counts.
     """
 
     def __init__(self, model=None, driver=None, comm=None, name=None, reports=_UNDEFINED,
@@ -224,6 +227,7 @@ class Problem(object, metaclass=ProblemMetaclass):
         self.cite = CITATION
         self._warned = False
         self._computing_coloring = False
+        self._restarted = False
 
         if comm is None:
             use_mpi = check_mpi_env()
@@ -291,6 +295,20 @@ class Problem(object, metaclass=ProblemMetaclass):
                              "each group that has set it to True. Note that subsystems of a Group "
                              "that form a cycle will never be reordered, regardless of the value of"
                              " the 'auto_order' option.")
+        self.options.declare('vector_precision', values=('double', 'single', 'mixed'),
+                             default='double',
+                             desc="Floating point precision of the model vectors. 'single' "
+                             "allocates all nonlinear and linear vectors as float32, and 'mixed' "
+                             "allocates float32 nonlinear vectors and float64 linear vectors. "
+                             "Vector norms are always computed in double precision. Vectors that "
+                             "need complex storage for complex step and distributed vectors are "
+                             "always double precision.")
+        self.options.declare('deriv_columns', types=int, default=1, lower=1,
+                             desc="Number of seeds that compute_totals solves together, using "
+                             "linear vectors with a column for each seed. Only used when all "
+                             "linear solvers and components in the model support several "
+                             "columns, otherwise the seeds are solved one at a time. This needs "
+                             "additional memory for deriv_columns copies of the linear vectors.")
         self.options.update(options)
 
         # Options passed to models
@@ -676,17 +694,21 @@ class Problem(object, metaclass=ProblemMetaclass):
             self._recording_iter.prefix = case_prefix
 
         try:
-            if self.model.iter_count > 0 and reset_iter_counts:
+            if self.model.iter_count > 0 and reset_iter_counts and not self._restarted:
                 self.driver.iter_count = 0
                 self.model._reset_iter_counts()
+            self._restarted = False
 
             self.final_setup()
 
             self._run_counter += 1
             record_model_options(self, self._run_counter)
+            reset_recording_policies(self)
 
             self.model._clear_iprint()
             self.model.run_solve_nonlinear()
+
+            record_pending_iterations(self)
         finally:
             self._recording_iter.prefix = old_prefix
 
@@ -731,9 +753,10 @@ class Problem(object, metaclass=ProblemMetaclass):
             self._recording_iter.prefix = case_prefix
 
         try:
-            if model.iter_count > 0 and reset_iter_counts:
+            if model.iter_count > 0 and reset_iter_counts and not self._restarted:
                 driver.iter_count = 0
                 model._reset_iter_counts()
+            self._restarted = False
 
             self.final_setup()
 
@@ -743,10 +766,15 @@ class Problem(object, metaclass=ProblemMetaclass):
 
             self._run_counter += 1
             record_model_options(self, self._run_counter)
+            reset_recording_policies(self)
 
             model._clear_iprint()
 
-            return driver._run()
+            fail = driver._run()
+
+            record_pending_iterations(self)
+
+            return fail
         finally:
             self._recording_iter.prefix = old_prefix
 
@@ -1007,12 +1035,16 @@ class Problem(object, metaclass=ProblemMetaclass):
             'checking': False,  # True if check_totals or check_partials is running
             'model_options': self.model_options,  # A dict of options passed to all systems in tree
             'allow_post_setup_reorder': self.options['allow_post_setup_reorder'],  # see option
+            'vector_precision': self.options['vector_precision'],  # see option
+            'deriv_columns': self.options['deriv_columns'],  # see option
             'singular_jac_behavior': 'warn',  # How to handle singular jac conditions
             'parallel_deriv_color': None,  # None unless derivatives involving a parallel deriv
                                            # colored dv/response are currently being computed.
             'seed_vars': None,  # set of names of seed variables. Seed variables are those that
                                 # have their derivative value set to 1.0 at the beginning of the
                                 # current derivative solve.
+            'seed_key': None,  # identifies the seed of the current derivative solve across calls
+                               # to compute_totals. Used to warm start iterative linear solvers.
             'coloring_randgen': None,  # If total coloring is being computed, will contain a random
                                        # number generator, else None.
             'randomize_subjacs': True,  # If True, randomize subjacs before computing total sparsity
@@ -1466,7 +1498,7 @@ class Problem(object, metaclass=ProblemMetaclass):
 
         model = self.model
 
-        if method == 'cs' and not model._outputs._alloc_complex:
+        if method == 'cs' and not model._outputs._can_complex_step():
             msg = "\n" + self.msginfo + ": To enable complex step, specify "\
                   "'force_alloc_complex=True' when calling " + \
                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
@@ -2048,6 +2080,50 @@ class Problem(object, metaclass=ProblemMetaclass):
 
         print(file=out_stream)
 
+    def save_checkpoint(self, filepath):
+        """
+        Save a checkpoint of the current state of the problem.
+
+        The checkpoint holds the root nonlinear and linear vectors, discrete variable values,
+        iteration counts, and the internal state of the driver and solvers. It can be used
+        with restart_from to resume a run that was interrupted.
+
+        Parameters
+        ----------
+        filepath : str or Path
+            The path of the checkpoint file.
+        """
+        from openmdao.recorders.checkpoint_recorder import save_checkpoint
+
+        if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+            raise RuntimeError(f"{self.msginfo}: final_setup must be called before saving a "
+                               "checkpoint.")
+
+        save_checkpoint(self, filepath)
+
+    def restart_from(self, checkpoint):
+        """
+        Restore the state of the problem from a checkpoint so that the next run resumes from it.
+
+        Unlike load_case, the full model vectors are restored along with the iteration counts
+        and the internal state of the driver and solvers, so solvers start warm and drivers
+        continue from where the checkpointed run left off.
+
+        Parameters
+        ----------
+        checkpoint : str or Path
+            The path of a checkpoint file saved by save_checkpoint or a CheckpointRecorder.
+        """
+        from openmdao.recorders.checkpoint_recorder import load_checkpoint
+
+        if self._metadata['setup_status'] < _SetupStatus.POST_SETUP:
+            raise RuntimeError(f"{self.msginfo}: The `setup` method must be called before "
+                               "`restart_from`.")
+
+        self.final_setup()
+        load_checkpoint(self, checkpoint)
+        self._restarted = True
+
     def load_case(self, case):
         """
         Pull all input and output variables from a case into the model.
@@ -2253,7 +2329,7 @@ class Problem(object, metaclass=ProblemMetaclass):
                                "`Problem.run_model()`, `Problem.run_driver()`, or "
                                "`Problem.final_setup()`.")
 
-        if active and not self.model._outputs._alloc_complex:
+        if active and not self.model._outputs._can_complex_step():
             raise RuntimeError(f"{self.msginfo}: To enable complex step, specify "
                                "'force_alloc_complex=True' when calling setup on the problem, "
                                "e.g. 'problem.setup(force_alloc_complex=True)'")
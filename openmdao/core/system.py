@@ -18,8 +18,8 @@ import numpy as np
 from openmdao.core.constants import _DEFAULT_COLORING_DIR, _DEFAULT_OUT_STREAM, \
     _UNDEFINED, INT_DTYPE, INF_BOUND, _SetupStatus
 from openmdao.jacobians.dictionary_jacobian import Jacobian, DictionaryJacobian
-from openmdao.jacobians.assembled_jacobian import DenseJacobian, CSCJacobian
-from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.jacobians.assembled_jacobian import DenseJacobian, CSCJacobian, BSRJacobian
+from openmdao.recorders.recording_manager import RecordingManager, _declare_policy_options
 from openmdao.vectors.vector import _full_slice
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
 from openmdao.utils.options_dictionary import OptionsDictionary
@@ -49,6 +49,7 @@ _empty_frozen_set = frozenset()
 _asm_jac_types = {
     'csc': CSCJacobian,
     'dense': DenseJacobian,
+    'bsr': BSRJacobian,
 }
 
 # Suppored methods for derivatives
@@ -414,9 +415,13 @@ class System(object, metaclass=SystemMetaclass):
         # System options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
 
-        self.options.declare('assembled_jac_type', values=['csc', 'dense'], default='csc',
+        self.options.declare('assembled_jac_type', values=['csc', 'dense', 'bsr'], default='csc',
                              desc='Linear solver(s) in this group or implicit component, '
                                   'if using an assembled jacobian, will use this type.')
+        self.options.declare('assembled_jac_skip_unchanged', types=bool, default=False,
+                             desc='If True, an assembled jacobian in this group or implicit '
+                                  'component only updates the subjacs of components whose '
+                                  'partials may have changed since its last update.')
         self.options.declare('derivs_method', default=None, values=['jax', 'cs', 'fd', None],
                              desc='The method to use for computing derivatives')
 
@@ -436,6 +441,7 @@ class System(object, metaclass=SystemMetaclass):
                                             '(processed post-includes). Uses fnmatch wildcards')
         self.recording_options.declare('options_excludes', types=list, default=[],
                                        desc='User-defined metadata to exclude in recording')
+        _declare_policy_options(self.recording_options)
 
         self._problem_meta = None
 
@@ -2480,7 +2486,7 @@ class System(object, metaclass=SystemMetaclass):
         self._vectors = vectors = {'input': {}, 'output': {}, 'residual': {}}
 
         # Allocate complex if root vector was allocated complex.
-        alloc_complex = root_vectors['output']['nonlinear']._alloc_complex
+        alloc_complex = root_vectors['output']['nonlinear']._can_complex_step()
 
         # This happens if you reconfigure and switch to 'cs' without forcing the vectors to be
         # initially allocated as complex.
@@ -2499,11 +2505,13 @@ class System(object, metaclass=SystemMetaclass):
 
             # Only allocate complex in the vectors we need.
             vec_alloc_complex = root_vectors['output'][vec_name]._alloc_complex
+            vec_lazy_complex = root_vectors['output'][vec_name]._lazy_complex
 
             for kind in ['input', 'output', 'residual']:
                 rootvec = root_vectors[kind][vec_name]
                 vectors[kind][vec_name] = vector_class(
-                    vec_name, kind, self, rootvec, alloc_complex=vec_alloc_complex)
+                    vec_name, kind, self, rootvec, alloc_complex=vec_alloc_complex,
+                    lazy_complex=vec_lazy_complex)
 
         if self._use_derivatives:
             vectors['input']['linear']._scaling_nl_vec = vectors['input']['nonlinear']._scaling
@@ -5075,6 +5083,31 @@ class System(object, metaclass=SystemMetaclass):
         """
         pass
 
+    def _supports_deriv_columns(self):
+        """
+        Return whether the linear solves of this System work with several vector columns.
+
+        Returns
+        -------
+        bool
+            True if this System supports vectorized derivative solves.
+        """
+        return self._linear_solver is None or self._linear_solver.supports['multi_column']
+
+    def _set_deriv_columns(self, ncols):
+        """
+        Give the linear vectors of this System and its subsystems a column for each seed.
+
+        Parameters
+        ----------
+        ncols : int or None
+            Number of columns. If None, the single column linear vectors are restored.
+        """
+        for s in self.system_iter(include_self=True, recurse=True):
+            s._dinputs._set_columns(ncols)
+            s._doutputs._set_columns(ncols)
+            s._dresiduals._set_columns(ncols)
+
     def _linearize(self, jac, sub_do_ln=True):
         """
         Compute jacobian / factorization. The model is assumed to be in a scaled state.
@@ -5147,55 +5180,61 @@ class System(object, metaclass=SystemMetaclass):
         """
         Record an iteration of the current System.
         """
+        if self._rec_mgr._recorders and self._rec_mgr._check_policy(self, self.comm):
+            self._record_iteration()
+
+        # All calls to _solve_nonlinear are recorded, The counter is incremented after recording.
+        self.iter_count += 1
+        if not self.under_approx:
+            self.iter_count_without_approx += 1
+
+    def _record_iteration(self):
+        """
+        Gather and record the data for the current iteration of the System.
+        """
         global _recordable_funcs
 
-        if self._rec_mgr._recorders:
-            parallel = self._rec_mgr._check_parallel() if self.comm.size > 1 else False
-            do_gather = self._rec_mgr._check_gather()
-            local = parallel and not do_gather
-            options = self.recording_options
-            metadata = create_local_meta(self.pathname)
+        parallel = self._rec_mgr._check_parallel() if self.comm.size > 1 else False
+        do_gather = self._rec_mgr._check_gather()
+        local = parallel and not do_gather
+        options = self.recording_options
+        metadata = create_local_meta(self.pathname)
 
-            # Get the data to record
-            if self._recording_iter.stack:
-                stack_top = self._recording_iter.stack[-1][0]
-                method = stack_top.rsplit('.', 1)[-1]
+        # Get the data to record
+        if self._recording_iter.stack:
+            stack_top = self._recording_iter.stack[-1][0]
+            method = stack_top.rsplit('.', 1)[-1]
 
-                if method not in _recordable_funcs:
-                    raise ValueError(f"{self.msginfo}: {method} must be one of: "
-                                     f"{sorted(_recordable_funcs)}")
+            if method not in _recordable_funcs:
+                raise ValueError(f"{self.msginfo}: {method} must be one of: "
+                                 f"{sorted(_recordable_funcs)}")
 
-                if 'nonlinear' in method:
-                    inputs, outputs, residuals = self.get_nonlinear_vectors()
-                    vec_name = 'nonlinear'
-                else:
-                    inputs, outputs, residuals = self.get_linear_vectors()
-                    vec_name = 'linear'
-            else:
-                # outside of a run, just record nonlinear vectors
+            if 'nonlinear' in method:
                 inputs, outputs, residuals = self.get_nonlinear_vectors()
                 vec_name = 'nonlinear'
+            else:
+                inputs, outputs, residuals = self.get_linear_vectors()
+                vec_name = 'linear'
+        else:
+            # outside of a run, just record nonlinear vectors
+            inputs, outputs, residuals = self.get_nonlinear_vectors()
+            vec_name = 'nonlinear'
 
-            discrete_inputs = self._discrete_inputs
-            discrete_outputs = self._discrete_outputs
-            filt = self._filtered_vars_to_record
-
-            data = {'input': {}, 'output': {}, 'residual': {}}
-            if options['record_inputs'] and (inputs._names or len(discrete_inputs) > 0):
-                data['input'] = self._retrieve_data_of_kind(filt, 'input', vec_name, local)
+        discrete_inputs = self._discrete_inputs
+        discrete_outputs = self._discrete_outputs
+        filt = self._filtered_vars_to_record
 
-            if options['record_outputs'] and (outputs._names or len(discrete_outputs) > 0):
-                data['output'] = self._retrieve_data_of_kind(filt, 'output', vec_name, local)
+        data = {'input': {}, 'output': {}, 'residual': {}}
+        if options['record_inputs'] and (inputs._names or len(discrete_inputs) > 0):
+            data['input'] = self._retrieve_data_of_kind(filt, 'input', vec_name, local)
 
-            if options['record_residuals'] and residuals._names:
-                data['residual'] = self._retrieve_data_of_kind(filt, 'residual', vec_name, local)
+        if options['record_outputs'] and (outputs._names or len(discrete_outputs) > 0):
+            data['output'] = self._retrieve_data_of_kind(filt, 'output', vec_name, local)
 
-            self._rec_mgr.record_iteration(self, data, metadata)
+        if options['record_residuals'] and residuals._names:
+            data['residual'] = self._retrieve_data_of_kind(filt, 'residual', vec_name, local)
 
-        # All calls to _solve_nonlinear are recorded, The counter is incremented after recording.
-        self.iter_count += 1
-        if not self.under_approx:
-            self.iter_count_without_approx += 1
+        self._rec_mgr.record_iteration(self, data, metadata)
 
     def _clear_iprint(self):
         """
@@ -5282,7 +5321,7 @@ class System(object, metaclass=SystemMetaclass):
         self._outputs.set_complex_step_mode(active)
         self._residuals.set_complex_step_mode(active)
 
-        if self._doutputs._alloc_complex:
+        if self._doutputs._can_complex_step():
             self._doutputs.set_complex_step_mode(active)
             self._dinputs.set_complex_step_mode(active)
             self._dresiduals.set_complex_step_mode(active)
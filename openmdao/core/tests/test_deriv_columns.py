@@ -0,0 +1,185 @@
+"""Test compute_totals with linear vectors that have a column for each seed."""
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.core.total_jac import _TotalJacInfo
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class MatFreeComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(2))
+        self.add_output('y', np.ones(2))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 3. * inputs['x']
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        if mode == 'fwd':
+            d_outputs['y'] += 3. * d_inputs['x']
+        else:
+            d_inputs['x'] += 3. * d_outputs['y']
+
+
+def _build(mode, deriv_columns=1, linear_solver=om.DirectSolver, top_solver=None,
+           matfree=False):
+    prob = om.Problem(deriv_columns=deriv_columns)
+    model = prob.model
+
+    model.add_subsystem('p', om.IndepVarComp('x', np.arange(1., 6.), units='m'),
+                        promotes=['*'])
+    model.add_subsystem('c1', om.ExecComp('y = 2.*x**2', x={'val': np.ones(5), 'units': 'km'},
+                                          y={'val': np.ones(5), 'ref': 3.}),
+                        promotes=['*'])
+    model.add_subsystem('c2', om.ExecComp('z = 3.*y[1:4]*y[0:3]', y=np.ones(5), z=np.ones(3)))
+    model.connect('y', 'c2.y')
+
+    sub = model.add_subsystem('sub', om.Group())
+    sub.add_subsystem('s', SellarDerivatives())
+    sub.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+    sub.linear_solver = linear_solver()
+    model.connect('x', 'sub.s.x', src_indices=[0])
+    model.connect('c2.z', 'sub.s.z', src_indices=[0, 1])
+
+    if matfree:
+        model.add_subsystem('mf', MatFreeComp())
+        model.connect('c2.z', 'mf.x', src_indices=[1, 2])
+        model.add_constraint('mf.y', upper=0.)
+
+    if top_solver is not None:
+        model.linear_solver = top_solver()
+
+    model.add_design_var('x')
+    model.add_constraint('c2.z', lower=0., ref=10.)
+    model.add_constraint('sub.s.con1', upper=0.)
+    model.add_objective('sub.s.obj', ref=3.)
+
+    prob.setup(mode=mode)
+    prob.run_model()
+    return prob
+
+
+def _batch_sizes(prob, driver=False):
+    """
+    Compute the totals and return them with the number of seeds in each vectorized solve.
+    """
+    orig = _TotalJacInfo._solve_deriv_columns
+    with mock.patch.object(_TotalJacInfo, '_solve_deriv_columns', autospec=True,
+                           side_effect=orig) as solve:
+        if driver:
+            J = prob.driver._compute_totals()
+        else:
+            J = prob.compute_totals()
+
+    return J, [call.args[1].shape[1] for call in solve.call_args_list]
+
+
+class TestDerivColumns(unittest.TestCase):
+
+    def test_linear_solvers(self):
+        solvers = {
+            'direct': om.DirectSolver,
+            'direct_unassembled': lambda: om.DirectSolver(assemble_jac=False),
+            'block_gs': lambda: om.LinearBlockGS(maxiter=100, atol=1e-14, rtol=1e-14,
+                                                 iprint=-1),
+            'block_jac': lambda: om.LinearBlockJac(maxiter=200, atol=1e-14, rtol=1e-14,
+                                                   iprint=-1),
+        }
+        for mode in ('fwd', 'rev'):
+            for name, linear_solver in solvers.items():
+                with self.subTest(mode=mode, linear_solver=name):
+                    expected, sizes = _batch_sizes(_build(mode, linear_solver=linear_solver))
+                    self.assertEqual(sizes, [])
+
+                    prob = _build(mode, 4, linear_solver=linear_solver)
+                    J, sizes = _batch_sizes(prob)
+                    assert_near_equal(J, expected, 1e-10)
+
+                    # 5 design variable entries in fwd and 5 response entries in rev
+                    self.assertEqual(sizes, [4, 1])
+
+                    # each seed still counts as a linear solve
+                    J, sizes = _batch_sizes(prob, driver=True)
+                    self.assertEqual(prob.driver._total_jac.nsolves, 5)
+
+                    prob = _build(mode, 8, linear_solver=linear_solver)
+                    J, sizes = _batch_sizes(prob)
+                    assert_near_equal(J, expected, 1e-10)
+                    self.assertEqual(sizes, [5])
+
+    def test_vectors_restored(self):
+        prob = _build('rev', 4)
+        prob.compute_totals()
+
+        for system in prob.model.system_iter(include_self=True, recurse=True):
+            for vec in (system._dinputs, system._doutputs, system._dresiduals):
+                self.assertEqual(vec.asarray().ndim, 1)
+                self.assertIsNone(vec._col_data)
+
+        # linear solves of the model still work one column at a time
+        J = prob.compute_totals()
+        assert_near_equal(J, _build('rev').compute_totals(), 1e-10)
+
+    def test_unsupported(self):
+        cases = {
+            'krylov': {'linear_solver': lambda: om.ScipyKrylov(atol=1e-14, iprint=-1)},
+            'aitken': {'linear_solver': lambda: om.LinearBlockGS(use_aitken=True, maxiter=100,
+                                                                 atol=1e-14, rtol=1e-14,
+                                                                 iprint=-1)},
+            'matfree': {'matfree': True},
+        }
+        for mode in ('fwd', 'rev'):
+            for name, options in cases.items():
+                with self.subTest(mode=mode, case=name):
+                    expected = _build(mode, **options).compute_totals()
+
+                    # the seeds are solved one at a time
+                    J, sizes = _batch_sizes(_build(mode, 4, **options))
+                    assert_near_equal(J, expected, 1e-10)
+                    self.assertEqual(sizes, [])
+
+    def test_coloring(self):
+        def build(deriv_columns):
+            prob = om.Problem(deriv_columns=deriv_columns)
+            model = prob.model
+            model.add_subsystem('p', om.IndepVarComp('x', np.arange(1., 11.)), promotes=['*'])
+            model.add_subsystem('c', om.ExecComp('y = x**2', x=np.ones(10), y=np.ones(10),
+                                                 has_diag_partials=True), promotes=['*'])
+            model.add_subsystem('d', om.ExecComp('z = 3*x', x=np.ones(10), z=np.ones(10),
+                                                 has_diag_partials=True), promotes=['*'])
+            model.add_subsystem('o', om.ExecComp('f = sum(y)', y=np.ones(10)), promotes=['*'])
+            model.add_design_var('x')
+            model.add_constraint('y', upper=0.)
+            model.add_constraint('z', upper=0.)
+            model.add_objective('f')
+            prob.driver.declare_coloring(show_summary=False)
+            prob.setup(mode='rev')
+            prob.run_model()
+            prob.driver._get_coloring(run_model=False)
+            return prob
+
+        expected, sizes = _batch_sizes(build(1), driver=True)
+        self.assertEqual(sizes, [])
+
+        # the 3 colors are solved together
+        prob = build(4)
+        J, sizes = _batch_sizes(prob, driver=True)
+        assert_near_equal(J, expected, 1e-12)
+        self.assertEqual(sizes, [3])
+        self.assertEqual(prob.driver._total_jac.nsolves, 3)
+
+    def test_direct_multi_rhs(self):
+        # a model level DirectSolver that solves several right-hand sides is used instead
+        prob = _build('rev', 4, top_solver=om.DirectSolver)
+        J, sizes = _batch_sizes(prob)
+        assert_near_equal(J, _build('rev', top_solver=om.DirectSolver).compute_totals(), 1e-10)
+        self.assertEqual(sizes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
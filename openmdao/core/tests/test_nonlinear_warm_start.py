@@ -0,0 +1,165 @@
+"""Test the prediction of the starting outputs of the model across driver iterations."""
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.core.nonlinear_warm_start import NonlinearWarmStart
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def _build(driver, nonlinear_solver):
+    prob = om.Problem()
+    model = prob.model = SellarDerivatives()
+    model.nonlinear_solver = nonlinear_solver
+    model.linear_solver = om.DirectSolver()
+
+    prob.driver = driver
+    model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+    model.add_design_var('x', lower=0.0, upper=10.0)
+    model.add_objective('obj')
+    model.add_constraint('con1', upper=0.0)
+    model.add_constraint('con2', upper=0.0)
+
+    prob.setup()
+    return prob
+
+
+def _run_driver(prob):
+    """
+    Run the driver and return the number of iterations of each solve of the model.
+    """
+    iters = []
+    solver = prob.model.nonlinear_solver
+    solve = solver.solve
+
+    def counting_solve():
+        solve()
+        iters.append(solver._iter_count)
+
+    solver.solve = counting_solve
+    try:
+        prob.run_driver()
+    finally:
+        del solver.solve
+
+    return iters
+
+
+@use_tempdirs
+class TestNonlinearWarmStart(unittest.TestCase):
+
+    def test_optimization(self):
+        solvers = {
+            'newton': lambda: om.NewtonSolver(solve_subsystems=False, atol=1e-10, rtol=1e-10,
+                                              maxiter=50, iprint=-1),
+            'nlbgs': lambda: om.NonlinearBlockGS(atol=1e-10, rtol=1e-10, maxiter=100,
+                                                 iprint=-1),
+        }
+        for name, solver in solvers.items():
+            for warm_start in (True, {'tangent': False}):
+                with self.subTest(solver=name, warm_start=warm_start):
+                    driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+                    cold = _build(driver, solver())
+                    cold_iters = _run_driver(cold)
+
+                    driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                                    nonlinear_warm_start=warm_start)
+                    prob = _build(driver, solver())
+                    iters = _run_driver(prob)
+
+                    assert_near_equal(prob.get_val('obj'), cold.get_val('obj'), 1e-8)
+                    assert_near_equal(prob.get_val('z'), cold.get_val('z'), 1e-6)
+                    assert_near_equal(prob.get_val('y1'), cold.get_val('y1'), 1e-6)
+
+                    stats = prob.driver._nl_warm_start.stats
+                    if warm_start is True:
+                        # the totals are computed at every design point of SLSQP
+                        self.assertEqual(stats['secant'], 0)
+                        self.assertEqual(stats['tangent'], len(iters) - 2)
+                        self.assertLess(sum(iters), sum(cold_iters))
+                    else:
+                        self.assertEqual(stats['tangent'], 0)
+                        self.assertEqual(stats['secant'], len(iters) - 2)
+                        self.assertLessEqual(sum(iters), sum(cold_iters))
+
+    def test_doe(self):
+        # without derivatives, the outputs are extrapolated from the previous design points
+        cases = [[('x', x), ('z', np.array([5.0, 2.0]) * x)] for x in np.linspace(1., 1.2, 6)]
+
+        def solver():
+            return om.NonlinearBlockGS(atol=1e-10, rtol=1e-10, maxiter=100, iprint=-1)
+
+        cold = _build(om.DOEDriver(om.ListGenerator(cases)), solver())
+        cold.driver.add_recorder(om.SqliteRecorder('cold.sql'))
+        cold_iters = _run_driver(cold)
+        cold.cleanup()
+
+        driver = om.DOEDriver(om.ListGenerator(cases), nonlinear_warm_start={'history': 3})
+        prob = _build(driver, solver())
+        prob.driver.add_recorder(om.SqliteRecorder('warm.sql'))
+        iters = _run_driver(prob)
+        prob.cleanup()
+
+        self.assertEqual(prob.driver._nl_warm_start.stats, {'tangent': 0, 'secant': 4})
+        self.assertLess(sum(iters), sum(cold_iters))
+
+        cold_cases = om.CaseReader(cold.get_outputs_dir() / 'cold.sql').get_cases('driver')
+        cases = om.CaseReader(prob.get_outputs_dir() / 'warm.sql').get_cases('driver')
+        for cold_case, case in zip(cold_cases, cases):
+            # the design variables aren't changed by the prediction
+            assert_near_equal(case.get_val('x'), cold_case.get_val('x'), 1e-15)
+            assert_near_equal(case.get_val('z'), cold_case.get_val('z'), 1e-15)
+            assert_near_equal(case.get_val('obj'), cold_case.get_val('obj'), 1e-8)
+
+    def test_tangent_keeps_linear_caches(self):
+        driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                        nonlinear_warm_start=True)
+        prob = _build(driver, om.NewtonSolver(solve_subsystems=False, atol=1e-10, rtol=1e-10,
+                                              maxiter=50, iprint=-1))
+        linear_solver = om.ScipyKrylov(atol=1e-12, rtol=1e-12, recycle_size=5, warm_start=True,
+                                       iprint=-1)
+        prob.model.linear_solver = linear_solver
+        prob.setup(mode='rev')
+
+        tangent_step = NonlinearWarmStart._tangent_step
+        checked = []
+
+        def checking_tangent_step(warm_start, driver, dx):
+            recycled = linear_solver._recycled.copy()
+            cache = dict(linear_solver._warm_start._cache)
+
+            du = tangent_step(warm_start, driver, dx)
+
+            for mode in ('fwd', 'rev'):
+                self.assertIs(linear_solver._recycled[mode], recycled[mode])
+            self.assertEqual(linear_solver._warm_start._cache.keys(), cache.keys())
+            for key, value in cache.items():
+                self.assertIs(linear_solver._warm_start._cache[key], value)
+            # the caches were filled by the compute_totals at the last design point
+            checked.append(recycled['rev'] is not None and len(cache) > 0)
+            return du
+
+        with mock.patch.object(NonlinearWarmStart, '_tangent_step', checking_tangent_step):
+            prob.run_driver()
+
+        self.assertEqual(len(checked), prob.driver._nl_warm_start.stats['tangent'])
+        self.assertTrue(any(checked))
+        assert_near_equal(prob.get_val('obj'), 3.18339395, 1e-6)
+
+    def test_unrecognized_option(self):
+        driver = om.ScipyOptimizeDriver(nonlinear_warm_start={'foo': True, 'bar': 1})
+
+        with self.assertRaises(ValueError) as cm:
+            _build(driver, om.NonlinearBlockGS()).final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "ScipyOptimizeDriver: unrecognized 'nonlinear_warm_start' options "
+                         "['bar', 'foo']. Valid options are ('history', 'tangent').")
+
+
+if __name__ == '__main__':
+    unittest.main()
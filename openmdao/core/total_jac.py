@@ -84,6 +84,8 @@ class _TotalJacInfo(object):
     in_idx_map : dict
         Mapping of jacobian row/col index to a tuple of the form
         (relevant_systems, cache_linear_solutions_flag, voi name)
+    seed_offsets : dict
+        Starting jacobian row/col index of each var of interest, keyed by mode.
     directional : bool
         If True, perform a single directional derivative.
     relevance : dict
@@ -236,6 +238,7 @@ class _TotalJacInfo(object):
                 modes = self.simul_coloring.modes()
 
             self.in_idx_map = {}
+            self.seed_offsets = {}
             self.in_loc_idxs = {}
             self.idx_iter_dict = {}
             self.seeds = {}
@@ -587,6 +590,7 @@ class _TotalJacInfo(object):
 
         loc_idxs = []
         idx_map = []
+        seed_offsets = {}
         start = 0
         end = 0
 
@@ -715,6 +719,7 @@ class _TotalJacInfo(object):
             if imeta is not None:
                 imeta['seed_vars'] = tuple(sorted(imeta['seed_vars']))
 
+            seed_offsets[name] = start
             tup = (cache_lin_sol, name, source)
 
             idx_map.extend([tup] * (end - start))
@@ -765,6 +770,7 @@ class _TotalJacInfo(object):
             idx_iter_dict['@simul_coloring'] = (imeta, self.simul_coloring_iter)
 
         self.in_idx_map[mode] = idx_map
+        self.seed_offsets[mode] = seed_offsets
         self.in_loc_idxs[mode] = loc_idxs
         self.idx_iter_dict[mode] = idx_iter_dict
         self.seeds[mode] = seed
@@ -1421,13 +1427,24 @@ class _TotalJacInfo(object):
 
                 self.J[:] = 0.0
 
+                multi_rhs_solver = self._get_multi_rhs_solver()
+                if multi_rhs_solver is None:
+                    deriv_columns = self._get_deriv_columns()
+                else:
+                    deriv_columns = multi_rhs_solver.options['rhs_batch_size']
+
                 # Main loop over columns (fwd) or rows (rev) of the jacobian
                 for mode in self.modes:
+                    if deriv_columns > 1:
+                        self._compute_totals_multi_rhs(multi_rhs_solver, mode, deriv_columns)
+                        continue
+
                     fwd = mode == 'fwd'
                     for key, idx_info in self.idx_iter_dict[mode].items():
                         imeta, idx_iter = idx_info
                         for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
                             model._problem_meta['seed_vars'] = itermeta['seed_vars']
+                            model._problem_meta['seed_key'] = self._get_seed_key(inds, mode)
                             _, cache_key = input_setter(inds, itermeta, mode)
 
                             if debug_print:
@@ -1480,6 +1497,7 @@ class _TotalJacInfo(object):
                             # reset any Problem level data for the current iteration
                             self.model._problem_meta['parallel_deriv_color'] = None
                             self.model._problem_meta['seed_vars'] = None
+                            self.model._problem_meta['seed_key'] = None
 
                 # Driver scaling.
                 if self.has_scaling:
@@ -1505,6 +1523,148 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _get_multi_rhs_solver(self):
+        """
+        Return the linear solver of the model if it can solve all of the seeds together.
+
+        Returns
+        -------
+        LinearSolver or None
+            The linear solver of the model, or None if the seeds must be solved one at a time.
+        """
+        model = self.model
+        ln_solver = model._linear_solver
+        if ln_solver is None or not ln_solver.supports['multi_rhs'] or model._owns_approx_jac \
+                or self.comm.size > 1 or self.debug_print or self.directional:
+            return None
+
+        return ln_solver
+
+    def _get_deriv_columns(self):
+        """
+        Return the number of seeds to solve together in vectorized derivative solves.
+
+        Returns
+        -------
+        int
+            The number of linear vector columns, or 1 if the seeds must be solved one at a time.
+        """
+        model = self.model
+        ncols = model._problem_meta['deriv_columns']
+        if ncols == 1 or model._owns_approx_jac or self.comm.size > 1 or self.debug_print or \
+                self.directional or model.under_complex_step:
+            return 1
+
+        for system in model.system_iter(include_self=True, recurse=True):
+            if not system._supports_deriv_columns():
+                return 1
+
+        return ncols
+
+    def _compute_totals_multi_rhs(self, ln_solver, mode, batch_size):
+        """
+        Compute the rows or columns of the total jacobian for one mode in batched solves.
+
+        Each seed is set into the linear vectors as it would be for a single solve and its
+        right-hand side is collected. The right-hand sides are then solved together and each
+        solution is put back into the linear vectors before the jacobian is set from it.
+
+        Parameters
+        ----------
+        ln_solver : LinearSolver or None
+            The linear solver of the model if it supports multiple right-hand sides, else None
+            to solve the model with a linear vector column for each seed.
+        mode : str
+            Direction of derivative solution.
+        batch_size : int
+            Maximum number of seeds solved together.
+        """
+        model = self.model
+        input_vec = self.input_vec[mode]
+        output_vec = self.output_vec[mode]
+        save_cache = not self.has_lin_cons and self.mode == mode
+
+        seeds = [(inds, input_setter, jac_setter, itermeta, imeta)
+                 for imeta, idx_iter in self.idx_iter_dict[mode].values()
+                 for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode)]
+
+        # columns are contiguous in Fortran order, as the solvers want them
+        rhs = np.empty((input_vec.asarray().size, min(batch_size, len(seeds))),
+                       dtype=input_vec.asarray().dtype, order='F')
+
+        for start in range(0, len(seeds), batch_size):
+            batch = seeds[start:start + batch_size]
+            cache_keys = []
+            seed_vars = set()
+
+            for j, (inds, input_setter, _, itermeta, _) in enumerate(batch):
+                _, cache_key = input_setter(inds, itermeta, mode)
+                cache_keys.append(cache_key)
+                seed_vars.update(itermeta['seed_vars'])
+                model._problem_meta['parallel_deriv_color'] = None
+                rhs[:, j] = input_vec.asarray()
+
+            if ln_solver is None:
+                sol = self._solve_deriv_columns(rhs[:, :len(batch)], mode,
+                                                tuple(sorted(seed_vars)))
+            else:
+                sol = ln_solver._solve_multi_rhs(rhs[:, :len(batch)], mode)
+
+            for j, (inds, _, jac_setter, _, imeta) in enumerate(batch):
+                output_vec.set_val(sol[:, j])
+
+                if save_cache and cache_keys[j] is not None:
+                    with model._scaled_context_all():
+                        self._save_linear_solution(cache_keys[j], mode)
+
+                self.nsolves += 1
+                jac_setter(inds, mode, imeta)
+
+    def _solve_deriv_columns(self, rhs, mode, seed_vars):
+        """
+        Solve the model for several seeds at once, with a linear vector column for each seed.
+
+        The right-hand sides and solutions are in the unscaled state the vectors are in
+        outside of the scaled context of the model. The relevant systems are those of any of
+        the seeds.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array with the right-hand side of a seed in each column.
+        mode : str
+            Direction of derivative solution.
+        seed_vars : tuple of str
+            Sorted names of the seed variables of all of the seeds.
+
+        Returns
+        -------
+        ndarray
+            Array with the solution for each seed in the same column.
+        """
+        model = self.model
+        if mode == 'fwd':
+            fwd_seeds, rev_seeds = seed_vars, None
+        else:
+            fwd_seeds, rev_seeds = None, seed_vars
+
+        model._problem_meta['seed_vars'] = seed_vars
+        model._set_deriv_columns(rhs.shape[1])
+        try:
+            model._dinputs.set_val(0.0)
+            model._doutputs.set_val(0.0)
+            model._dresiduals.set_val(0.0)
+            self.input_vec[mode].set_val(rhs)
+
+            with self.relevance.seeds_active(fwd_seeds=fwd_seeds, rev_seeds=rev_seeds):
+                with model._scaled_context_all():
+                    model._solve_linear(mode)
+
+            return self.output_vec[mode].asarray(copy=True)
+        finally:
+            model._set_deriv_columns(None)
+            model._problem_meta['seed_vars'] = None
+
     def _compute_totals_approx(self, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -1755,6 +1915,30 @@ class _TotalJacInfo(object):
                 else:
                     issue_warning(msg, category=DerivativesWarning)
 
+    def _get_seed_key(self, inds, mode):
+        """
+        Return a key that identifies the seed of a linear solve across calls to compute_totals.
+
+        Parameters
+        ----------
+        inds : int or sequence of int
+            Total jacobian row or column indices of the seed.
+        mode : str
+            Direction of derivative solution.
+
+        Returns
+        -------
+        tuple or None
+            Mode, name of the first var of interest in the seed, and index within that variable,
+            or None if the seed values are random.
+        """
+        if self.directional or self.add_coloring_noise:
+            return None
+
+        idx = inds if np.ndim(inds) == 0 else inds[0]
+        name = self.in_idx_map[mode][idx][1]
+        return (mode, name, idx - self.seed_offsets[mode][name])
+
     def _restore_linear_solution(self, key, mode):
         """
         Restore the previous linear solution.
@@ -4,6 +4,7 @@ Design-of-Experiments Driver.
 
 import traceback
 import inspect
+from itertools import islice
 
 import numpy as np
 
@@ -37,6 +38,8 @@ class DOEDriver(Driver):
         List of design variables, used to compute derivatives.
     _quantities : list
         Contains the objectives plus nonlinear constraints, used to compute derivatives.
+    _cases_run : int
+        The number of cases from the generator that have been run on this proc.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -77,6 +80,7 @@ class DOEDriver(Driver):
         self._indep_list = []
         self._quantities = []
         self._total_jac_format = 'dict'
+        self._cases_run = 0
 
     def _declare_options(self):
         """
@@ -163,9 +167,13 @@ class DOEDriver(Driver):
             Failure flag; True if failed to converge, False is successful.
         """
         self.result.reset()
-        self.iter_count = 0
         self._quantities = []
 
+        # when restarting from a checkpoint, skip the cases that have already been run
+        restart_state = self._pop_restart_state()
+        self._cases_run = 0 if restart_state is None else restart_state.get('cases_run', 0)
+        self.iter_count = self._cases_run
+
         # set driver name with current generator
         self._set_name()
 
@@ -187,7 +195,8 @@ class DOEDriver(Driver):
         else:
             case_gen = self.options['generator']
 
-        for case in case_gen(self._designvars, self._problem().model):
+        for case in islice(case_gen(self._designvars, self._problem().model),
+                           self._cases_run, None):
             self._run_case(case)
             self.iter_count += 1
 
@@ -230,6 +239,9 @@ class DOEDriver(Driver):
                 metadata['msg'] = traceback.format_exc()
                 print(metadata['msg'])
 
+            # count the case before it is recorded so that a checkpoint skips it on restart
+            self._cases_run += 1
+
             # save reference to metadata for use in record_iteration
             self._metadata = metadata
 
@@ -239,6 +251,17 @@ class DOEDriver(Driver):
                                  return_format=self._total_jac_format,
                                  driver_scaling=False)
 
+    def _get_restart_state(self):
+        """
+        Return the internal state of the driver to be saved in a checkpoint.
+
+        Returns
+        -------
+        dict
+            The state needed to resume a run of this driver.
+        """
+        return {'iter_count': self._cases_run, 'cases_run': self._cases_run}
+
     def _parallel_generator(self, design_vars, model=None):
         """
         Generate case for this processor when running under MPI.
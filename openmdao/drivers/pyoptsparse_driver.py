@@ -358,7 +358,9 @@ class pyOptSparseDriver(Driver):
         self.pyopt_solution = None
         self._total_jac = None
         self._total_jac_linear = None
-        self.iter_count = 0
+        # continue the iteration count of a run restarted from a checkpoint
+        restart_state = self._pop_restart_state()
+        self.iter_count = 0 if restart_state is None else restart_state['iter_count']
         self._nl_responses = []
 
         optimizer = self.options['optimizer']
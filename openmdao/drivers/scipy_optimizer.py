@@ -254,7 +254,9 @@ class ScipyOptimizeDriver(Driver):
         prob = self._problem()
         opt = self.options['optimizer']
         model = prob.model
-        self.iter_count = 0
+        # continue the iteration count of a run restarted from a checkpoint
+        restart_state = self._pop_restart_state()
+        self.iter_count = 0 if restart_state is None else restart_state['iter_count']
         self._total_jac = None
         self._total_jac_linear = None
         self._desvar_array_cache = None
@@ -9,6 +9,7 @@ from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
+from openmdao.matrices.bsr_matrix import BSRMatrix
 from openmdao.utils.units import unit_conversion
 from openmdao.utils.iter_utils import meta2range_iter
 
@@ -46,6 +47,16 @@ class AssembledJacobian(Jacobian):
         Column ranges for inputs.
     _out_ranges : dict
         Row ranges for outputs.
+    _skip_unchanged : bool
+        If True, only update the subjacs of components whose partials may have changed since
+        the last update.
+    _owner_iters : dict
+        Mapping of system pathname to a list of (component, keys, ext_keys) for the components
+        owning the subjacs that are updated by that system. The component is None for subjacs
+        that must always be updated.
+    _owner_versions : dict
+        Mapping of system pathname to a dict of the (jacobian, version) of each component when
+        its subjacs were last updated.
     """
 
     def __init__(self, matrix_class, system):
@@ -65,6 +76,9 @@ class AssembledJacobian(Jacobian):
         self._out_ranges = self._get_ranges(system, 'output')
         self._in_ranges = self._get_ranges(system, 'input')
         self._subjac_iters = defaultdict(lambda: None)
+        self._skip_unchanged = system.options['assembled_jac_skip_unchanged']
+        self._owner_iters = {}
+        self._owner_versions = defaultdict(dict)
 
     def _get_ranges(self, system, vtype):
         """
@@ -307,6 +321,50 @@ class AssembledJacobian(Jacobian):
 
         return subjac_iters
 
+    def _get_owner_iters(self, system):
+        """
+        Return the subjacs updated by the given system, grouped by owning component.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+
+        Returns
+        -------
+        list
+            List of (component, keys, ext_keys) tuples. The component is None for subjacs that
+            must always be updated.
+        """
+        owner_iters = self._owner_iters.get(system.pathname)
+        if owner_iters is None:
+            iters, iters_in_ext = self._get_subjac_iters(system)
+            subjacs = system._subjacs_info
+
+            if isinstance(system, Component):
+                comps = [system]
+            else:
+                comps = system.system_iter(recurse=True, typ=Component)
+
+            owners = {}
+            for comp in comps:
+                for key, meta in comp._subjacs_info.items():
+                    # subjacs set by an approximated group aren't owned by the component
+                    if subjacs.get(key) is meta:
+                        owners[key] = comp
+
+            groups = {}
+            for i, keys in enumerate((iters, iters_in_ext)):
+                for key in keys:
+                    comp = owners.get(key)
+                    if comp not in groups:
+                        groups[comp] = (comp, [], [])
+                    groups[comp][i + 1].append(key)
+
+            self._owner_iters[system.pathname] = owner_iters = list(groups.values())
+
+        return owner_iters
+
     def _update(self, system):
         """
         Read the user's sub-Jacobians and set into the global matrix.
@@ -339,8 +397,27 @@ class AssembledJacobian(Jacobian):
 
             for key in iters_in_ext:
                 ext_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['val'], key))
-        else:
 
+            # the matrices no longer hold the partials, so they must all be set again by the
+            # next update
+            self._owner_versions.clear()
+        elif self._skip_unchanged:
+            versions = self._owner_versions[system.pathname]
+            for comp, keys, ext_keys in self._get_owner_iters(system):
+                if comp is not None:
+                    jac = comp._jacobian
+                    if isinstance(jac, Jacobian):
+                        version = (jac, jac._subjacs_version)
+                        if versions.get(comp.pathname) == version:
+                            continue  # partials haven't changed since the last update
+                        versions[comp.pathname] = version
+
+                for key in keys:
+                    int_mtx._update_submat(key, subjacs[key]['val'])
+
+                for key in ext_keys:
+                    ext_mtx._update_submat(key, subjacs[key]['val'])
+        else:
             for key in iters:
                 int_mtx._update_submat(key, subjacs[key]['val'])
 
@@ -490,3 +567,20 @@ class CSCJacobian(AssembledJacobian):
         Initialize all attributes.
         """
         super().__init__(CSCMatrix, system=system)
+
+
+class BSRJacobian(AssembledJacobian):
+    """
+    Assemble sparse global <Jacobian> in Block Sparse Row format.
+
+    Parameters
+    ----------
+    system : System
+        Parent system to this jacobian.
+    """
+
+    def __init__(self, system):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(BSRMatrix, system=system)
@@ -1,9 +1,11 @@
 """Define the DictionaryJacobian class."""
 import numpy as np
 import scipy.sparse as sp
+from scipy.sparse import issparse
 
 from openmdao.jacobians.jacobian import Jacobian
 from openmdao.core.constants import INT_DTYPE
+from openmdao.utils.iter_utils import meta2range_iter
 
 
 class DictionaryJacobian(Jacobian):
@@ -23,6 +25,19 @@ class DictionaryJacobian(Jacobian):
         List of tuples of variable names that match subjacs in the this Jacobian.
     _key_owner : dict
         Dict mapping subjac keys to the rank where that subjac is local.
+    _op : csr_matrix, False or None
+        Sparse operator mapping the local d_outputs and d_inputs of a component to its
+        d_residuals. False if matvec products can't use an operator, or None if it hasn't been
+        built yet.
+    _op_map : tuple or None
+        The subjacs_info dict and its size, the (key, meta, rows) of each subjac, and the index
+        array that scatters the concatenated subjac values into the data of _op.
+    _op_cols : dict
+        Column ranges of _op keyed by variable name.
+    _op_masks : dict
+        Column masks of _op keyed by the names of the outputs and inputs in a matvec scope.
+    _op_version : int or None
+        Version of the subjacs when their values were last copied into _op.
     """
 
     def __init__(self, system, **kwargs):
@@ -32,6 +47,11 @@ class DictionaryJacobian(Jacobian):
         super().__init__(system, **kwargs)
         self._iter_keys = None
         self._key_owner = None
+        self._op = None
+        self._op_map = None
+        self._op_cols = None
+        self._op_masks = {}
+        self._op_version = None
 
     def _iter_abs_keys(self, system):
         """
@@ -109,6 +129,151 @@ class DictionaryJacobian(Jacobian):
 
         return self._iter_keys
 
+    def _build_operator(self, system):
+        """
+        Build the sparse operator used for the matvec products of a component.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        """
+        self._op = False
+        self._op_map = None
+        self._op_masks = {}
+
+        # groups may need subjacs from other procs, so they use the per-subjac products
+        if system._subsystems_allprocs:
+            return
+
+        subjacs_info = self._subjacs_info
+
+        # columns hold the outputs followed by the inputs, rows hold the residuals
+        col_ranges = {}
+        nout = 0
+        for name, start, nout in meta2range_iter(system._var_abs2meta['output'].items()):
+            col_ranges[name] = (start, nout)
+        ncols = nout
+        for name, start, end in meta2range_iter(system._var_abs2meta['input'].items()):
+            ncols = nout + end
+            col_ranges[name] = (nout + start, ncols)
+
+        self._iter_keys = None
+        keys = []
+        rows = []
+        cols = []
+        for key in self._iter_abs_keys(system):
+            meta = subjacs_info[key]
+            if issparse(meta['val']):
+                return
+
+            of, wrt = key
+            roffset = col_ranges[of][0]
+            coffset = col_ranges[wrt][0]
+            if meta['rows'] is None:
+                nrows, ncols_sub = meta['shape']
+                r, c = np.divmod(np.arange(nrows * ncols_sub, dtype=INT_DTYPE), ncols_sub)
+                rows.append(r + roffset)
+                cols.append(c + coffset)
+            else:
+                rows.append(meta['rows'] + roffset)
+                cols.append(meta['cols'] + coffset)
+            keys.append((key, meta, meta['rows']))
+
+        if rows:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+        else:
+            rows = cols = np.zeros(0, dtype=INT_DTYPE)
+
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(nout + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(rows, minlength=nout), out=indptr[1:])
+
+        self._op = sp.csr_matrix((np.zeros(order.size), cols[order], indptr),
+                                 shape=(nout, ncols))
+        self._op_map = (subjacs_info, len(subjacs_info), keys, order)
+        self._op_cols = col_ranges
+
+    def _get_operator(self, system):
+        """
+        Return the sparse operator for the matvec products, updating its values if needed.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+
+        Returns
+        -------
+        csr_matrix or None
+            The sparse operator, or None if the per-subjac products must be used.
+        """
+        if self._op is None:
+            self._build_operator(system)
+        elif self._op is False:
+            return None
+        elif self._op_version == self._subjacs_version:
+            return self._op
+        else:
+            subjacs_info, nsubjacs, keys, _ = self._op_map
+
+            # rebuild if any subjacs were added, removed, or had their sparsity changed
+            if subjacs_info is not self._subjacs_info or nsubjacs != len(subjacs_info) or \
+                    not all(subjacs_info.get(key) is meta and meta['rows'] is rows
+                            for key, meta, rows in keys):
+                self._build_operator(system)
+
+        if self._op is False:
+            return None
+
+        _, _, keys, order = self._op_map
+
+        vals = [meta['val'] for _, meta, _ in keys]
+        if any(issparse(v) for v in vals):
+            self._op = False
+            return None
+
+        op = self._op
+        if vals:
+            data = np.concatenate([np.ravel(v) for v in vals])[order]
+            if data.dtype == op.data.dtype:
+                op.data[:] = data
+            else:
+                op.data = data
+
+        self._op_version = self._subjacs_version
+        return op
+
+    def _get_operator_mask(self, system, out_names, in_names):
+        """
+        Return the mask of the operator columns that are in the current matvec scope.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        out_names : frozenset
+            Names of the outputs in scope.
+        in_names : frozenset
+            Names of the inputs in scope.
+
+        Returns
+        -------
+        ndarray or None
+            The column mask, or None if all columns are in scope.
+        """
+        if len(out_names) == len(system._var_abs2meta['output']) and \
+                len(in_names) == len(system._var_abs2meta['input']):
+            return None
+
+        mask = np.zeros(self._op.shape[1], dtype=bool)
+        for name, (start, end) in self._op_cols.items():
+            if name in out_names or name in in_names:
+                mask[start:end] = True
+
+        return mask
+
     def _apply(self, system, d_inputs, d_outputs, d_residuals, mode):
         """
         Compute matrix-vector product.
@@ -141,8 +306,34 @@ class DictionaryJacobian(Jacobian):
         is_explicit = system.is_explicit()
         do_randomize = self._randgen is not None and system._problem_meta['randomize_subjacs']
 
+        op = None if do_randomize else self._get_operator(system)
+
         do_reset = False
         with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            if op is not None:
+                names = (d_out_names, d_inp_names)
+                try:
+                    mask = self._op_masks[names]
+                except KeyError:
+                    mask = self._op_masks[names] = self._get_operator_mask(system, *names)
+
+                doutputs = d_outputs.asarray()
+                dinputs = d_inputs.asarray()
+                if fwd:
+                    wrtvec = np.concatenate((doutputs, dinputs))
+                    if mask is not None:
+                        wrtvec[~mask] = 0.
+                    dresids = d_residuals.asarray()
+                    dresids += op.dot(wrtvec)
+                else:  # rev
+                    prod = op.T.dot(d_residuals.asarray())
+                    if mask is not None:
+                        prod[~mask] = 0.
+                    nout = doutputs.shape[0]
+                    doutputs += prod[:nout]
+                    dinputs += prod[nout:]
+                return
+
             for abs_key in self._iter_abs_keys(system):
                 if abs_key not in subjacs_info:
                     # for components that compute sparsity at first linearization, some subjacs
@@ -192,7 +383,10 @@ class DictionaryJacobian(Jacobian):
                         linds, rinds = rows, subjac_info['cols']
                         if not fwd:
                             linds, rinds = rinds, linds
-                        if self._under_complex_step:
+                        if right_vec.ndim > 1:
+                            # a column for each seed of a vectorized derivative solve
+                            np.add.at(left_vec, linds, right_vec[rinds] * subjac[:, np.newaxis])
+                        elif self._under_complex_step:
                             # bincount only works with float, so split into parts
                             prod = right_vec[rinds] * subjac
                             left_vec[:].real += np.bincount(linds, prod.real,
@@ -241,6 +435,7 @@ class _CheckingJacobian(DictionaryJacobian):
         super().__init__(system)
         self._subjacs_info = self._subjacs_info.copy()
         self._uncovered_threshold = uncovered_threshold
+        self._op = False
 
         # Convert any scipy.sparse subjacs to OpenMDAO's interal COO specification.
         for key, subjac in self._subjacs_info.items():
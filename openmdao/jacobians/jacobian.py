@@ -45,6 +45,9 @@ class Jacobian(object):
         List of column var names.
     _col2name_ind : ndarray
         Array that maps jac col index to index of column name.
+    _subjacs_version : int
+        Counter that is incremented whenever the subjac values may have changed, so that
+        anything built from them can tell when it needs to be updated.
     """
 
     def __init__(self, system):
@@ -58,6 +61,7 @@ class Jacobian(object):
         self._col_var_offset = None
         self._col_varnames = None
         self._col2name_ind = None
+        self._subjacs_version = 0
 
     def _get_abs_key(self, key):
         try:
@@ -106,6 +110,7 @@ class Jacobian(object):
         dict
             Metadata dict for the given key.
         """
+        self._subjacs_version += 1
         try:
             return self._subjacs_info[self._get_abs_key(key)]
         except KeyError:
@@ -142,6 +147,8 @@ class Jacobian(object):
         ndarray or spmatrix or list[3]
             sub-Jacobian as an array, sparse mtx, or AIJ/IJ list or tuple.
         """
+        # the returned array may be modified in place
+        self._subjacs_version += 1
         try:
             return self._subjacs_info[self._get_abs_key(key)]['val']
         except KeyError:
@@ -170,6 +177,7 @@ class Jacobian(object):
             raise KeyError(msg.format(self.msginfo, key[0], key[1]))
 
         subjacs_info = self._subjacs_info[abs_key]
+        self._subjacs_version += 1
 
         if issparse(subjac):
             subjacs_info['val'] = subjac
@@ -335,6 +343,7 @@ class Jacobian(object):
                 meta['val'] = meta['val'].real
 
         self._under_complex_step = active
+        self._subjacs_version += 1
 
     def _setup_index_maps(self, system):
         self._col_var_offset = {}
@@ -373,6 +382,7 @@ class Jacobian(object):
 
         wrt = self._col_varnames[self._col2name_ind[icol]]
         loc_idx = icol - self._col_var_offset[wrt]  # local col index into subjacs
+        self._subjacs_version += 1
 
         for of, start, end, _, _ in system._jac_of_iter():
             key = (of, wrt)
@@ -402,6 +412,7 @@ class Jacobian(object):
         if self._col_varnames is None:
             self._setup_index_maps(system)
 
+        self._subjacs_version += 1
         wrtiter = list(system._jac_wrt_iter())
         for of, start, end, _, _ in system._jac_of_iter():
             for wrt, wstart, wend, _, _, _ in wrtiter:
@@ -419,4 +430,5 @@ class Jacobian(object):
         Revert all subjacs back to the way they were as declared by the user.
         """
         self._subjacs_info = self._system()._subjacs_info
+        self._subjacs_version += 1
         self._col_varnames = None  # force recompute of internal index maps on next set_col
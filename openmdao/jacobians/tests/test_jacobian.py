@@ -1245,5 +1245,419 @@ class MaskingTestCase(unittest.TestCase):
                 np.testing.assert_allclose(totals, expected)
 
 
+class MixedPartialsComp(ImplicitComponent):
+    """
+    Nonlinear implicit component with dense, COO, and declared-constant partials.
+    """
+
+    def setup(self):
+        self.add_input('a', np.ones(3))
+        self.add_input('b', 2.0)
+        self.add_output('x', np.ones(3))
+        self.add_output('y', 1.0)
+
+        ar = np.arange(3)
+        self.declare_partials('x', 'a', rows=ar, cols=ar)
+        self.declare_partials('x', 'x', rows=ar, cols=ar)
+        self.declare_partials('x', 'b')
+        self.declare_partials('y', ['x', 'a'])
+        self.declare_partials('y', 'y', val=1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = outputs['x'] ** 3 + outputs['x'] - inputs['a'] * inputs['b']
+        residuals['y'] = outputs['y'] - np.sum(outputs['x'] * inputs['a'] ** 2)
+
+    def linearize(self, inputs, outputs, partials):
+        partials['x', 'x'] = 3. * outputs['x'] ** 2 + 1.
+        partials['x', 'a'] = -inputs['b']
+        partials['x', 'b'] = -inputs['a']
+        partials['y', 'x'] = -inputs['a'] ** 2
+        partials['y', 'a'] = -2. * outputs['x'] * inputs['a']
+
+
+class DictionaryJacobianOperatorTestCase(unittest.TestCase):
+
+    def _build(self, linear_solver, mode, a=(1., 2., 3.)):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('ivc', IndepVarComp('a', np.array(a)), promotes=['*'])
+        model.add_subsystem('comp', ExecComp('b = 2. * c', c=1.5), promotes=['*'])
+        model.add_subsystem('mixed', MixedPartialsComp(), promotes=['*'])
+
+        model.nonlinear_solver = NewtonSolver(solve_subsystems=False, maxiter=50, iprint=-1)
+        model.linear_solver = linear_solver
+
+        model.add_design_var('a')
+        model.add_design_var('c')
+        model.add_objective('y')
+        model.add_constraint('x', lower=0.)
+
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    def _check_totals(self, totals, mode, a):
+        expected = self._build(DirectSolver(assemble_jac=True), mode, a).compute_totals()
+        for key, val in expected.items():
+            assert_near_equal(totals[key], val, 1e-9)
+
+    def test_operator(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self._build(ScipyKrylov(atol=1e-14), mode)
+
+                jac = prob.model.mixed._jacobian
+                self._check_totals(prob.compute_totals(), mode, (1., 2., 3.))
+                self.assertIsInstance(jac._op, csr_matrix)
+                self.assertEqual(jac._op.shape, (4, 8))
+
+                data = jac._op.data
+                data_copy = data.copy()
+
+                # values are refreshed from the subjacs after the next linearization
+                prob.set_val('a', np.array([3., 2., 1.]))
+                prob.run_model()
+                self._check_totals(prob.compute_totals(), mode, (3., 2., 1.))
+                self.assertFalse(np.array_equal(jac._op.data, data_copy))
+
+                # the operator is updated in place when the sparsity doesn't change
+                self.assertIs(jac._op.data, data)
+
+    def test_matvec_scope(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = Problem()
+                model = prob.model
+                model.add_subsystem('ivc', IndepVarComp('a', np.array([1., 2., 3.])),
+                                    promotes=['*'])
+                model.add_subsystem('comp', ExecComp('b = 2. * c', c=1.5), promotes=['*'])
+                sub = model.add_subsystem('sub', Group(), promotes=['*'])
+                sub.add_subsystem('mixed', MixedPartialsComp(), promotes=['*'])
+                sub.nonlinear_solver = NewtonSolver(solve_subsystems=False, maxiter=50,
+                                                    iprint=-1)
+                sub.linear_solver = ScipyKrylov(atol=1e-14)
+                model.linear_solver = DirectSolver()
+
+                model.add_design_var('a')
+                model.add_design_var('c')
+                model.add_objective('y')
+                model.add_constraint('x', lower=0.)
+
+                prob.setup(mode=mode)
+                prob.run_model()
+                self._check_totals(prob.compute_totals(), mode, (1., 2., 3.))
+
+                # the inputs connected from outside of 'sub' are masked out of the matvecs
+                # done by its krylov solver
+                masks = prob.model.sub.mixed._jacobian._op_masks
+                self.assertTrue(any(mask is not None for mask in masks.values()))
+
+    def test_sparse_subjac(self):
+        class SparseComp(ExplicitComponent):
+            def setup(self):
+                self.add_input('x', np.ones(4))
+                self.add_output('y', np.ones(4))
+                self.declare_partials('y', 'x', val=csr_matrix(np.diag(np.arange(1., 5.))))
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = np.arange(1., 5.) * inputs['x']
+
+        prob = Problem()
+        prob.model.add_subsystem('comp', SparseComp())
+        prob.model.linear_solver = ScipyKrylov()
+        prob.setup()
+        prob.run_model()
+
+        totals = prob.compute_totals(of=['comp.y'], wrt=['comp.x'])
+        assert_near_equal(totals['comp.y', 'comp.x'], np.diag(np.arange(1., 5.)))
+
+        # scipy sparse subjacs use the per-subjac products
+        self.assertIs(prob.model.comp._jacobian._op, False)
+
+
+class ConstantPartialsComp(ExplicitComponent):
+    """
+    Linear component whose partials are declared once and never recomputed.
+    """
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('z', np.ones(3))
+        self.declare_partials('z', 'x', rows=np.arange(3), cols=np.arange(3), val=3.0)
+
+    def compute(self, inputs, outputs):
+        outputs['z'] = 3.0 * inputs['x']
+
+
+class IncrementalUpdateTestCase(unittest.TestCase):
+
+    def _build(self, jac_type, skip_unchanged=False):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('ivc', IndepVarComp('a', np.array([1., 2., 3.])), promotes=['*'])
+        model.add_subsystem('comp', ExecComp('b = 2. * c', c=1.5), promotes=['*'])
+        model.add_subsystem('mixed', MixedPartialsComp(), promotes=['*'])
+        model.add_subsystem('const', ConstantPartialsComp(), promotes_outputs=['z'])
+        model.connect('x', 'const.x')
+
+        model.nonlinear_solver = NewtonSolver(solve_subsystems=False, maxiter=50, iprint=-1)
+        model.linear_solver = DirectSolver()
+        model.options['assembled_jac_type'] = jac_type
+        model.options['assembled_jac_skip_unchanged'] = skip_unchanged
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def test_fixed_structure(self):
+        expected = self._build('dense').compute_totals(of=['y', 'z'], wrt=['a', 'c'])
+
+        prob = self._build('csc')
+        int_mtx = prob.model._assembled_jac._int_mtx
+        csc = int_mtx._matrix
+        indices = csc.indices
+        self.assertIs(csc, int_mtx._csc)
+        self.assertFalse(int_mtx._has_repeats)
+
+        prob.set_val('a', np.array([3., 2., 1.]))
+        prob.run_model()
+        prob.set_val('a', np.array([1., 2., 3.]))
+        prob.run_model()
+
+        # the matrix and its sparsity structure are reused by every linearization
+        self.assertIs(int_mtx._matrix, csc)
+        self.assertIs(csc.indices, indices)
+
+        totals = prob.compute_totals(of=['y', 'z'], wrt=['a', 'c'])
+        for key, val in expected.items():
+            assert_near_equal(totals[key], val, 1e-10)
+
+    def test_skip_unchanged(self):
+        for jac_type in ('csc', 'dense'):
+            for skip in (True, False):
+                with self.subTest(jac_type=jac_type, skip_unchanged=skip):
+                    prob = self._build(jac_type, skip)
+                    expected = prob.compute_totals(of=['y', 'z'], wrt=['a', 'c'])
+
+                    # change a constant subjac without going through the jacobian, so only
+                    # a full update will pick it up
+                    meta = prob.model.const._subjacs_info['const.z', 'const.x']
+                    meta['val'][:] = 4.0
+
+                    prob.set_val('a', np.array([3., 2., 1.]))
+                    prob.run_model()
+                    prob.set_val('a', np.array([1., 2., 3.]))
+                    prob.run_model()
+
+                    totals = prob.compute_totals(of=['y', 'z'], wrt=['a', 'c'])
+                    assert_near_equal(totals['y', 'a'], expected['y', 'a'], 1e-10)
+                    assert_near_equal(totals['y', 'c'], expected['y', 'c'], 1e-10)
+                    if skip:
+                        assert_near_equal(totals['z', 'a'], expected['z', 'a'], 1e-10)
+                    else:
+                        assert_near_equal(totals['z', 'a'], expected['z', 'a'] * 4. / 3., 1e-10)
+
+    def test_skip_unchanged_total_coloring(self):
+        # computing the total coloring sets random values into the matrices, which must all be
+        # replaced by the next update, even the ones of components whose partials are constant
+        def build(skip_unchanged):
+            prob = Problem()
+            model = prob.model
+            model.add_subsystem('ivc', IndepVarComp('x', np.array([1., 2., 3.])))
+            sub = model.add_subsystem('sub', Group())
+            sub.add_subsystem('const', ConstantPartialsComp())
+            sub.add_subsystem('comp', ExecComp('y = z**2', y=np.ones(3), z=np.ones(3),
+                                               has_diag_partials=True))
+            sub.connect('const.z', 'comp.z')
+            model.connect('ivc.x', 'sub.const.x')
+
+            sub.nonlinear_solver = NewtonSolver(solve_subsystems=False, iprint=-1)
+            sub.linear_solver = DirectSolver()
+            sub.options['assembled_jac_skip_unchanged'] = skip_unchanged
+
+            model.add_design_var('ivc.x')
+            model.add_objective('sub.comp.y', index=0)
+            model.add_constraint('sub.const.z', upper=100.)
+
+            prob.driver = ScipyOptimizeDriver()
+            prob.driver.declare_coloring()
+
+            prob.setup(mode='fwd')
+            prob.run_model()
+            return prob
+
+        expected = build(False).driver._compute_totals(return_format='array')
+
+        prob = build(True)
+        totals = prob.driver._compute_totals(return_format='array')
+
+        self.assertIsNotNone(prob.driver._coloring_info.coloring)
+        assert_near_equal(totals, expected, 1e-12)
+
+
+class BlockComp(ImplicitComponent):
+    """
+    Vectorized implicit component with a dense 3x3 block of partials per node.
+    """
+
+    def initialize(self):
+        self.options.declare('vec_size', types=int, default=4)
+
+    def setup(self):
+        n = self.options['vec_size']
+        self.add_input('a', np.ones((n, 3)))
+        self.add_output('x', np.ones((n, 3)))
+
+        rows, cols = np.nonzero(np.kron(np.eye(n), np.ones((3, 3))))
+        self.declare_partials('x', 'x', rows=rows, cols=cols)
+        self.declare_partials('x', 'a', rows=rows, cols=cols)
+
+        rng = np.random.default_rng(11)
+        self.A = rng.random((n, 3, 3)) + 3. * np.eye(3)
+        self.B = rng.random((n, 3, 3))
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = np.einsum('nij,nj->ni', self.A, outputs['x']) + outputs['x'] ** 3 - \
+            np.einsum('nij,nj->ni', self.B, inputs['a'])
+
+    def linearize(self, inputs, outputs, partials):
+        partials['x', 'x'] = (self.A + np.einsum('ij,ni->nij', np.eye(3),
+                                                 3. * outputs['x'] ** 2)).ravel()
+        partials['x', 'a'] = -self.B.ravel()
+
+
+class ScalarStateComp(ImplicitComponent):
+    """
+    Implicit component with a scalar state that depends on a vector input.
+    """
+
+    def setup(self):
+        self.add_input('x', np.ones((4, 3)))
+        self.add_output('s', 1.)
+        self.declare_partials('s', ['s', 'x'])
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['s'] = 2. * outputs['s'] - np.sum(inputs['x'])
+
+    def linearize(self, inputs, outputs, partials):
+        partials['s', 's'] = 2.
+        partials['s', 'x'] = -np.ones((1, 12))
+
+
+class BSRJacobianTestCase(unittest.TestCase):
+
+    def test_block_size(self):
+        from openmdao.matrices.bsr_matrix import _get_block_size
+
+        rows, cols = np.nonzero(np.kron(np.eye(4), np.ones((3, 3))))
+        self.assertEqual(_get_block_size(rows, cols, [(0, rows.size)]), 3)
+
+        # a diagonal has no block structure
+        self.assertEqual(_get_block_size(np.arange(12), np.arange(12), [(0, 12)]), 1)
+
+        # a scalar subjac that doesn't line up with the blocks only adds its own block
+        srows = np.concatenate([rows, [12]])
+        scols = np.concatenate([cols, [12]])
+        self.assertEqual(_get_block_size(srows, scols, [(0, rows.size), (rows.size, srows.size)]),
+                         3)
+
+        # blocks that are shifted by one row and column only fill smaller blocks
+        self.assertEqual(_get_block_size(rows + 1, cols + 1, [(0, rows.size)]), 2)
+
+    def _build(self, jac_type, linear_solver, mode, scalar=None):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('ivc', IndepVarComp('a', np.arange(12.).reshape((4, 3)) / 12.),
+                            promotes=['*'])
+        if scalar == 'first':
+            model.add_subsystem('scalar', ScalarStateComp(), promotes=['*'])
+        model.add_subsystem('blocks', BlockComp(), promotes=['*'])
+        if scalar == 'last':
+            model.add_subsystem('scalar', ScalarStateComp(), promotes=['*'])
+
+        model.nonlinear_solver = NewtonSolver(solve_subsystems=False, iprint=-1)
+        model.linear_solver = linear_solver
+        model.options['assembled_jac_type'] = jac_type
+
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    def test_bsr_jacobian(self):
+        for mode in ('fwd', 'rev'):
+            for scalar in (None, 'last'):
+                expected = self._build('csc', DirectSolver(), mode,
+                                       scalar).compute_totals(of=['x'], wrt=['a'])
+                for linear_solver in (DirectSolver, ScipyKrylov):
+                    with self.subTest(mode=mode, scalar=scalar,
+                                      linear_solver=linear_solver.__name__):
+                        prob = self._build('bsr', linear_solver(assemble_jac=True), mode, scalar)
+                        totals = prob.compute_totals(of=['x'], wrt=['a'])
+
+                        for key, val in expected.items():
+                            assert_near_equal(totals[key], val, 1e-8)
+
+                        # a trailing scalar is padded into the last block
+                        int_mtx = prob.model._assembled_jac._int_mtx
+                        self.assertEqual(int_mtx._matrix.format, 'bsr')
+                        self.assertEqual(int_mtx._matrix.blocksize, (3, 3))
+
+                        # the entry indices are only needed to build the blocks
+                        self.assertIsNone(int_mtx._coo)
+
+    def test_bsr_shifted_blocks(self):
+        # a leading scalar shifts the blocks of the vector variables out of line
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                expected = self._build('csc', DirectSolver(), mode,
+                                       'first').compute_totals(of=['x'], wrt=['a'])
+                prob = self._build('bsr', ScipyKrylov(assemble_jac=True), mode, 'first')
+                totals = prob.compute_totals(of=['x'], wrt=['a'])
+
+                for key, val in expected.items():
+                    assert_near_equal(totals[key], val, 1e-8)
+
+                self.assertEqual(prob.model._assembled_jac._int_mtx._matrix.format, 'bsr')
+
+    def test_bsr_fallback_csc(self):
+        # partials without any block structure are stored in CSC format
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = Problem()
+                model = prob.model
+                model.add_subsystem('ivc', IndepVarComp('a', np.arange(12.)))
+                model.add_subsystem('comp', ExecComp('y = 3. * a', a=np.ones(12), y=np.ones(12),
+                                                     has_diag_partials=True))
+                model.connect('ivc.a', 'comp.a')
+                model.linear_solver = DirectSolver()
+                model.options['assembled_jac_type'] = 'bsr'
+
+                prob.setup(mode=mode)
+                prob.run_model()
+                totals = prob.compute_totals(of=['comp.y'], wrt=['ivc.a'])
+
+                assert_near_equal(totals['comp.y', 'ivc.a'], 3. * np.eye(12), 1e-12)
+                self.assertEqual(prob.model._assembled_jac._int_mtx._matrix.format, 'csc')
+
+    def test_bsr_direct_csc_cached(self):
+        prob = self._build('bsr', DirectSolver(), 'fwd', 'last')
+        int_mtx = prob.model._assembled_jac._int_mtx
+
+        csc = int_mtx._get_csc()
+        indices = csc.indices
+        data = csc.data.copy()
+        # the entries of a, x and s, without the zeros that fill the blocks
+        self.assertEqual(csc.nnz, 12 + 2 * 36 + 13)
+
+        # later linearizations only copy the values into the same CSC structure
+        prob.set_val('a', 2. * prob.get_val('a'))
+        prob.run_model()
+        self.assertIs(int_mtx._get_csc(), csc)
+        self.assertIs(csc.indices, indices)
+        self.assertFalse(np.allclose(csc.data, data))
+
+        np.testing.assert_allclose(csc.toarray(), int_mtx._bsr.toarray()[:25, :25])
+
+
 if __name__ == '__main__':
     unittest.main()
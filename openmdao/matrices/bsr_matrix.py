@@ -0,0 +1,393 @@
+"""Define the BSRmatrix class."""
+import numpy as np
+from numpy import ndarray
+from scipy.sparse import bsr_matrix, csc_matrix
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.matrices.coo_matrix import COOMatrix
+from openmdao.matrices.csc_matrix import CSCMatrix
+
+# Largest block size that will be considered when detecting the block structure.
+_MAX_BLOCK_SIZE = 16
+
+# Fraction of the entries in the blocks that must be exceeded by the nonzeros for a block size
+# to be used.
+_MIN_BLOCK_FILL = 0.5
+
+
+def _get_block_size(rows, cols, ranges):
+    """
+    Return the largest square block size that fits the given sparsity structure.
+
+    The blocks of each subjac are counted separately, so a subjac whose entries don't line up
+    with the blocks of a given size only lowers the fill of that block size by its own entries.
+
+    Parameters
+    ----------
+    rows : ndarray
+        Row indices of the nonzero entries.
+    cols : ndarray
+        Column indices of the nonzero entries.
+    ranges : list of (int, int)
+        Start and end of the entries of each subjac in rows and cols.
+
+    Returns
+    -------
+    int
+        The block size, which is 1 if the matrix has no block structure.
+    """
+    ranges = [(start, end) for start, end in ranges if end > start]
+    nnz = sum(end - start for start, end in ranges)
+    if nnz == 0:
+        return 1
+
+    for bsize in range(_MAX_BLOCK_SIZE, 1, -1):
+        max_blocks = nnz / (_MIN_BLOCK_FILL * bsize * bsize)
+        nblocks = 0
+        for start, end in ranges:
+            brows = rows[start:end] // bsize
+            bcols = cols[start:end] // bsize
+            nblocks += np.unique(brows * (bcols.max() + 1) + bcols).size
+            if nblocks >= max_blocks:
+                break
+        else:
+            return bsize
+
+    return 1
+
+
+class BSRMatrix(CSCMatrix):
+    """
+    Sparse matrix in Block Sparse Row format.
+
+    The block size is the largest one for which the blocks holding the nonzero entries of the
+    subjacs are mostly filled, so the vectorized subjacs of components with per-node blocks are
+    stored as small dense blocks instead of entry by entry. The block structure is computed once
+    when the matrix is built, after which the subjacs are set directly into the block data and
+    the row and column indices of the entries are discarded. If no block structure is found,
+    the matrix is stored in CSC format instead.
+
+    Parameters
+    ----------
+    comm : MPI.Comm or <FakeComm>
+        Communicator of the top-level system that owns the <Jacobian>.
+    is_internal : bool
+        If True, this is the int_mtx of an AssembledJacobian.
+
+    Attributes
+    ----------
+    _bsr : bsr_matrix or None
+        BSR matrix with a fixed block structure, padded with zero rows and columns up to a
+        multiple of the block size. None if the matrix is stored in CSC format.
+    _bsr_T : bsr_matrix or None
+        Cached transpose of _bsr, used for reverse products.
+    _flat : ndarray or None
+        Flat view of the block data of _bsr.
+    _coo_data : ndarray or None
+        Data of the subjacs, only kept if some of their entries map to the same block entry.
+    _coo2bsr : ndarray or None
+        Index into the flat block data of each entry of _coo_data.
+    _bsr2csc : ndarray or None
+        Index into the flat block data of each entry of the CSC data returned by _get_csc.
+    _shape : tuple
+        The number of rows and columns of the matrix, without padding.
+    """
+
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(comm, is_internal)
+        self._bsr = None
+        self._bsr_T = None
+        self._flat = None
+        self._coo_data = None
+        self._coo2bsr = None
+        self._bsr2csc = None
+        self._shape = None
+
+    def _build(self, num_rows, num_cols, system=None):
+        """
+        Allocate the matrix.
+
+        Parameters
+        ----------
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        system : <System>
+            owning system.
+        """
+        COOMatrix._build(self, num_rows, num_cols, system)
+        coo = self._matrix
+        self._shape = (num_rows, num_cols)
+
+        bsize = _get_block_size(coo.row, coo.col,
+                                [rng[:2] for rng in self._key_ranges.values()])
+        if bsize == 1:
+            # a BSR matrix of 1x1 blocks is slower than CSC
+            self._build_csc(num_cols)
+            return
+
+        nbrows = -(-num_rows // bsize)
+        nbcols = -(-num_cols // bsize)
+
+        block_ids = (coo.row // bsize) * nbcols + coo.col // bsize
+        ublocks, block_idx = np.unique(block_ids, return_inverse=True)
+
+        indptr = np.zeros(nbrows + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(ublocks // nbcols, minlength=nbrows), out=indptr[1:])
+
+        coo2bsr = (block_idx.ravel() * bsize * bsize + (coo.row % bsize) * bsize +
+                   coo.col % bsize).astype(INT_DTYPE)
+
+        data = np.zeros((ublocks.size, bsize, bsize), dtype=coo.data.dtype)
+        self._bsr = bsr_matrix((data, (ublocks % nbcols).astype(INT_DTYPE), indptr),
+                               shape=(nbrows * bsize, nbcols * bsize), blocksize=(bsize, bsize))
+        self._flat = self._bsr.data.reshape(-1)
+
+        if np.unique(coo2bsr).size < coo2bsr.size:
+            # repeated entries are set into the COO data and summed into the blocks
+            self._coo_data = coo.data
+            self._coo2bsr = coo2bsr
+        else:
+            # subjacs are set directly into the block data
+            metadata = self._metadata
+            for key, (idxs, jac_type, factor) in metadata.items():
+                metadata[key] = (coo2bsr[idxs], jac_type, factor)
+
+        # the entry indices are no longer needed
+        self._coo = None
+        self._matrix = self._bsr
+
+    def _get_entry_idxs(self, key):
+        """
+        Return the index into the flat block data of the entries of a subjac.
+
+        Parameters
+        ----------
+        key : (str, str)
+            the global output and input variable names.
+
+        Returns
+        -------
+        ndarray or slice
+            Index of the entries of the subjac.
+        """
+        idxs = self._metadata[key][0]
+        if self._coo2bsr is not None:
+            return self._coo2bsr[idxs]
+        return idxs
+
+    def _update_submat(self, key, jac):
+        """
+        Update the values of a sub-jacobian.
+
+        Parameters
+        ----------
+        key : (str, str)
+            the global output and input variable names.
+        jac : ndarray or scipy.sparse or tuple
+            the sub-jacobian, the same format with which it was declared.
+        """
+        if self._bsr is None:
+            super()._update_submat(key, jac)
+            return
+
+        idxs, jac_type, factor = self._metadata[key]
+        if not isinstance(jac, jac_type) and (jac_type is list and not isinstance(jac, ndarray)):
+            raise TypeError("Jacobian entry for %s is of different type (%s) than "
+                            "the type (%s) used at init time." % (key,
+                                                                  type(jac).__name__,
+                                                                  jac_type.__name__))
+
+        data = self._flat if self._coo_data is None else self._coo_data
+        if isinstance(jac, ndarray):
+            data[idxs] = jac.flat
+        else:  # sparse
+            data[idxs] = jac.data
+
+        if factor is not None:
+            data[idxs] *= factor
+
+    def _pre_update(self):
+        """
+        Do anything that needs to be done at the start of AssembledJacobian._update.
+        """
+        if self._bsr is None:
+            super()._pre_update()
+
+    def _post_update(self):
+        """
+        Do anything that needs to be done at the end of AssembledJacobian._update.
+        """
+        if self._bsr is None:
+            super()._post_update()
+            return
+
+        if self._coo_data is not None:
+            # add any repeated entries together
+            data = self._coo_data
+            flat = self._flat
+            if np.iscomplexobj(data):
+                flat[:] = np.bincount(self._coo2bsr, data.real, minlength=flat.size)
+                flat.imag = np.bincount(self._coo2bsr, data.imag, minlength=flat.size)
+            else:
+                flat[:] = np.bincount(self._coo2bsr, data, minlength=flat.size)
+
+        self._bsr_T = None
+
+    def _get_csc(self):
+        """
+        Return the matrix in CSC format, for use in sparse LU factorizations.
+
+        The CSC structure, which only holds the entries of the subjacs, is computed the first
+        time this is called and kept, so later calls only copy the block data into it.
+
+        Returns
+        -------
+        csc_matrix
+            The matrix in CSC format.
+        """
+        if self._bsr is None:
+            return self._matrix
+
+        flat = self._flat
+        if self._bsr2csc is None:
+            # positions of the subjac entries in the block data
+            used = np.zeros(flat.size, dtype=bool)
+            for key in self._metadata:
+                used[self._get_entry_idxs(key)] = True
+            pos = np.nonzero(used)[0]
+
+            bsize = self._bsr.blocksize[0]
+            block, rem = np.divmod(pos, bsize * bsize)
+            brows = np.repeat(np.arange(self._bsr.indptr.size - 1), np.diff(self._bsr.indptr))
+            rows = brows[block] * bsize + rem // bsize
+            cols = self._bsr.indices[block] * bsize + rem % bsize
+
+            order = np.lexsort((rows, cols))
+            indptr = np.zeros(self._shape[1] + 1, dtype=INT_DTYPE)
+            np.cumsum(np.bincount(cols, minlength=self._shape[1]), out=indptr[1:])
+
+            self._bsr2csc = pos[order].astype(INT_DTYPE)
+            self._csc = csc_matrix((flat[self._bsr2csc], rows[order].astype(INT_DTYPE), indptr),
+                                   shape=self._shape)
+        elif self._csc.data.dtype != flat.dtype:
+            self._csc.data = flat[self._bsr2csc]
+        else:
+            np.take(flat, self._bsr2csc, out=self._csc.data)
+
+        return self._csc
+
+    def _prod(self, in_vec, mode, mask=None):
+        """
+        Perform a matrix vector product.
+
+        Parameters
+        ----------
+        in_vec : ndarray[:]
+            incoming vector to multiply.
+        mode : str
+            'fwd' or 'rev'.
+        mask : ndarray of type bool, or None
+            Array used to zero out part of the matrix data.
+
+        Returns
+        -------
+        ndarray[:]
+            vector resulting from the product.
+        """
+        if self._bsr is None:
+            return super()._prod(in_vec, mode, mask)
+
+        bsr = self._bsr
+        if mask is not None:
+            save = bsr.data[mask]
+            bsr.data[mask] = 0.0
+
+        num_rows, num_cols = self._shape
+        nin, nout = (num_cols, num_rows) if mode == 'fwd' else (num_rows, num_cols)
+        padded = bsr.shape[1] if mode == 'fwd' else bsr.shape[0]
+        if padded > nin:
+            vec = np.zeros(padded, dtype=np.result_type(in_vec, bsr.data))
+            vec[:nin] = in_vec
+            in_vec = vec
+
+        if mode == 'fwd':
+            val = bsr.dot(in_vec)
+        elif mask is None:
+            # transposing a BSR matrix copies its data, so only do it once per update
+            if self._bsr_T is None:
+                self._bsr_T = bsr.T
+            val = self._bsr_T.dot(in_vec)
+        else:
+            val = bsr.T.dot(in_vec)
+
+        if mask is not None:
+            bsr.data[mask] = save
+
+        return val[:nout]
+
+    def _create_mask_cache(self, d_inputs):
+        """
+        Create masking array for this matrix.
+
+        Note : this only applies when this Matrix is an 'ext_mtx' inside of a
+        Jacobian object.
+
+        Parameters
+        ----------
+        d_inputs : Vector
+            The inputs linear vector.
+
+        Returns
+        -------
+        ndarray or None
+            The mask array or None.
+        """
+        if self._bsr is None:
+            return super()._create_mask_cache(d_inputs)
+
+        if d_inputs._in_matvec_context():
+            input_names = d_inputs._names
+
+            if any(key[1] in input_names for key in self._metadata):
+                mask = np.zeros(self._flat.size, dtype=bool)
+                for key in self._metadata:
+                    if key[1] not in input_names:
+                        mask[self._get_entry_idxs(key)] = True
+
+                if np.any(mask):
+                    return mask.reshape(self._bsr.data.shape)
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        if self._bsr is None:
+            super().set_complex_step_mode(active)
+            return
+
+        bsr = self._bsr
+        if active:
+            if 'complex' not in bsr.dtype.__str__():
+                bsr.data = bsr.data.astype(complex)
+                if self._coo_data is not None:
+                    self._coo_data = self._coo_data.astype(complex)
+        else:
+            bsr.data = bsr.data.real.copy()
+            if self._coo_data is not None:
+                self._coo_data = self._coo_data.real.copy()
+
+        self._flat = bsr.data.reshape(-1)
+        self._bsr_T = None
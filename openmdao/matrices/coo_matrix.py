@@ -250,7 +250,7 @@ class COOMatrix(Matrix):
             for key, val in self._key_ranges.items():
                 if key[1] in input_names:
                     if mask is None:
-                        mask = np.ones(self._matrix.data.size, dtype=bool)
+                        mask = np.ones(self._coo.data.size, dtype=bool)
                     start, stop, _, _ = val
                     mask[start:stop] = False
 
@@ -1,7 +1,8 @@
 """Define the CSCmatrix class."""
-
+import numpy as np
 from scipy.sparse import csc_matrix
 
+from openmdao.core.constants import INT_DTYPE
 from openmdao.matrices.coo_matrix import COOMatrix
 
 
@@ -9,14 +10,37 @@ class CSCMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Col Storage format.
 
+    The sparsity structure of the CSC matrix is computed once when the matrix is built. If no
+    entries of the subjacs overlap, the subjacs are scattered directly into the CSC data.
+    Otherwise they're set into the COO data, and the repeated entries are summed into the CSC
+    data at the end of each update.
+
     Parameters
     ----------
     comm : MPI.Comm or <FakeComm>
         Communicator of the top-level system that owns the <Jacobian>.
     is_internal : bool
         If True, this is the int_mtx of an AssembledJacobian.
+
+    Attributes
+    ----------
+    _csc : csc_matrix
+        CSC matrix with a fixed sparsity structure.
+    _coo2csc : ndarray
+        Index into the CSC data of each entry of the COO data.
+    _has_repeats : bool
+        True if some entries of the COO data map to the same CSC entry.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(comm, is_internal)
+        self._csc = None
+        self._coo2csc = None
+        self._has_repeats = False
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -31,24 +55,66 @@ class CSCMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols, system)
-        self._coo = self._matrix
+        self._build_csc(num_cols)
+
+    def _build_csc(self, num_cols):
+        """
+        Compute the CSC sparsity structure from the COO matrix.
+
+        Parameters
+        ----------
+        num_cols : int
+            number of cols in the matrix.
+        """
+        self._coo = coo = self._matrix
+
+        # sort the COO entries by column, then row, and find the first of each repeated entry
+        order = np.lexsort((coo.row, coo.col))
+        rows = coo.row[order]
+        cols = coo.col[order]
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+
+        indptr = np.zeros(num_cols + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(cols[first], minlength=num_cols), out=indptr[1:])
+
+        self._coo2csc = np.empty(order.size, dtype=INT_DTYPE)
+        self._coo2csc[order] = np.cumsum(first) - 1
+        self._has_repeats = not np.all(first)
+
+        self._csc = csc_matrix((np.zeros(np.count_nonzero(first), dtype=coo.data.dtype),
+                                rows[first], indptr), shape=coo.shape)
+
+        if not self._has_repeats:
+            # subjacs are set directly into the CSC data, so index it instead of the COO data
+            metadata = self._metadata
+            for key, (idxs, jac_type, factor) in metadata.items():
+                metadata[key] = (self._coo2csc[idxs], jac_type, factor)
+            self._matrix = self._csc
 
     def _pre_update(self):
         """
         Do anything that needs to be done at the start of AssembledJacobian._update.
         """
-        self._matrix = self._coo
+        if self._has_repeats:
+            self._matrix = self._coo
 
     def _post_update(self):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        coo = self._coo
-        # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        if self._has_repeats:
+            # add any repeated entries together
+            data = self._coo.data
+            csc = self._csc
+            if np.iscomplexobj(data):
+                if not np.iscomplexobj(csc.data):
+                    csc.data = csc.data.astype(complex)
+                csc.data.real = np.bincount(self._coo2csc, data.real, minlength=csc.data.size)
+                csc.data.imag = np.bincount(self._coo2csc, data.imag, minlength=csc.data.size)
+            else:
+                csc.data[:] = np.bincount(self._coo2csc, data, minlength=csc.data.size)
+            self._matrix = csc
 
     def _convert_mask(self, mask):
         """
@@ -64,9 +130,7 @@ class CSCMatrix(COOMatrix):
         ndarray
             The converted mask array.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        return np.bincount(self._coo2csc, mask, minlength=self._csc.data.size) > 0
 
     def set_complex_step_mode(self, active):
         """
@@ -80,14 +144,12 @@ class CSCMatrix(COOMatrix):
         active : bool
             Complex mode flag; set to True prior to commencing complex step.
         """
-        if active:
-            if 'complex' not in self._matrix.dtype.__str__():
-                self._matrix.data = self._matrix.data.astype(complex)
-                self._matrix.dtype = complex
-                self._coo.data = self._coo.data.astype(complex)
-                self._coo.dtype = complex
-        else:
-            self._matrix.data = self._matrix.data.real
-            self._matrix.dtype = float
-            self._coo.data = self._coo.data.real
-            self._coo.dtype = float
+        for mtx in (self._csc, self._coo):
+            if active:
+                if 'complex' not in mtx.dtype.__str__():
+                    mtx.data = mtx.data.astype(complex)
+                    mtx.dtype = complex
+            else:
+                # the data must be contiguous for the LU factorization
+                mtx.data = mtx.data.real.copy()
+                mtx.dtype = float
@@ -19,8 +19,26 @@ class DenseMatrix(COOMatrix):
         Communicator of the top-level system that owns the <Jacobian>.
     is_internal : bool
         If True, this is the int_mtx of an AssembledJacobian.
+
+    Attributes
+    ----------
+    _dense : ndarray
+        Preallocated dense matrix that the COO data is scattered into.
+    _flat_idxs : ndarray
+        Index into the flattened dense matrix of each entry of the COO data.
+    _has_repeats : bool
+        True if some entries of the COO data map to the same dense entry.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(comm, is_internal)
+        self._dense = None
+        self._flat_idxs = None
+        self._has_repeats = False
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -35,7 +53,11 @@ class DenseMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols)
-        self._coo = self._matrix
+        self._coo = coo = self._matrix
+
+        self._flat_idxs = coo.row * num_cols + coo.col
+        self._has_repeats = np.unique(self._flat_idxs).size < self._flat_idxs.size
+        self._dense = np.zeros((num_rows, num_cols), dtype=coo.data.dtype)
 
     def _prod(self, in_vec, mode, mask=None):
         """
@@ -118,5 +140,16 @@ class DenseMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        # this will add any repeated entries together
-        self._matrix = self._coo.toarray()
+        data = self._coo.data
+        dense = self._dense
+        if dense.dtype != data.dtype:
+            self._dense = dense = np.zeros(dense.shape, dtype=data.dtype)
+
+        if self._has_repeats:
+            # add any repeated entries together
+            dense[:] = 0.
+            np.add.at(dense.ravel(), self._flat_idxs, data)
+        else:
+            np.put(dense, self._flat_idxs, data)
+
+        self._matrix = dense
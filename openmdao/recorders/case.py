@@ -4,6 +4,7 @@ A Case class.
 
 import sys
 import itertools
+import json
 
 from fnmatch import fnmatchcase
 
@@ -41,6 +42,8 @@ class Case(object):
         Dictionary with information about variables (scaling, indices, execution order).
     data_format : int
         A version number specifying the format of array data, if not numpy arrays.
+    var_layouts : dict or None
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
 
     Attributes
     ----------
@@ -72,6 +75,9 @@ class Case(object):
         Absolute tolerance (None if not recorded).
     rel_err : float or None
         Relative tolerance (None if not recorded).
+    solver_stats : dict or None
+        Solver specific statistics of the iteration for a solver case, e.g., the number of
+        linearizations of a NewtonSolver (None if not recorded).
     _prom2abs : {'input': dict, 'output': dict}
         Dictionary mapping promoted names of all variables to absolute names.
     _abs2prom : {'input': dict, 'output': dict}
@@ -87,7 +93,7 @@ class Case(object):
     """
 
     def __init__(self, source, data, prom2abs, abs2prom, abs2meta, conns, var_info,
-                 data_format=-1):
+                 data_format=-1, var_layouts=None):
         """
         Initialize.
         """
@@ -120,6 +126,11 @@ class Case(object):
         self.abs_err = data['abs_err'] if 'abs_err' in data.keys() else None
         self.rel_err = data['rel_err'] if 'rel_err' in data.keys() else None
 
+        if 'solver_stats' in data.keys() and data['solver_stats'] is not None:
+            self.solver_stats = json.loads(data['solver_stats'])
+        else:
+            self.solver_stats = None
+
         # rename solver keys
         if 'solver_inputs' in data.keys():
             if not isinstance(data, dict):
@@ -136,7 +147,8 @@ class Case(object):
 
         if 'inputs' in data.keys():
             if data_format >= 3:
-                inputs = deserialize(data['inputs'], abs2meta, prom2abs, conns)
+                inputs = deserialize(data['inputs'], abs2meta, prom2abs, conns,
+                                     var_layouts)
             elif data_format in (1, 2):
                 inputs = blob_to_array(data['inputs'])
                 if type(inputs) is np.ndarray and not inputs.shape:
@@ -148,7 +160,8 @@ class Case(object):
 
         if 'outputs' in data.keys():
             if data_format >= 3:
-                outputs = deserialize(data['outputs'], abs2meta, prom2abs, conns)
+                outputs = deserialize(data['outputs'], abs2meta, prom2abs, conns,
+                                      var_layouts)
             elif self._format_version in (1, 2):
                 outputs = blob_to_array(data['outputs'])
                 if type(outputs) is np.ndarray and not outputs.shape:
@@ -161,7 +174,8 @@ class Case(object):
 
         if 'residuals' in data.keys():
             if data_format >= 3:
-                residuals = deserialize(data['residuals'], abs2meta, prom2abs, conns)
+                residuals = deserialize(data['residuals'], abs2meta, prom2abs, conns,
+                                        var_layouts)
             elif data_format in (1, 2):
                 residuals = blob_to_array(data['residuals'])
                 if type(residuals) is np.ndarray and not residuals.shape:
@@ -1,10 +1,10 @@
 """
 CaseReader factory function.
 """
-from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.sqlite_reader import SqliteCaseReader, _DEFAULT_CACHE_SIZE
 
 
-def CaseReader(filename, pre_load=True, metadata_filename=None):
+def CaseReader(filename, pre_load=True, metadata_filename=None, cache_size=_DEFAULT_CACHE_SIZE):
     """
     Return a CaseReader for the given file.
 
@@ -14,13 +14,16 @@ def CaseReader(filename, pre_load=True, metadata_filename=None):
         A path to the recorded file.
         Currently only sqlite database files recorded via SqliteRecorder are supported.
     pre_load : bool
-        If True, load all the data into memory during initialization.
+        If True, load the data into memory during initialization, up to cache_size.
     metadata_filename : str
         For separate metadata from parallel runs, the metadata database filename.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache the decoded cases of each case
+        table. The least recently used cases are dropped first. If None, the cache is unbounded.
 
     Returns
     -------
     BaseCaseReader
         An instance of a CaseReader.
     """
-    return SqliteCaseReader(filename, pre_load, metadata_filename)
+    return SqliteCaseReader(filename, pre_load, metadata_filename, cache_size)
@@ -0,0 +1,288 @@
+"""
+Class definition for CheckpointRecorder, which saves checkpoints that a run can be restarted from.
+"""
+import os
+import pickle
+
+from openmdao import __version__ as openmdao_version
+from openmdao.core.driver import Driver
+from openmdao.core.problem import Problem
+from openmdao.recorders.case_recorder import CaseRecorder, PICKLE_VER
+from openmdao.utils.mpi import MPI
+
+
+# Version of the checkpoint file contents
+#
+# 1 -- Raw root vector arrays, discrete values, iteration counts, driver and solver state.
+CHECKPOINT_VERSION = 1
+
+
+def _get_checkpoint_path(problem, filepath):
+    """
+    Return the path of the checkpoint file for this process.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem being checkpointed.
+    filepath : str or Path
+        The path of the checkpoint.
+
+    Returns
+    -------
+    str
+        The path of the checkpoint file, which has the rank appended when running under MPI.
+    """
+    comm = problem.comm
+    if MPI and comm.size > 1:
+        return f'{filepath}_{comm.rank}'
+    return str(filepath)
+
+
+def save_checkpoint(problem, filepath):
+    """
+    Save a checkpoint of the current state of a problem.
+
+    The checkpoint holds the raw data of the root nonlinear and linear vectors, the values
+    of discrete variables, the iteration counts of the systems, and the internal state of the
+    driver and of any solvers that can be warm started. Under MPI, each process writes the
+    local part of the vectors to its own file, <filepath>_<rank>.
+
+    The file is written to a temporary file first and then moved into place, so an existing
+    checkpoint is never left partially written.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem to checkpoint.
+    filepath : str or Path
+        The path of the checkpoint.
+    """
+    model = problem.model
+
+    vectors = {}
+    for vec_name, vecs in (('nonlinear', model.get_nonlinear_vectors()),
+                           ('linear', model.get_linear_vectors())):
+        vectors[vec_name] = {kind: vec.asarray(copy=True)
+                             for kind, vec in zip(('input', 'output', 'residual'), vecs)}
+
+    iter_counts = {}
+    solvers = {}
+    for system in model.system_iter(include_self=True, recurse=True):
+        iter_counts[system.pathname] = (system.iter_count, system.iter_count_apply,
+                                        system.iter_count_without_approx)
+
+        for solver_name, solver in (('nonlinear_solver', system._nonlinear_solver),
+                                    ('linear_solver', system._linear_solver)):
+            if solver is not None:
+                state = solver._get_restart_state()
+                if state is not None:
+                    solvers[system.pathname, solver_name] = state
+
+    checkpoint = {
+        'version': CHECKPOINT_VERSION,
+        'openmdao_version': openmdao_version,
+        'model_hash': model._generate_md5_hash(),
+        'vectors': vectors,
+        'discrete': {
+            'input': dict(model._discrete_inputs.items()),
+            'output': dict(model._discrete_outputs.items()),
+        },
+        'iter_counts': iter_counts,
+        'solvers': solvers,
+        'driver': problem.driver._get_restart_state(),
+    }
+
+    path = _get_checkpoint_path(problem, filepath)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(checkpoint, f, PICKLE_VER)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(problem, filepath):
+    """
+    Restore the state of a problem from a checkpoint.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem to restore, which must have the same model as the checkpointed problem.
+    filepath : str or Path
+        The path of the checkpoint.
+    """
+    path = _get_checkpoint_path(problem, filepath)
+    with open(path, 'rb') as f:
+        checkpoint = pickle.load(f)
+
+    model = problem.model
+
+    if checkpoint['model_hash'] != model._generate_md5_hash():
+        raise ValueError(f"{problem.msginfo}: The checkpoint '{path}' was saved from a "
+                         "different model.")
+
+    for vec_name, vecs in (('nonlinear', model.get_nonlinear_vectors()),
+                           ('linear', model.get_linear_vectors())):
+        for kind, vec in zip(('input', 'output', 'residual'), vecs):
+            data = checkpoint['vectors'][vec_name][kind]
+            if data.size != vec.asarray().size:
+                raise ValueError(f"{problem.msginfo}: The size of the {vec_name} {kind} vector "
+                                 f"in the checkpoint '{path}' ({data.size}) does not match the "
+                                 f"size of the model's vector ({vec.asarray().size}).")
+            vec.set_val(data)
+
+    for kind, discrete in (('input', model._discrete_inputs),
+                           ('output', model._discrete_outputs)):
+        for name, val in checkpoint['discrete'][kind].items():
+            if name in discrete:
+                discrete[name] = val
+
+    iter_counts = checkpoint['iter_counts']
+    solvers = checkpoint['solvers']
+    for system in model.system_iter(include_self=True, recurse=True):
+        try:
+            system.iter_count, system.iter_count_apply, system.iter_count_without_approx = \
+                iter_counts[system.pathname]
+        except KeyError:
+            pass
+
+        for solver_name, solver in (('nonlinear_solver', system._nonlinear_solver),
+                                    ('linear_solver', system._linear_solver)):
+            state = solvers.get((system.pathname, solver_name))
+            if solver is not None and state is not None:
+                solver._set_restart_state(state)
+
+    problem.driver._set_restart_state(checkpoint['driver'])
+
+
+class CheckpointRecorder(CaseRecorder):
+    """
+    Recorder that saves a checkpoint of the problem each time an iteration is recorded.
+
+    The checkpoint is overwritten each time, so it always holds the latest recorded iteration.
+    A problem can be restarted from it with Problem.restart_from. The 'every' and
+    'min_interval_seconds' recording options of the driver control how often it is saved.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path of the checkpoint file. If it has no directory, the file is saved in the
+        outputs directory of the problem.
+
+    Attributes
+    ----------
+    _filepath : str or Path
+        Path of the checkpoint file.
+    _use_outputs_dir : bool
+        Flag indicating if the checkpoint is being saved in the problem outputs dir.
+    """
+
+    def __init__(self, filepath):
+        """
+        Initialize the CheckpointRecorder.
+        """
+        self._filepath = str(filepath)
+        self._use_outputs_dir = not (os.path.sep in self._filepath or '/' in self._filepath)
+
+        super().__init__(record_viewer_data=False)
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare for a new run.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or <FakeComm> or None
+            The MPI communicator for the recorder (should be the comm for the Problem).
+        """
+        if isinstance(recording_requester, Driver):
+            problem = recording_requester._problem()
+        elif isinstance(recording_requester, Problem):
+            problem = recording_requester
+        else:
+            raise TypeError(f"{recording_requester.msginfo}: A CheckpointRecorder can only be "
+                            "attached to a Problem or a Driver.")
+
+        super().startup(recording_requester, comm)
+
+        if self._use_outputs_dir:
+            self._filepath = problem.get_outputs_dir(mkdir=True) / self._filepath
+            self._use_outputs_dir = False
+
+    def record_iteration(self, recording_requester, data, metadata, **kwargs):
+        """
+        Save a checkpoint of the problem.
+
+        Every process saves a checkpoint, since each holds its own part of the model vectors.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver or Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict, optional
+            Dictionary containing execution metadata.
+        **kwargs : keyword args
+            Some implementations of record_iteration need additional args.
+        """
+        if isinstance(recording_requester, Driver):
+            problem = recording_requester._problem()
+        else:
+            problem = recording_requester
+
+        save_checkpoint(problem, self._filepath)
+
+    def record_metadata_system(self, system, run_number=None):
+        """
+        Record system metadata (not needed for a checkpoint).
+
+        Parameters
+        ----------
+        system : System
+            The System for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+        """
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """
+        Record solver metadata (not needed for a checkpoint).
+
+        Parameters
+        ----------
+        solver : Solver
+            The Solver for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+        """
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver (not needed for a checkpoint).
+
+        Parameters
+        ----------
+        recording_requester : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        """
+        Record model viewer data (not needed for a checkpoint).
+
+        Parameters
+        ----------
+        model_viewer_data : dict
+            Data required to visualize the model.
+        """
+        pass
@@ -0,0 +1,573 @@
+"""
+Merge the case recorder files written by the recording processes of a parallel run.
+
+When a SqliteRecorder records on multiple processors, the cases from each rank are written to
+a separate file, <filename>_<rank>, and the common metadata is written to <filename>_meta.
+The functions in this module combine those files into a single case recorder file that can be
+read with a CaseReader like any serial recording.
+"""
+import argparse
+import heapq
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import closing
+
+import numpy as np
+
+from openmdao.utils.record_util import check_valid_sqlite3_db
+from openmdao.utils.om_warnings import issue_warning
+
+
+# map record types (as found in global_iterations) to the tables holding the case data
+_case_tables = {
+    'driver': 'driver_iterations',
+    'system': 'system_iterations',
+    'solver': 'solver_iterations',
+    'problem': 'problem_cases',
+}
+
+_metadata_tables = ('metadata', 'driver_metadata', 'system_metadata', 'solver_metadata')
+
+# columns that may hold packed binary variable data, which starts with a var_layouts id
+_data_columns = ('inputs', 'outputs', 'residuals',
+                 'solver_inputs', 'solver_output', 'solver_residuals')
+
+# number of chunks of cases that each reader thread may read ahead of the writer
+_READ_AHEAD = 2
+
+
+def get_case_files(filepath):
+    """
+    Find the case recorder files written by the recording ranks of a parallel run.
+
+    Parameters
+    ----------
+    filepath : str
+        The filename given to the SqliteRecorder.
+
+    Returns
+    -------
+    list of str
+        The case files, <filepath>_<rank>, ordered by rank.
+    str or None
+        The metadata file, <filepath>_meta, or None if it does not exist.
+    """
+    dirname, basename = os.path.split(filepath)
+    rank_re = re.compile(re.escape(basename) + r'_(\d+)')
+
+    ranks = []
+    for name in os.listdir(dirname or '.'):
+        match = rank_re.fullmatch(name)
+        if match:
+            ranks.append((int(match.group(1)), os.path.join(dirname, name)))
+
+    metadata_filepath = f'{filepath}_meta'
+    if not os.path.isfile(metadata_filepath):
+        metadata_filepath = None
+
+    return [path for _, path in sorted(ranks)], metadata_filepath
+
+
+def merge_cases(filepaths, out_filepath, metadata_filepath=None, chunk_size=100):
+    """
+    Merge case recorder files into a single case recorder file.
+
+    The cases are streamed from all of the input files concurrently, each file being read in a
+    separate thread, and interleaved in the order in which they were recorded (according to
+    their timestamps, which are only comparable between processes on the same machine), so the
+    memory used does not depend on the number of cases. The merged cases are assigned a single
+    counter and the metadata, which may be recorded separately or duplicated in each input file,
+    is recorded once.
+
+    Parameters
+    ----------
+    filepaths : str or list of str
+        The case recorder files to merge. If a single filename is given that is not itself a
+        case recorder file, it is taken to be the filename given to a SqliteRecorder that
+        recorded on multiple processors and the per rank case files are merged.
+    out_filepath : str
+        The path of the merged case recorder file. An existing file will be overwritten.
+    metadata_filepath : str or None
+        The file holding the metadata for the cases, if it was recorded separately.
+        If None, the <filename>_meta file corresponding to the first case file is used
+        if it exists.
+    chunk_size : int
+        The number of cases that are read from an input file or written to the merged file
+        at a time.
+
+    Returns
+    -------
+    int
+        The number of cases in the merged file.
+    """
+    if isinstance(filepaths, str):
+        if os.path.isfile(filepaths):
+            filepaths = [filepaths]
+        else:
+            base, (filepaths, meta) = filepaths, get_case_files(filepaths)
+            if not filepaths:
+                raise IOError(f"No case recorder files were found for '{base}'.")
+            if metadata_filepath is None:
+                metadata_filepath = meta
+    else:
+        filepaths = list(filepaths)
+        if not filepaths:
+            raise ValueError("No case recorder files were given to merge.")
+
+    if metadata_filepath is None:
+        meta = re.sub(r'^(.*)_(\d+)$', r'\1_meta', filepaths[0])
+        if meta != filepaths[0] and os.path.isfile(meta):
+            metadata_filepath = meta
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1 but {chunk_size} was given.")
+
+    for path in filepaths:
+        check_valid_sqlite3_db(path)
+        if os.path.abspath(path) == os.path.abspath(out_filepath):
+            raise ValueError(f"The merged case recorder file, {out_filepath}, cannot be one of "
+                             "the files being merged.")
+    if metadata_filepath is not None:
+        check_valid_sqlite3_db(metadata_filepath)
+
+    try:
+        os.remove(out_filepath)
+        issue_warning(f'The existing case recorder file, {out_filepath}, is being overwritten.',
+                      category=UserWarning)
+    except OSError:
+        pass
+
+    with closing(sqlite3.connect(out_filepath)) as con:
+        meta_sources = [path for path in [metadata_filepath] + filepaths if path is not None]
+        _create_tables(con, filepaths[0], meta_sources)
+        _merge_metadata(con, meta_sources)
+        layout_maps = _merge_layouts(con, filepaths)
+        count = _merge_iterations(con, filepaths, layout_maps, chunk_size)
+        _merge_derivatives(con, filepaths)
+
+    return count
+
+
+def _get_tables(con):
+    """
+    Return the names of the tables in a database.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        The database connection.
+
+    Returns
+    -------
+    set of str
+        The table names.
+    """
+    return {row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+
+def _get_columns(con, table):
+    """
+    Return the column names of a table.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        The database connection.
+    table : str
+        The table name.
+
+    Returns
+    -------
+    list of str
+        The column names, in order.
+    """
+    return [row[1] for row in con.execute(f"PRAGMA table_info({table})")]
+
+
+def _create_tables(con, case_filepath, meta_filepaths):
+    """
+    Create the tables and indexes of the merged file using those of the files being merged.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged file.
+    case_filepath : str
+        A case recorder file holding the case tables.
+    meta_filepaths : list of str
+        The files that may hold the metadata tables, in order of preference.
+    """
+    with closing(sqlite3.connect(case_filepath)) as src:
+        schema = src.execute("SELECT type, tbl_name, sql FROM sqlite_master "
+                             "WHERE sql IS NOT NULL ORDER BY type DESC").fetchall()
+
+    with con:
+        for _, table, sql in schema:
+            if table not in _metadata_tables:
+                con.execute(sql)
+
+        for path in meta_filepaths:
+            with closing(sqlite3.connect(path)) as src:
+                if 'metadata' in _get_tables(src):
+                    for (sql,) in src.execute("SELECT sql FROM sqlite_master WHERE type='table' "
+                                              f"AND name IN {_metadata_tables}"):
+                        con.execute(sql)
+                    return
+
+    raise RuntimeError("No metadata was found for the case recorder files being merged.")
+
+
+def _merge_metadata(con, meta_filepaths):
+    """
+    Copy the metadata of the files being merged, keeping a single copy of each entry.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged file.
+    meta_filepaths : list of str
+        The files that may hold the metadata tables, in order of preference.
+    """
+    for path in meta_filepaths:
+        con.execute("ATTACH DATABASE ? AS src", (path,))
+        try:
+            with con:
+                tables = {row[0] for row in con.execute("SELECT name FROM src.sqlite_master "
+                                                        "WHERE type='table'")}
+                if 'metadata' in tables and \
+                        con.execute("SELECT count(*) FROM main.metadata").fetchone()[0] == 0:
+                    con.execute("INSERT INTO main.metadata SELECT * FROM src.metadata")
+                for table in _metadata_tables[1:]:
+                    if table in tables:
+                        con.execute(f"INSERT OR IGNORE INTO main.{table} "
+                                    f"SELECT * FROM src.{table}")
+        finally:
+            con.execute("DETACH DATABASE src")
+
+
+def _merge_layouts(con, filepaths):
+    """
+    Copy the variable layouts of the files being merged, keeping a single copy of each layout.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged file.
+    filepaths : list of str
+        The case recorder files being merged.
+
+    Returns
+    -------
+    list of dict
+        For each file, a dictionary mapping its layout ids to the layout ids in the merged file.
+    """
+    layout_ids = {}
+    layout_maps = []
+
+    for path in filepaths:
+        layout_map = {}
+        with closing(sqlite3.connect(path)) as src:
+            if 'var_layouts' in _get_tables(src):
+                for layout_id, layout in src.execute("SELECT id, layout FROM var_layouts"):
+                    layout = bytes(layout)
+                    try:
+                        layout_map[layout_id] = layout_ids[layout]
+                    except KeyError:
+                        layout_map[layout_id] = layout_ids[layout] = len(layout_ids) + 1
+        layout_maps.append(layout_map)
+
+    if layout_ids:
+        with con:
+            con.executemany("INSERT INTO var_layouts(id, layout) VALUES(?,?)",
+                            [(layout_id, sqlite3.Binary(layout))
+                             for layout, layout_id in layout_ids.items()])
+
+    return layout_maps
+
+
+def _read_cases(filepath, file_idx, layout_map, chunk_size, out_queue, stop):
+    """
+    Read the cases from a case recorder file in the order they were recorded.
+
+    This runs in a separate thread for each file. The cases are put on the queue in chunks as
+    tuples of (timestamp, file index, sequence number, record type, source, row), where the row
+    is a list of the column values with any packed variable data referring to the merged
+    layout ids. The timestamp is the latest one recorded up to and including the case.
+    The end of the cases is indicated by None and an error by the exception raised.
+
+    Parameters
+    ----------
+    filepath : str
+        The case recorder file.
+    file_idx : int
+        Index of the file in the list of files being merged.
+    layout_map : dict
+        Dictionary mapping the layout ids of the file to the layout ids in the merged file.
+    chunk_size : int
+        The number of cases to put on the queue at a time.
+    out_queue : queue.Queue
+        The queue that receives the chunks of cases.
+    stop : threading.Event
+        Set when the merge is abandoned, so that reading stops.
+    """
+    def put(item):
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        with closing(sqlite3.connect(filepath)) as con:
+            tables = _get_tables(con)
+            readers = {}
+            for record_type, table in _case_tables.items():
+                if table in tables:
+                    columns = _get_columns(con, table)
+                    blob_cols = [i for i, col in enumerate(columns) if col in _data_columns]
+                    readers[record_type] = (con.execute(f"SELECT * FROM {table} ORDER BY id"),
+                                            columns.index('timestamp'), blob_cols)
+
+            chunk = []
+            # a case can have an earlier timestamp than a case recorded before it (e.g. a system
+            # case and the solver iterations within it), so the latest timestamp so far is used
+            # to keep the cases of each file in the order they were recorded
+            timestamp = -np.inf
+            iterations = con.execute("SELECT record_type, rowid, source FROM global_iterations "
+                                     "ORDER BY id")
+            for seq, (record_type, rowid, source) in enumerate(iterations):
+                cur, ts_idx, blob_cols = readers[record_type]
+
+                row = cur.fetchone()
+                while row is not None and row[0] < rowid:
+                    row = cur.fetchone()
+                if row is None or row[0] != rowid:
+                    raise RuntimeError(f"{filepath}: {record_type} case {rowid} listed in "
+                                       "global_iterations was not found.")
+
+                row = list(row)
+                for i in blob_cols:
+                    blob = row[i]
+                    if isinstance(blob, bytes) and blob:
+                        layout_id = int(np.frombuffer(blob, dtype=np.int64, count=1)[0])
+                        row[i] = sqlite3.Binary(np.int64(layout_map[layout_id]).tobytes() +
+                                                blob[8:])
+
+                if row[ts_idx] is not None and row[ts_idx] > timestamp:
+                    timestamp = row[ts_idx]
+
+                chunk.append((timestamp, file_idx, seq, record_type, source, row))
+                if len(chunk) == chunk_size:
+                    if not put(chunk):
+                        return
+                    chunk = []
+
+            if chunk and not put(chunk):
+                return
+        put(None)
+    except Exception as err:
+        put(err)
+
+
+def _iter_queue(in_queue):
+    """
+    Yield the cases put on the queue by a reader thread.
+
+    Parameters
+    ----------
+    in_queue : queue.Queue
+        The queue of chunks of cases.
+
+    Yields
+    ------
+    tuple
+        The case data.
+    """
+    while True:
+        chunk = in_queue.get()
+        if chunk is None:
+            return
+        if isinstance(chunk, Exception):
+            raise chunk
+        yield from chunk
+
+
+def _merge_iterations(con, filepaths, layout_maps, chunk_size):
+    """
+    Copy the cases from the files being merged, renumbering them in the order they were recorded.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged file.
+    filepaths : list of str
+        The case recorder files being merged.
+    layout_maps : list of dict
+        For each file, a dictionary mapping its layout ids to the layout ids in the merged file.
+    chunk_size : int
+        The number of cases read or written at a time.
+
+    Returns
+    -------
+    int
+        The number of cases in the merged file.
+    """
+    # column names of each case table, which are the same in the merged file
+    inserts = {}
+    counter_cols = {}
+    delta_cols = {}
+    tables = _get_tables(con)
+    for record_type, table in _case_tables.items():
+        if table in tables:
+            columns = _get_columns(con, table)
+            inserts[record_type] = (f"INSERT INTO {table}({', '.join(columns)}) "
+                                    f"VALUES({', '.join('?' * len(columns))})")
+            counter_cols[record_type] = columns.index('counter')
+            if 'delta_base' in columns:
+                delta_cols[record_type] = columns.index('delta_base')
+
+    # only the files that recorded deltas need their keyframe ids mapped to the merged ids
+    has_deltas = []
+    for path in filepaths:
+        with closing(sqlite3.connect(path)) as src:
+            has_deltas.append({record_type for record_type in delta_cols
+                               if src.execute(f"SELECT 1 FROM {_case_tables[record_type]} "
+                                              "WHERE delta_base IS NOT NULL LIMIT 1").fetchone()})
+
+    stop = threading.Event()
+    queues = []
+    threads = []
+    for file_idx, path in enumerate(filepaths):
+        q = queue.Queue(maxsize=_READ_AHEAD)
+        thread = threading.Thread(target=_read_cases, daemon=True,
+                                  args=(path, file_idx, layout_maps[file_idx], chunk_size, q, stop))
+        queues.append(q)
+        threads.append(thread)
+        thread.start()
+
+    row_ids = dict.fromkeys(inserts, 0)
+    keyframes = {}
+    batches = {record_type: [] for record_type in inserts}
+    global_batch = []
+    counter = 0
+
+    def flush():
+        with con:
+            for record_type, batch in batches.items():
+                if batch:
+                    con.executemany(inserts[record_type], batch)
+                    batch.clear()
+            con.executemany("INSERT INTO global_iterations(record_type, rowid, source) "
+                            "VALUES(?,?,?)", global_batch)
+            global_batch.clear()
+
+    try:
+        cases = heapq.merge(*[_iter_queue(q) for q in queues])
+        for _, file_idx, _, record_type, source, row in cases:
+            counter += 1
+            row_ids[record_type] += 1
+            row_id = row_ids[record_type]
+
+            if record_type in delta_cols:
+                idx = delta_cols[record_type]
+                if row[idx] is not None:
+                    row[idx] = keyframes[file_idx, record_type, row[idx]]
+                elif record_type in has_deltas[file_idx]:
+                    keyframes[file_idx, record_type, row[0]] = row_id
+
+            row[0] = row_id
+            row[counter_cols[record_type]] = counter
+            batches[record_type].append(row)
+            global_batch.append((record_type, row_id, source))
+
+            if len(global_batch) == chunk_size:
+                flush()
+
+        flush()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return counter
+
+
+def _merge_derivatives(con, filepaths):
+    """
+    Copy the driver derivatives from the files being merged, using the merged case counters.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged file.
+    filepaths : list of str
+        The case recorder files being merged.
+    """
+    if 'driver_derivatives' not in _get_tables(con):
+        return
+
+    columns = _get_columns(con, 'driver_derivatives')[1:]
+    select = ', '.join('m.counter' if col == 'counter' else f's.{col}' for col in columns)
+
+    for path in filepaths:
+        con.execute("ATTACH DATABASE ? AS src", (path,))
+        try:
+            with con:
+                con.execute(f"INSERT INTO main.driver_derivatives({', '.join(columns)}) "
+                            f"SELECT {select} FROM src.driver_derivatives s "
+                            "LEFT JOIN main.driver_iterations m "
+                            "ON m.iteration_coordinate = s.iteration_coordinate ORDER BY s.id")
+        finally:
+            con.execute("DETACH DATABASE src")
+
+
+def _merge_cases_setup_parser(parser):
+    """
+    Set up the subparser for the 'openmdao merge_cases' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('files', nargs='+',
+                        help='Case recorder files to merge. If a single filename is given that '
+                             'is not itself a case recorder file, the files recorded by each '
+                             'rank of a parallel run with that filename are merged.')
+    parser.add_argument('-o', '--outfile', action='store', dest='outfile', required=True,
+                        help='Name of the merged case recorder file.')
+    parser.add_argument('-m', '--metadata', action='store', dest='metadata', default=None,
+                        help='Name of the file holding the metadata for the cases, if recorded '
+                             'separately. By default the <filename>_meta file is used if it '
+                             'exists.')
+    parser.add_argument('--chunk_size', action='store', dest='chunk_size', type=int, default=100,
+                        help='Number of cases read or written at a time.')
+
+
+def _merge_cases_cmd(options, user_args):
+    """
+    Run the merge_cases command.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    files = options.files[0] if len(options.files) == 1 else options.files
+    count = merge_cases(files, options.outfile, metadata_filepath=options.metadata,
+                        chunk_size=options.chunk_size)
+    print(f"Merged {count} cases into {options.outfile}.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    _merge_cases_setup_parser(parser)
+    args = parser.parse_args()
+    _merge_cases_cmd(args, None)
@@ -1,9 +1,30 @@
 """Management of iteration stack for recording."""
+import threading
 import weakref
 
 _norec_funcs = frozenset(['_run_apply', '_compute_totals'])
 
 
+class _RecIterationState(threading.local):
+    """
+    The iteration stack of a _RecIteration, kept separately by each thread.
+
+    Attributes
+    ----------
+    stack : list
+        A list that holds the stack of iteration coordinates.
+    norec_refcount : int
+        Number of coordinates on the stack whose function disables recording.
+    """
+
+    def __init__(self):
+        """
+        Initialize.
+        """
+        self.stack = []
+        self.norec_refcount = 0
+
+
 class _RecIteration(object):
     """
     A class that encapsulates the iteration stack.
@@ -13,12 +34,12 @@ class _RecIteration(object):
 
     Attributes
     ----------
-    stack : list
-        A list that holds the stack of iteration coordinates.
     prefix : str or None
         Prefix to prepend to iteration coordinates.
     rank : int
         The MPI rank to use when constructing iteration coordinates.
+    _state : _RecIterationState
+        The iteration stack of each thread.
     """
 
     def __init__(self, rank=0):
@@ -30,10 +51,47 @@ class _RecIteration(object):
         rank : int
             The rank to use when constructing iteration coordinates.
         """
-        self.stack = []
+        self._state = _RecIterationState()
         self.prefix = None
         self.rank = 0
-        self._norec_refcount = 0
+
+    @property
+    def stack(self):
+        """
+        Return the iteration stack of the calling thread.
+
+        Returns
+        -------
+        list
+            A list that holds the stack of iteration coordinates.
+        """
+        return self._state.stack
+
+    @stack.setter
+    def stack(self, stack):
+        """
+        Set the iteration stack of the calling thread.
+
+        Parameters
+        ----------
+        stack : list
+            A list that holds the stack of iteration coordinates.
+        """
+        state = self._state
+        state.stack = stack
+        state.norec_refcount = sum(1 for name, _ in stack if name in _norec_funcs)
+
+    @property
+    def _norec_refcount(self):
+        """
+        Return the number of coordinates on the stack of the calling thread that disable recording.
+
+        Returns
+        -------
+        int
+            Number of coordinates on the stack whose function disables recording.
+        """
+        return self._state.norec_refcount
 
     def print_recording_iteration_stack(self):
         """
@@ -83,9 +141,10 @@ class _RecIteration(object):
         iter_coord : tuple
             (func_name, iter_count) for the current iteration.
         """
-        self.stack.append(iter_coord)
+        state = self._state
+        state.stack.append(iter_coord)
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount += 1
+            state.norec_refcount += 1
 
     def pop(self):
         """
@@ -96,9 +155,10 @@ class _RecIteration(object):
         tuple
             (function_name, iter_count) for current iteration.
         """
-        iter_coord = self.stack.pop()
+        state = self._state
+        iter_coord = state.stack.pop()
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount -= 1
+            state.norec_refcount -= 1
         return iter_coord
 
 
@@ -3,6 +3,8 @@ RecordingManager class definition.
 """
 import time
 
+import numpy as np
+
 from openmdao.utils.om_warnings import issue_warning
 
 
@@ -14,6 +16,15 @@ class RecordingManager(object):
     ----------
     _recorders : list of CaseRecorder
         All of the recorders attached to the current object.
+    _num_iters : int
+        The number of iterations of the object since the start of the run.
+    _last_record_time : float or None
+        The time at which the last iteration of the object was recorded.
+    _best_objective : float or None
+        The best objective value recorded so far, for a Driver recording on improvement.
+    _pending_last : tuple or None
+        The iteration stack and recording args of the latest iteration that was not recorded
+        by an object that records its first and last iterations.
     """
 
     def __init__(self):
@@ -21,6 +32,7 @@ class RecordingManager(object):
         init.
         """
         self._recorders = []
+        self._reset_policy()
 
     def __getitem__(self, index):
         """
@@ -126,6 +138,112 @@ class RecordingManager(object):
         for recorder in self._recorders:
             recorder.record_derivatives(recording_requester, data, metadata)
 
+    def _reset_policy(self):
+        """
+        Reset the state of the recording policy at the start of a run.
+        """
+        self._num_iters = 0
+        self._last_record_time = None
+        self._best_objective = None
+        self._pending_last = None
+
+    def _start_solve(self):
+        """
+        Reset the iteration count of the recording policy at the start of a solver solve.
+
+        The 'every' and 'first_and_last' policies of a solver apply to the iterations of each
+        solve, while the minimum interval between recorded iterations still spans the run.
+        """
+        self._num_iters = 0
+        self._pending_last = None
+
+    def _check_policy(self, recording_requester, comm, **kwargs):
+        """
+        Check whether the current iteration of the requester should be recorded.
+
+        This is evaluated before any data is gathered for the iteration, so iterations that
+        are not recorded cost almost nothing.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        comm : MPI.Comm or <FakeComm>
+            The communicator of the requester.
+        **kwargs : dict
+            The args of the requester's record_iteration call.
+
+        Returns
+        -------
+        bool
+            True if the iteration should be recorded.
+        """
+        opts = recording_requester.recording_options
+        every = opts['every']
+        first_and_last = opts['first_and_last']
+        min_interval = opts['min_interval_seconds']
+        on_improvement = 'on_objective_improvement' in opts and opts['on_objective_improvement']
+
+        if every == 1 and not (first_and_last or min_interval or on_improvement):
+            return True
+
+        self._num_iters += 1
+        record = (self._num_iters - 1) % every == 0
+
+        if record and first_and_last and self._num_iters > 1:
+            record = False
+
+        objective = None
+        if record and on_improvement:
+            objectives = recording_requester.get_objective_values(driver_scaling=True)
+            if objectives:
+                objective = np.sum(next(iter(objectives.values())))
+                if self._best_objective is not None and not objective < self._best_objective:
+                    record = False
+
+        now = None
+        if record and min_interval:
+            now = time.perf_counter()
+            if self._last_record_time is not None and now - self._last_record_time < min_interval:
+                record = False
+            if comm.size > 1:
+                # all procs must agree, since gathering the data is collective
+                record = comm.bcast(record, root=0)
+
+        if record:
+            if now is not None:
+                self._last_record_time = now
+            if objective is not None:
+                self._best_objective = objective
+            self._pending_last = None
+        elif first_and_last:
+            self._pending_last = (list(recording_requester._recording_iter.stack), kwargs)
+
+        return record
+
+    def _record_pending(self, recording_requester):
+        """
+        Record the last iteration of the run, or of the solve for a solver, if it was not recorded.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        """
+        if self._pending_last is None:
+            return
+
+        stack, kwargs = self._pending_last
+        self._pending_last = None
+
+        # record with the iteration coordinate of the last iteration
+        rec_iter = recording_requester._recording_iter
+        saved, rec_iter.stack = rec_iter.stack, stack
+        try:
+            recording_requester._record_iteration(**kwargs)
+        finally:
+            rec_iter.stack = saved
+
     def has_recorders(self):
         """
         Are there any recorders managed by this RecordingManager.
@@ -165,6 +283,27 @@ def _get_all_requesters(problem):
                 yield nl.linesearch
 
 
+def _declare_policy_options(recording_options):
+    """
+    Declare the options that control which iterations of an object are recorded.
+
+    Parameters
+    ----------
+    recording_options : OptionsDictionary
+        The recording options of the Driver, System or Solver.
+    """
+    recording_options.declare('every', types=int, default=1, lower=1,
+                              desc='Record only every Nth iteration, starting with the first.')
+    recording_options.declare('first_and_last', types=bool, default=False,
+                              desc='Set to True to record only the first and last iterations of '
+                                   'each run, or of each solve for a solver.')
+    recording_options.declare('min_interval_seconds', types=(int, float), default=0., lower=0.,
+                              desc='Minimum time in seconds between recorded iterations.')
+    recording_options.declare('max_cases', types=int, default=None, allow_none=True, lower=1,
+                              desc='If set, only the latest max_cases cases are kept by the '
+                                   'recorders.')
+
+
 def _get_all_viewer_data_recorders(problem):
     for req in _get_all_requesters(problem):
         for r in req._rec_mgr._recorders:
@@ -209,6 +348,34 @@ def record_viewer_data(problem):
             recorder.record_viewer_data(viewer_data)
 
 
+def reset_recording_policies(problem):
+    """
+    Reset the recording policies of all recording requesters at the start of a run.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem being run.
+    """
+    for req in _get_all_requesters(problem):
+        if req._rec_mgr._recorders:
+            req._rec_mgr._reset_policy()
+
+
+def record_pending_iterations(problem):
+    """
+    Record the last iterations of the run that were held back by 'first_and_last' policies.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem being run.
+    """
+    for req in _get_all_requesters(problem):
+        if req._rec_mgr._recorders:
+            req._rec_mgr._record_pending(req)
+
+
 def record_model_options(problem, run_number):
     """
     Record the options for all systems and solvers in the model.
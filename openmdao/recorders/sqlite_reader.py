@@ -4,6 +4,7 @@ Definition of the SqliteCaseReader.
 import pathlib
 import sqlite3
 from collections import OrderedDict
+from bisect import bisect_left
 
 import sys
 import numpy as np
@@ -13,8 +14,11 @@ from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import Case
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.variable_table import write_source_table
-from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system, \
+    get_var_layouts, blob_to_structured_array, strip_iteration_counts, deserialize, \
+    dict_to_structured_array
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
+from openmdao.utils.units import unit_conversion, simplify_unit
 
 from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP
 
@@ -27,6 +31,21 @@ import re
 from json import loads as json_loads
 from io import TextIOBase
 
+# default approximate memory budget, in bytes, for the decoded cases cached by each case table
+_DEFAULT_CACHE_SIZE = 256 * 1024 ** 2
+
+# tables with fewer rows than this are not worth indexing when opening files that lack indexes
+_INDEX_MIN_ROWS = 10000
+
+# indexes used to look up cases by their iteration coordinate or name
+_case_indexes = {
+    'driv_iter_ind': ('driver_iterations', 'iteration_coordinate'),
+    'driv_deriv_iter_ind': ('driver_derivatives', 'iteration_coordinate'),
+    'prob_name_ind': ('problem_cases', 'case_name'),
+    'sys_iter_ind': ('system_iterations', 'iteration_coordinate'),
+    'solv_iter_ind': ('solver_iterations', 'iteration_coordinate'),
+}
+
 
 class UnknownType:
     """
@@ -123,6 +142,141 @@ def _safer_unpickle(s, desc, compressed=False):
     return data
 
 
+def _case_nbytes(case):
+    """
+    Estimate the memory used by the variable data of a case.
+
+    Parameters
+    ----------
+    case : Case
+        The case.
+
+    Returns
+    -------
+    int
+        The approximate number of bytes used by the case.
+    """
+    nbytes = sys.getsizeof(case)
+
+    for vals in (case.inputs, case.outputs, case.residuals, case.derivatives):
+        if vals is None:
+            continue
+        data = vals._values
+        if isinstance(data, (np.ndarray, np.void)):
+            nbytes += data.nbytes
+        else:
+            for val in data.values():
+                nbytes += val.nbytes if isinstance(val, np.ndarray) else sys.getsizeof(val)
+
+    return nbytes
+
+
+class _CaseCache(object):
+    """
+    A least recently used cache of decoded cases that stays within a memory budget.
+
+    Parameters
+    ----------
+    max_bytes : int or None
+        Approximate maximum memory used by the cached cases. If None, the cache is unbounded.
+
+    Attributes
+    ----------
+    max_bytes : int or None
+        Approximate maximum memory used by the cached cases. If None, the cache is unbounded.
+    nbytes : int
+        Approximate memory used by the cached cases.
+    evictions : int
+        Number of cases that have been dropped from the cache to stay within the budget.
+    _cases : OrderedDict
+        The cached cases and their sizes, from least to most recently used.
+    """
+
+    def __init__(self, max_bytes=None):
+        """
+        Initialize.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.evictions = 0
+        self._cases = OrderedDict()
+
+    def __len__(self):
+        """
+        Return the number of cached cases.
+
+        Returns
+        -------
+        int
+            The number of cached cases.
+        """
+        return len(self._cases)
+
+    def __contains__(self, key):
+        """
+        Check if a case is in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The case ID.
+
+        Returns
+        -------
+        bool
+            True if the case is in the cache.
+        """
+        return key in self._cases
+
+    def __getitem__(self, key):
+        """
+        Get a case from the cache and mark it as the most recently used.
+
+        Parameters
+        ----------
+        key : str
+            The case ID.
+
+        Returns
+        -------
+        Case
+            The cached case.
+        """
+        case = self._cases[key][0]
+        self._cases.move_to_end(key)
+        return case
+
+    def __setitem__(self, key, case):
+        """
+        Add a case to the cache, dropping the least recently used cases if over budget.
+
+        Parameters
+        ----------
+        key : str
+            The case ID.
+        case : Case
+            The case.
+        """
+        if key in self._cases:
+            self.nbytes -= self._cases.pop(key)[1]
+
+        nbytes = _case_nbytes(case)
+        self._cases[key] = (case, nbytes)
+        self.nbytes += nbytes
+
+        if self.max_bytes is not None:
+            while self.nbytes > self.max_bytes and self._cases:
+                self.nbytes -= self._cases.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all cases from the cache.
+        """
+        self._cases.clear()
+        self.nbytes = 0
+
+
 class SqliteCaseReader(BaseCaseReader):
     """
     A CaseReader specific to files created with SqliteRecorder.
@@ -132,9 +286,13 @@ class SqliteCaseReader(BaseCaseReader):
     filename : str or pathlib.Path
         The path to the filename containing the recorded data.
     pre_load : bool
-        If True, load all the data into memory during initialization.
+        If True, load the data into memory during initialization, up to the cache_size of
+        each case table.
     metadata_filename : str
         The path to the filename containing the recorded metadata, if separate.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache the decoded cases of each case
+        table. The least recently used cases are dropped first. If None, the cache is unbounded.
 
     Attributes
     ----------
@@ -166,9 +324,20 @@ class SqliteCaseReader(BaseCaseReader):
         Helper object for accessing cases from the problem_cases table.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _global_coords : list or None
+        The case ID of each of the global iterations, in order.
+    _global_counters : dict or None
+        Dictionary mapping case IDs to their position in the global iterations, starting at 1.
+    _global_children : dict or None
+        Dictionary mapping case IDs to the positions and IDs of their system and solver children.
+    _sorted_coords : tuple or None
+        The case IDs of the global iterations in sorted order and their positions.
+    _var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
     """
 
-    def __init__(self, filename, pre_load=False, metadata_filename=None):
+    def __init__(self, filename, pre_load=False, metadata_filename=None,
+                 cache_size=_DEFAULT_CACHE_SIZE):
         """Initialize."""
         super().__init__(filename, pre_load)
 
@@ -184,6 +353,10 @@ class SqliteCaseReader(BaseCaseReader):
         self._abs2meta = None
         self._conns = None
         self._global_iterations = None
+        self._global_coords = None
+        self._global_counters = None
+        self._global_children = None
+        self._sorted_coords = None
 
         filename = str(filename)
 
@@ -191,9 +364,15 @@ class SqliteCaseReader(BaseCaseReader):
             con.row_factory = sqlite3.Row
             cur = con.cursor()
 
+            # files from older versions may lack some of the indexes used to look up cases
+            self._create_indexes(con)
+
             # get the global iterations table, and save it as an attribute
             self._global_iterations = self._get_global_iterations(cur)
 
+            # get the layouts of any iteration data stored as packed binary
+            self._var_layouts = get_var_layouts(cur)
+
             # If separate metadata not specified, check the current db
             # to make sure it's there
             if metadata_filename is None:
@@ -241,19 +420,23 @@ class SqliteCaseReader(BaseCaseReader):
         var_info = self.problem_metadata['variables']
         self._driver_cases = DriverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, self._var_layouts,
+                                         cache_size)
         self._system_cases = SystemCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, self._var_layouts,
+                                         cache_size)
         self._solver_cases = SolverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, var_info)
+                                         self._conns, var_info, self._var_layouts,
+                                         cache_size)
         if self._format_version >= 2:
             self._problem_cases = ProblemCases(filename,
                                                self._format_version,
                                                self._global_iterations,
                                                self._prom2abs, self._abs2prom, self._abs2meta,
-                                               self._conns, var_info)
+                                               self._conns, var_info, self._var_layouts,
+                                               cache_size)
 
         # if requested, load all the iteration data into memory
         if pre_load:
@@ -400,6 +583,33 @@ class SqliteCaseReader(BaseCaseReader):
                 'solver_class': row[2]
             }
 
+    def _create_indexes(self, con):
+        """
+        Create any missing indexes used to look up cases in the larger tables of the database.
+
+        Parameters
+        ----------
+        con : sqlite3.Connection
+            Connection to the database.
+        """
+        cur = con.cursor()
+        cur.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')")
+        existing = {(row[0], row[1]) for row in cur.fetchall()}
+
+        for index, (table, column) in _case_indexes.items():
+            if ('index', index) in existing or ('table', table) not in existing:
+                continue
+            cur.execute(f"SELECT max(rowid) FROM {table}")  # nosec: trusted input
+            if (cur.fetchone()[0] or 0) < _INDEX_MIN_ROWS:
+                continue
+            try:
+                with con:
+                    con.execute(f"CREATE INDEX IF NOT EXISTS {index} "  # nosec: trusted input
+                                f"ON {table}({column})")
+            except sqlite3.OperationalError:
+                # the database is read-only or locked, so lookups will just be slower
+                return
+
     def _get_global_iterations(self, cur):
         """
         Get the global iterations table.
@@ -417,6 +627,117 @@ class SqliteCaseReader(BaseCaseReader):
         cur.execute('select * from global_iterations')
         return cur.fetchall()
 
+    def _get_global_coords(self):
+        """
+        Get the case ID of each of the global iterations.
+
+        Returns
+        -------
+        list
+            The case IDs of the global iterations, in order.
+        """
+        if self._global_coords is None:
+            tables = {
+                'driver': self._driver_cases,
+                'system': self._system_cases,
+                'solver': self._solver_cases,
+            }
+            if self._format_version >= 2:
+                tables['problem'] = self._problem_cases
+
+            coords = []
+            for global_iter in self._global_iterations:
+                table, row = global_iter[1], global_iter[2]
+                try:
+                    coords.append(tables[table]._get_row_key(row))
+                except KeyError:
+                    if table not in tables:
+                        raise RuntimeError('Unexpected table name in global iterations:', table)
+                    raise
+
+            self._global_coords = coords
+
+        return self._global_coords
+
+    def _get_global_counter(self, coord):
+        """
+        Get the position of a case in the global iterations.
+
+        Parameters
+        ----------
+        coord : str
+            The case ID.
+
+        Returns
+        -------
+        int or None
+            The position of the case in the global iterations, starting at 1, or None.
+        """
+        if self._global_counters is None:
+            counters = {}
+            for i, case_coord in enumerate(self._get_global_coords()):
+                counters.setdefault(case_coord, i + 1)
+            self._global_counters = counters
+
+        return self._global_counters.get(coord)
+
+    def _get_global_positions(self, coord, count):
+        """
+        Get the positions of the global iterations whose case ID starts with the given prefix.
+
+        Parameters
+        ----------
+        coord : str
+            The case ID prefix.
+        count : int
+            Only the first count global iterations are searched.
+
+        Returns
+        -------
+        list of int
+            The matching positions, in order.
+        """
+        if not coord:
+            return range(count)
+
+        if self._sorted_coords is None:
+            coords = self._get_global_coords()
+            order = sorted(range(len(coords)), key=coords.__getitem__)
+            self._sorted_coords = ([coords[i] for i in order], np.array(order, dtype=int))
+
+        # case IDs with a common prefix are contiguous when sorted
+        sorted_coords, order = self._sorted_coords
+        start = bisect_left(sorted_coords, coord)
+        end = bisect_left(sorted_coords, coord + chr(sys.maxunicode), start)
+
+        positions = np.sort(order[start:end])
+        return positions[positions < count].tolist()
+
+    def _get_global_children(self, coord):
+        """
+        Get the system and solver cases that are direct children of a case.
+
+        Parameters
+        ----------
+        coord : str
+            The case ID of the parent case.
+
+        Returns
+        -------
+        list of (int, str)
+            The position in the global iterations and the case ID of each child, in order.
+        """
+        if self._global_children is None:
+            children = {}
+            global_iters = self._global_iterations
+            for i, case_coord in enumerate(self._get_global_coords()):
+                if global_iters[i][1] in ('system', 'solver'):
+                    parent_coord = '|'.join(case_coord.split('|')[:-2])
+                    children.setdefault(parent_coord, []).append((i, case_coord))
+            self._global_children = children
+
+        return self._global_children.get(coord, [])
+
     def _load_cases(self):
         """
         Load all driver, solver, and system cases into memory.
@@ -747,15 +1068,13 @@ class SqliteCaseReader(BaseCaseReader):
                 elif flat:
                     # return list of cases from the source plus child cases
                     cases = []
-                    source_cases = case_table.get_cases(source)
-                    for case in source_cases:
-                        cases += self._list_cases_recurse_flat(case.name, out_stream=None)
+                    for case_id in case_table.list_cases(source):
+                        cases += self._list_cases_recurse_flat(case_id, out_stream=None)
                 else:
                     # return nested dict of cases from the source and child cases
                     cases = OrderedDict()
-                    source_cases = case_table.get_cases(source)
-                    for case in source_cases:
-                        cases.update(self._list_cases_recurse_nested(case.name))
+                    for case_id in case_table.list_cases(source):
+                        cases.update(self._list_cases_recurse_nested(case_id))
                     return cases
             elif '|' in source:
                 # source is a coordinate
@@ -795,27 +1114,17 @@ class SqliteCaseReader(BaseCaseReader):
         dict
             A nested dictionary of identified cases.
         """
-        solver_cases = self._solver_cases.list_cases()
-        system_cases = self._system_cases.list_cases()
-        driver_cases = self._driver_cases.list_cases()
-        if self._format_version >= 2:
-            problem_cases = self._problem_cases.list_cases()
         global_iters = self._global_iterations
+        global_coords = self._get_global_coords()
 
         if not coord:
             # will return all cases
             coord = ''
             parent_case_counter = len(global_iters)
-        elif coord in driver_cases:
-            parent_case_counter = self._driver_cases.get_case(coord).counter
-        elif coord in system_cases:
-            parent_case_counter = self._system_cases.get_case(coord).counter
-        elif coord in solver_cases:
-            parent_case_counter = self._solver_cases.get_case(coord).counter
-        elif coord in problem_cases:
-            parent_case_counter = self._problem_cases.get_case(coord).counter
         else:
-            raise RuntimeError('Case not found for coordinate:', coord)
+            parent_case_counter = self._get_global_counter(coord)
+            if parent_case_counter is None:
+                raise RuntimeError('Case not found for coordinate:', coord)
 
         cases = []
 
@@ -827,34 +1136,23 @@ class SqliteCaseReader(BaseCaseReader):
         current_table = None
         current_cases = []
 
-        for i in range(0, parent_case_counter):
-            global_iter = global_iters[i]
-            table, row = global_iter[1], global_iter[2]
-            if table == 'solver':
-                case_coord = solver_cases[row - 1]
-            elif table == 'system':
-                case_coord = system_cases[row - 1]
-            elif table == 'driver':
-                case_coord = driver_cases[row - 1]
-            elif table == 'problem':
-                case_coord = problem_cases[row - 1]
-            else:
-                raise RuntimeError('Unexpected table name in global iterations:', table)
+        for i in self._get_global_positions(coord, parent_case_counter):
+            table = global_iters[i][1]
+            case_coord = global_coords[i]
 
-            if case_coord.startswith(coord):
-                cases.append(case_coord)
-                self.source_cases_table[table].append(case_coord)
+            cases.append(case_coord)
+            self.source_cases_table[table].append(case_coord)
 
-                if out_stream:
-                    if not current_cases:
-                        current_table = table
-                        current_cases = {table: [case_coord]}
-                    elif table == current_table:
-                        current_cases[table].append(case_coord)
-                    else:
-                        source_cases.append(current_cases)
-                        current_table = table
-                        current_cases = {table: [case_coord]}
+            if out_stream:
+                if not current_cases:
+                    current_table = table
+                    current_cases = {table: [case_coord]}
+                elif table == current_table:
+                    current_cases[table].append(case_coord)
+                else:
+                    source_cases.append(current_cases)
+                    current_table = table
+                    current_cases = {table: [case_coord]}
 
         if out_stream:
             if current_cases:
@@ -877,41 +1175,20 @@ class SqliteCaseReader(BaseCaseReader):
         dict
             A nested dictionary of identified cases.
         """
-        solver_cases = self._solver_cases.list_cases()
-        system_cases = self._system_cases.list_cases()
-        driver_cases = self._driver_cases.list_cases()
-        global_iters = self._global_iterations
-
-        if coord in driver_cases:
-            parent_case = self._driver_cases.get_case(coord)
-        elif coord in system_cases:
-            parent_case = self._system_cases.get_case(coord)
-        elif coord in solver_cases:
-            parent_case = self._solver_cases.get_case(coord)
-        else:
+        parent_case_counter = self._get_global_counter(coord)
+        if parent_case_counter is None or \
+                self._global_iterations[parent_case_counter - 1][1] == 'problem':
             raise RuntimeError('Case not found for coordinate:', coord)
 
         cases = OrderedDict()
         children = OrderedDict()
-        cases[parent_case.name] = children
+        cases[coord] = children
 
-        # return all cases in the global iteration table that precede the given case
-        # and whose coordinate is prefixed by the given coordinate
-        for i in range(0, parent_case.counter - 1):
-            global_iter = global_iters[i]
-            table, row = global_iter[1], global_iter[2]
-            if table == 'solver':
-                case_coord = solver_cases[row - 1]
-                if case_coord.startswith(coord):
-                    parent_coord = '|'.join(case_coord.split('|')[:-2])
-                    if parent_coord == coord:
-                        children.update(self._list_cases_recurse_nested(case_coord))
-            elif table == 'system':
-                case_coord = system_cases[row - 1]
-                if case_coord.startswith(coord):
-                    parent_coord = '|'.join(case_coord.split('|')[:-2])
-                    if parent_coord == coord:
-                        children.update(self._list_cases_recurse_nested(case_coord))
+        # return all system and solver cases in the global iteration table that precede
+        # the given case and whose parent coordinate is the given coordinate
+        for i, case_coord in self._get_global_children(coord):
+            if i < parent_case_counter - 1:
+                children.update(self._list_cases_recurse_nested(case_coord))
 
         return cases
 
@@ -990,14 +1267,11 @@ class SqliteCaseReader(BaseCaseReader):
             global_iter = global_iters[case_id]
             table, row = global_iter[1], global_iter[2]
             if table == 'solver':
-                solver_cases = self._solver_cases.list_cases()
-                case_id = solver_cases[row - 1]
+                case_id = self._solver_cases._get_row_key(row)
             elif table == 'system':
-                system_cases = self._system_cases.list_cases()
-                case_id = system_cases[row - 1]
+                case_id = self._system_cases._get_row_key(row)
             elif table == 'driver':
-                driver_cases = self._driver_cases.list_cases()
-                case_id = driver_cases[row - 1]
+                case_id = self._driver_cases._get_row_key(row)
 
         if recurse:
             return self.get_cases(case_id, recurse=True)
@@ -1013,6 +1287,170 @@ class SqliteCaseReader(BaseCaseReader):
 
         raise RuntimeError('Case not found:', case_id)
 
+    def get_val_array(self, source, name, units=None, indices=None):
+        """
+        Get the value of a variable in every case from the given source as a single array.
+
+        Only the requested variable is decoded, no Case objects are created.
+
+        Parameters
+        ----------
+        source : {'problem', 'driver', <system hierarchy location>, <solver hierarchy location>}
+            Identifies the source of the cases. Child cases are not included.
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+        units : str, optional
+            Units to convert to before return.
+        indices : int or list of ints or tuple of ints or int ndarray or Iterable or None, optional
+            Indices or slice to return from the value in each case.
+
+        Returns
+        -------
+        list
+            The ids of the cases, in the order they were recorded.
+        ndarray
+            Array of shape (ncases, ...) containing the value of the variable in each case.
+        """
+        case_ids = []
+        chunks = []
+        for ids, vals in self.iter_val_array(source, name, units, indices, chunk_size=None):
+            case_ids.extend(ids)
+            chunks.append(vals)
+
+        if len(chunks) == 1:
+            return case_ids, chunks[0]
+
+        # no matching cases, but keep the shape of the variable so results can be stacked
+        try:
+            shape = self._get_var_meta(name).get('shape')
+        except KeyError:
+            shape = None
+
+        if shape is None:
+            return case_ids, np.zeros(0)
+
+        shape = tuple(shape)
+        if indices is not None:
+            shape = np.empty(shape)[indices].shape
+
+        return case_ids, np.empty((0, *shape))
+
+    def iter_val_array(self, source, name, units=None, indices=None, chunk_size=1000):
+        """
+        Iterate over the value of a variable in the cases from the given source in chunks.
+
+        Only one chunk of cases is read from the file at a time, so this can be used with
+        recordings that are too large to fit in memory.
+
+        Parameters
+        ----------
+        source : {'problem', 'driver', <system hierarchy location>, <solver hierarchy location>}
+            Identifies the source of the cases. Child cases are not included.
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+        units : str, optional
+            Units to convert to before return.
+        indices : int or list of ints or tuple of ints or int ndarray or Iterable or None, optional
+            Indices or slice to return from the value in each case.
+        chunk_size : int or None
+            Maximum number of cases in each chunk. If None, all cases are returned in one chunk.
+
+        Yields
+        ------
+        list
+            The ids of the cases in the chunk.
+        ndarray
+            Array of shape (ncases_in_chunk, ...) containing the value of the variable.
+        """
+        if source == 'problem':
+            if self._format_version < 2:
+                raise RuntimeError('No problem cases recorded (data format = %d).' %
+                                   self._format_version)
+            case_table = self._problem_cases
+        elif source == 'driver':
+            case_table = self._driver_cases
+        elif source in self._system_cases.list_sources():
+            case_table = self._system_cases
+        elif source in self._solver_cases.list_sources():
+            case_table = self._solver_cases
+        else:
+            raise RuntimeError('Source not found: %s' % source)
+
+        scale = offset = None
+        if units is not None:
+            base_units = self._get_units(name)
+            simp_units = simplify_unit(units)
+
+            if base_units is None:
+                msg = "Can't express variable '{}' with units of 'None' in units of '{}'."
+                raise TypeError(msg.format(name, simp_units))
+
+            try:
+                scale, offset = unit_conversion(base_units, simp_units)
+            except TypeError:
+                msg = "Can't express variable '{}' with units of '{}' in units of '{}'."
+                raise TypeError(msg.format(name, base_units, simp_units))
+
+        for ids, vals in case_table._iter_val_chunks(source, name, chunk_size):
+            if indices is not None:
+                vals = [val[indices] for val in vals]
+
+            vals = np.array(vals)
+
+            if scale is not None:
+                vals = (vals + offset) * scale
+
+            yield ids, vals
+
+    def _get_units(self, name):
+        """
+        Get the units for a variable name.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+
+        Returns
+        -------
+        str
+            Unit string.
+        """
+        return self._get_var_meta(name)['units']
+
+    def _get_var_meta(self, name):
+        """
+        Get the metadata for a variable name.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+
+        Returns
+        -------
+        dict
+            Metadata of the variable, or of its source if it is a connected input.
+        """
+        meta = self._abs2meta
+
+        if name in meta:
+            return meta[name]
+
+        prom2abs = self._prom2abs
+
+        if name in prom2abs['output']:
+            return meta[prom2abs['output'][name][0]]
+
+        elif name in prom2abs['input']:
+            return meta[self._conns[prom2abs['input'][name][0]]]
+
+        elif name in self.problem_metadata['variables']:
+            # This can happen if name is an alias.
+            return self.problem_metadata['variables'][name]
+
+        raise KeyError('Variable name "{}" not found.'.format(name))
+
 
 class CaseTable(object):
     """
@@ -1040,6 +1478,11 @@ class CaseTable(object):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache decoded cases. If None, the cache
+        is unbounded.
 
     Attributes
     ----------
@@ -1063,18 +1506,29 @@ class CaseTable(object):
         Dictionary of all model connections.
     _var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    _var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
     _sources : list
         List of sources of cases in the table.
     _keys : list
         List of keys of cases in the table.
-    _cases : dict
-        Dictionary mapping keys to cases that have already been loaded.
+    _source_keys : dict or None
+        Dictionary mapping each source to the keys of its cases in the table.
+    _row_keys : dict or None
+        Dictionary mapping row ids to case keys, if the row ids are not consecutive.
+    _row_sources : dict or None
+        Dictionary mapping row ids of the table to the source of the case in that row.
+    _cases : _CaseCache
+        Least recently used cache of cases that have already been loaded.
+    _has_deltas : bool
+        True if cases in the table may only record the variables that changed since an
+        earlier case.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
     """
 
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, var_layouts=None, cache_size=None):
         """
         Initialize.
         """
@@ -1088,11 +1542,17 @@ class CaseTable(object):
         self._abs2meta = abs2meta
         self._conns = conns
         self._var_info = var_info
+        self._var_layouts = var_layouts
 
         # cached keys/cases
         self._sources = None
         self._keys = None
-        self._cases = {}
+        self._source_keys = None
+        self._row_keys = None
+        self._row_sources = None
+        self._cases = _CaseCache(cache_size)
+
+        self._has_deltas = ver >= 16
 
     def count(self):
         """
@@ -1130,14 +1590,18 @@ class CaseTable(object):
         if not self._keys:
             with sqlite3.connect(self._filename) as con:
                 cur = con.cursor()
-                cur.execute(f"SELECT {self._index_name} FROM {self._table_name}"
+                cur.execute(f"SELECT id, {self._index_name} FROM {self._table_name}"
                             " ORDER BY id ASC")  # nosec trusted input
                 rows = cur.fetchall()
 
             con.close()
 
             # cache case list for future use
-            self._keys = [row[0] for row in rows]
+            self._keys = [row[1] for row in rows]
+
+            # cases may have been dropped by a recorder that only keeps the latest cases
+            if rows and rows[-1][0] != len(rows):
+                self._row_keys = {row[0]: row[1] for row in rows}
 
         if not source:
             # return all cases
@@ -1147,7 +1611,7 @@ class CaseTable(object):
             return [key for key in self._keys if key.startswith(source)]
         else:
             # source is a system or solver
-            return [key for key in self._keys if self._get_source(key) == source]
+            return list(self._get_source_keys().get(source, []))
 
     def get_cases(self, source=None, recurse=False, flat=False):
         """
@@ -1194,14 +1658,11 @@ class CaseTable(object):
                                  if get_source_system(key).startswith(source_sys)])
                 else:
                     cases = OrderedDict()
-                    for key in self._keys:
-                        case_source = self._get_source(key)
-                        if case_source == source:
-                            cases[key] = self.get_cases(key, recurse, flat)
+                    for key in self._get_source_keys().get(source, []):
+                        cases[key] = self.get_cases(key, recurse, flat)
                     return cases
             else:
-                return [self.get_case(key) for key in self._keys
-                        if self._get_source(key) == source]
+                return [self.get_case(key) for key in self._get_source_keys().get(source, [])]
 
     def get_case(self, case_id, cache=False):
         """
@@ -1234,6 +1695,8 @@ class CaseTable(object):
             cur.execute(f"SELECT * FROM {self._table_name} "  # nosec: trusted input
                         f"WHERE {self._index_name}=?", (case_id, ))
             row = cur.fetchone()
+            if row is not None:
+                row = self._apply_deltas(row, cur)
 
         con.close()
 
@@ -1252,7 +1715,8 @@ class CaseTable(object):
                 source = self._get_source(row[self._index_name])
 
             case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._var_info, self._format_version)
+                        self._conns, self._var_info, self._format_version,
+                        self._var_layouts)
 
             # cache it if requested
             if cache:
@@ -1262,6 +1726,76 @@ class CaseTable(object):
         else:
             return None
 
+    def _apply_deltas(self, row, cur):
+        """
+        Reconstruct the full data of a case that only recorded the variables that changed.
+
+        Parameters
+        ----------
+        row : sqlite3.Row
+            The row of the case.
+        cur : sqlite3.Cursor
+            Database cursor to use for reading the earlier cases the case is relative to.
+
+        Returns
+        -------
+        sqlite3.Row or dict
+            The row, with all recorded variables if it only recorded changes.
+        """
+        if not self._has_deltas or row['delta_base'] is None:
+            return row
+
+        if self._table_name == 'solver_iterations':
+            columns = ('solver_inputs', 'solver_output', 'solver_residuals')
+        else:
+            columns = ('inputs', 'outputs', 'residuals')
+
+        # the full case and every case since then, up to this one, hold the latest values
+        base = row['delta_base']
+        cur.execute(f"SELECT {', '.join(columns)} FROM {self._table_name} "  # nosec: trusted
+                    "WHERE (id=? OR delta_base=?) AND id<=? ORDER BY id ASC",
+                    (base, base, row['id']))
+
+        merged = [{} for _ in columns]
+        for delta_row in cur.fetchall():
+            for values, data in zip(merged, delta_row):
+                if data is None:
+                    continue
+                data = deserialize(data, self._abs2meta, self._prom2abs, self._conns,
+                                   self._var_layouts)
+                if isinstance(data, np.ndarray):
+                    values.update((name, data[name][0]) for name in data.dtype.names)
+                elif data:
+                    values.update(data)
+
+        row = dict(zip(row.keys(), row))
+        for column, values in zip(columns, merged):
+            if all(isinstance(val, (np.ndarray, np.number)) for val in values.values()):
+                # numeric values are stored as a structured array, as when recorded in full
+                values = dict_to_structured_array(values)
+            row[column] = values
+
+        return row
+
+    def _get_row_key(self, row_id):
+        """
+        Return the key of the case in the given row of the table.
+
+        Parameters
+        ----------
+        row_id : int
+            The id of the row.
+
+        Returns
+        -------
+        str
+            The key of the case.
+        """
+        keys = self.list_cases()
+        if self._row_keys is None:
+            return keys[row_id - 1]
+        return self._row_keys[row_id]
+
     def _get_iteration_coordinate(self, case_idx):
         """
         Return the iteration coordinate for the indexed case (handles negative indices, etc.).
@@ -1298,13 +1832,16 @@ class CaseTable(object):
         with sqlite3.connect(self._filename) as con:
             con.row_factory = sqlite3.Row
             cur = con.cursor()
+            delta_cur = con.cursor()
             cur.execute(f"SELECT * FROM {self._table_name} ORDER BY id ASC")  # nosec: trusted input
             # rows = cur.fetchall()
             for row in cur:
+                row = self._apply_deltas(row, delta_cur)
                 case_id = row[self._index_name]
                 source = self._get_source(case_id)
                 case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._var_info, self._format_version)
+                            self._conns, self._var_info, self._format_version,
+                            self._var_layouts)
                 if cache:
                     self._cases[case_id] = case
                 yield case
@@ -1313,10 +1850,12 @@ class CaseTable(object):
 
     def _load_cases(self):
         """
-        Load all cases into memory.
+        Load cases into memory until the cache is full.
         """
         for case in self.cases(cache=True):
-            pass
+            if self._cases.evictions:
+                # out of room, the remaining cases will be loaded when requested
+                break
 
     def list_sources(self):
         """
@@ -1340,10 +1879,39 @@ class CaseTable(object):
                             sources.add(source)
                 self._sources = sources
             else:
-                self._sources = set([self._get_source(case) for case in self.list_cases()])
+                self._sources = set(self._get_source_keys())
 
         return self._sources
 
+    def _get_source_keys(self):
+        """
+        Get the keys of the cases in the table grouped by their source.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each source to the keys of its cases, in order.
+        """
+        if self._source_keys is None:
+            keys = self.list_cases()
+
+            # the source only depends on the parts of the key other than the iteration counts
+            sources = {}
+            source_keys = {}
+            for key, pattern in zip(keys, strip_iteration_counts(keys)):
+                try:
+                    source = sources[pattern]
+                except KeyError:
+                    source = sources[pattern] = self._get_source(key)
+                try:
+                    source_keys[source].append(key)
+                except KeyError:
+                    source_keys[source] = [key]
+
+            self._source_keys = source_keys
+
+        return self._source_keys
+
     def _get_source(self, iteration_coordinate):
         """
         Get the source of the iteration.
@@ -1374,12 +1942,189 @@ class CaseTable(object):
         str
             The source of the case.
         """
-        table = self._table_name.partition('_')[0]  # remove "_iterations" from table name
+        if self._row_sources is None:
+            table = self._table_name.partition('_')[0]  # remove "_iterations" from table name
+
+            row_sources = {}
+            for global_iter in self._global_iterations:
+                if global_iter[1] == table:
+                    row_sources.setdefault(global_iter[2], global_iter[3])
+            self._row_sources = row_sources
+
+        return self._row_sources.get(row_id)
+
+    def _iter_val_chunks(self, source, name, chunk_size=None):
+        """
+        Iterate over the values of a variable in the cases from a source, decoding only it.
+
+        Parameters
+        ----------
+        source : str
+            The source of the cases.
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+        chunk_size : int or None
+            Maximum number of rows read at a time. If None, all rows are read at once.
+
+        Yields
+        ------
+        list
+            The ids of the cases in the chunk.
+        list
+            The value of the variable in each case of the chunk.
+        """
+        if self._format_version < 8:
+            # not all tables record outputs and inputs, so fall back to full cases
+            ids = self.list_cases(source)
+            step = chunk_size or max(len(ids), 1)
+            for i in range(0, len(ids), step):
+                chunk = ids[i:i + step]
+                yield chunk, [self.get_case(case_id)[name] for case_id in chunk]
+            return
+
+        if self._table_name == 'solver_iterations':
+            columns = 'solver_output, solver_inputs'
+        else:
+            columns = 'outputs, inputs'
+
+        if self._has_deltas:
+            columns += ', id, delta_base'
+        else:
+            columns += ', NULL, NULL'
+
+        keys = {}
+        source_keys = set(self._get_source_keys().get(source, ()))
+
+        # latest value of the variable for the cases relative to each full case
+        latest = {}
+
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT {self._index_name}, {columns} FROM "  # nosec: trusted input
+                        f"{self._table_name} ORDER BY id ASC")
+
+            while True:
+                rows = cur.fetchmany(chunk_size) if chunk_size else cur.fetchall()
+                if not rows:
+                    break
+
+                ids = []
+                vals = []
+                for case_id, outputs, inputs, row_id, delta_base in rows:
+                    if case_id not in source_keys:
+                        continue
+
+                    if delta_base is None:
+                        val = self._decode_val(name, outputs, inputs, keys)
+                        if row_id is not None:
+                            latest[row_id] = val
+                    else:
+                        try:
+                            val = self._decode_val(name, outputs, inputs, keys)
+                        except KeyError:
+                            # unchanged since it was last recorded
+                            if delta_base not in latest:
+                                raise
+                            val = latest[delta_base]
+                        latest[delta_base] = val
+
+                    ids.append(case_id)
+                    vals.append(val)
+
+                if ids:
+                    yield ids, vals
+
+                if not chunk_size:
+                    break
+
+        con.close()
+
+    def _decode_val(self, name, outputs, inputs, keys):
+        """
+        Decode the value of a single variable from the recorded outputs or inputs of a case.
 
-        for global_iter in self._global_iterations:
-            record_type, row, source = global_iter[1], global_iter[2], global_iter[3]
-            if record_type == table and row == row_id:
-                return source
+        Parameters
+        ----------
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+        outputs : str or bytes or None
+            The recorded outputs of the case.
+        inputs : str or bytes or None
+            The recorded inputs of the case.
+        keys : dict
+            Cache of recorded names resolved for each variable layout.
+
+        Returns
+        -------
+        float or ndarray or any python object
+            The value of the variable.
+        """
+        for data, io in ((outputs, 'output'), (inputs, 'input')):
+            if data is None:
+                continue
+
+            if isinstance(data, bytes):
+                values = blob_to_structured_array(data, self._var_layouts)
+                layout = (values.dtype, io)
+                try:
+                    key = keys[layout]
+                except KeyError:
+                    key = keys[layout] = self._find_key(name, values.dtype.names, io)
+                if key is not None:
+                    return values[0][key]
+            else:
+                values = json_loads(data)
+                if values:
+                    key = self._find_key(name, values, io)
+                    if key is not None:
+                        val = values[key]
+                        return np.asarray(val) if isinstance(val, (list, float)) else val
+
+        raise KeyError('Variable name "%s" not found.' % name)
+
+    def _find_key(self, name, keys, io):
+        """
+        Find the name under which a variable was recorded.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or relative variable name in the root system's namespace.
+        keys : Iterable of str
+            The recorded variable names.
+        io : str
+            Either 'output' or 'input', the kind of variables that were recorded.
+
+        Returns
+        -------
+        str or None
+            The recorded name of the variable, or None if it was not recorded.
+        """
+        if name in keys:
+            return name
+
+        prom2abs = self._prom2abs
+        abs2prom = self._abs2prom
+
+        if io == 'input':
+            if name in prom2abs['input'] and prom2abs['input'][name][0] in keys:
+                return prom2abs['input'][name][0]
+            return None
+
+        for abs_name in prom2abs['output'].get(name, ()):
+            if abs_name in keys:
+                return abs_name
+
+        if name in abs2prom['output'] and abs2prom['output'][name] in keys:
+            return abs2prom['output'][name]
+
+        if name in prom2abs['input'] and name not in abs2prom['input']:
+            # promoted input, look for its connected source
+            src = self._conns[prom2abs['input'][name][0]]
+            if src in keys:
+                return src
+            if src in abs2prom['output'] and abs2prom['output'][src] in keys:
+                return abs2prom['output'][src]
 
         return None
 
@@ -1426,16 +2171,22 @@ class DriverCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache decoded cases. If None, the cache
+        is unbounded.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, var_layouts=None, cache_size=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'driver_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, var_layouts,
+                         cache_size)
 
     def cases(self, cache=False):
         """
@@ -1459,6 +2210,8 @@ class DriverCases(CaseTable):
             rows = cur.fetchall()
 
             for row in rows:
+                row = self._apply_deltas(row, cur)
+
                 if self._format_version > 1:
                     # fetch associated derivative data, if available
                     cur.execute("SELECT * FROM driver_derivatives WHERE iteration_coordinate=?",
@@ -1467,11 +2220,12 @@ class DriverCases(CaseTable):
 
                     if derivs_row:
                         # convert row to a regular dict and add jacobian
-                        row = dict(zip(row.keys(), row))
+                        row = {key: row[key] for key in row.keys()}
                         row['jacobian'] = derivs_row['derivatives']
 
                 case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._var_info, self._format_version)
+                            self._conns, self._var_info, self._format_version,
+                            self._var_layouts)
 
                 if cache:
                     self._cases[case.name] = case
@@ -1514,6 +2268,8 @@ class DriverCases(CaseTable):
                         "iteration_coordinate=:iteration_coordinate",
                         {"iteration_coordinate": case_id})
             row = cur.fetchone()
+            if row:
+                row = self._apply_deltas(row, cur)
 
             # fetch associated derivative data, if available
             if row and self._format_version > 1:
@@ -1524,14 +2280,15 @@ class DriverCases(CaseTable):
 
                 if derivs_row:
                     # convert row to a regular dict and add jacobian
-                    row = dict(zip(row.keys(), row))
+                    row = {key: row[key] for key in row.keys()}
                     row['jacobian'] = derivs_row['derivatives']
         con.close()
 
         # if found, create Case object (and cache it if requested) else return None
         if row:
             case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._var_info, self._format_version)
+                        self._conns, self._var_info, self._format_version,
+                        self._var_layouts)
             if cache:
                 self._cases[case_id] = case
             return case
@@ -1604,16 +2361,22 @@ class SystemCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache decoded cases. If None, the cache
+        is unbounded.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, var_layouts=None, cache_size=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'system_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, var_layouts,
+                         cache_size)
 
 
 class SolverCases(CaseTable):
@@ -1638,16 +2401,22 @@ class SolverCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache decoded cases. If None, the cache
+        is unbounded.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, var_layouts=None, cache_size=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'solver_iterations', 'iteration_coordinate', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, var_layouts,
+                         cache_size)
 
     def _get_source(self, iteration_coordinate):
         """
@@ -1700,16 +2469,25 @@ class ProblemCases(CaseTable):
         Dictionary of all model connections.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    var_layouts : dict
+        Dictionary mapping variable layout ids to structured dtypes for packed binary data.
+    cache_size : int or None
+        Approximate maximum memory, in bytes, used to cache decoded cases. If None, the cache
+        is unbounded.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 var_info):
+                 var_info, var_layouts=None, cache_size=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'problem_cases', 'case_name', giter,
-                         prom2abs, abs2prom, abs2meta, conns, var_info)
+                         prom2abs, abs2prom, abs2meta, conns, var_info, var_layouts,
+                         cache_size)
+
+        # problem cases are always recorded in full
+        self._has_deltas = False
 
     def list_sources(self):
         """
@@ -3,10 +3,16 @@ Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 """
 
 from io import BytesIO
+from copy import deepcopy
+from collections import deque
 
 import os.path
 import gc
 import sqlite3
+import threading
+import queue
+import atexit
+import time
 
 import json
 import numpy as np
@@ -30,6 +36,18 @@ from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 """
 SQL case database version history.
 ----------------------------------
+17-- OpenMDAO 3.38.1
+     Added solver_stats column to the solver_iterations table, holding solver specific
+     statistics of the iteration, such as the number of linearizations of a NewtonSolver,
+     as JSON.
+16-- OpenMDAO 3.38.1
+     Added delta_base column to the driver, system and solver iteration tables. Cases that only
+     record the variables that changed since the previous case of their source hold the id of
+     the full (keyframe) case they are relative to.
+15-- OpenMDAO 3.38.1
+     Iteration inputs, outputs and residuals that are all numeric arrays are stored as packed
+     float64 BLOBs, with variable offsets, shapes and dtypes stored once per layout in the
+     var_layouts table.
 14-- OpenMDAO 3.8.1
      Metadata pickle and JSON blobs are compressed.
      Save metadata separately for parallel runs.
@@ -62,7 +80,7 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 14
+format_version = 17
 
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
@@ -114,6 +132,142 @@ def blob_to_array(blob):
     return np.load(out, allow_pickle=True)
 
 
+class _CaseWriter(object):
+    """
+    Background thread that writes queued rows to a sqlite database in batched transactions.
+
+    Parameters
+    ----------
+    connection : sqlite connection object
+        Connection to the sqlite3 database. It must allow use from other threads.
+    lock : threading.Lock
+        Lock that serializes use of the connection with the recording thread.
+    batch_size : int
+        Number of queued statements after which the pending batch is committed.
+    batch_interval : float
+        Maximum time in seconds that queued statements wait before being committed.
+    queue_size : int
+        Maximum number of queued entries. Adding entries blocks while the queue is full.
+
+    Attributes
+    ----------
+    _connection : sqlite connection object
+        Connection to the sqlite3 database.
+    _lock : threading.Lock
+        Lock that serializes use of the connection with the recording thread.
+    _batch_size : int
+        Number of queued statements after which the pending batch is committed.
+    _batch_interval : float
+        Maximum time in seconds that queued statements wait before being committed.
+    _queue : queue.Queue
+        Queue of statement tuples waiting to be written.
+    _thread : threading.Thread
+        The thread draining the queue.
+    _error : Exception or None
+        Exception raised in the writer thread, re-raised in the recording thread.
+    """
+
+    def __init__(self, connection, lock, batch_size, batch_interval, queue_size):
+        """
+        Initialize and start the writer thread.
+        """
+        self._connection = connection
+        self._lock = lock
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='SqliteRecorderWriter',
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def put(self, statements):
+        """
+        Queue statements to be written in the same batch, blocking while the queue is full.
+
+        Parameters
+        ----------
+        statements : tuple
+            Tuple of (sql, params) pairs.
+        """
+        self._check_error()
+        self._queue.put(statements)
+
+    def flush(self):
+        """
+        Wait until all queued statements have been committed.
+        """
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.1):
+            if not self._thread.is_alive():
+                break
+        self._check_error()
+
+    def stop(self):
+        """
+        Commit all queued statements and stop the writer thread.
+        """
+        atexit.unregister(self.stop)
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._check_error()
+
+    def _check_error(self):
+        """
+        Raise any error that occurred in the writer thread.
+        """
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise RuntimeError(f"Error writing recorded cases: {err}") from err
+
+    def _run(self):
+        """
+        Drain the queue, grouping statements by SQL so each group is written with executemany.
+        """
+        pending = {}
+        count = 0
+        last_commit = time.perf_counter()
+
+        while True:
+            timeout = self._batch_interval - (time.perf_counter() - last_commit)
+            try:
+                item = self._queue.get(timeout=max(timeout, 0.) if pending else None)
+            except queue.Empty:
+                item = ()
+
+            if item:
+                if isinstance(item, threading.Event):
+                    # flush request, commit everything pending
+                    count = self._batch_size
+                else:
+                    for sql, params in item:
+                        try:
+                            pending[sql].append(params)
+                        except KeyError:
+                            pending[sql] = [params]
+                    count += len(item)
+
+            if pending and (item is None or count >= self._batch_size or
+                            time.perf_counter() - last_commit >= self._batch_interval):
+                try:
+                    with self._lock, self._connection as c:
+                        for sql, rows in pending.items():
+                            c.executemany(sql, rows)
+                except Exception as err:
+                    self._error = err
+                pending = {}
+                count = 0
+                last_commit = time.perf_counter()
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                break
+
+
 class SqliteRecorder(CaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
@@ -128,6 +282,25 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    async_write : bool, optional
+        If True, iteration data is written to the database by a background thread in batched
+        transactions. All recorded data is committed when the recorder is shut down.
+    batch_size : int, optional
+        When writing asynchronously, the number of queued rows after which they are committed.
+    batch_interval : float, optional
+        When writing asynchronously, the maximum time in seconds rows wait to be committed.
+    queue_size : int, optional
+        When writing asynchronously, the maximum number of queued cases. Recording blocks
+        while the queue is full.
+    record_deltas : bool, optional
+        If True, driver, system and solver cases only record the variables whose values
+        changed since they were last recorded for the same source, with a full case recorded
+        periodically. Full cases are reconstructed when the cases are read.
+    delta_tol : float, optional
+        When recording deltas, variables that differ from their last recorded values by no more
+        than this absolute tolerance are not recorded.
+    keyframe_interval : int, optional
+        When recording deltas, the number of cases recorded for each source between full cases.
 
     Attributes
     ----------
@@ -156,9 +329,36 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     _use_outputs_dir : bool
         Flag indicating if the database is being saved in the problem outputs dir.
+    _var_layouts : dict
+        Dictionary mapping a tuple of (name, shape) pairs to the id, variable offsets and size
+        of its recorded layout.
+    _row_ids : dict
+        Dictionary mapping table names to the id of the last row written to them.
+    _async_write : bool
+        If True, iteration data is written to the database by a background thread.
+    _writer_options : tuple
+        The batch size, batch interval and queue size used by the background writer.
+    _writer : _CaseWriter or None
+        The background writer, if writing asynchronously.
+    _lock : threading.Lock
+        Lock serializing use of the database connection with the background writer.
+    _record_deltas : bool
+        If True, cases only record the variables that changed since the last case of the source.
+    _delta_tol : float
+        Absolute tolerance below which changes in variable values are not recorded.
+    _keyframe_interval : int
+        The number of cases recorded for each source between full cases.
+    _last_recorded : dict
+        Dictionary mapping each source to the id of its last full case, the number of cases
+        recorded since then and the last recorded inputs, outputs and residuals.
+    _case_rings : dict
+        Dictionary mapping each source that only keeps its latest cases to the row ids and
+        global iteration ids of those cases.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 async_write=False, batch_size=1000, batch_interval=1.0, queue_size=1000,
+                 record_deltas=False, delta_tol=0.0, keyframe_interval=20):
         """
         Initialize the SqliteRecorder.
         """
@@ -180,6 +380,23 @@ class SqliteRecorder(CaseRecorder):
 
         self._database_initialized = False
         self._started = set()
+        self._var_layouts = {}
+        self._row_ids = {}
+
+        self._async_write = async_write
+        self._writer_options = (batch_size, batch_interval, queue_size)
+        self._writer = None
+        self._lock = threading.Lock()
+
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be at least 1, but {keyframe_interval} "
+                             "was given.")
+
+        self._record_deltas = record_deltas
+        self._delta_tol = delta_tol
+        self._keyframe_interval = keyframe_interval
+        self._last_recorded = {}
+        self._case_rings = {}
 
         super().__init__(record_viewer_data)
 
@@ -194,6 +411,11 @@ class SqliteRecorder(CaseRecorder):
         """
         filepath = None
         self.connection = self.metadata_connection = None
+        self._var_layouts = {}
+        self._last_recorded = {}
+        self._case_rings = {}
+        self._row_ids = dict.fromkeys(('global_iterations', 'driver_iterations', 'problem_cases',
+                                       'system_iterations', 'solver_iterations', 'var_layouts'), 0)
 
         if MPI and comm and comm.size > 1:
             if self._record_on_proc:
@@ -233,7 +455,8 @@ class SqliteRecorder(CaseRecorder):
             except OSError:
                 pass
 
-            self.connection = sqlite3.connect(filepath)
+            # the background writer uses the connection from its own thread
+            self.connection = sqlite3.connect(filepath, check_same_thread=not self._async_write)
             if self._record_metadata and self.metadata_connection is None:
                 self.metadata_connection = self.connection
 
@@ -244,11 +467,15 @@ class SqliteRecorder(CaseRecorder):
 
                 c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
+                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
+                          "delta_base INT)")
                 c.execute("CREATE TABLE driver_derivatives(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, derivatives BLOB)")
+                c.execute("CREATE INDEX driv_deriv_iter_ind on "
+                          "driver_derivatives(iteration_coordinate)")
                 c.execute("CREATE INDEX driv_iter_ind on driver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX driv_delta_ind on driver_iterations(delta_base)")
 
                 c.execute("CREATE TABLE problem_cases(id INTEGER PRIMARY KEY, "
                           "counter INT, case_name TEXT, timestamp REAL, "
@@ -258,14 +485,21 @@ class SqliteRecorder(CaseRecorder):
 
                 c.execute("CREATE TABLE system_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
+                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
+                          "delta_base INT)")
                 c.execute("CREATE INDEX sys_iter_ind on system_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX sys_delta_ind on system_iterations(delta_base)")
 
                 c.execute("CREATE TABLE solver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
-                          "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
+                          "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT, "
+                          "delta_base INT, solver_stats TEXT)")
                 c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX solv_delta_ind on solver_iterations(delta_base)")
+
+                # variable name/offset/shape index for the packed binary iteration data
+                c.execute("CREATE TABLE var_layouts(id INTEGER PRIMARY KEY, layout BLOB)")
 
                 if self._record_metadata:
                     with self.metadata_connection as m:
@@ -282,6 +516,9 @@ class SqliteRecorder(CaseRecorder):
                         m.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
                                   "solver_options BLOB, solver_class TEXT)")
 
+            if self._async_write:
+                self._writer = _CaseWriter(self.connection, self._lock, *self._writer_options)
+
         self._database_initialized = True
         if MPI and comm and comm.size > 1:
             comm.barrier()
@@ -317,6 +554,249 @@ class SqliteRecorder(CaseRecorder):
             var_settings[name] = meta
         return var_settings
 
+    def _next_row_id(self, table):
+        """
+        Get the id of the next row to be written to the given table.
+
+        Row ids are assigned here rather than by sqlite so that rows can be written in batches.
+
+        Parameters
+        ----------
+        table : str
+            Name of the table.
+
+        Returns
+        -------
+        int
+            The id of the next row.
+        """
+        self._row_ids[table] += 1
+        return self._row_ids[table]
+
+    def _write(self, *statements):
+        """
+        Execute the given statements in a single transaction, or queue them for the writer.
+
+        Parameters
+        ----------
+        *statements : tuple
+            The (sql, params) pairs to execute.
+        """
+        if self._writer is not None:
+            self._writer.put(statements)
+        else:
+            with self.connection as c:
+                for sql, params in statements:
+                    c.execute(sql, params)
+
+    def _serialize(self, values):
+        """
+        Convert a dict of variable values into a form that can be stored in the database.
+
+        If all values are numeric arrays, they are packed into a single binary blob of float64
+        values preceded by the int64 id of the layout (names, offsets, shapes and dtypes) of the
+        variables. Layouts are recorded in the var_layouts table the first time they are seen.
+        Otherwise the values are converted to a JSON string.
+
+        Parameters
+        ----------
+        values : dict or None
+            Dictionary mapping variable names to values.
+
+        Returns
+        -------
+        bytes or str
+            The packed binary blob or the JSON string.
+        """
+        if values:
+            key = []
+            for name, val in values.items():
+                if not isinstance(val, np.ndarray) or val.dtype.kind not in 'biuf':
+                    break
+                key.append((name, val.shape, val.dtype.str))
+            else:
+                key = tuple(key)
+                try:
+                    layout_id, offsets, size = self._var_layouts[key]
+                except KeyError:
+                    layout_id, offsets, size = self._add_var_layout(key)
+
+                buf = np.empty(size + 1)
+                buf[:1].view(np.int64)[0] = layout_id
+                for val, (start, end) in zip(values.values(), offsets):
+                    buf[start:end] = val.ravel()
+
+                return sqlite3.Binary(buf)
+
+            values = {name: make_serializable(val) for name, val in values.items()}
+
+        return json.dumps(values)
+
+    def _add_var_layout(self, key):
+        """
+        Record a new variable layout for the packed binary iteration data.
+
+        Parameters
+        ----------
+        key : tuple
+            Tuple of (name, shape, dtype) entries for the variables in the layout.
+
+        Returns
+        -------
+        tuple
+            The layout id, the (start, end) offset of each variable in the packed buffer
+            (including the leading layout id) and the number of float64 values in the layout.
+        """
+        layout = []
+        offsets = []
+        size = 0
+        for name, shape, dtype in key:
+            layout.append([name, size, shape, dtype])
+            end = size + int(np.prod(shape))
+            offsets.append((size + 1, end + 1))
+            size = end
+
+        layout_blob = zlib.compress(json.dumps(layout).encode('ascii'))
+        layout_id = self._next_row_id('var_layouts')
+
+        self._write(("INSERT INTO var_layouts(id, layout) VALUES(?,?)",
+                     (layout_id, sqlite3.Binary(layout_blob))))
+
+        self._var_layouts[key] = entry = (layout_id, offsets, size)
+        return entry
+
+    def _get_deltas(self, source, row_id, *values):
+        """
+        Get the values to record for a case, keeping only changes if recording deltas.
+
+        Parameters
+        ----------
+        source : tuple
+            The table and source of the case.
+        row_id : int
+            The id of the row the case will be written to.
+        *values : dict
+            The inputs, outputs and residuals of the case.
+
+        Returns
+        -------
+        int or None
+            The id of the full case that the recorded values are relative to, or None if all
+            values are recorded.
+        tuple of dict
+            The inputs, outputs and residuals to record.
+        """
+        if not self._record_deltas or source in self._case_rings:
+            # cases of a source that only keeps its latest cases can't depend on earlier ones
+            return None, values
+
+        last = self._last_recorded.get(source)
+
+        if last is not None and last[1] < self._keyframe_interval and \
+                all(vals.keys() == last_vals.keys() for vals, last_vals in zip(values, last[2])):
+            last[1] += 1
+            deltas = []
+            for vals, last_vals in zip(values, last[2]):
+                changed = {}
+                for name, val in vals.items():
+                    if self._changed(val, last_vals[name]):
+                        changed[name] = val
+                        last_vals[name] = self._copy_value(val)
+                deltas.append(changed)
+
+            return last[0], tuple(deltas)
+
+        # record a full case that later cases are relative to
+        last_values = [{name: self._copy_value(val) for name, val in vals.items()}
+                       for vals in values]
+        self._last_recorded[source] = [row_id, 1, last_values]
+
+        return None, values
+
+    def _drop_old_cases(self, recording_requester, source, row_id, global_id):
+        """
+        Get the statements that delete the oldest case of a source that keeps only its latest.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The Driver, System or Solver that recorded the case.
+        source : tuple
+            The table and source of the case.
+        row_id : int
+            The id of the row the case will be written to.
+        global_id : int
+            The id of the global iteration of the case.
+
+        Returns
+        -------
+        tuple
+            The statements to execute, if any.
+        """
+        max_cases = recording_requester.recording_options['max_cases']
+        if max_cases is None:
+            return ()
+
+        try:
+            ring = self._case_rings[source]
+        except KeyError:
+            ring = self._case_rings[source] = deque()
+
+        ring.append((row_id, global_id))
+        if len(ring) <= max_cases:
+            return ()
+
+        old_row_id, old_global_id = ring.popleft()
+        return ((f"DELETE FROM {source[0]}_iterations WHERE id=?", (old_row_id,)),
+                ("DELETE FROM global_iterations WHERE id=?", (old_global_id,)))
+
+    def _changed(self, val, last_val):
+        """
+        Check if a variable value differs from its last recorded value.
+
+        Parameters
+        ----------
+        val : object
+            The current value.
+        last_val : object
+            The last recorded value.
+
+        Returns
+        -------
+        bool
+            True if the value has changed by more than the delta tolerance.
+        """
+        if isinstance(val, np.ndarray):
+            if not isinstance(last_val, np.ndarray) or val.shape != last_val.shape:
+                return True
+            if val.dtype.kind in 'iuf':
+                # NaNs compare as changed
+                return not (np.abs(val - last_val) <= self._delta_tol).all()
+            return not np.array_equal(val, last_val)
+
+        try:
+            return not bool(val == last_val)
+        except Exception:
+            return True
+
+    def _copy_value(self, val):
+        """
+        Copy a variable value so it is not changed by later iterations.
+
+        Parameters
+        ----------
+        val : object
+            The value.
+
+        Returns
+        -------
+        object
+            The copy.
+        """
+        if isinstance(val, np.ndarray):
+            return val.copy()
+        return deepcopy(val)
+
     def startup(self, recording_requester, comm=None):
         """
         Prepare for a new run and create/update the abs2prom and prom2abs variables.
@@ -440,7 +920,7 @@ class SqliteRecorder(CaseRecorder):
                 json.dumps(var_settings, default=default_noraise).encode('ascii'))
 
             if self._record_metadata:
-                with self.metadata_connection as m:
+                with self._lock, self.metadata_connection as m:
                     m.execute("UPDATE metadata SET " +   # nosec: trusted input
                               "abs2prom=?, prom2abs=?, abs2meta=?, var_settings=?, conns=?",
                               (abs2prom, prom2abs, abs2meta, var_settings_json, conns))
@@ -467,33 +947,28 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            outputs = data['output']
-            inputs = data['input']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, driver._get_name()))
+            source = ('driver', driver._get_name())
+            row_id = self._next_row_id('driver_iterations')
+            global_id = self._next_row_id('global_iterations')
+            drop_cases = self._drop_old_cases(driver, source, row_id, global_id)
+
+            delta_base, (inputs, outputs, residuals) = \
+                self._get_deltas(source, row_id,
+                                 data['input'], data['output'], data['residual'])
+
+            outputs_text = self._serialize(outputs)
+            inputs_text = self._serialize(inputs)
+            residuals_text = self._serialize(residuals)
+
+            self._write(("INSERT INTO driver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals, delta_base) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?)",
+                         (row_id, self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text, delta_base)),
+                        ("INSERT INTO global_iterations(id, record_type, rowid, source) "
+                         "VALUES(?,?,?,?)", (global_id, 'driver', row_id, driver._get_name())),
+                        *drop_cases)
 
     def record_iteration_problem(self, problem, data, metadata):
         """
@@ -528,34 +1003,26 @@ class SqliteRecorder(CaseRecorder):
             totals_array = dict_to_structured_array(totals)
             totals_blob = array_to_blob(totals_array)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            outputs_text = self._serialize(outputs)
+            inputs_text = self._serialize(inputs)
+            residuals_text = self._serialize(residuals)
 
             abs_err = data['abs'] if 'abs' in data else None
             rel_err = data['rel'] if 'rel' in data else None
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
+            row_id = self._next_row_id('problem_cases')
+            global_id = self._next_row_id('global_iterations')
 
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+            self._write(("INSERT INTO problem_cases(id, counter, case_name, "
+                         "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
+                         "abs_err, rel_err ) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?,?,?)",
+                         (row_id, self._counter, metadata['name'],
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text, totals_blob,
+                          abs_err, rel_err)),
+                        ("INSERT INTO global_iterations(id, record_type, rowid, source) "
+                         "VALUES(?,?,?,?)", (global_id, 'problem', row_id, metadata['name'])))
 
     def record_iteration_system(self, system, data, metadata):
         """
@@ -577,36 +1044,32 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                for var, dat in i_o_r.items():
-                    i_o_r[var] = make_serializable(dat)
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = system.pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+            # get the pathname of the source system
+            source_system = system.pathname
+            if source_system == '':
+                source_system = 'root'
+
+            row_id = self._next_row_id('system_iterations')
+            global_id = self._next_row_id('global_iterations')
+            drop_cases = self._drop_old_cases(system, ('system', source_system), row_id, global_id)
+
+            delta_base, (inputs, outputs, residuals) = \
+                self._get_deltas(('system', source_system), row_id,
+                                 data['input'], data['output'], data['residual'])
+
+            outputs_text = self._serialize(outputs)
+            inputs_text = self._serialize(inputs)
+            residuals_text = self._serialize(residuals)
+
+            self._write(("INSERT INTO system_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs , outputs , residuals, delta_base) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?)",
+                         (row_id, self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          inputs_text, outputs_text, residuals_text, delta_base)),
+                        ("INSERT INTO global_iterations(id, record_type, rowid, source) "
+                         "VALUES(?,?,?,?)", (global_id, 'system', row_id, source_system)),
+                        *drop_cases)
 
     def record_iteration_solver(self, solver, data, metadata):
         """
@@ -630,49 +1093,49 @@ class SqliteRecorder(CaseRecorder):
         if self.connection:
             abs = data['abs']
             rel = data['rel']
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = make_serializable(i_o_r[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = solver._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = solver.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % solver.SOLVER)
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+            # get the pathname of the source system
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
+
+            row_id = self._next_row_id('solver_iterations')
+            global_id = self._next_row_id('global_iterations')
+            drop_cases = self._drop_old_cases(solver, ('solver', source_solver), row_id, global_id)
+
+            delta_base, (inputs, outputs, residuals) = \
+                self._get_deltas(('solver', source_solver), row_id,
+                                 data['input'], data['output'], data['residual'])
+
+            outputs_text = self._serialize(outputs)
+            inputs_text = self._serialize(inputs)
+            residuals_text = self._serialize(residuals)
+
+            stats = metadata.get('solver_stats')
+            stats_text = json.dumps(stats, default=default_noraise) if stats else None
+
+            self._write(("INSERT INTO solver_iterations(id, counter, iteration_coordinate, "
+                         "timestamp, success, msg, abs_err, rel_err, "
+                         "solver_inputs, solver_output, solver_residuals, delta_base, "
+                         "solver_stats) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                         (row_id, self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          abs, rel, inputs_text, outputs_text, residuals_text, delta_base,
+                          stats_text)),
+                        ("INSERT INTO global_iterations(id, record_type, rowid, source) "
+                         "VALUES(?,?,?,?)", (global_id, 'solver', row_id, source_solver)),
+                        *drop_cases)
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -690,7 +1153,7 @@ class SqliteRecorder(CaseRecorder):
 
             # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
             try:
-                with self.metadata_connection as m:
+                with self._lock, self.metadata_connection as m:
                     m.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
                               (key, json_data))
             except sqlite3.IntegrityError:
@@ -744,7 +1207,7 @@ class SqliteRecorder(CaseRecorder):
             else:
                 name = META_KEY_SEP.join([path, str(run_number)])
 
-            with self.metadata_connection as m:
+            with self._lock, self.metadata_connection as m:
                 m.execute("INSERT INTO system_metadata"
                           "(id, scaling_factors, component_metadata) "
                           "VALUES(?,?,?)", (name, scaling_factors,
@@ -776,7 +1239,7 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = zlib.compress(pickle.dumps(solver.options, self._pickle_version))
 
-            with self.metadata_connection as m:
+            with self._lock, self.metadata_connection as m:
                 m.execute("INSERT INTO solver_metadata(id, solver_options, solver_class)"
                           " VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
@@ -798,26 +1261,30 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+            self._write(("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
+                         "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+                         (self._counter, self._iteration_coordinate,
+                          metadata['timestamp'], metadata['success'], metadata['msg'],
+                          data_blob)))
 
     def shutdown(self):
         """
         Shut down the recorder.
         """
-        # close database connection
-        if self._record_metadata and self.metadata_connection and \
-                self.metadata_connection != self.connection:
-            self.metadata_connection.close()
+        writer, self._writer = self._writer, None
 
-        if self.connection:
-            self.connection.close()
+        try:
+            # commit any cases still queued for the background writer
+            if writer is not None:
+                writer.stop()
+        finally:
+            # close database connection
+            if self._record_metadata and self.metadata_connection and \
+                    self.metadata_connection != self.connection:
+                self.metadata_connection.close()
+
+            if self.connection:
+                self.connection.close()
 
         # sqlite close() does not always write until garbage collection occurs.
         # If collection is not forced like this and a reader is immediately opened on
@@ -830,12 +1297,22 @@ class SqliteRecorder(CaseRecorder):
         Delete all the recordings.
         """
         if self.connection:
+            if self._writer is not None:
+                self._writer.flush()
+
+            for table in self._row_ids:
+                self._row_ids[table] = 0
+            self._last_recorded = {}
+            self._case_rings = {}
+
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
             self.connection.execute("DELETE FROM driver_derivatives")
             self.connection.execute("DELETE FROM problem_cases")
             self.connection.execute("DELETE FROM system_iterations")
             self.connection.execute("DELETE FROM solver_iterations")
+            self.connection.execute("DELETE FROM var_layouts")
+            self._var_layouts = {}
             self.connection.execute("DELETE FROM driver_metadata")
             self.connection.execute("DELETE FROM system_metadata")
             self.connection.execute("DELETE FROM solver_metadata")
@@ -5,7 +5,8 @@ import zlib
 
 from contextlib import contextmanager
 
-from openmdao.utils.record_util import format_iteration_coordinate, deserialize
+from openmdao.utils.record_util import format_iteration_coordinate, deserialize, \
+    get_var_layouts
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
 
@@ -76,6 +77,7 @@ def assertProblemDataRecorded(test, filepath, expected, tolerance):
     """
     with database_cursor(filepath) as db_cur:
         f_version, abs2meta, prom2abs, conns = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur)
 
         # iterate through the cases
         for case, (t0, t1), outputs_expected in expected:
@@ -91,7 +93,7 @@ def assertProblemDataRecorded(test, filepath, expected, tolerance):
                 outputs_text, residuals_text, derivatives, abs_err, rel_err = row_actual
 
             if f_version >= 3:
-                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns)
+                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns, var_layouts)
             elif f_version in (1, 2):
                 outputs_actual = blob_to_array(outputs_text)
 
@@ -126,6 +128,7 @@ def assertDriverIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
     """
     with database_cursor(filepath) as db_cur:
         f_version, abs2meta, prom2abs, conns = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur)
 
         # iterate through the cases
         for coord, (t0, t1), outputs_expected, inputs_expected, residuals_expected in expected:
@@ -141,12 +144,13 @@ def assertDriverIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
                             'iteration coordinate: "{}"'.format(iter_coord))
 
             counter, global_counter, iteration_coordinate, timestamp, success, msg,\
-                inputs_text, outputs_text, residuals_text = row_actual
+                inputs_text, outputs_text, residuals_text, delta_base = row_actual
 
             if f_version >= 3:
-                inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns)
-                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns)
-                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns)
+                inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns, var_layouts)
+                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns, var_layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns,
+                                               var_layouts)
             elif f_version in (1, 2):
                 inputs_actual = blob_to_array(inputs_text)
                 outputs_actual = blob_to_array(outputs_text)
@@ -305,6 +309,7 @@ def assertSystemIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
     """
     with database_cursor(filepath) as db_cur:
         f_version, abs2meta, prom2abs, conns = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur)
 
         # iterate through the cases
         for coord, (t0, t1), inputs_expected, outputs_expected, residuals_expected in expected:
@@ -319,12 +324,13 @@ def assertSystemIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
                                         'iteration coordinate: "{}"'.format(iter_coord))
 
             counter, global_counter, iteration_coordinate, timestamp, success, msg, inputs_text, \
-                outputs_text, residuals_text = row_actual
+                outputs_text, residuals_text, delta_base = row_actual
 
             if f_version >= 3:
-                inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns)
-                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns)
-                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns)
+                inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns, var_layouts)
+                outputs_actual = deserialize(outputs_text, abs2meta, prom2abs, conns, var_layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns,
+                                               var_layouts)
             elif f_version in (1, 2):
                 inputs_actual = blob_to_array(inputs_text)
                 outputs_actual = blob_to_array(outputs_text)
@@ -365,6 +371,7 @@ def assertSolverIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
     """
     with database_cursor(filepath) as db_cur:
         f_version, abs2meta, prom2abs, conns = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur)
 
         # iterate through the cases
         for coord, (t0, t1), expected_abs_error, expected_rel_error, expected_output, \
@@ -381,11 +388,13 @@ def assertSolverIterDataRecorded(test, filepath, expected, tolerance, prefix=Non
                                         'iteration coordinate: "{}"'.format(iter_coord))
 
             counter, global_counter, iteration_coordinate, timestamp, success, msg, \
-                abs_err, rel_err, input_blob, output_text, residuals_text = row_actual
+                abs_err, rel_err, input_blob, output_text, residuals_text, delta_base, \
+                solver_stats = row_actual
 
             if f_version >= 3:
-                output_actual = deserialize(output_text, abs2meta, prom2abs, conns)
-                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns)
+                output_actual = deserialize(output_text, abs2meta, prom2abs, conns, var_layouts)
+                residuals_actual = deserialize(residuals_text, abs2meta, prom2abs, conns,
+                                               var_layouts)
             elif f_version in (1, 2):
                 output_actual = blob_to_array(output_text)
                 residuals_actual = blob_to_array(residuals_text)
@@ -0,0 +1,189 @@
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+class NodeFailure(BaseException):
+    pass
+
+
+class FailingParaboloid(Paraboloid):
+    """
+    Paraboloid that simulates a node failure after a given number of executions.
+    """
+
+    def initialize(self):
+        self.options.declare('fail_after', default=None, allow_none=True)
+        self.count = 0
+
+    def compute(self, inputs, outputs):
+        if self.options['fail_after'] is not None and self.count >= self.options['fail_after']:
+            raise NodeFailure()
+        self.count += 1
+        super().compute(inputs, outputs)
+
+
+SAMPLES = [(x, y) for x in (-10., 0., 10.) for y in (-10., 0., 10.)]
+
+
+def doe_problem(cases, fail_after=None, checkpoint=None):
+    prob = om.Problem()
+    prob.model.add_subsystem('comp', FailingParaboloid(fail_after=fail_after),
+                             promotes=['x', 'y', 'f_xy'])
+    prob.model.add_design_var('x', lower=-10.0, upper=10.0)
+    prob.model.add_design_var('y', lower=-10.0, upper=10.0)
+    prob.model.add_objective('f_xy')
+
+    prob.driver = om.DOEDriver(om.ListGenerator([[('x', x), ('y', y)] for x, y in SAMPLES]))
+    prob.driver.add_recorder(om.SqliteRecorder(os.path.join('.', cases)))
+    if checkpoint is not None:
+        prob.driver.add_recorder(om.CheckpointRecorder(checkpoint))
+
+    prob.setup()
+    return prob
+
+
+def opt_problem(fail_after=None, checkpoint=None, every=1):
+    prob = om.Problem()
+    prob.model.add_subsystem('comp', FailingParaboloid(fail_after=fail_after),
+                             promotes=['x', 'y', 'f_xy'])
+    prob.model.add_subsystem('con', om.ExecComp('c = - x + y', x=0., y=0.), promotes=['*'])
+    prob.model.add_design_var('x', lower=-50.0, upper=50.0)
+    prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+    prob.model.add_objective('f_xy')
+    prob.model.add_constraint('c', upper=-15.0)
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+    if checkpoint is not None:
+        prob.driver.add_recorder(om.CheckpointRecorder(checkpoint))
+        prob.driver.recording_options['every'] = every
+
+    prob.setup()
+    prob.set_val('x', 50.)
+    prob.set_val('y', 50.)
+    return prob
+
+
+@use_tempdirs
+class TestCheckpointRecorder(unittest.TestCase):
+
+    def test_doe_restart(self):
+        prob = doe_problem('cases.sql', fail_after=4, checkpoint=os.path.join('.', 'doe.chk'))
+        with self.assertRaises(NodeFailure):
+            prob.run_driver()
+        prob.cleanup()
+
+        prob = doe_problem('restart.sql', checkpoint=os.path.join('.', 'doe.chk'))
+        prob.restart_from(os.path.join('.', 'doe.chk'))
+        self.assertEqual(prob.driver.iter_count, 4)
+
+        prob.run_driver(case_prefix='restart')
+        prob.cleanup()
+
+        # only the cases that had not been run before the failure are run
+        self.assertEqual(prob.model.comp.count, 5)
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        cr = om.CaseReader(os.path.join('.', 'restart.sql'))
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(cases, [f'restart_rank0:DOEDriver_List|{i}' for i in range(4, 9)])
+
+        for case, (x, y) in zip(cr.get_cases('driver'), SAMPLES[4:]):
+            assert_near_equal(case.get_val('x'), x)
+            assert_near_equal(case.get_val('y'), y)
+
+    def test_optimizer_restart(self):
+        cold = opt_problem()
+        cold.run_driver()
+        cold_count = cold.model.comp.count
+
+        prob = opt_problem(fail_after=cold_count - 3, checkpoint='opt.chk', every=2)
+        with self.assertRaises(NodeFailure):
+            prob.run_driver()
+        prob.cleanup()
+
+        chk = prob.get_outputs_dir() / 'opt.chk'
+        self.assertTrue(chk.exists())
+
+        prob = opt_problem()
+        prob.restart_from(chk)
+        iter_count = prob.driver.iter_count
+        self.assertGreater(iter_count, 0)
+
+        prob.run_driver()
+
+        assert_near_equal(prob.get_val('x'), cold.get_val('x'), 1e-6)
+        assert_near_equal(prob.get_val('y'), cold.get_val('y'), 1e-6)
+        assert_near_equal(prob.get_val('f_xy'), cold.get_val('f_xy'), 1e-6)
+
+        # resuming from the checkpoint takes fewer model evaluations than starting cold
+        self.assertLess(prob.model.comp.count, cold_count)
+        self.assertGreater(prob.driver.iter_count, iter_count)
+
+    def test_solver_warm_start(self):
+        def sellar(solver):
+            prob = om.Problem(SellarDerivatives())
+            prob.model.nonlinear_solver = solver
+            prob.model.linear_solver = om.DirectSolver()
+            prob.setup()
+            return prob
+
+        cold = sellar(om.BroydenSolver(maxiter=50, atol=1e-10, rtol=1e-10))
+        cold.run_model()
+        cold_iters = cold.model.nonlinear_solver._iter_count
+        cold.save_checkpoint('sellar.chk')
+
+        prob = sellar(om.BroydenSolver(maxiter=50, atol=1e-10, rtol=1e-10))
+        prob.restart_from('sellar.chk')
+
+        assert_near_equal(prob.get_val('y1'), cold.get_val('y1'))
+        assert_near_equal(prob.get_val('y2'), cold.get_val('y2'))
+        self.assertFalse(prob.model.nonlinear_solver._recompute_jacobian)
+        assert_near_equal(np.asarray(prob.model.nonlinear_solver.Gm),
+                          np.asarray(cold.model.nonlinear_solver.Gm))
+        self.assertEqual(prob.model.iter_count, cold.model.iter_count)
+
+        prob.run_model()
+        assert_near_equal(prob.get_val('y1'), cold.get_val('y1'), 1e-8)
+        self.assertLess(prob.model.nonlinear_solver._iter_count, cold_iters)
+
+        # the iteration counts continue from the checkpoint
+        self.assertEqual(prob.model.iter_count, cold.model.iter_count + 1)
+
+    def test_restart_errors(self):
+        prob = doe_problem('cases.sql')
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.save_checkpoint('doe.chk')
+        self.assertEqual(str(cm.exception),
+                         f"{prob.msginfo}: final_setup must be called before saving a checkpoint.")
+
+        prob.final_setup()
+        prob.save_checkpoint('doe.chk')
+
+        other = om.Problem(SellarDerivatives())
+        other.setup()
+        with self.assertRaises(ValueError) as cm:
+            other.restart_from('doe.chk')
+        self.assertEqual(str(cm.exception),
+                         f"{other.msginfo}: The checkpoint 'doe.chk' was saved from a different "
+                         "model.")
+
+        other = om.Problem(SellarDerivatives())
+        other.model.add_recorder(om.CheckpointRecorder('model.chk'))
+        other.setup()
+        with self.assertRaises(TypeError) as cm:
+            other.final_setup()
+        self.assertEqual(str(cm.exception), f"{other.model.msginfo}: A CheckpointRecorder can "
+                         "only be attached to a Problem or a Driver.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+import argparse
+import os
+import sqlite3
+import unittest
+from contextlib import closing
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.recorders.merge_cases import merge_cases, get_case_files, _merge_cases_setup_parser, \
+    _merge_cases_cmd
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def run_doe(filename, samples, prefix, **recorder_options):
+    prob = om.Problem()
+    prob.model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+    prob.model.add_design_var('x', lower=-10.0, upper=10.0)
+    prob.model.add_design_var('y', lower=-10.0, upper=10.0)
+    prob.model.add_objective('f_xy')
+
+    prob.driver = om.DOEDriver(om.ListGenerator([[('x', x), ('y', y)] for x, y in samples]))
+    # a filename with a path is recorded in the current directory rather than the outputs dir
+    prob.driver.add_recorder(om.SqliteRecorder(os.path.join('.', filename), **recorder_options))
+
+    prob.setup()
+    prob.run_driver(case_prefix=prefix)
+    prob.cleanup()
+
+
+def split_metadata(filenames, metadata_filename):
+    # move the metadata from the case files into a separate file, as when recording in parallel
+    with closing(sqlite3.connect(metadata_filename)) as con:
+        con.execute("ATTACH DATABASE ? AS src", (filenames[0],))
+        with con:
+            for table in ('metadata', 'driver_metadata', 'system_metadata', 'solver_metadata'):
+                con.execute(f"CREATE TABLE {table} AS SELECT * FROM src.{table}")
+        con.execute("DETACH DATABASE src")
+
+    for filename in filenames:
+        with closing(sqlite3.connect(filename)) as con:
+            with con:
+                for table in ('metadata', 'driver_metadata', 'system_metadata',
+                              'solver_metadata'):
+                    con.execute(f"DROP TABLE {table}")
+
+
+@use_tempdirs
+class TestMergeCases(unittest.TestCase):
+
+    def setUp(self):
+        self.samples = [
+            [(0., 0.), (1., 1.), (2., 2.)],
+            [(3., 0.), (4., 1.)],
+            [(5., 0.), (6., 1.), (7., 2.), (8., 3.)],
+        ]
+
+    def record_ranks(self, **recorder_options):
+        filenames = [f'cases.sql_{rank}' for rank in range(len(self.samples))]
+        for rank, (filename, samples) in enumerate(zip(filenames, self.samples)):
+            run_doe(filename, samples, f'rank{rank}', **recorder_options)
+        split_metadata(filenames, 'cases.sql_meta')
+        return filenames
+
+    def check_merged(self, filenames, merged):
+        cr = om.CaseReader(merged)
+
+        expected = {}
+        for filename in filenames:
+            rank_cr = om.CaseReader(filename)
+            for case in rank_cr.get_cases('driver'):
+                expected[case.name] = (case.get_val('x'), case.get_val('y'),
+                                       case.get_val('f_xy'))
+
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), sum(len(samples) for samples in self.samples))
+        self.assertEqual(sorted(case.name for case in cases), sorted(expected))
+        self.assertEqual([case.counter for case in cases], list(range(1, len(cases) + 1)))
+
+        for case in cases:
+            x, y, f_xy = expected[case.name]
+            assert_near_equal(case.get_val('x'), x)
+            assert_near_equal(case.get_val('y'), y)
+            assert_near_equal(case.get_val('f_xy'), f_xy)
+
+        self.assertEqual(cr.list_sources(out_stream=None), ['driver'])
+        self.assertEqual(set(cr.problem_metadata['abs2prom']['output']),
+                         {'comp.f_xy', '_auto_ivc.v0', '_auto_ivc.v1'})
+
+        return cr
+
+    def test_merge_ranks(self):
+        filenames = self.record_ranks()
+
+        self.assertEqual(get_case_files('cases.sql'), (filenames, 'cases.sql_meta'))
+
+        count = merge_cases('cases.sql', 'merged.sql')
+        self.assertEqual(count, 9)
+
+        cr = self.check_merged(filenames, 'merged.sql')
+
+        # cases are in the order they were recorded
+        self.assertEqual(cr.list_cases('driver', recurse=False, out_stream=None),
+                         [f'rank{rank}_rank0:DOEDriver_List|{i}'
+                          for rank, samples in enumerate(self.samples)
+                          for i in range(len(samples))])
+
+        # the merged file holds a single copy of the metadata and layouts
+        with closing(sqlite3.connect('merged.sql')) as con:
+            self.assertEqual(con.execute("SELECT count(*) FROM metadata").fetchone()[0], 1)
+            self.assertEqual(con.execute("SELECT count(*) FROM var_layouts").fetchone()[0], 1)
+            self.assertEqual(con.execute("SELECT count(*) FROM global_iterations").fetchone()[0],
+                             9)
+
+    def test_merge_interleaved(self):
+        filenames = self.record_ranks()
+
+        # give the cases of the ranks interleaved timestamps, as when recorded concurrently
+        for rank, filename in enumerate(filenames):
+            with closing(sqlite3.connect(filename)) as con:
+                with con:
+                    con.execute("UPDATE driver_iterations SET timestamp = ? + id * 10",
+                                (rank,))
+
+        merge_cases(filenames, 'merged.sql', chunk_size=1)
+
+        cr = self.check_merged(filenames, 'merged.sql')
+        self.assertEqual(cr.list_cases('driver', recurse=False, out_stream=None), [
+            'rank0_rank0:DOEDriver_List|0',
+            'rank1_rank0:DOEDriver_List|0',
+            'rank2_rank0:DOEDriver_List|0',
+            'rank0_rank0:DOEDriver_List|1',
+            'rank1_rank0:DOEDriver_List|1',
+            'rank2_rank0:DOEDriver_List|1',
+            'rank0_rank0:DOEDriver_List|2',
+            'rank2_rank0:DOEDriver_List|2',
+            'rank2_rank0:DOEDriver_List|3',
+        ])
+
+    def test_merge_deltas(self):
+        filenames = self.record_ranks(record_deltas=True, keyframe_interval=2)
+
+        merge_cases('cases.sql', 'merged.sql', chunk_size=2)
+
+        self.check_merged(filenames, 'merged.sql')
+
+    def test_merge_duplicated_metadata(self):
+        # each file has its own copy of the metadata
+        filenames = []
+        for rank, samples in enumerate(self.samples):
+            filename = f'rank{rank}.sql'
+            run_doe(filename, samples, f'rank{rank}')
+            filenames.append(filename)
+
+        merge_cases(filenames, 'merged.sql')
+
+        self.check_merged(filenames, 'merged.sql')
+
+        with closing(sqlite3.connect('merged.sql')) as con:
+            self.assertEqual(con.execute("SELECT count(*) FROM metadata").fetchone()[0], 1)
+            self.assertEqual(con.execute("SELECT count(*) FROM driver_metadata").fetchone()[0], 1)
+
+    def test_merge_system_solver_cases(self):
+        filenames = []
+        for rank in range(2):
+            prob = om.Problem(SellarDerivatives())
+            prob.model.nonlinear_solver = om.NonlinearBlockGS()
+            filename = f'cases.sql_{rank}'
+            recorder = om.SqliteRecorder(os.path.join('.', filename))
+            prob.model.add_recorder(recorder)
+            prob.model.nonlinear_solver.add_recorder(recorder)
+            prob.setup()
+            prob.set_val('x', 1. + rank)
+            prob.run_model(case_prefix=f'rank{rank}')
+            prob.cleanup()
+            filenames.append(filename)
+
+        expected = []
+        for filename in filenames:
+            cr = om.CaseReader(filename)
+            expected.extend((case.source, case.get_val('y1')) for case in cr.get_cases())
+
+        merge_cases(filenames, 'merged.sql')
+
+        cr = om.CaseReader('merged.sql')
+        cases = cr.get_cases()
+        self.assertEqual(len(cases), len(expected))
+        for case, (source, y1) in zip(cases, expected):
+            self.assertEqual(case.source, source)
+            assert_near_equal(case.get_val('y1'), y1)
+
+    def test_merge_cmd(self):
+        self.record_ranks()
+
+        parser = argparse.ArgumentParser()
+        _merge_cases_setup_parser(parser)
+        _merge_cases_cmd(parser.parse_args(['cases.sql', '-o', 'merged.sql']), None)
+
+        cr = om.CaseReader('merged.sql')
+        self.assertEqual(len(cr.list_cases(out_stream=None)), 9)
+
+    def test_merge_errors(self):
+        filenames = self.record_ranks()
+
+        with self.assertRaises(IOError) as cm:
+            merge_cases('nocases.sql', 'merged.sql')
+        self.assertEqual(str(cm.exception), "No case recorder files were found for 'nocases.sql'.")
+
+        with self.assertRaises(ValueError) as cm:
+            merge_cases(filenames, filenames[1])
+        self.assertEqual(str(cm.exception), "The merged case recorder file, cases.sql_1, cannot "
+                         "be one of the files being merged.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            merge_cases(filenames[1:], 'merged.sql', metadata_filepath=filenames[0])
+        self.assertEqual(str(cm.exception),
+                         "No metadata was found for the case recorder files being merged.")
+
+
+if __name__ == '__main__':
+    unittest.main()
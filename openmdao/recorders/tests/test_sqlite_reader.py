@@ -4,6 +4,8 @@ import sys
 import os
 import unittest
 import platform
+import sqlite3
+from unittest import mock
 
 from io import StringIO
 from tempfile import mkstemp
@@ -1776,6 +1778,100 @@ class TestSqliteCaseReader(unittest.TestCase):
         assert_near_equal(case.get_val('ayy', indices=0), 52., 1e-6)
         assert_near_equal(case.get_val('ayy', 'degF', indices=0), 125.6, 1e-6)
 
+    def test_get_val_array(self):
+        model = om.Group()
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([77.0, 95.0]), units='degF'),
+                            promotes=['x'])
+        model.add_subsystem('acomp', om.ExecComp('y=x-25.',
+                                                 x={'val': np.array([77.0, 95.0]), 'units': 'degF'},
+                                                 y={'val': np.array([0., 0.]), 'units': 'degC'}),
+                            promotes=['x'])
+        model.add_design_var('x', lower=0., upper=200.)
+        model.add_objective('acomp.y', index=0)
+
+        samples = [[('x', np.array([float(i), 2. * i]))] for i in range(7)]
+
+        prob = om.Problem(model)
+        prob.driver = om.DOEDriver(om.ListGenerator(samples))
+        prob.driver.add_recorder(self.recorder)
+        prob.driver.recording_options['includes'] = ['*']
+        model.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+
+        driver_cases = cr.list_cases('driver', recurse=False, out_stream=None)
+        cases = [cr.get_case(case_id) for case_id in driver_cases]
+
+        case_ids, vals = cr.get_val_array('driver', 'acomp.y')
+        self.assertEqual(case_ids, driver_cases)
+        self.assertEqual(vals.shape, (7, 2))
+        assert_near_equal(vals, np.array([case.get_val('acomp.y') for case in cases]), 1e-12)
+
+        # units, indices and promoted input names
+        case_ids, vals = cr.get_val_array('driver', 'acomp.y', units='degF', indices=1)
+        assert_near_equal(vals, np.array([case.get_val('acomp.y', 'degF', indices=1)
+                                          for case in cases]), 1e-12)
+
+        case_ids, vals = cr.get_val_array('driver', 'x', units='degC', indices=[0])
+        self.assertEqual(vals.shape, (7, 1))
+        assert_near_equal(vals, np.array([case.get_val('x', 'degC', indices=[0])
+                                          for case in cases]), 1e-12)
+
+        # chunked iteration yields the same data in order
+        chunks = list(cr.iter_val_array('driver', 'acomp.y', chunk_size=3))
+        self.assertEqual([len(ids) for ids, _ in chunks], [3, 3, 1])
+        self.assertEqual([case_id for ids, _ in chunks for case_id in ids], driver_cases)
+        assert_near_equal(np.concatenate([v for _, v in chunks]),
+                          np.array([case.get_val('acomp.y') for case in cases]), 1e-12)
+
+        # system source
+        system_cases = cr.list_cases('root', recurse=False, out_stream=None)
+        case_ids, vals = cr.get_val_array('root', 'acomp.x')
+        self.assertEqual(case_ids, system_cases)
+        assert_near_equal(vals, np.array([cr.get_case(case_id).get_val('acomp.x')
+                                          for case_id in system_cases]), 1e-12)
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_array('driver', 'foo')
+        self.assertEqual(str(cm.exception), "'Variable name \"foo\" not found.'")
+
+        with self.assertRaises(TypeError) as cm:
+            cr.get_val_array('driver', 'acomp.y', units='m')
+        self.assertEqual(str(cm.exception),
+                         "Can't express variable 'acomp.y' with units of 'degC' in units of 'm'.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_array('foo', 'acomp.y')
+        self.assertEqual(str(cm.exception), "Source not found: foo")
+
+    def test_get_val_array_no_cases(self):
+        model = om.Group()
+        model.add_subsystem('acomp', om.ExecComp('y=2*x', x=np.ones((2, 3)), y=np.ones((2, 3))))
+
+        prob = om.Problem(model)
+        model.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+
+        # the driver was not recorded, but the values keep the shape of the variable
+        case_ids, vals = cr.get_val_array('driver', 'acomp.y')
+        self.assertEqual(case_ids, [])
+        self.assertEqual(vals.shape, (0, 2, 3))
+
+        case_ids, vals = cr.get_val_array('driver', 'acomp.x', indices=1)
+        self.assertEqual(vals.shape, (0, 3))
+
+        case_ids, vals = cr.get_val_array('driver', 'acomp.y', indices=[0])
+        self.assertEqual(vals.shape, (0, 1, 3))
+
+        self.assertEqual(np.concatenate([vals, vals]).shape, (0, 1, 3))
+
     def test_get_val_reducable_units(self):
 
         model = om.Group()
@@ -2065,6 +2161,97 @@ class TestSqliteCaseReader(unittest.TestCase):
                 self.assertTrue(key in case_type._cases)
                 self.assertEqual(key, case_type._cases[key].name)
 
+    def test_case_cache_size(self):
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                             linear_solver=om.ScipyKrylov)
+        prob.setup()
+
+        prob.model.nonlinear_solver.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        cr = om.CaseReader(filename, pre_load=False)
+        solver_cases = cr._solver_cases
+        keys = solver_cases.list_cases()
+        self.assertEqual(len(keys), 7)
+
+        case = solver_cases.get_case(keys[0], cache=True)
+        case_size = solver_cases._cases.nbytes
+        self.assertTrue(case_size > 0)
+
+        # only room for three cases, so the least recently used cases are dropped
+        cr = om.CaseReader(filename, pre_load=False, cache_size=3 * case_size)
+        solver_cases = cr._solver_cases
+
+        for key in keys[:3]:
+            solver_cases.get_case(key, cache=True)
+        self.assertEqual(len(solver_cases._cases), 3)
+
+        # touch the first case so the second becomes the least recently used
+        self.assertIs(solver_cases.get_case(keys[0]), solver_cases.get_case(keys[0]))
+        solver_cases.get_case(keys[3], cache=True)
+
+        self.assertEqual(len(solver_cases._cases), 3)
+        self.assertEqual(solver_cases._cases.evictions, 1)
+        self.assertTrue(solver_cases._cases.nbytes <= 3 * case_size)
+        self.assertTrue(keys[0] in solver_cases._cases)
+        self.assertFalse(keys[1] in solver_cases._cases)
+
+        # pre_load stops once the cache is full
+        cr = om.CaseReader(filename, pre_load=True, cache_size=3 * case_size)
+        self.assertEqual(len(cr._solver_cases._cases), 3)
+
+        # cases that are not cached are still available
+        for key in keys:
+            self.assertEqual(cr.get_case(key).name, key)
+
+    def test_case_indexes(self):
+        prob = SellarProblem()
+        prob.setup()
+
+        prob.driver.add_recorder(self.recorder)
+
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        # remove the indexes, as in a file from an older version
+        with sqlite3.connect(filename) as con:
+            con.execute("DROP INDEX driv_iter_ind")
+            con.execute("DROP INDEX driv_deriv_iter_ind")
+        con.close()
+
+        # small tables are not indexed when the file is opened
+        cr = om.CaseReader(filename)
+
+        with sqlite3.connect(filename) as con:
+            indexes = [row[0] for row in
+                       con.execute("SELECT name FROM sqlite_master WHERE type='index' "
+                                   "AND name NOT LIKE 'sqlite_%'")]
+        con.close()
+
+        self.assertEqual(sorted(indexes), ['driv_delta_ind', 'prob_name_ind', 'solv_delta_ind',
+                                           'solv_iter_ind', 'sys_delta_ind', 'sys_iter_ind'])
+
+        with mock.patch('openmdao.recorders.sqlite_reader._INDEX_MIN_ROWS', 0):
+            cr = om.CaseReader(filename)
+
+        with sqlite3.connect(filename) as con:
+            indexes = [row[0] for row in
+                       con.execute("SELECT name FROM sqlite_master WHERE type='index' "
+                                   "AND name NOT LIKE 'sqlite_%'")]
+        con.close()
+
+        self.assertEqual(sorted(indexes), ['driv_delta_ind', 'driv_deriv_iter_ind',
+                                           'driv_iter_ind', 'prob_name_ind', 'solv_delta_ind',
+                                           'solv_iter_ind', 'sys_delta_ind', 'sys_iter_ind'])
+
+        self.assertEqual(len(cr.list_cases('driver', out_stream=None)), 1)
+
     def test_simple_paraboloid_scaled_desvars(self):
 
         prob = om.Problem()
@@ -466,6 +466,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        assembled_jac_skip_unchanged: False",
             "        derivs_method: None",
             "        auto_order: False",
             "    Subsystem : p1",
@@ -540,6 +541,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        assembled_jac_skip_unchanged: False",
             "        derivs_method: None",
             "        auto_order: False",
             ""
@@ -581,6 +583,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        assembled_jac_skip_unchanged: False",
             "        derivs_method: None",
             "        auto_order: False",
             "    Subsystem : p1",
@@ -655,6 +658,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        assembled_jac_skip_unchanged: False",
             "        derivs_method: None",
             "        auto_order: False",
             ""
@@ -1950,6 +1954,119 @@ class TestSqliteRecorder(unittest.TestCase):
         )
         assertSystemIterDataRecorded(self, prob.get_outputs_dir() / self.filename, expected_data, self.eps)
 
+    def test_binary_storage(self):
+        # numeric iteration data is stored as packed binary, discrete data falls back to JSON
+        from openmdao.test_suite.components.expl_comp_array import TestExplCompArray
+        from openmdao.core.tests.test_discrete import ModCompEx
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', TestExplCompArray(thickness=1.), promotes=['*'])
+        indep = model.add_subsystem('indep', om.IndepVarComp())
+        indep.add_discrete_output('x', 11)
+        model.add_subsystem('mod', ModCompEx(3))
+        model.connect('indep.x', 'mod.x')
+
+        model.comp.add_recorder(self.recorder)
+        model.mod.add_recorder(self.recorder)
+        model.comp.recording_options['record_residuals'] = True
+
+        prob.setup()
+        prob['lengths'] = 3.
+        prob['widths'] = 2.
+        prob.run_model()
+        prob.run_model()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        with sqlite3.connect(filename) as con:
+            types = con.execute("SELECT typeof(inputs), typeof(outputs), typeof(residuals) "
+                                "FROM system_iterations ORDER BY id").fetchall()
+            nlayouts = con.execute("SELECT count(*) FROM var_layouts").fetchone()[0]
+        con.close()
+
+        self.assertEqual(types[0], ('blob', 'blob', 'blob'))
+        # residuals of 'mod' only contain the continuous output
+        self.assertEqual(types[1], ('text', 'text', 'blob'))
+        self.assertEqual(types[2], types[0])
+        self.assertEqual(types[3], types[1])
+
+        # each distinct layout is only recorded once (comp outputs and residuals share one)
+        self.assertEqual(nlayouts, 3)
+
+        cr = om.CaseReader(filename)
+
+        comp_case = cr.get_case(cr.list_cases('root.comp', out_stream=None)[-1])
+        assert_near_equal(comp_case.inputs['comp.lengths'], 3. * np.ones((2, 2)))
+        assert_near_equal(comp_case.outputs['areas'], 6. * np.ones((2, 2)))
+        assert_near_equal(comp_case.get_val('total_volume'), 24.)
+        assert_near_equal(comp_case.residuals['areas'], np.zeros((2, 2)))
+
+        mod_case = cr.get_case(cr.list_cases('root.mod', out_stream=None)[-1])
+        self.assertEqual(mod_case.inputs['mod.x'], 11)
+        self.assertEqual(mod_case.outputs['mod.y'], 2)
+        assert_near_equal(mod_case.residuals['mod.b'], 0.)
+
+    def test_binary_storage_dtypes(self):
+        # numeric arrays that are not float64 are read back with their original dtype
+        prob = om.Problem()
+        indep = prob.model.add_subsystem('indep', om.IndepVarComp('x', np.ones(2)))
+        indep.add_discrete_output('n', np.array([1, 2, 3]))
+        indep.add_discrete_output('flags', np.array([True, False]))
+
+        prob.model.add_recorder(self.recorder)
+
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        with sqlite3.connect(filename) as con:
+            otype = con.execute("SELECT typeof(outputs) FROM system_iterations").fetchone()[0]
+        con.close()
+
+        self.assertEqual(otype, 'blob')
+
+        cr = om.CaseReader(filename)
+        case = cr.get_case(cr.list_cases('root', out_stream=None)[-1])
+
+        n = case.outputs['indep.n']
+        self.assertEqual(n.dtype, np.array([1]).dtype)
+        np.testing.assert_array_equal(n, [1, 2, 3])
+
+        flags = case.outputs['indep.flags']
+        self.assertEqual(flags.dtype, bool)
+        np.testing.assert_array_equal(flags, [True, False])
+
+        x = case.outputs['indep.x']
+        self.assertEqual(x.dtype, np.float64)
+        assert_near_equal(x, np.ones(2))
+
+        # the decoded values can be changed like those of any other case
+        case.outputs['indep.x'] = 3.
+        assert_near_equal(case.outputs['indep.x'], 3. * np.ones(2))
+        case.outputs['indep.n'][0] = 7
+        np.testing.assert_array_equal(case.outputs['indep.n'], [7, 2, 3])
+
+    def test_binary_storage_writable(self):
+        # values decoded from float64 blobs can be set and changed in place
+        prob = SellarProblem()
+        prob.model.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+        case = cr.get_case(cr.list_cases('root', out_stream=None)[-1])
+
+        case.outputs['y1'] = 3.0
+        assert_near_equal(case.outputs['y1'], 3.0)
+
+        case.inputs['obj_cmp.y2'] += 1.0
+        assert_near_equal(case.inputs['obj_cmp.y2'], prob['y2'] + 1.0, 1e-10)
+
     def test_record_system_recursively(self):
         # Test adding recorders to all Systems using the recurse option to add_recorder
 
@@ -2179,6 +2296,264 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertFalse(system._rec_mgr.has_recorders())
         self.assertFalse(solver._rec_mgr.has_recorders())
 
+    def test_async_write(self):
+        # cases written by the background writer should match those written synchronously
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+            prob.setup()
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            prob.model.mda.nonlinear_solver.add_recorder(recorder)
+            prob.add_recorder(recorder)
+            prob.run_driver()
+            prob.record('final')
+            prob.cleanup()
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath)
+
+        sync_cr = run(om.SqliteRecorder('sync_cases.sql'))
+        async_cr = run(om.SqliteRecorder('async_cases.sql', async_write=True,
+                                         batch_size=7, queue_size=3))
+
+        sync_cases = sync_cr.list_cases(out_stream=None)
+        self.assertEqual(async_cr.list_cases(out_stream=None), sync_cases)
+        self.assertEqual(async_cr.list_sources(out_stream=None),
+                         sync_cr.list_sources(out_stream=None))
+
+        for case_id in sync_cases:
+            sync_case = sync_cr.get_case(case_id)
+            async_case = async_cr.get_case(case_id)
+            self.assertEqual(async_case.counter, sync_case.counter)
+            for name in sync_case.outputs:
+                assert_near_equal(async_case.outputs[name], sync_case.outputs[name])
+
+    def test_async_write_error(self):
+        prob = SellarProblem()
+        recorder = om.SqliteRecorder(self.filename, async_write=True)
+        prob.model.add_recorder(recorder)
+        prob.setup()
+        prob.run_model()
+
+        # force a failure in the writer thread
+        recorder._row_ids['system_iterations'] = 0
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.cleanup()
+
+        self.assertEqual(str(cm.exception), "Error writing recorded cases: "
+                         "UNIQUE constraint failed: system_iterations.id")
+
+    def test_record_deltas(self):
+        # cases reconstructed from deltas should match those recorded in full
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+            prob.setup()
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            prob.model.mda.nonlinear_solver.add_recorder(recorder)
+            prob.model.mda.nonlinear_solver.recording_options['record_solver_residuals'] = True
+            prob.add_recorder(recorder)
+            prob.run_driver()
+            prob.record('final')
+            prob.cleanup()
+            return prob.get_outputs_dir() / recorder._filepath
+
+        full_file = run(om.SqliteRecorder('full_cases.sql'))
+        delta_file = run(om.SqliteRecorder('delta_cases.sql', record_deltas=True,
+                                           keyframe_interval=5))
+
+        with sqlite3.connect(delta_file) as con:
+            cur = con.cursor()
+            for table in ('driver_iterations', 'system_iterations', 'solver_iterations'):
+                cur.execute(f"SELECT count(*) FROM {table} WHERE delta_base IS NULL")
+                keyframes = cur.fetchone()[0]
+                cur.execute(f"SELECT count(*) FROM {table} WHERE delta_base IS NOT NULL")
+                deltas = cur.fetchone()[0]
+                self.assertTrue(keyframes > 0)
+                self.assertTrue(deltas >= 3 * keyframes)
+        con.close()
+
+        full_cr = om.CaseReader(full_file)
+        delta_cr = om.CaseReader(delta_file, pre_load=False)
+
+        full_cases = full_cr.list_cases(out_stream=None)
+        self.assertEqual(delta_cr.list_cases(out_stream=None), full_cases)
+
+        for case_id in full_cases:
+            full_case = full_cr.get_case(case_id)
+            delta_case = delta_cr.get_case(case_id)
+            for attr in ('inputs', 'outputs', 'residuals'):
+                full_vals = getattr(full_case, attr)
+                delta_vals = getattr(delta_case, attr)
+                if full_vals is None:
+                    self.assertIsNone(delta_vals)
+                    continue
+                self.assertEqual(list(delta_vals), list(full_vals))
+                for name in full_vals:
+                    assert_near_equal(delta_vals[name], full_vals[name], 1e-15)
+
+        # iterating over all cases or a single variable reconstructs them as well
+        for full_case, delta_case in zip(full_cr.get_cases('root.mda.nonlinear_solver'),
+                                         delta_cr._solver_cases.cases()):
+            assert_near_equal(delta_case.outputs['y1'], full_case.outputs['y1'], 1e-15)
+
+        for source, name in (('driver', 'z'), ('root', 'y2'), ('root.mda.nonlinear_solver', 'y2')):
+            full_ids, full_vals = full_cr.get_val_array(source, name)
+            delta_ids, delta_vals = delta_cr.get_val_array(source, name)
+            self.assertEqual(delta_ids, full_ids)
+            assert_near_equal(delta_vals, full_vals, 1e-15)
+
+    def test_record_deltas_tol(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('ivc', om.IndepVarComp('x', np.ones(3)))
+        prob.model.add_subsystem('comp', om.ExecComp('y=2*x', x=np.ones(3), y=np.ones(3)))
+        prob.model.connect('ivc.x', 'comp.x')
+        prob.model.add_design_var('ivc.x')
+        prob.model.add_objective('comp.y', index=0)
+
+        expected = [1., 1.0001, 1.0002, 1.002, 1.]
+        prob.driver = om.DOEDriver(om.ListGenerator([[('ivc.x', x * np.ones(3))]
+                                                     for x in expected]))
+
+        recorder = om.SqliteRecorder(self.filename, record_deltas=True, delta_tol=1e-3)
+        prob.model.add_recorder(recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = prob.get_outputs_dir() / self.filename
+
+        with sqlite3.connect(filename) as con:
+            cur = con.cursor()
+            cur.execute("SELECT outputs, delta_base FROM system_iterations ORDER BY id")
+            rows = cur.fetchall()
+        con.close()
+
+        # only the keyframe and the cases that changed by more than the tolerance record values
+        self.assertEqual([row[1] for row in rows], [None, 1, 1, 1, 1])
+        self.assertEqual([row[0] for row in rows][1:3], ['{}', '{}'])
+
+        cr = om.CaseReader(filename)
+        cases = cr.list_cases('root', out_stream=None)
+        recorded = [1., 1., 1., 1.002, 1.]
+        for case_id, x in zip(cases, recorded):
+            assert_near_equal(cr.get_case(case_id).get_val('ivc.x'), x * np.ones(3), 1e-15)
+
+    def _run_doe_policy(self, **options):
+        # DOE with objective values 17, 13, 14, 17, 14, 22, 29
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-10, upper=10)
+        prob.model.add_design_var('y', lower=-10, upper=10)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x), ('y', 0.)]
+                                                     for x in (5., 3., 4., 1., 2., 0., 7.)]))
+        prob.driver.add_recorder(self.recorder)
+        prob.driver.recording_options.update(options)
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+        return [case.get_val('x')[0] for case in cr.get_cases('driver')]
+
+    def test_record_every(self):
+        self.assertEqual(self._run_doe_policy(every=3), [5., 1., 7.])
+
+    def test_record_first_and_last(self):
+        self.assertEqual(self._run_doe_policy(first_and_last=True), [5., 7.])
+
+    def test_record_on_objective_improvement(self):
+        self.assertEqual(self._run_doe_policy(on_objective_improvement=True), [5., 3.])
+
+    def test_record_min_interval(self):
+        self.assertEqual(self._run_doe_policy(min_interval_seconds=1e6), [5.])
+
+    def test_record_max_cases(self):
+        self.assertEqual(self._run_doe_policy(max_cases=3), [2., 0., 7.])
+
+    def test_record_max_cases_every(self):
+        self.assertEqual(self._run_doe_policy(max_cases=2, every=2), [2., 7.])
+
+    def test_record_max_cases_deltas(self):
+        # a source that keeps only its latest cases records them in full
+        self.recorder = om.SqliteRecorder(self.filename, record_deltas=True)
+        self.assertEqual(self._run_doe_policy(max_cases=3), [2., 0., 7.])
+
+    def test_record_policies_solver(self):
+        prob = SellarProblem()
+        prob.model.nonlinear_solver = om.NonlinearBlockGS()
+        prob.setup()
+
+        solver = prob.model.nonlinear_solver
+        solver.add_recorder(self.recorder)
+        solver.recording_options['first_and_last'] = True
+        prob.model.add_recorder(self.recorder)
+        prob.model.recording_options['every'] = 2
+
+        for i in range(3):
+            prob.set_val('x', 1. + i)
+            prob.run_model(case_prefix=f'run{i}')
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+
+        # the first and last iterations of the solver in each run
+        solver_cases = cr.list_cases('root.nonlinear_solver', recurse=False, out_stream=None)
+        self.assertEqual(solver_cases, [f'run{i}_rank0:root._solve_nonlinear|0|NonlinearBlockGS|{j}'
+                                        for i, last in enumerate((7, 6, 6)) for j in (1, last)])
+        last_case = cr.get_case(solver_cases[-1])
+        assert_near_equal(last_case.get_val('y1'), prob.get_val('y1'), 1e-15)
+
+        # the system is run once per run_model
+        self.assertEqual(len(cr.list_cases('root', recurse=False, out_stream=None)), 3)
+
+        prob = SellarProblem()
+        prob.setup()
+        prob.model.add_recorder(om.SqliteRecorder(self.filename))
+        prob.model.recording_options['every'] = 2
+        prob.run_model()
+        for _ in range(4):
+            prob.model.run_solve_nonlinear()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+        self.assertEqual(cr.list_cases('root', recurse=False, out_stream=None),
+                         ['rank0:root._solve_nonlinear|0', 'rank0:root._solve_nonlinear|2',
+                          'rank0:root._solve_nonlinear|4'])
+
+    def test_record_first_and_last_each_solve(self):
+        # a solver records the first and last iterations of each of its solves in a run
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS)
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x)] for x in (1., 2., 3.)]))
+        prob.setup()
+
+        solver = prob.model.nonlinear_solver
+        solver.add_recorder(self.recorder)
+        solver.recording_options['first_and_last'] = True
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / self.filename)
+
+        solver_cases = cr.list_cases('root.nonlinear_solver', recurse=False, out_stream=None)
+        self.assertEqual(solver_cases,
+                         [f'rank0:DOEDriver_List|{i}|root._solve_nonlinear|{i}|NonlinearBlockGS|{j}'
+                          for i, last in enumerate((7, 6, 6)) for j in (1, last)])
+
+        # the last iteration of each solve holds the converged values of that solve
+        for i, x in enumerate((1., 2., 3.)):
+            case = cr.get_case(solver_cases[2 * i + 1])
+            assert_near_equal(case.get_val('x'), x, 1e-15)
+
+        assert_near_equal(cr.get_case(solver_cases[-1]).get_val('y1'), prob.get_val('y1'),
+                          1e-15)
+
     def test_problem_record_no_voi(self):
         prob = om.Problem(SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS,
                                             linear_solver=om.ScipyKrylov))
@@ -3020,6 +3395,7 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
+                                               'nonlinear_warm_start': False,
                                                'run_parallel': False, 'procs_per_model': 1})
 
         # Optimization
@@ -3040,6 +3416,7 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "invalid_desvar_behavior": "warn",
+                                               "nonlinear_warm_start": False,
                                                 'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
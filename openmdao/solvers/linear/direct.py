@@ -5,12 +5,12 @@ import warnings
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, bsr_matrix
 
 from openmdao.solvers.solver import LinearSolver
-from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.utils.array_utils import identity_column_iter
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
+from openmdao.solvers.linear.lu_backends import _lu_backends
 
 
 def index_to_varname(system, loc):
@@ -184,6 +184,8 @@ class DirectSolver(LinearSolver):
     ----------
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _backend : LUBackend or None
+        Object that computes and holds the LU factorization.
     """
 
     SOLVER = 'LN: Direct'
@@ -194,6 +196,7 @@ class DirectSolver(LinearSolver):
         """
         super().__init__(**kwargs)
         self._lin_rhs_checker = None
+        self._backend = None
 
     def _declare_options(self):
         """
@@ -211,6 +214,21 @@ class DirectSolver(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('backend', default='auto', values=['auto'] + list(_lu_backends),
+                             desc="Library used for the LU factorization. 'superlu' and 'klu' "
+                             "are sparse factorizations that compute the column ordering once "
+                             "and reuse it while the sparsity structure doesn't change, 'klu' "
+                             "using a KLU-like ordering and pivoting strategy. 'dense' uses "
+                             "LAPACK, and 'pardiso' uses the threaded MKL PARDISO solver if "
+                             "pypardiso is installed. 'auto' uses 'superlu' for sparse "
+                             "assembled jacobians and 'dense' otherwise.")
+
+        self.options.declare('rhs_batch_size', types=int, default=64, lower=1,
+                             desc="Maximum number of right-hand sides that are solved together "
+                             "when computing total derivatives with this solver on the model. "
+                             "Larger batches make fewer calls to the factorization but use "
+                             "more memory. Set to 1 to solve them one at a time.")
+
         # this solver does not iterate
         self.options.undeclare("maxiter")
         self.options.undeclare("err_on_non_converge")
@@ -239,6 +257,22 @@ class DirectSolver(LinearSolver):
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
 
+        # total derivative solves can only be batched in the unscaled state of the assembled
+        # jacobian, and if each one doesn't need to be checked
+        self.supports['multi_rhs'] = self.options['assemble_jac'] and \
+            self._lin_rhs_checker is None and self.options['rhs_batch_size'] > 1
+        self.supports['multi_column'] = self._lin_rhs_checker is None
+
+        # an 'auto' backend is chosen when the type of the matrix is known
+        backend = self.options['backend']
+        if backend == 'auto':
+            self._backend = None
+        else:
+            try:
+                self._backend = _lu_backends[backend]()
+            except RuntimeError as err:
+                raise RuntimeError(f"{self.msginfo}: {err}")
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -323,33 +357,22 @@ class DirectSolver(LinearSolver):
         if self._assembled_jac is not None:
             matrix = self._assembled_jac._int_mtx._matrix
 
+            if isinstance(matrix, bsr_matrix):
+                # SuperLU only factorizes CSC matrices. The BSR matrix keeps a CSC copy with a
+                # fixed structure, so the conversion is only computed once.
+                matrix = self._assembled_jac._int_mtx._get_csc()
+
             if matrix is None:
                 # this happens if we're not rank 0 when using owned_sizes
-                self._lu = self._lup = None
+                if self._backend is not None:
+                    self._backend.clear()
 
             # Perform dense or sparse lu factorization.
-            elif isinstance(matrix, csc_matrix):
-                try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
-                except RuntimeError:
-                    raise RuntimeError(format_singular_error(system, matrix))
-
-            elif isinstance(matrix, np.ndarray):  # dense
-                # During LU decomposition, detect singularities and warn user.
-                with warnings.catch_warnings():
-                    if self.options['err_on_singular']:
-                        warnings.simplefilter('error', RuntimeWarning)
-                    try:
-                        self._lup = scipy.linalg.lu_factor(matrix)
-                    except RuntimeWarning:
-                        raise RuntimeError(format_singular_error(system, matrix))
-
-                    # NaN in matrix.
-                    except ValueError:
-                        raise RuntimeError(format_nan_error(system, matrix))
-
             # Note: calling scipy.sparse.linalg.splu on a COO actually transposes
             # the matrix during conversion to csc prior to LU decomp, so we can't use COO.
+            elif isinstance(matrix, (csc_matrix, np.ndarray)):
+                self._factor(matrix)
+
             else:
                 raise RuntimeError("Direct solver not implemented for matrix type %s"
                                    " in %s." % (type(self._assembled_jac._int_mtx),
@@ -359,26 +382,40 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("DirectSolvers without an assembled jacobian are not supported "
                                    "when running under MPI if comm.size > 1.")
 
-            mtx = self._build_mtx()
+            self._factor(self._build_mtx())
 
-            # During LU decomposition, detect singularities and warn user.
-            with warnings.catch_warnings():
+        if self._lin_rhs_checker is not None:
+            self._lin_rhs_checker.clear()
 
-                if self.options['err_on_singular']:
-                    warnings.simplefilter('error', RuntimeWarning)
+    def _factor(self, matrix):
+        """
+        Compute the LU factorization of the matrix with the backend.
 
-                try:
-                    self._lup = scipy.linalg.lu_factor(mtx)
+        Parameters
+        ----------
+        matrix : ndarray or csc_matrix
+            Matrix to be factorized.
+        """
+        if self._backend is None:
+            self._backend = _lu_backends['dense' if isinstance(matrix, np.ndarray)
+                                         else 'superlu']()
 
-                except RuntimeWarning:
-                    raise RuntimeError(format_singular_error(system, mtx))
+        # During LU decomposition, detect singularities and warn user.
+        with warnings.catch_warnings():
+            if self.options['err_on_singular']:
+                warnings.simplefilter('error', RuntimeWarning)
 
-                # NaN in matrix.
-                except ValueError:
-                    raise RuntimeError(format_nan_error(system, mtx))
+            try:
+                self._backend.factor(matrix)
 
-        if self._lin_rhs_checker is not None:
-            self._lin_rhs_checker.clear()
+            except (RuntimeError, RuntimeWarning):
+                raise RuntimeError(format_singular_error(self._system(), matrix))
+
+            # NaN in matrix.
+            except ValueError:
+                if scipy.sparse.issparse(matrix):
+                    matrix = matrix.toarray()
+                raise RuntimeError(format_nan_error(self._system(), matrix))
 
     def _inverse(self):
         """
@@ -399,6 +436,9 @@ class DirectSolver(LinearSolver):
 
             matrix = self._assembled_jac._int_mtx._matrix
 
+            if isinstance(matrix, bsr_matrix):
+                matrix = self._assembled_jac._int_mtx._get_csc()
+
             if matrix is None:
                 # This happens if we're not rank 0 and owned_sizes are being used
                 sz = np.sum(system._owned_sizes)
@@ -477,13 +517,9 @@ class DirectSolver(LinearSolver):
         if mode == 'fwd':
             x_vec = d_outputs.asarray()
             b_vec = d_residuals.asarray()
-            trans_lu = 0
-            trans_splu = 'N'
         else:  # rev
             x_vec = d_residuals.asarray()
             b_vec = d_outputs.asarray()
-            trans_lu = 1
-            trans_splu = 'T'
 
             if self._lin_rhs_checker is not None:
                 sol_array, is_zero = self._lin_rhs_checker.get_solution(b_vec, system)
@@ -496,19 +532,33 @@ class DirectSolver(LinearSolver):
 
         # AssembledJacobians are unscaled.
         if self._assembled_jac is not None:
-            full_b = b_vec
-
             with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
-                    sol_array = scipy.linalg.lu_solve(self._lup, full_b, trans=trans_lu)
-                else:
-                    sol_array = self._lu.solve(full_b, trans_splu)
-
-                x_vec[:] = sol_array
+                x_vec[:] = sol_array = self._backend.solve(b_vec, mode == 'rev')
 
         # matrix-vector-product generated jacobians are scaled.
         else:
-            x_vec[:] = sol_array = scipy.linalg.lu_solve(self._lup, b_vec, trans=trans_lu)
+            x_vec[:] = sol_array = self._backend.solve(b_vec, mode == 'rev')
 
         if not system.under_complex_step and self._lin_rhs_checker is not None and mode == 'rev':
             self._lin_rhs_checker.add_solution(b_vec, sol_array, copy=True)
+
+    def _solve_multi_rhs(self, rhs, mode):
+        """
+        Solve for several right-hand sides at once.
+
+        This is only supported with an assembled jacobian, which is unscaled, so the right-hand
+        sides and the solutions are in the unscaled state of the vectors.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array with a right-hand side in each column.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Array with the solution for each right-hand side in the same column.
+        """
+        return self._backend.solve(rhs, mode == 'rev')
@@ -50,6 +50,22 @@ class LinearBlockGS(BlockLinearSolver):
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
 
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        # the Aitken relaxation factor comes from dot products of single column vectors
+        self.supports['multi_column'] = not self.options['use_aitken']
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -1,5 +1,5 @@
 """Define the LinearBlockJac class."""
-from openmdao.solvers.solver import BlockLinearSolver
+from openmdao.solvers.solver import BlockLinearSolver, _get_num_threads, _run_subsystems
 
 
 class LinearBlockJac(BlockLinearSolver):
@@ -10,56 +10,120 @@ class LinearBlockJac(BlockLinearSolver):
     ----------
     **kwargs : dict
         Options dictionary.
+
+    Attributes
+    ----------
+    _num_threads : int
+        Number of threads used to run the subsystems, or 1 if they are run one after the other.
     """
 
     SOLVER = 'LN: LNBJ'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize attributes.
+        """
+        super().__init__(**kwargs)
+        self._num_threads = 1
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', default=1, types=int, lower=1,
+                             desc='Number of threads used to run the subsystems concurrently. '
+                                  'This only pays off when the subsystems spend their time in '
+                                  'code that releases the GIL, such as numpy or compiled '
+                                  'extensions. It is ignored under MPI and when a recorder is '
+                                  'attached below the owning system.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._num_threads = _get_num_threads(self, system)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
         mode = self._mode
+        num_threads = self._num_threads
 
-        subs = list(system._relevance.filter(system._subsystems_myproc))
-        scopelist = [None] * len(subs)
+        scopelist = []
+        for subsys in system._relevance.filter(system._subsystems_myproc):
+            scope_out, scope_in = system._get_matvec_scope(subsys)
+            scopelist.append((subsys, mode, self._vars_union(self._scope_out, scope_out),
+                              self._vars_union(self._scope_in, scope_in)))
 
         if mode == 'fwd':
             system._transfer('linear', mode)
 
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = system._get_matvec_scope(subsys)
-                scope_out = self._vars_union(self._scope_out, scope_out)
-                scope_in = self._vars_union(self._scope_in, scope_in)
-                scopelist[i] = (scope_out, scope_in)
-                if subsys._iter_call_apply_linear():
-                    subsys._apply_linear(None, mode, scope_out, scope_in)
-                else:
-                    subsys._dresiduals.set_val(0.0)
+            _run_subsystems(system, _apply_linear, scopelist, num_threads)
 
             system._dresiduals *= -1.0
             system._dresiduals += self._rhs_vec
 
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = scopelist[i]
-                subsys._solve_linear(mode, scope_out, scope_in)
+            _run_subsystems(system, _solve_linear, scopelist, num_threads)
 
         else:  # rev
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = system._get_matvec_scope(subsys)
-                scope_out = self._vars_union(self._scope_out, scope_out)
-                scope_in = self._vars_union(self._scope_in, scope_in)
-                scopelist[i] = (scope_out, scope_in)
-                if subsys._iter_call_apply_linear():
-                    subsys._apply_linear(None, mode, scope_out, scope_in)
-                else:
-                    subsys._doutputs.set_val(0.0)
+            _run_subsystems(system, _apply_linear, scopelist, num_threads)
 
             system._transfer('linear', mode)
 
             system._doutputs *= -1.0
             system._doutputs += self._rhs_vec
 
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = scopelist[i]
-                subsys._solve_linear(mode, scope_out, scope_in)
+            _run_subsystems(system, _solve_linear, scopelist, num_threads)
+
+
+def _apply_linear(subsys, mode, scope_out, scope_in):
+    """
+    Run the linear apply of a subsystem.
+
+    Parameters
+    ----------
+    subsys : System
+        The subsystem.
+    mode : str
+        'fwd' or 'rev'.
+    scope_out : set, None, or _UNDEFINED
+        Outputs relevant to possible lower level calls to _apply_linear on Components.
+    scope_in : set, None, or _UNDEFINED
+        Inputs relevant to possible lower level calls to _apply_linear on Components.
+    """
+    if subsys._iter_call_apply_linear():
+        subsys._apply_linear(None, mode, scope_out, scope_in)
+    elif mode == 'fwd':
+        subsys._dresiduals.set_val(0.0)
+    else:
+        subsys._doutputs.set_val(0.0)
+
+
+def _solve_linear(subsys, mode, scope_out, scope_in):
+    """
+    Run the linear solve of a subsystem.
+
+    Parameters
+    ----------
+    subsys : System
+        The subsystem.
+    mode : str
+        'fwd' or 'rev'.
+    scope_out : set, None, or _UNDEFINED
+        Outputs relevant to possible lower level calls to _apply_linear on Components.
+    scope_in : set, None, or _UNDEFINED
+        Inputs relevant to possible lower level calls to _apply_linear on Components.
+    """
+    subsys._solve_linear(mode, scope_out, scope_in)
@@ -0,0 +1,218 @@
+"""
+Define the LinearWarmStart class.
+
+LinearWarmStart keeps the last solution of each derivative seed for use as the initial guess of
+an iterative linear solver in later calls to compute_totals.
+"""
+
+import atexit
+
+import numpy as np
+
+from openmdao.visualization.tables.table_builder import generate_table
+
+
+_warm_start_stats = {}
+
+
+def _print_stats():
+    """
+    Print out warm start statistics at the end of the run.
+    """
+    if _warm_start_stats:
+        headers = ['System', 'Hits', 'Misses', 'Avg Warm Iters', 'Avg Cold Iters']
+        for prob_name, dct in _warm_start_stats.items():
+            rows = []
+            for syspath, stats in dct.items():
+                rows.append([syspath, stats['hits'], stats['misses'],
+                             _avg(stats['warm_iters'], stats['hits']),
+                             _avg(stats['cold_iters'], stats['misses'])])
+
+            print(f"\nWarm Start Statistics for Problem '{prob_name}':")
+            generate_table(rows, tablefmt='simple_grid', headers=headers).display()
+
+
+def _avg(total, count):
+    """
+    Return the average number of iterations, or '-' if there were no solves.
+
+    Parameters
+    ----------
+    total : int
+        Total number of iterations.
+    count : int
+        Number of solves.
+
+    Returns
+    -------
+    float or str
+        The average number of iterations.
+    """
+    return round(total / count, 2) if count else '-'
+
+
+class LinearWarmStart(object):
+    """
+    Class that keeps the last linear solution of each derivative seed.
+
+    The solution of a seed from a previous call to compute_totals is used as the initial guess
+    when the same seed is solved again, e.g., in the next driver iteration.
+
+    Parameters
+    ----------
+    system : System
+        The system that owns the solver that owns this LinearWarmStart.
+    float32 : bool
+        If True, store the solutions in single precision to halve the memory they use.
+        Defaults to False.
+    collect_stats : bool
+        If True, collect statistics about the hits and iterations. Defaults to False.
+
+    Attributes
+    ----------
+    _cache : dict
+        Tuples of the compute_totals count and the solution, keyed by seed.
+    _dtype : dtype
+        Data type of the stored solutions.
+    _key : tuple or None
+        Key of the seed currently being solved, or None if it won't be stored.
+    _warm : bool or None
+        True if the current solve started from a stored solution, False if there was none, or
+        None if the seed was already solved in the current compute_totals.
+    _stats : dict or None
+        Dictionary to store warm start statistics.
+    """
+
+    options = ('float32', 'collect_stats')
+
+    def __init__(self, system, float32=False, collect_stats=False):
+        """
+        Initialize the LinearWarmStart.
+        """
+        self._cache = {}
+        self._dtype = np.float32 if float32 else float
+        self._key = None
+        self._warm = False
+
+        # print out the stats at the end of the run
+        if collect_stats:
+            self._stats = {'hits': 0, 'misses': 0, 'warm_iters': 0, 'cold_iters': 0}
+            prob_name = system._problem_meta['name']
+            if not _warm_start_stats:
+                atexit.register(_print_stats)
+            if prob_name not in _warm_start_stats:
+                _warm_start_stats[prob_name] = {}
+            _warm_start_stats[prob_name][system.pathname] = self._stats
+        else:
+            self._stats = None
+
+    @staticmethod
+    def create(system, opts):
+        """
+        Conditionally create a LinearWarmStart instance.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the solver that owns this LinearWarmStart.
+        opts : dict or bool
+            Options for the LinearWarmStart. If True, the LinearWarmStart will be created
+            with default options.  If a dict, the values will override the defaults.
+
+        Returns
+        -------
+        LinearWarmStart or None
+            A LinearWarmStart instance if it was created, None otherwise.
+        """
+        if isinstance(opts, dict):
+            invalid = set(opts).difference(LinearWarmStart.options)
+            if invalid:
+                if len(invalid) == 1:
+                    invalid = f" '{invalid.pop()}'"
+                else:
+                    invalid = f"s {sorted(invalid)}"
+                raise ValueError(f"{system.linear_solver.msginfo}: unrecognized 'warm_start' "
+                                 f"option{invalid}. Valid options are {LinearWarmStart.options}.")
+            return LinearWarmStart(system, **opts)
+        elif opts:
+            return LinearWarmStart(system)
+
+    def clear(self):
+        """
+        Clear the stored solutions.
+        """
+        self._cache.clear()
+
+    def start(self, system, x_vec):
+        """
+        Set the stored solution of the current seed, if any, into the solution vector.
+
+        Nothing is done outside of compute_totals, under complex step, or when the same seed
+        has already been solved in the current compute_totals, e.g., because an iterative solver
+        higher in the model is iterating, in which case the current value of the solution vector
+        is better.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the solver that owns this LinearWarmStart.
+        x_vec : Vector
+            The solution vector.
+
+        Returns
+        -------
+        bool
+            True if the solution vector was set to a stored solution.
+        """
+        meta = system._problem_meta
+        self._key = key = meta['seed_key']
+        self._warm = False
+
+        if key is None or system.under_complex_step or x_vec.asarray().ndim > 1:
+            self._key = None
+            return False
+
+        try:
+            ncompute_totals, solution = self._cache[key]
+        except KeyError:
+            if self._stats is not None:
+                self._stats['misses'] += 1
+            return False
+
+        if ncompute_totals == meta['ncompute_totals']:
+            self._warm = None
+            return False
+
+        x_vec.set_val(solution)
+        self._warm = True
+        if self._stats is not None:
+            self._stats['hits'] += 1
+
+        return True
+
+    def finish(self, system, x_vec, iter_count):
+        """
+        Store the solution of the current seed.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the solver that owns this LinearWarmStart.
+        x_vec : Vector
+            The solution vector.
+        iter_count : int
+            Number of iterations taken by the solve.
+        """
+        if self._key is None:
+            return
+
+        self._cache[self._key] = (system._problem_meta['ncompute_totals'],
+                                  x_vec.asarray().astype(self._dtype))
+
+        if self._stats is not None:
+            if self._warm:
+                self._stats['warm_iters'] += iter_count
+            elif self._warm is not None:
+                self._stats['cold_iters'] += iter_count
+
+        self._key = None
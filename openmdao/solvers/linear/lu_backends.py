@@ -0,0 +1,394 @@
+"""
+Define the LU factorization backends used by the DirectSolver.
+
+The SuperLU backends compute the fill-reducing column ordering of the matrix the first time it
+is factorized and reuse it for every later factorization of a matrix with the same sparsity
+structure, so only the numeric factorization is repeated.
+"""
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix, csr_matrix, issparse
+
+from openmdao.core.constants import INT_DTYPE
+
+try:
+    import pypardiso
+except ImportError:
+    pypardiso = None
+
+
+class LUBackend(object):
+    """
+    Base class for the LU factorization backends of a DirectSolver.
+
+    A backend raises a RuntimeError (or issues a RuntimeWarning) when the matrix is singular
+    and a ValueError when it contains NaN, so the DirectSolver can report the problem.
+
+    Attributes
+    ----------
+    _num_factorizations : int
+        Number of times a matrix has been factorized.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        self._num_factorizations = 0
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or csc_matrix
+            Matrix to be factorized.
+        """
+        self._num_factorizations += 1
+
+    def clear(self):
+        """
+        Discard the current factorization.
+        """
+        pass
+
+    def solve(self, b, trans=False):
+        """
+        Solve the factorized linear system for the given right-hand side.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side of the linear system.
+        trans : bool
+            If True, solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has not implemented 'solve'.")
+
+
+class DenseLUBackend(LUBackend):
+    """
+    LU factorization backend using the dense LAPACK routines in scipy.linalg.
+
+    Sparse matrices are converted to dense arrays before they are factorized.
+
+    Attributes
+    ----------
+    _lup : tuple
+        LU factors and pivot indices returned by scipy.linalg.lu_factor.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        super().__init__()
+        self._lup = None
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or csc_matrix
+            Matrix to be factorized.
+        """
+        super().factor(matrix)
+        if issparse(matrix):
+            matrix = matrix.toarray()
+        self._lup = scipy.linalg.lu_factor(matrix)
+
+    def clear(self):
+        """
+        Discard the current factorization.
+        """
+        self._lup = None
+
+    def solve(self, b, trans=False):
+        """
+        Solve the factorized linear system for the given right-hand side.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side of the linear system.
+        trans : bool
+            If True, solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        return scipy.linalg.lu_solve(self._lup, b, trans=1 if trans else 0)
+
+
+class SuperLUBackend(LUBackend):
+    """
+    Sparse LU factorization backend using SuperLU through scipy.sparse.linalg.splu.
+
+    The column ordering computed by the first factorization is kept. Later matrices with the
+    same sparsity structure have their columns permuted into that order and are factorized
+    without recomputing it.
+
+    Attributes
+    ----------
+    _lu : SuperLU or None
+        The current factorization.
+    _permuted : bool
+        True if _lu is the factorization of the column permuted matrix.
+    _indptr : ndarray or None
+        Column pointers of the matrix the ordering was computed for.
+    _indices : ndarray or None
+        Row indices of the matrix the ordering was computed for.
+    _perm : ndarray or None
+        Column of the matrix that is moved to each column of the permuted matrix.
+    _lu_perm_c : ndarray or None
+        Column of the permuted matrix that each column of the matrix is moved to.
+    _perm_data : ndarray or None
+        Index into the matrix data of each entry of the permuted matrix data.
+    _perm_indices : ndarray or None
+        Row indices of the permuted matrix.
+    _perm_indptr : ndarray or None
+        Column pointers of the permuted matrix.
+    _num_orderings : int
+        Number of times the column ordering has been computed.
+    """
+
+    # Options passed to splu when computing the column ordering.
+    _permc_spec = 'COLAMD'
+    _splu_options = {}
+
+    # Threshold used to decide if a diagonal entry is an acceptable pivot.
+    _diag_pivot_thresh = 1.0
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        super().__init__()
+        self._lu = None
+        self._permuted = False
+        self._indptr = None
+        self._indices = None
+        self._perm = None
+        self._lu_perm_c = None
+        self._perm_data = None
+        self._perm_indices = None
+        self._perm_indptr = None
+        self._num_orderings = 0
+
+    def _same_structure(self, matrix):
+        """
+        Return True if the matrix has the sparsity structure the ordering was computed for.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to be factorized.
+
+        Returns
+        -------
+        bool
+            True if the stored ordering can be used for the matrix.
+        """
+        if self._perm is None or matrix.indptr.size != self._indptr.size or \
+                matrix.indices.size != self._indices.size:
+            return False
+
+        return (matrix.indptr is self._indptr or np.array_equal(matrix.indptr, self._indptr)) \
+            and (matrix.indices is self._indices or np.array_equal(matrix.indices, self._indices))
+
+    def _compute_ordering(self, matrix):
+        """
+        Factorize the matrix while computing its column ordering, and store the ordering.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The matrix to be factorized.
+        """
+        self._lu = scipy.sparse.linalg.splu(matrix, permc_spec=self._permc_spec,
+                                            diag_pivot_thresh=self._diag_pivot_thresh,
+                                            options=self._splu_options)
+        self._num_orderings += 1
+
+        # splu factorizes A Pc, where column j of A is moved to column perm_c[j]
+        perm = np.empty_like(self._lu.perm_c)
+        perm[self._lu.perm_c] = np.arange(perm.size)
+
+        indptr = matrix.indptr
+        counts = np.diff(indptr)[perm]
+        perm_indptr = np.zeros(indptr.size, dtype=INT_DTYPE)
+        np.cumsum(counts, out=perm_indptr[1:])
+
+        self._perm_data = (np.repeat(indptr[:-1][perm] - perm_indptr[:-1], counts) +
+                           np.arange(perm_indptr[-1])).astype(INT_DTYPE)
+        self._perm_indices = matrix.indices[self._perm_data]
+        self._perm_indptr = perm_indptr
+        self._perm = perm
+        self._lu_perm_c = self._lu.perm_c
+        self._indptr = indptr
+        self._indices = matrix.indices
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or csc_matrix
+            Matrix to be factorized.
+        """
+        super().factor(matrix)
+        if not isinstance(matrix, csc_matrix):
+            matrix = csc_matrix(matrix)
+
+        if self._same_structure(matrix):
+            permuted = csc_matrix((matrix.data[self._perm_data], self._perm_indices,
+                                   self._perm_indptr), shape=matrix.shape)
+            self._lu = scipy.sparse.linalg.splu(permuted, permc_spec='NATURAL',
+                                                diag_pivot_thresh=self._diag_pivot_thresh,
+                                                options=self._splu_options)
+            self._permuted = True
+        else:
+            self._compute_ordering(matrix)
+            self._permuted = False
+
+    def clear(self):
+        """
+        Discard the current factorization, but keep the column ordering.
+        """
+        self._lu = None
+        self._permuted = False
+
+    def solve(self, b, trans=False):
+        """
+        Solve the factorized linear system for the given right-hand side.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side of the linear system.
+        trans : bool
+            If True, solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        if not self._permuted:
+            return self._lu.solve(b, 'T' if trans else 'N')
+
+        # the rows are permuted through the transpose so that several right-hand sides stay in
+        # the Fortran order that SuperLU uses
+        if trans:
+            return self._lu.solve(np.take(b.T, self._perm, axis=-1).T, 'T')
+
+        return np.take(self._lu.solve(b).T, self._lu_perm_c, axis=-1).T
+
+
+class KLULikeBackend(SuperLUBackend):
+    """
+    Sparse LU factorization backend configured like KLU, using SuperLU.
+
+    The column ordering is an approximate minimum degree ordering of A + A^T and diagonal
+    pivots are preferred unless they are much smaller than the other entries in their column.
+    This suits the nearly structurally symmetric matrices of circuit-like coupled systems. As
+    with SuperLUBackend, the ordering is computed once and reused.
+    """
+
+    _permc_spec = 'MMD_AT_PLUS_A'
+    _splu_options = {'SymmetricMode': True}
+    _diag_pivot_thresh = 1e-3
+
+
+class PardisoBackend(LUBackend):
+    """
+    Threaded sparse LU factorization backend using the MKL PARDISO solver from pypardiso.
+
+    Attributes
+    ----------
+    _solver : PyPardisoSolver or None
+        The PARDISO solver, which holds the factorization.
+    _matrix : csr_matrix or None
+        The factorized matrix, which PARDISO needs when solving.
+    _matrix_T : csc_matrix or None
+        The transpose of _matrix, sharing its arrays, used to solve the transposed system.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        if pypardiso is None:
+            raise RuntimeError("The 'pardiso' backend requires pypardiso, which is not "
+                               "installed.")
+        super().__init__()
+        self._solver = None
+        self._matrix = None
+        self._matrix_T = None
+
+    def factor(self, matrix):
+        """
+        Compute the LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : ndarray or csc_matrix
+            Matrix to be factorized.
+        """
+        super().factor(matrix)
+        if self._solver is None:
+            self._solver = pypardiso.PyPardisoSolver()
+
+        self._matrix = mtx = csr_matrix(matrix)
+        mtx.sort_indices()
+        self._matrix_T = csc_matrix((mtx.data, mtx.indices, mtx.indptr), shape=mtx.shape[::-1])
+        self._solver.factorize(mtx)
+
+    def clear(self):
+        """
+        Discard the current factorization.
+        """
+        if self._solver is not None and self._matrix is not None:
+            self._solver.free_memory()
+        self._matrix = self._matrix_T = None
+
+    def solve(self, b, trans=False):
+        """
+        Solve the factorized linear system for the given right-hand side.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side of the linear system.
+        trans : bool
+            If True, solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        # pypardiso solves the transposed system when given a CSC matrix, and the CSC transpose
+        # has the same arrays as the factorized CSR matrix, so the factorization is reused
+        return self._solver.solve(self._matrix_T if trans else self._matrix, b)
+
+
+_lu_backends = {
+    'superlu': SuperLUBackend,
+    'klu': KLULikeBackend,
+    'dense': DenseLUBackend,
+    'pardiso': PardisoBackend,
+}
@@ -4,6 +4,7 @@ import numpy as np
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
+from openmdao.solvers.linear.linear_warm_start import LinearWarmStart
 from openmdao.utils.mpi import check_mpi_env
 
 use_mpi = check_mpi_env()
@@ -180,6 +181,8 @@ class PETScKrylov(LinearSolver):
         Dictionary of KSP instances (keyed on vector name).
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _warm_start : LinearWarmStart or None
+        Object that keeps the solutions of derivative seeds for use as initial guesses.
     """
 
     SOLVER = 'LN: PETScKrylov'
@@ -197,6 +200,7 @@ class PETScKrylov(LinearSolver):
         self._ksp = None
         self.precon = None
         self._lin_rhs_checker = None
+        self._warm_start = None
 
     def _declare_options(self):
         """
@@ -221,10 +225,17 @@ class PETScKrylov(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('warm_start', types=(bool, dict), default=False,
+                             desc="If True, start the solve of each derivative seed from its "
+                             "solution in the previous call to compute_totals. Can also be set to "
+                             "a dict of options for the LinearWarmStart to allow finer control "
+                             f"over it. Allowed options are: {LinearWarmStart.options}")
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 100
 
         self.supports['implicit_components'] = True
+        self.supports['jacobian_free'] = True
 
     def _assembled_jac_solver_iter(self):
         """
@@ -265,6 +276,7 @@ class PETScKrylov(LinearSolver):
 
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
+        self._warm_start = LinearWarmStart.create(self._system(), self.options['warm_start'])
 
     def _set_solver_print(self, level=2, type_='all'):
         """
@@ -321,8 +333,11 @@ class PETScKrylov(LinearSolver):
         x_vec.set_val(_get_petsc_vec_array(in_vec))
 
         # apply linear
-        scope_out, scope_in = system._get_matvec_scope()
-        system._apply_linear(self._assembled_jac, self._mode, scope_out, scope_in)
+        if self._jac_free_op is not None:
+            self._jac_free_op()
+        else:
+            scope_out, scope_in = system._get_matvec_scope()
+            system._apply_linear(self._assembled_jac, self._mode, scope_out, scope_in)
 
         # stuff resulting value of b vector into result for KSP
         result.array[:] = b_vec.asarray()
@@ -391,6 +406,9 @@ class PETScKrylov(LinearSolver):
                     x_vec.set_val(sol_array)
                     return
 
+        if self._warm_start is not None:
+            self._warm_start.start(system, x_vec)
+
         rhs_array = b_vec.asarray(copy=True)
         sol_array = x_vec.asarray(copy=True)
 
@@ -407,6 +425,9 @@ class PETScKrylov(LinearSolver):
         # stuff the result into the x vector
         x_vec.set_val(sol_array)
 
+        if self._warm_start is not None:
+            self._warm_start.finish(system, x_vec, self._iter_count)
+
         # as of petsc4py v3.20, the 'converged' attribute has been renamed to 'is_converged'
         if hasattr(self._ksp, 'is_converged'):
             if not self._ksp.is_converged:
@@ -3,8 +3,10 @@
 from packaging.version import Version
 import numpy as np
 import scipy
+from scipy.linalg import solve_triangular
 from scipy.sparse.linalg import LinearOperator, gmres
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
+from openmdao.solvers.linear.linear_warm_start import LinearWarmStart
 
 from openmdao.solvers.solver import LinearSolver
 
@@ -32,6 +34,11 @@ class ScipyKrylov(LinearSolver):
         Preconditioner for linear solve. Default is None for no preconditioner.
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _warm_start : LinearWarmStart or None
+        Object that keeps the solutions of derivative seeds for use as initial guesses.
+    _recycled : dict
+        Recycled vectors U and their orthonormal products C with the operator, as a (U, C) tuple
+        keyed by mode, or None if no vectors have been recycled since the last linearization.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -44,6 +51,8 @@ class ScipyKrylov(LinearSolver):
 
         self.precon = None
         self._lin_rhs_checker = None
+        self._warm_start = None
+        self._recycled = {'fwd': None, 'rev': None}
 
     def _assembled_jac_solver_iter(self):
         """
@@ -69,6 +78,13 @@ class ScipyKrylov(LinearSolver):
                                   'iteration cost, but may be necessary for convergence. This '
                                   'option applies only to gmres.')
 
+        self.options.declare('recycle_size', default=0, types=int, lower=0,
+                             desc='Number of vectors recycled from previous solves with the same '
+                                  'linearization to deflate the gmres operator, as in GCRO-DR. '
+                                  'Recycling pays off when the same linear system is solved for '
+                                  'many right-hand sides, as in compute_totals. Set to 0 to '
+                                  'disable recycling. This option applies only to gmres.')
+
         self.options.declare('rhs_checking', types=(bool, dict),
                              default=False,
                              desc="If True, check RHS vs. cache and/or zero to avoid some solves."
@@ -76,11 +92,18 @@ class ScipyKrylov(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('warm_start', types=(bool, dict), default=False,
+                             desc="If True, start the solve of each derivative seed from its "
+                             "solution in the previous call to compute_totals. Can also be set to "
+                             "a dict of options for the LinearWarmStart to allow finer control "
+                             f"over it. Allowed options are: {LinearWarmStart.options}")
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
         self.options['atol'] = 1.0e-12
 
         self.supports['implicit_components'] = True
+        self.supports['jacobian_free'] = True
 
     def _setup_solvers(self, system, depth):
         """
@@ -100,6 +123,8 @@ class ScipyKrylov(LinearSolver):
 
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
+        self._warm_start = LinearWarmStart.create(self._system(), self.options['warm_start'])
+        self._recycled = {'fwd': None, 'rev': None}
 
     def _set_solver_print(self, level=2, type_='all'):
         """
@@ -140,6 +165,30 @@ class ScipyKrylov(LinearSolver):
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
 
+        self._recycled = {'fwd': None, 'rev': None}
+
+    def _get_cache_state(self):
+        """
+        Return the state of the data that this solver keeps from one solve to the next.
+
+        Returns
+        -------
+        dict
+            The recycled vectors of each direction.
+        """
+        return self._recycled.copy()
+
+    def _set_cache_state(self, state):
+        """
+        Restore the data that this solver keeps from one solve to the next.
+
+        Parameters
+        ----------
+        state : dict
+            The recycled vectors of each direction, as returned by _get_cache_state.
+        """
+        self._recycled = state.copy()
+
     def _mat_vec(self, in_arr):
         """
         Compute matrix-vector product.
@@ -164,8 +213,11 @@ class ScipyKrylov(LinearSolver):
             b_vec = system._doutputs
 
         x_vec.set_val(in_arr)
-        scope_out, scope_in = system._get_matvec_scope()
-        system._apply_linear(self._assembled_jac, self._mode, scope_out, scope_in)
+        if self._jac_free_op is not None:
+            self._jac_free_op()
+        else:
+            scope_out, scope_in = system._get_matvec_scope()
+            system._apply_linear(self._assembled_jac, self._mode, scope_out, scope_in)
 
         # DO NOT REMOVE: frequently used for debugging
         # print('in', in_arr)
@@ -207,12 +259,8 @@ class ScipyKrylov(LinearSolver):
 
         system = self._system()
         solver = _SOLVER_TYPES[self.options['solver']]
-        if solver is gmres:
-            restart = self.options['restart']
-
         maxiter = self.options['maxiter']
         atol = self.options['atol']
-        rtol = self.options['rtol']
 
         if mode == 'fwd':
             x_vec = system._doutputs
@@ -230,6 +278,9 @@ class ScipyKrylov(LinearSolver):
                     x_vec.set_val(sol_array)
                     return
 
+        if self._warm_start is not None:
+            self._warm_start.start(system, x_vec)
+
         x_vec_combined = x_vec.asarray()
         size = x_vec_combined.size
         linop = LinearOperator((size, size), dtype=float, matvec=self._mat_vec)
@@ -242,14 +293,13 @@ class ScipyKrylov(LinearSolver):
 
         self._iter_count = 0
         if solver is gmres:
-            if Version(Version(scipy.__version__).base_version) < Version("1.12"):
-                x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
-                                 x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
-                                 callback=self._monitor, callback_type='legacy')
+            # recycled vectors are only valid for the operator of a single linearization
+            if self.options['recycle_size'] > 0 and not system.under_complex_step and \
+                    self._jac_free_op is None:
+                x, info = self._recycled_gmres(linop, b_vec.asarray(True), M, x_vec_combined)
             else:
-                x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
-                                 x0=x_vec_combined, maxiter=maxiter, atol=atol, rtol=rtol,
-                                 callback=self._monitor, callback_type='legacy')
+                x, info = self._gmres(linop, b_vec.asarray(True), M, x_vec_combined, atol,
+                                      self.options['rtol'])
         else:
             x, info = solver(linop, b_vec.asarray(True), M=M,
                              x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
@@ -257,6 +307,8 @@ class ScipyKrylov(LinearSolver):
 
         if info == 0:
             x_vec.set_val(x)
+            if self._warm_start is not None:
+                self._warm_start.finish(system, x_vec, self._iter_count)
         elif info > 0:
             self._convergence_failure()
         else:
@@ -268,6 +320,163 @@ class ScipyKrylov(LinearSolver):
         if not system.under_complex_step and self._lin_rhs_checker is not None and mode == 'rev':
             self._lin_rhs_checker.add_solution(b_vec.asarray(), x, copy=True)
 
+    def _gmres(self, linop, b, M, x0, atol, rtol, legacy=True):
+        """
+        Run the scipy gmres solver.
+
+        Parameters
+        ----------
+        linop : LinearOperator
+            The operator of the linear system.
+        b : ndarray
+            The right-hand side of the linear system.
+        M : LinearOperator or None
+            The preconditioner.
+        x0 : ndarray
+            The initial guess.
+        atol : float
+            Absolute convergence tolerance.
+        rtol : float
+            Convergence tolerance relative to the norm of b.
+        legacy : bool
+            If True, scipy versions older than 1.12 get atol as their legacy tolerance, which is
+            relative to the norm of b, as they always have.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        int
+            Exit code from gmres.
+        """
+        restart = self.options['restart']
+        maxiter = self.options['maxiter']
+
+        if Version(Version(scipy.__version__).base_version) < Version("1.12"):
+            if legacy:
+                return gmres(linop, b, M=M, restart=restart, x0=x0, maxiter=maxiter, tol=atol,
+                             atol='legacy', callback=self._monitor, callback_type='legacy')
+            return gmres(linop, b, M=M, restart=restart, x0=x0, maxiter=maxiter, tol=rtol,
+                         atol=atol, callback=self._monitor, callback_type='legacy')
+
+        return gmres(linop, b, M=M, restart=restart, x0=x0, maxiter=maxiter, atol=atol,
+                     rtol=rtol, callback=self._monitor, callback_type='legacy')
+
+    def _recycled_gmres(self, linop, b, M, x0):
+        """
+        Run gmres on the operator deflated by the vectors recycled from previous solves.
+
+        With recycled vectors U whose products with the operator A are the orthonormal columns
+        of C, the part of the solution in the span of U is found directly and gmres only solves
+        (I - C C^T) A y = r for the rest. The new correction is then added to the recycled
+        vectors, keeping the harmonic Ritz vectors with the smallest values when there are too
+        many of them.
+
+        Parameters
+        ----------
+        linop : LinearOperator
+            The operator of the linear system.
+        b : ndarray
+            The right-hand side of the linear system.
+        M : LinearOperator or None
+            The preconditioner.
+        x0 : ndarray
+            The initial guess.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        int
+            Exit code from gmres.
+        """
+        mat_vec = self._mat_vec
+        recycled = self._recycled[self._mode]
+
+        x = x0.copy()
+        r = b - mat_vec(x) if np.any(x) else b
+
+        if recycled is None:
+            op = linop
+        else:
+            U, C = recycled
+            h = C.T.dot(r)
+            x += U.dot(h)
+            r = r - C.dot(h)
+
+            def deflated_mat_vec(in_arr):
+                out = mat_vec(in_arr)
+                return out - C.dot(C.T.dot(out))
+
+            op = LinearOperator(linop.shape, dtype=float, matvec=deflated_mat_vec)
+
+        # the residual of the deflated system is the residual of the original one, so converge
+        # it to the tolerance relative to the original right-hand side
+        atol = max(self.options['atol'], self.options['rtol'] * np.linalg.norm(b))
+        y, info = self._gmres(op, r, M, np.zeros(r.size), atol, 0.0, legacy=False)
+
+        # take out the part of the correction that the recycled vectors already account for
+        c = mat_vec(y).copy()
+        u = y
+        if recycled is not None:
+            h = C.T.dot(c)
+            c -= C.dot(h)
+            u = y - U.dot(h)
+        x += u
+
+        if info == 0:
+            self._add_recycled(u, c)
+
+        return x, info
+
+    def _add_recycled(self, u, c):
+        """
+        Add a vector and its product with the operator to the recycled vectors.
+
+        Parameters
+        ----------
+        u : ndarray
+            The new vector.
+        c : ndarray
+            The product of the operator with u, orthogonal to the recycled products.
+        """
+        norm = np.linalg.norm(c)
+        if norm == 0.0:
+            return
+
+        u = u / norm
+        c = c / norm
+
+        recycled = self._recycled[self._mode]
+        if recycled is None:
+            U = u[:, np.newaxis]
+            C = c[:, np.newaxis]
+        else:
+            U = np.column_stack((recycled[0], u))
+            C = np.column_stack((recycled[1], c))
+
+        k = self.options['recycle_size']
+        if U.shape[1] > k:
+            # The harmonic Ritz values theta of the operator on span(U) satisfy
+            # (C^T U) z = z / theta, so keep the eigenvectors with the largest eigenvalues.
+            # Complex pairs are kept as their real and imaginary parts.
+            mu, Z = np.linalg.eig(C.T.dot(U))
+            cols = []
+            for j in np.argsort(-np.abs(mu)):
+                if mu[j].imag < 0.0:
+                    continue
+                cols.append(Z[:, j].real)
+                if mu[j].imag > 0.0:
+                    cols.append(Z[:, j].imag)
+                if len(cols) >= k:
+                    break
+
+            P = np.linalg.qr(np.column_stack(cols[:k]))[0]
+            C, R = np.linalg.qr(C.dot(P))
+            U = solve_triangular(R, U.dot(P).T, trans='T').T
+
+        self._recycled[self._mode] = (U, C)
+
     def _apply_precon(self, in_vec):
         """
         Apply preconditioner.
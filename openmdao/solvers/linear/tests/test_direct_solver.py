@@ -15,6 +15,7 @@ from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.general_utils import printoptions
 from openmdao.utils.mpi import MPI
+from openmdao.solvers.linear.lu_backends import pypardiso
 try:
     from openmdao.vectors.petsc_vector import PETScVector
 except ImportError:
@@ -933,6 +934,178 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.run_model()
 
 
+class TestDirectSolverBackends(unittest.TestCase):
+
+    def _build(self, mode, **options):
+        prob = om.Problem(DoubleSellar())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=20, atol=1e-12,
+                                                 rtol=1e-12, iprint=-1)
+        model.linear_solver = om.DirectSolver(**options)
+
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    def test_backends(self):
+        of = ['g1.y1', 'g2.y2']
+        wrt = ['g1.x', 'g2.z']
+        for mode in ('fwd', 'rev'):
+            expected = self._build(mode, assemble_jac=False).compute_totals(of=of, wrt=wrt)
+
+            for backend in ('auto', 'superlu', 'klu', 'dense'):
+                for assemble_jac in (True, False):
+                    with self.subTest(mode=mode, backend=backend, assemble_jac=assemble_jac):
+                        prob = self._build(mode, backend=backend, assemble_jac=assemble_jac)
+                        totals = prob.compute_totals(of=of, wrt=wrt)
+                        for key, val in expected.items():
+                            assert_near_equal(totals[key], val, 1e-10)
+
+                        solver = prob.model.linear_solver
+                        self.assertGreater(solver._backend._num_factorizations, 1)
+
+                        if backend in ('superlu', 'klu') or (backend == 'auto' and assemble_jac):
+                            # the column ordering is only computed for the first factorization
+                            self.assertEqual(solver._backend._num_orderings, 1)
+                        else:
+                            self.assertEqual(type(solver._backend).__name__, 'DenseLUBackend')
+
+    def test_clear_without_matrix(self):
+        prob = self._build('fwd')
+        solver = prob.model.linear_solver
+        self.assertIsNotNone(solver._backend._lu)
+
+        # on the procs that don't own the matrix under MPI, the old factorization is discarded
+        prob.model._assembled_jac._int_mtx._matrix = None
+        solver._linearize()
+        self.assertIsNone(solver._backend._lu)
+
+    def test_singular_klu(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', 1.0))
+        model.add_subsystem('comp', SingularComp())
+        model.connect('ivc.x', 'comp.x')
+        model.linear_solver = om.DirectSolver(backend='klu')
+
+        prob.setup()
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['comp.y'], wrt=['ivc.x'])
+
+        self.assertEqual(str(cm.exception),
+                         "Singular entry found in <model> <class Group> for row associated with "
+                         "state/residual 'comp.y' index 0.")
+
+    @unittest.skipIf(pypardiso is not None, "only run if pypardiso is not installed.")
+    def test_pardiso_not_installed(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', TestExplCompSimpleJacVec())
+        prob.model.linear_solver = om.DirectSolver(backend='pardiso')
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "DirectSolver in <model> <class Group>: The 'pardiso' backend requires "
+                         "pypardiso, which is not installed.")
+
+    @unittest.skipUnless(pypardiso, "pypardiso is required.")
+    def test_pardiso(self):
+        of = ['g1.y1', 'g2.y2']
+        wrt = ['g1.x', 'g2.z']
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                expected = self._build(mode).compute_totals(of=of, wrt=wrt)
+                totals = self._build(mode, backend='pardiso').compute_totals(of=of, wrt=wrt)
+                for key, val in expected.items():
+                    assert_near_equal(totals[key], val, 1e-10)
+
+
+class ScaledLinearComp(om.ImplicitComponent):
+    """
+    Implicit component solving A y = x, with scaled outputs and residuals.
+    """
+
+    def setup(self):
+        self.add_input('x', np.ones(8))
+        self.add_output('y', np.ones(8), ref=3., res_ref=7.)
+
+        rng = np.random.default_rng(0)
+        self.A = rng.random((8, 8)) + 8. * np.eye(8)
+        self.declare_partials('y', 'x', rows=np.arange(8), cols=np.arange(8), val=-1.)
+        self.declare_partials('y', 'y', val=self.A)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['y'] = self.A.dot(outputs['y']) - inputs['x']
+
+    def solve_nonlinear(self, inputs, outputs):
+        outputs['y'] = np.linalg.solve(self.A, inputs['x'])
+
+
+class TestDirectSolverMultiRHS(unittest.TestCase):
+
+    def _build(self, mode, **options):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.arange(8.) + 1.), promotes=['*'])
+        model.add_subsystem('lin', ScaledLinearComp(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('z = y ** 2', y=np.ones(8), z=np.ones(8)),
+                            promotes=['*'])
+        model.add_design_var('x')
+        model.add_constraint('z', upper=0., ref=10.)
+        model.linear_solver = om.DirectSolver(**options)
+
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        solver = model.linear_solver
+        solver.batch_sizes = []
+        _solve_multi_rhs = solver._solve_multi_rhs
+
+        def counting_solve(rhs, mode):
+            solver.batch_sizes.append(rhs.shape[1])
+            return _solve_multi_rhs(rhs, mode)
+
+        solver._solve_multi_rhs = counting_solve
+        return prob
+
+    def test_multi_rhs(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self._build(mode, rhs_batch_size=1)
+                expected = prob.compute_totals()
+                expected_driver = prob.driver._compute_totals()
+                self.assertEqual(prob.model.linear_solver.batch_sizes, [])
+
+                prob = self._build(mode, rhs_batch_size=3)
+                assert_near_equal(prob.compute_totals(), expected, 1e-12)
+                self.assertEqual(prob.model.linear_solver.batch_sizes, [3, 3, 2])
+
+                prob = self._build(mode)
+                assert_near_equal(prob.compute_totals(), expected, 1e-12)
+                assert_near_equal(prob.driver._compute_totals(), expected_driver, 1e-12)
+                self.assertEqual(prob.model.linear_solver.batch_sizes, [8, 8])
+
+                # each seed still counts as a linear solve
+                self.assertEqual(prob.driver._total_jac.nsolves, 8)
+
+                # the matrix built by matrix-vector products is scaled, so its solves
+                # aren't batched
+                prob = self._build(mode, assemble_jac=False)
+                assert_near_equal(prob.compute_totals(), expected, 1e-12)
+                self.assertEqual(prob.model.linear_solver.batch_sizes, [])
+
+    def test_multi_rhs_backends(self):
+        for mode in ('fwd', 'rev'):
+            expected = self._build(mode, rhs_batch_size=1).compute_totals()
+            for backend in ('superlu', 'klu', 'dense'):
+                with self.subTest(mode=mode, backend=backend):
+                    prob = self._build(mode, backend=backend)
+                    assert_near_equal(prob.compute_totals(), expected, 1e-12)
+                    self.assertEqual(prob.model.linear_solver.batch_sizes, [8])
+
+
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
 
@@ -32,6 +32,98 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
                              "Linear solver 'LN: LNBJ' doesn't support assembled jacobians.")
 
 
+class CountingComp(om.ExplicitComponent):
+    """Matrix free component that counts its jacvec products."""
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+        self.num_jacvec = 0
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 3.0 * inputs['x']
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        self.num_jacvec += 1
+        if mode == 'fwd':
+            if 'x' in d_inputs:
+                d_outputs['y'] += 3.0 * d_inputs['x']
+        elif 'x' in d_inputs:
+            d_inputs['x'] += 3.0 * d_outputs['y']
+
+
+class TestLinearBlockJacThreads(unittest.TestCase):
+
+    def build(self, mode, num_threads, nested_threads=1):
+        prob = om.Problem()
+        model = prob.model
+
+        for i in range(3):
+            sellar = model.add_subsystem(f'sellar{i}', om.Group())
+            sellar.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            sellar.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+            sellar.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12, maxiter=100)
+            sellar.linear_solver = om.LinearBlockJac(num_threads=nested_threads, atol=1e-12,
+                                                     rtol=1e-12, maxiter=100)
+            sellar.set_input_defaults('x', 1.0 + i)
+
+            model.add_design_var(f'sellar{i}.x')
+            model.add_design_var(f'sellar{i}.z')
+            model.add_constraint(f'sellar{i}.y1', upper=0.)
+            model.add_constraint(f'sellar{i}.y2', upper=0.)
+
+        model.linear_solver = om.LinearBlockJac(num_threads=num_threads)
+
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    def test_threads(self):
+        for mode in ('fwd', 'rev'):
+            expected = self.build(mode, 1).compute_totals(return_format='array')
+
+            for num_threads, nested_threads in ((3, 1), (2, 1), (3, 2), (1, 2)):
+                with self.subTest(mode=mode, num_threads=num_threads,
+                                  nested_threads=nested_threads):
+                    prob = self.build(mode, num_threads, nested_threads)
+                    self.assertEqual(prob.model.linear_solver._num_threads, num_threads)
+
+                    J = prob.compute_totals(return_format='array')
+                    assert_near_equal(J, expected, 1e-15)
+
+
+    def test_relevance(self):
+        # the relevance of the calling thread applies to the nested groups run by the threads
+        for mode in ('fwd', 'rev'):
+            counts = []
+            for num_threads in (1, 2):
+                prob = om.Problem()
+                model = prob.model
+                model.add_subsystem('ivc', om.IndepVarComp('x', 1.0))
+                for i in range(2):
+                    sub = model.add_subsystem(f'sub{i}', om.Group())
+                    sub.add_subsystem('rel', om.ExecComp('y = 2.0 * x'))
+                    sub.add_subsystem('irr', CountingComp())
+                    model.connect('ivc.x', [f'sub{i}.rel.x', f'sub{i}.irr.x'])
+                    model.add_constraint(f'sub{i}.rel.y', upper=0.)
+
+                model.add_design_var('ivc.x')
+                model.linear_solver = om.LinearBlockJac(num_threads=num_threads)
+
+                prob.setup(mode=mode)
+                prob.run_model()
+
+                with self.subTest(mode=mode, num_threads=num_threads):
+                    J = prob.compute_totals(return_format='array')
+                    assert_near_equal(J, [[2.], [2.]], 1e-15)
+
+                counts.append([model.sub0.irr.num_jacvec, model.sub1.irr.num_jacvec])
+
+            with self.subTest(mode=mode):
+                self.assertEqual(counts[1], counts[0])
+                self.assertEqual(counts[0], [0, 0])
+
+
 class TestBJacSolverFeature(unittest.TestCase):
 
     def test_specify_solver(self):
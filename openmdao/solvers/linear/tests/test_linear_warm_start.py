@@ -0,0 +1,153 @@
+"""Test the warm starting of iterative linear solvers across calls to compute_totals."""
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivatives, \
+    SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _build(mode, linear_solver, warm_start):
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('sellar', SellarDerivatives(), promotes=['*'])
+
+    sellar = model.sellar
+    sellar.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+    sellar.linear_solver = linear_solver(warm_start=warm_start, maxiter=200, atol=1e-12,
+                                         rtol=1e-12, iprint=-1)
+
+    model.add_design_var('x')
+    model.add_design_var('z')
+    model.add_objective('obj')
+    model.add_constraint('con1', upper=0.)
+    model.add_constraint('con2', upper=0.)
+
+    prob.setup(mode=mode)
+    prob.run_model()
+    return prob
+
+
+def _compute_totals(prob, solver):
+    """
+    Compute the totals and return them with the number of iterations of each linear solve.
+    """
+    iters = []
+    solve = solver.solve
+
+    def counting_solve(mode, rel_systems=None):
+        solve(mode, rel_systems)
+        iters.append(solver._iter_count)
+
+    solver.solve = counting_solve
+    try:
+        J = prob.compute_totals(return_format='array')
+    finally:
+        del solver.solve
+
+    return J, iters
+
+
+class TestLinearWarmStart(unittest.TestCase):
+
+    def test_warm_start(self):
+        solvers = {
+            'block_gs': om.LinearBlockGS,
+            'block_jac': om.LinearBlockJac,
+            'krylov': om.ScipyKrylov,
+        }
+        for mode in ('fwd', 'rev'):
+            for name, linear_solver in solvers.items():
+                with self.subTest(mode=mode, linear_solver=name):
+                    cold = _build(mode, linear_solver, False)
+                    cold.compute_totals()
+                    cold.set_val('x', 1.01)
+                    cold.run_model()
+                    expected, cold_iters = _compute_totals(cold, cold.model.sellar.linear_solver)
+
+                    prob = _build(mode, linear_solver, {'collect_stats': True})
+                    solver = prob.model.sellar.linear_solver
+                    J, iters = _compute_totals(prob, solver)
+
+                    # there is nothing to start from in the first compute_totals
+                    self.assertEqual(solver._warm_start._stats['hits'], 0)
+                    self.assertEqual(solver._warm_start._stats['misses'], 3)
+
+                    prob.set_val('x', 1.01)
+                    prob.run_model()
+                    J, iters = _compute_totals(prob, solver)
+
+                    assert_near_equal(J, expected, 1e-9)
+                    self.assertEqual(solver._warm_start._stats['hits'], 3)
+                    self.assertEqual(solver._warm_start._stats['warm_iters'], sum(iters))
+                    if name == 'krylov':
+                        # the coupled system is so small that gmres converges in about as many
+                        # iterations as it has unknowns, from any initial guess
+                        self.assertLessEqual(sum(iters), sum(cold_iters))
+                    else:
+                        self.assertLess(sum(iters), sum(cold_iters))
+
+    def test_float32(self):
+        expected = _build('rev', om.LinearBlockGS, False).compute_totals(return_format='array')
+
+        prob = _build('rev', om.LinearBlockGS, {'float32': True})
+        solver = prob.model.sellar.linear_solver
+        prob.compute_totals()
+        J, iters = _compute_totals(prob, solver)
+
+        assert_near_equal(J, expected, 1e-10)
+        for ncompute_totals, solution in solver._warm_start._cache.values():
+            self.assertEqual(solution.dtype, np.float32)
+
+    def test_nested(self):
+        # the solver of the subgroup is called several times for each seed by the iterative
+        # solver above it, and only starts from its stored solution on the first call
+        def build(warm_start):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+            model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])),
+                                promotes=['z'])
+            cycle = model.add_subsystem('cycle', om.Group(), promotes=['*'])
+            cycle.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            sub = cycle.add_subsystem('sub', om.Group(), promotes=['*'])
+            sub.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+            sub.linear_solver = om.LinearBlockGS(warm_start=warm_start, maxiter=50, iprint=-1)
+            cycle.nonlinear_solver = om.NonlinearBlockGS(maxiter=100, atol=1e-14, rtol=1e-14,
+                                                         iprint=-1)
+            cycle.linear_solver = om.LinearBlockGS(maxiter=100, atol=1e-14, rtol=1e-14,
+                                                   iprint=-1)
+            model.add_design_var('x')
+            model.add_design_var('z')
+            model.add_constraint('y1', upper=0.)
+            model.add_constraint('y2', upper=0.)
+            prob.setup(mode='rev')
+            prob.run_model()
+            return prob
+
+        expected = build(False).compute_totals(return_format='array')
+
+        prob = build(True)
+        prob.compute_totals()
+        J = prob.compute_totals(return_format='array')
+        assert_near_equal(J, expected, 1e-12)
+
+    def test_unrecognized_option(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('sellar', SellarDerivatives())
+        prob.model.sellar.linear_solver = om.ScipyKrylov(warm_start={'foo': True})
+
+        with self.assertRaises(ValueError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in 'sellar' <class SellarDerivatives>: unrecognized "
+                         "'warm_start' option 'foo'. Valid options are ('float32', "
+                         "'collect_stats').")
+
+
+if __name__ == '__main__':
+    unittest.main()
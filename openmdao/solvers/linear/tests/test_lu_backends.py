@@ -0,0 +1,73 @@
+"""Test the LU factorization backends of the DirectSolver."""
+
+import unittest
+
+import numpy as np
+from scipy.sparse import random as sparse_random, eye, csc_matrix
+
+from openmdao.solvers.linear.lu_backends import _lu_backends, pypardiso
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _matrix(scale=1.):
+    mtx = sparse_random(30, 30, density=0.15, random_state=7) + 4. * eye(30)
+    return csc_matrix(scale * mtx)
+
+
+class TestLUBackends(unittest.TestCase):
+
+    def _check_backend(self, name):
+        backend = _lu_backends[name]()
+        rng = np.random.default_rng(3)
+        b = rng.random(30)
+        rhs = rng.random((30, 4))
+
+        for scale in (1., 2.):
+            mtx = _matrix(scale)
+            dense = mtx.toarray()
+            backend.factor(mtx)
+
+            assert_near_equal(dense.dot(backend.solve(b)), b, 1e-12)
+            assert_near_equal(dense.T.dot(backend.solve(b, trans=True)), b, 1e-12)
+            assert_near_equal(dense.dot(backend.solve(rhs)), rhs, 1e-12)
+            assert_near_equal(dense.T.dot(backend.solve(rhs, trans=True)), rhs, 1e-12)
+
+        self.assertEqual(backend._num_factorizations, 2)
+        return backend
+
+    def test_backends(self):
+        for name in ('superlu', 'klu', 'dense'):
+            with self.subTest(backend=name):
+                backend = self._check_backend(name)
+                backend.clear()
+
+                # a factorization can be computed again after it was cleared
+                mtx = _matrix(3.)
+                backend.factor(mtx)
+                b = np.arange(30.)
+                assert_near_equal(mtx.toarray().dot(backend.solve(b)), b, 1e-12)
+
+    def test_superlu_clear_keeps_ordering(self):
+        backend = self._check_backend('superlu')
+        self.assertEqual(backend._num_orderings, 1)
+
+        backend.clear()
+        self.assertIsNone(backend._lu)
+
+        backend.factor(_matrix(3.))
+        self.assertEqual(backend._num_orderings, 1)
+
+    @unittest.skipUnless(pypardiso, "pypardiso is required.")
+    def test_pardiso(self):
+        backend = self._check_backend('pardiso')
+        backend.clear()
+        self.assertIsNone(backend._matrix)
+
+        mtx = _matrix(3.)
+        backend.factor(mtx)
+        b = np.arange(30.)
+        assert_near_equal(mtx.toarray().T.dot(backend.solve(b, trans=True)), b, 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
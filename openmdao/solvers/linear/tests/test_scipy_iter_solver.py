@@ -1,9 +1,11 @@
 """Test the ScipyKrylov linear solver class."""
 
 import unittest
+from unittest import mock
 
 import numpy as np
 import scipy
+import scipy.sparse as sp
 
 from packaging.version import Version
 
@@ -404,5 +406,134 @@ class TestCaching(unittest.TestCase):
 
         assert_check_totals(prob.check_totals(out_stream=None))
 
+class SparseLinearComp(om.ImplicitComponent):
+    """
+    Solves A x = b for a random sparse, nonsymmetric A.
+    """
+
+    def initialize(self):
+        self.options.declare('size', default=60, types=int)
+
+    def setup(self):
+        n = self.options['size']
+        A = sp.random(n, n, density=0.05, random_state=11) + sp.diags(np.linspace(1., 20., n))
+        self.A = A.tocoo()
+
+        self.add_input('b', np.ones(n))
+        self.add_output('x', np.ones(n))
+
+        self.declare_partials('x', 'x', rows=self.A.row, cols=self.A.col, val=self.A.data)
+        self.declare_partials('x', 'b', rows=np.arange(n), cols=np.arange(n), val=-1.)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = self.A.dot(outputs['x']) - inputs['b']
+
+
+class TestRecycling(unittest.TestCase):
+
+    def build(self, mode, **options):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('b', np.ones(60)), promotes=['*'])
+        model.add_subsystem('lin', SparseLinearComp(), promotes=['*'])
+        model.linear_solver = om.ScipyKrylov(atol=1e-12, rtol=1e-12, iprint=-1, **options)
+        model.add_design_var('b')
+        model.add_constraint('x', upper=0.)
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        # record the number of iterations of each solve
+        solver = model.linear_solver
+        solver.iters = []
+        solve = solver.solve
+
+        def counting_solve(mode, rel_systems=None):
+            solve(mode, rel_systems)
+            solver.iters.append(solver._iter_count)
+
+        solver.solve = counting_solve
+        return prob
+
+    def test_recycling(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self.build(mode)
+                expected = prob.compute_totals(return_format='array')
+                iters = sum(prob.model.linear_solver.iters)
+
+                prob = self.build(mode, recycle_size=10)
+                J = prob.compute_totals(return_format='array')
+                assert_near_equal(J, expected, 1e-9)
+
+                # In rev mode, deflating with the recycled vectors saves iterations. In fwd mode,
+                # the seeds are in the rows of the IndepVarComp outputs, so the recycled vectors
+                # only deflate the trivial part of the operator.
+                if mode == 'rev':
+                    self.assertLess(sum(prob.model.linear_solver.iters), .6 * iters)
+                else:
+                    self.assertLessEqual(sum(prob.model.linear_solver.iters), iters)
+
+    def test_recycled_vectors(self):
+        prob = self.build('rev', recycle_size=6)
+        solver = prob.model.linear_solver
+        self.assertIsNone(solver._recycled['rev'])
+
+        prob.compute_totals()
+
+        U, C = solver._recycled['rev']
+        self.assertEqual(U.shape, (120, 6))
+        assert_near_equal(C.T.dot(C), np.eye(6), 1e-10)
+
+        # the recycled products are still the products of the operator with the vectors
+        solver._mode = 'rev'
+        for u, c in zip(U.T, C.T):
+            assert_near_equal(solver._mat_vec(u), c, 1e-9)
+
+        self.assertIsNone(solver._recycled['fwd'])
+
+        # the vectors aren't kept across linearizations
+        prob.model.run_linearize()
+        self.assertIsNone(solver._recycled['rev'])
+
+    def test_recycling_precon(self):
+        expected = self.build('rev').compute_totals(return_format='array')
+
+        prob = self.build('rev', recycle_size=10)
+        prob.model.linear_solver.precon = om.LinearRunOnce()
+        prob.setup(mode='rev')
+        prob.run_model()
+        J = prob.compute_totals(return_format='array')
+        assert_near_equal(J, expected, 1e-9)
+
+    def test_recycling_old_scipy(self):
+        from openmdao.solvers.linear import scipy_iter_solver
+
+        expected = self.build('rev').compute_totals(return_format='array')
+
+        calls = []
+        gmres = scipy_iter_solver.gmres
+
+        def old_gmres(*args, tol, atol, **kwargs):
+            # emulate the tolerances of scipy versions older than 1.12
+            calls.append((tol, atol))
+            if atol == 'legacy':
+                return gmres(*args, rtol=tol, atol=0., **kwargs)
+            return gmres(*args, rtol=tol, atol=atol, **kwargs)
+
+        prob = self.build('rev', recycle_size=10)
+        with mock.patch.object(scipy, '__version__', '1.11.4'), \
+                mock.patch.object(scipy_iter_solver, 'gmres', old_gmres), \
+                mock.patch.dict(scipy_iter_solver._SOLVER_TYPES, gmres=old_gmres):
+            J = prob.compute_totals(return_format='array')
+
+        assert_near_equal(J, expected, 1e-9)
+
+        # the tolerance of the deflated system is absolute
+        self.assertEqual(len(calls), len(prob.model.linear_solver.iters))
+        for tol, atol in calls:
+            self.assertEqual(tol, 0.)
+            self.assertEqual(atol, 1e-12)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,123 @@
+"""
+Define the AndersonAcceleration class.
+
+AndersonAcceleration mixes the updates of a fixed-point iteration, such as one block Gauss-Seidel
+or block Jacobi iteration, with the ones of previous iterations.
+"""
+
+import numpy as np
+
+
+# Gram matrices with a larger condition number than this are considered singular
+_MAX_COND = 1e14
+
+
+class AndersonAcceleration(object):
+    """
+    Class that computes Anderson accelerated iterates of a fixed-point iteration.
+
+    Each iterate minimizes the linearized fixed-point residual over the last depth updates,
+    as described by Walker and Ni in "Anderson Acceleration for Fixed-Point Iterations".
+
+    Parameters
+    ----------
+    depth : int
+        Maximum number of previous iterations used to compute an iterate.
+    beta : float
+        Mixing factor applied to the fixed-point residual. 1.0 means no damping.
+
+    Attributes
+    ----------
+    depth : int
+        Maximum number of previous iterations used to compute an iterate.
+    beta : float
+        Mixing factor applied to the fixed-point residual.
+    stats : dict
+        Number of previous iterations used for the last iterate ('anderson_depth') and number
+        of them dropped because they were linearly dependent ('anderson_dropped') since the last
+        reset.
+    _dF : list of ndarray
+        Changes of the fixed-point residual between consecutive iterations, oldest first.
+    _dG : list of ndarray
+        Changes of the fixed-point map between consecutive iterations, oldest first.
+    _f : ndarray or None
+        Fixed-point residual of the last iteration.
+    _g : ndarray or None
+        Fixed-point map of the last iteration.
+    """
+
+    def __init__(self, depth, beta=1.0):
+        """
+        Initialize the AndersonAcceleration.
+        """
+        self.depth = depth
+        self.beta = beta
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the previous iterations.
+        """
+        self._dF = []
+        self._dG = []
+        self._f = None
+        self._g = None
+        self.stats = {'anderson_depth': 0, 'anderson_dropped': 0}
+
+    def update(self, x, g, comm=None):
+        """
+        Return the next iterate.
+
+        Parameters
+        ----------
+        x : ndarray
+            The current iterate.
+        g : ndarray
+            The fixed-point map at x, i.e., the result of one iteration started from x.
+        comm : MPI.Comm or None
+            Communicator used to sum the dot products of distributed iterates.
+
+        Returns
+        -------
+        ndarray
+            The next iterate.
+        """
+        f = g - x
+
+        if self._f is not None:
+            self._dF.append(f - self._f)
+            self._dG.append(g - self._g)
+            if len(self._dF) > self.depth:
+                del self._dF[0]
+                del self._dG[0]
+
+        self._f = f
+        self._g = g.copy()
+
+        x_new = x + self.beta * f
+
+        while self._dF:
+            dF = np.array(self._dF).T
+            # no conjugate, so that complex step derivatives are computed correctly
+            gram = dF.T.dot(dF)
+            rhs = dF.T.dot(f)
+            if comm is not None and comm.size > 1:
+                gram = comm.allreduce(gram)
+                rhs = comm.allreduce(rhs)
+
+            if np.linalg.cond(gram) < _MAX_COND:
+                break
+
+            del self._dF[0]
+            del self._dG[0]
+            self.stats['anderson_dropped'] += 1
+
+        self.stats['anderson_depth'] = len(self._dF)
+
+        if self._dF:
+            gamma = np.linalg.solve(gram, rhs)
+            # the changes of x are dG - dF
+            dG = np.array(self._dG).T
+            x_new -= (dG + (self.beta - 1.0) * dF).dot(gamma)
+
+        return x_new
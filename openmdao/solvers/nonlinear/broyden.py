@@ -41,8 +41,8 @@ class BroydenSolver(NonlinearSolver):
         Most recent change in state vector.
     fxm : ndarray
         Most recent residual.
-    Gm : ndarray
-        Most recent Jacobian matrix.
+    Gm : ndarray or None
+        Most recent Jacobian matrix, or None if the limited memory variant is used.
     linear_solver : LinearSolver
         Linear solver to use for calculating inverse Jacobian.
     _linesearch : NonlinearSolver
@@ -59,6 +59,9 @@ class BroydenSolver(NonlinearSolver):
         Number of consecutive iterations that failed to converge to the tol definied in options.
     _full_inverse : bool
         When True, Broyden considers the whole vector rather than a list of states.
+    _lm_updates : list of tuple of ndarray
+        The (u, v) vector pairs of the most recent rank one updates u v^T of the initial inverse
+        Jacobian, oldest first, when the limited memory variant is used.
     _recompute_jacobian : bool
         Flag that becomes True when Broyden detects it needs to recompute the inverse Jacobian.
     """
@@ -90,6 +93,7 @@ class BroydenSolver(NonlinearSolver):
         self.delta_fxm = None
         self._converge_failures = 0
         self._computed_jacobians = 0
+        self._lm_updates = []
 
         # This gets set to True if the user doesn't declare any states.
         self._full_inverse = False
@@ -124,6 +128,13 @@ class BroydenSolver(NonlinearSolver):
                                   "Jacobian.")
         self.options.declare('max_jacobians', default=10,
                              desc="Maximum number of jacobians to compute.")
+        self.options.declare('limited_memory', types=int, default=0, lower=0,
+                             desc="When greater than 0, keep only this many of the most recent "
+                                  "Broyden updates instead of a dense inverse Jacobian, which "
+                                  "reduces memory and work per iteration from O(n**2) to "
+                                  "O(n * limited_memory). The initial inverse Jacobian is applied "
+                                  "with a linear solve when compute_jacobian is True, or is "
+                                  "Identity scaled by alpha otherwise.")
         self.options.declare('state_vars', [], desc="List of the state-variable/residuals that "
                                                     "are to be solved here.")
         self.options.declare('update_broyden', default=True,
@@ -138,6 +149,37 @@ class BroydenSolver(NonlinearSolver):
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
 
+    def _get_restart_state(self):
+        """
+        Return the warm start data of the solver to be saved in a checkpoint.
+
+        Returns
+        -------
+        dict or None
+            The data needed to warm start this solver, or None if it has none.
+        """
+        state = super()._get_restart_state() or {}
+        if self.Gm is not None and not self._recompute_jacobian:
+            state['Gm'] = np.array(self.Gm.real)
+        return state or None
+
+    def _set_restart_state(self, state):
+        """
+        Restore the warm start data of the solver from a checkpoint.
+
+        The inverse Jacobian is reused instead of being recomputed at the start of the next solve.
+
+        Parameters
+        ----------
+        state : dict
+            The data returned by _get_restart_state when the checkpoint was saved.
+        """
+        super()._set_restart_state(state)
+        Gm = state.get('Gm')
+        if Gm is not None and self.Gm is not None and Gm.shape == self.Gm.shape:
+            self.Gm[:] = Gm
+            self._recompute_jacobian = False
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -192,13 +234,17 @@ class BroydenSolver(NonlinearSolver):
             n = np.sum(system._owned_sizes)
 
         self.size = n
-        self.Gm = np.empty((n, n))
+        self.Gm = np.empty((n, n)) if self.options['limited_memory'] == 0 else None
         self.xm = np.empty((n, ))
         self.fxm = np.empty((n, ))
         self.delta_xm = None
         self.delta_fxm = None
+        self._lm_updates = []
 
         if self._full_inverse:
+            if self.Gm is None:
+                # the linear solver only needs to solve, not to invert the Jacobian
+                return
 
             # Can only use DirectSolver here.
             from openmdao.solvers.linear.direct import DirectSolver
@@ -295,11 +341,18 @@ class BroydenSolver(NonlinearSolver):
 
         # Convert local storage if we are under complex step.
         if system.under_complex_step:
-            self.Gm = self.Gm.astype(complex)
+            if self.Gm is not None:
+                self.Gm = self.Gm.astype(complex)
+            elif not np.iscomplexobj(self.xm):
+                # the linearization of the linear solver must be recomputed in complex
+                self._recompute_jacobian = True
             self.xm = self.xm.astype(complex)
             self.fxm = self.fxm.astype(complex)
         elif np.iscomplexobj(self.xm):
-            self.Gm = self.Gm.real
+            if self.Gm is not None:
+                self.Gm = self.Gm.real
+            else:
+                self._recompute_jacobian = True
             self.xm = self.xm.real
             self.fxm = self.fxm.real
 
@@ -378,10 +431,15 @@ class BroydenSolver(NonlinearSolver):
         Perform the operations in the iteration loop.
         """
         system = self._system()
-        Gm = self._update_inverse_jacobian()
         fxm = self.fxm
 
-        delta_xm = -Gm.dot(fxm)
+        if self.Gm is None:
+            Gm = None
+            self._update_limited_memory()
+            delta_xm = -self._apply_inverse_jacobian(fxm)
+        else:
+            Gm = self._update_inverse_jacobian()
+            delta_xm = -Gm.dot(fxm)
 
         if self.linesearch:
             self._solver_info.append_subsolver()
@@ -474,6 +532,96 @@ class BroydenSolver(NonlinearSolver):
 
         return Gm
 
+    def _update_limited_memory(self):
+        """
+        Add the latest Broyden update to the limited memory inverse Jacobian, or reset it.
+        """
+        opt = self.options
+
+        if opt['update_broyden'] and not self._recompute_jacobian:
+            dfxm = self.delta_fxm
+            fact = np.linalg.norm(dfxm)
+
+            # Sometimes you can get stuck, particularly when enforcing bounds in a linesearch.
+            # Make sure we don't update in this case because of divide by zero.
+            if fact > opt['atol']:
+                u = (self.delta_xm - self._apply_inverse_jacobian(dfxm)) * (1.0 / fact**2)
+                self._lm_updates.append((u, dfxm.copy()))
+                if len(self._lm_updates) > opt['limited_memory']:
+                    del self._lm_updates[0]
+
+        else:
+            self._lm_updates = []
+
+            if opt['compute_jacobian']:
+                # The initial inverse Jacobian is applied by solving with this linearization.
+                system = self._system()
+
+                # Disable local fd
+                approx_status = system._owns_approx_jac
+                system._owns_approx_jac = False
+
+                try:
+                    ln_solver = self.linear_solver
+                    my_asm_jac = ln_solver._assembled_jac
+                    system._linearize(my_asm_jac, sub_do_ln=ln_solver._linearize_children())
+                    if my_asm_jac is not None and \
+                            system.linear_solver._assembled_jac is not my_asm_jac:
+                        my_asm_jac._update(system)
+                    self._linearize()
+                finally:
+                    # Enable local fd
+                    system._owns_approx_jac = approx_status
+
+                self._computed_jacobians += 1
+
+    def _apply_inverse_jacobian(self, vec):
+        """
+        Return the product of the limited memory inverse Jacobian with a vector.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector of the size of the states.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        if self.options['compute_jacobian']:
+            system = self._system()
+            d_res = system._dresiduals
+            d_out = system._doutputs
+
+            if self._full_inverse:
+                d_res.set_val(vec)
+            else:
+                d_res.set_val(0.0)
+                for name in self.options['state_vars']:
+                    if name in d_res:
+                        i, j = self._idx[name]
+                        d_res[name] = vec[i:j]
+
+            # Disable local fd
+            approx_status = system._owns_approx_jac
+            system._owns_approx_jac = False
+
+            try:
+                self.linear_solver.solve('fwd')
+            finally:
+                # Enable local fd
+                system._owns_approx_jac = approx_status
+
+            result = self.get_vector(d_out)
+        else:
+            result = -self.options['alpha'] * vec
+
+        for u, v in self._lm_updates:
+            result += u * v.dot(vec)
+
+        return result
+
     def get_vector(self, vec):
         """
         Return a vector containing the values of vec at the states specified in options.
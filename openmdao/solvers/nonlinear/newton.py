@@ -1,5 +1,8 @@
 """Define the NewtonSolver class."""
 
+import numpy as np
+
+from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.recorders.recording_iteration_stack import Recording
@@ -23,6 +26,19 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     _linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_free_ivc_inds : ndarray or None
+        Indices of the outputs of IndepVarComps in the outputs of the owning system.
+    _jac_free_point : tuple of ndarray or None
+        Outputs, inputs, and residuals of the point about which the Jacobian-free matrix vector
+        products are computed, or None outside of the Jacobian-free linear solve.
+    _jac_stats : dict
+        Number of linearizations performed and skipped during the current solve.
+    _lin_iter : int or None
+        Iteration of the current solve at which the Jacobian was last linearized.
+    _norm : float
+        Most recent norm of the residuals.
+    _prev_norm : float
+        Norm of the residuals before the most recent iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -35,6 +51,11 @@ class NewtonSolver(NonlinearSolver):
 
         self.linear_solver = None
         self._linesearch = BoundsEnforceLS()
+        self._jac_free_ivc_inds = None
+        self._jac_free_point = None
+        self._jac_stats = {'linearizations': 0, 'reused_jacobians': 0}
+        self._lin_iter = None
+        self._norm = self._prev_norm = 0.0
 
     def _declare_options(self):
         """
@@ -53,6 +74,33 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('relinearize', default='always',
+                             values=['always', 'interval', 'contraction', 'once'],
+                             desc="When to recompute the Jacobian and refactor or update the "
+                             "linear solver during a solve. 'always' does it every iteration, "
+                             "'interval' every relinearize_interval iterations, 'contraction' "
+                             "when the residual norm decreased by less than relinearize_ratio in "
+                             "the last iteration, and 'once' only on the first iteration. The "
+                             "Jacobian is always recomputed on the first iteration of a solve.")
+        self.options.declare('relinearize_interval', types=int, default=2, lower=1,
+                             desc="Number of iterations between linearizations when relinearize "
+                             "is 'interval'.")
+        self.options.declare('relinearize_ratio', default=0.5, lower=0.0,
+                             desc="Ratio of the current residual norm to the previous one above "
+                             "which the Jacobian is recomputed when relinearize is "
+                             "'contraction'.")
+        self.options.declare('jacobian_free', types=bool, default=False,
+                             desc="When True, compute the products of the Jacobian with the "
+                             "Newton step in the Krylov linear solver as directional finite "
+                             "differences of the residuals, so that no partials are needed. The "
+                             "partials are still computed if the linear solver has a "
+                             "preconditioner.")
+        self.options.declare('jacobian_free_step', types=float,
+                             default=float(np.sqrt(np.finfo(float).eps)),
+                             desc="Relative step of the directional finite differences when "
+                             "jacobian_free is True. The step is scaled by (1 + |u|) / |v|, "
+                             "where u are the outputs and v is the direction. The default is "
+                             "the square root of the machine precision.")
 
         self.supports['linesearch'] = True
         self.supports['gradients'] = True
@@ -82,6 +130,13 @@ class NewtonSolver(NonlinearSolver):
         else:
             self.linear_solver = system.linear_solver
 
+        self._jac_free_ivc_inds = None
+        if self.options['jacobian_free'] and \
+                (self.linear_solver is None or not self.linear_solver.supports['jacobian_free']):
+            raise ValueError(f"{self.msginfo}: jacobian_free requires a Krylov linear solver "
+                             "such as ScipyKrylov or PETScKrylov, but the linear solver is "
+                             f"{self.linear_solver.SOLVER if self.linear_solver else None}.")
+
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
@@ -146,6 +201,91 @@ class NewtonSolver(NonlinearSolver):
         return (self.options['solve_subsystems'] and not self._system().under_complex_step
                 and self._iter_count <= self.options['max_sub_solves'])
 
+    def _do_relinearize(self):
+        """
+        Return True if the Jacobian must be recomputed for the current iteration.
+
+        Returns
+        -------
+        bool
+            True if the Jacobian must be recomputed.
+        """
+        policy = self.options['relinearize']
+        if policy == 'always' or self._lin_iter is None:
+            return True
+
+        if policy == 'interval':
+            return self._iter_count - self._lin_iter >= self.options['relinearize_interval']
+
+        if policy == 'contraction':
+            return self._norm > self.options['relinearize_ratio'] * self._prev_norm
+
+        return False
+
+    def _iter_get_norm(self):
+        """
+        Return the norm of the residual and keep the previous one.
+
+        Returns
+        -------
+        float
+            norm.
+        """
+        self._prev_norm = self._norm
+        self._norm = super()._iter_get_norm()
+        return self._norm
+
+    def _update_iteration_metadata(self, metadata):
+        """
+        Add the number of linearizations performed and skipped to the iteration statistics.
+
+        Parameters
+        ----------
+        metadata : dict
+            Metadata of the iteration being recorded.
+        """
+        metadata['solver_stats'] = self._jac_stats.copy()
+
+    def _jac_free_mat_vec(self):
+        """
+        Compute the product of the Jacobian with the linear outputs by finite differences.
+
+        The residuals are evaluated once at the outputs perturbed along the linear outputs, and
+        the product is placed in the linear residuals.
+        """
+        system = self._system()
+        outputs, inputs, residuals = self._jac_free_point
+
+        vnorm = system._doutputs.get_norm()
+        if vnorm == 0.0:
+            system._dresiduals.set_val(0.0)
+            return
+
+        step = self.options['jacobian_free_step'] * (1.0 + system._outputs.get_norm()) / vnorm
+
+        system._outputs.set_val(outputs + step * system._doutputs.asarray())
+        try:
+            self._run_apply()
+            system._dresiduals.set_val((system._residuals.asarray() - residuals) / step)
+        finally:
+            system._outputs.set_val(outputs)
+            system._inputs.set_val(inputs)
+            system._residuals.set_val(residuals)
+
+        # The residuals of independent variables are never computed, but their rows of the
+        # Jacobian are -I as in apply_linear.
+        ivc_inds = self._jac_free_ivc_inds
+        if ivc_inds is None:
+            slices = system._outputs.get_slice_dict()
+            ivc_inds = [np.arange(slices[name].start, slices[name].stop)
+                        for ivc in system.system_iter(recurse=True, typ=IndepVarComp)
+                        for name in ivc._var_abs2meta['output'] if name in slices]
+            self._jac_free_ivc_inds = ivc_inds = \
+                np.concatenate(ivc_inds) if ivc_inds else np.zeros(0, dtype=int)
+
+        if ivc_inds.size > 0:
+            system._dresiduals.asarray()[ivc_inds] = -system._doutputs.asarray()[ivc_inds]
+
     def _linearize(self):
         """
         Perform any required linearization operations such as matrix factorization.
@@ -170,6 +310,10 @@ class NewtonSolver(NonlinearSolver):
         system = self._system()
         solve_subsystems = self.options['solve_subsystems'] and not system.under_complex_step
 
+        self._jac_stats = {'linearizations': 0, 'reused_jacobians': 0}
+        self._lin_iter = None
+        self._norm = 0.0
+
         if self.options['debug_print']:
             self._err_cache['inputs'] = system._inputs._copy_vars()
             self._err_cache['outputs'] = system._outputs._copy_vars()
@@ -216,16 +360,42 @@ class NewtonSolver(NonlinearSolver):
         try:
             system._dresiduals.set_vec(system._residuals)
             system._dresiduals *= -1.0
-            my_asm_jac = self.linear_solver._assembled_jac
 
-            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-            if (my_asm_jac is not None and
-                    system.linear_solver._assembled_jac is not my_asm_jac):
-                my_asm_jac._update(system)
+            jac_free = self.options['jacobian_free']
+
+            # in Jacobian-free mode the partials are only needed by the preconditioner
+            use_jac = not jac_free or getattr(self.linear_solver, 'precon', None) is not None
 
-            self._linearize()
+            if self._do_relinearize():
+                if use_jac:
+                    my_asm_jac = self.linear_solver._assembled_jac
 
-            self.linear_solver.solve('fwd')
+                    system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+                    if (my_asm_jac is not None and
+                            system.linear_solver._assembled_jac is not my_asm_jac):
+                        my_asm_jac._update(system)
+
+                    self._jac_stats['linearizations'] += 1
+
+                self._linearize()
+
+                self._lin_iter = self._iter_count
+            elif use_jac:
+                # keep the previous Jacobian and factorization (modified Newton)
+                self._jac_stats['reused_jacobians'] += 1
+
+            if jac_free:
+                self._jac_free_point = (system._outputs.asarray(True),
+                                        system._inputs.asarray(True),
+                                        system._residuals.asarray(True))
+                self.linear_solver._jac_free_op = self._jac_free_mat_vec
+                try:
+                    self.linear_solver.solve('fwd')
+                finally:
+                    self.linear_solver._jac_free_op = None
+                    self._jac_free_point = None
+            else:
+                self.linear_solver.solve('fwd')
 
             if self.linesearch and not system.under_complex_step:
                 self.linesearch._do_subsolve = do_subsolve
@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from openmdao.solvers.nonlinear.anderson import AndersonAcceleration
 from openmdao.solvers.solver import NonlinearSolver
 
 
@@ -16,6 +17,8 @@ class NonlinearBlockGS(NonlinearSolver):
 
     Attributes
     ----------
+    _anderson : AndersonAcceleration or None
+        Object that computes the Anderson accelerated outputs, if that option is turned on.
     _delta_outputs_n_1 : ndarray
         Cached change in the full output vector for the previous iteration. Only used if the aitken
         acceleration option is turned on.
@@ -34,6 +37,7 @@ class NonlinearBlockGS(NonlinearSolver):
 
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
+        self._anderson = None
 
     def _setup_solvers(self, system, depth):
         """
@@ -52,6 +56,9 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_aitken'] and self.options['use_anderson']:
+            raise ValueError(f"{self.msginfo}: use_aitken and use_anderson can't both be True.")
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -66,6 +73,14 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='maximum number of previous iterations used by Anderson '
+                             'acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0,
+                             desc='mixing factor of Anderson acceleration. Values lower than 1 '
+                             'damp the iterations.')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -94,6 +109,12 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            self._anderson = AndersonAcceleration(self.options['anderson_depth'],
+                                                  self.options['anderson_beta'])
+        else:
+            self._anderson = None
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -116,7 +137,7 @@ class NonlinearBlockGS(NonlinearSolver):
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
 
-        if use_aitken:
+        if use_aitken or self._anderson is not None:
             # store a copy of the outputs, used to compute the change in outputs later
             delta_outputs_n = outputs.asarray(copy=True)
 
@@ -134,6 +155,9 @@ class NonlinearBlockGS(NonlinearSolver):
 
         if use_aitken:
             self._aitken_relax(outputs, residuals, outputs_n, delta_outputs_n)
+        elif self._anderson is not None:
+            outputs.set_val(self._anderson.update(delta_outputs_n, outputs.asarray(),
+                                                  system.comm))
 
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
@@ -167,7 +191,7 @@ class NonlinearBlockGS(NonlinearSolver):
             residuals = system._residuals
             use_aitken = self.options['use_aitken']
 
-            if use_aitken:
+            if use_aitken or self._anderson is not None:
                 # store a copy of the outputs, used to compute the change in outputs later
                 delta_outputs_n = outputs.asarray(copy=True)
 
@@ -182,11 +206,26 @@ class NonlinearBlockGS(NonlinearSolver):
 
             if use_aitken:
                 self._aitken_relax(outputs, residuals, outputs_n, delta_outputs_n)
+            elif self._anderson is not None:
+                outputs.set_val(self._anderson.update(delta_outputs_n, outputs.asarray(),
+                                                      system.comm))
 
             self._solver_info.pop()
             with system._unscaled_context(residuals=[residuals], outputs=[outputs]):
                 residuals.set_val(outputs.asarray() - outputs_n)
 
+    def _update_iteration_metadata(self, metadata):
+        """
+        Add the use of the Anderson acceleration history to the iteration statistics.
+
+        Parameters
+        ----------
+        metadata : dict
+            Metadata of the iteration being recorded.
+        """
+        if self._anderson is not None:
+            metadata['solver_stats'] = self._anderson.stats.copy()
+
     def _aitken_relax(self, outputs, residuals, outputs_n, delta_outputs_n):
         """
         Apply the aitken relaxation.
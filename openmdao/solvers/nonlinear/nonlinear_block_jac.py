@@ -1,6 +1,7 @@
 """Define the NonlinearBlockJac class."""
 from openmdao.recorders.recording_iteration_stack import Recording
-from openmdao.solvers.solver import NonlinearSolver
+from openmdao.solvers.nonlinear.anderson import AndersonAcceleration
+from openmdao.solvers.solver import NonlinearSolver, _get_num_threads, _run_subsystems
 from openmdao.utils.mpi import multi_proc_fail_check
 
 
@@ -12,16 +13,90 @@ class NonlinearBlockJac(NonlinearSolver):
     ----------
     **kwargs : dict
         Options dictionary.
+
+    Attributes
+    ----------
+    _anderson : AndersonAcceleration or None
+        Object that computes the Anderson accelerated outputs, if that option is turned on.
+    _num_threads : int
+        Number of threads used to run the subsystems, or 1 if they are run one after the other.
     """
 
     SOLVER = 'NL: NLBJ'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize attributes.
+        """
+        super().__init__(**kwargs)
+        self._anderson = None
+        self._num_threads = 1
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', default=1, types=int, lower=1,
+                             desc='Number of threads used to run the subsystems concurrently. '
+                                  'This only pays off when the subsystems spend their time in '
+                                  'code that releases the GIL, such as numpy or compiled '
+                                  'extensions. It is ignored under MPI and when a recorder is '
+                                  'attached below the owning system.')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='maximum number of previous iterations used by Anderson '
+                             'acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0,
+                             desc='mixing factor of Anderson acceleration. Values lower than 1 '
+                             'damp the iterations.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._num_threads = _get_num_threads(self, system)
+
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        if self.options['use_anderson']:
+            self._anderson = AndersonAcceleration(self.options['anderson_depth'],
+                                                  self.options['anderson_beta'])
+        else:
+            self._anderson = None
+
+        return super()._iter_initialize()
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
         self._solver_info.append_subsolver()
+
+        if self._anderson is not None:
+            # store a copy of the outputs, the starting point of the iteration
+            outputs_n = system._outputs.asarray(copy=True)
+
         system._transfer('nonlinear', 'fwd')
 
         with Recording('NonlinearBlockJac', 0, self) as rec:
@@ -32,14 +107,31 @@ class NonlinearBlockJac(NonlinearSolver):
                     for subsys in system._relevance.filter(system._subsystems_myproc):
                         subsys._solve_nonlinear()
             else:
-                for subsys in system._relevance.filter(system._subsystems_myproc):
-                    subsys._solve_nonlinear()
+                subs = [(subsys,) for subsys in
+                        system._relevance.filter(system._subsystems_myproc)]
+                _run_subsystems(system, _solve_nonlinear, subs, self._num_threads)
+
+            if self._anderson is not None:
+                outputs = system._outputs
+                outputs.set_val(self._anderson.update(outputs_n, outputs.asarray(), system.comm))
 
             rec.abs = 0.0
             rec.rel = 0.0
 
         self._solver_info.pop()
 
+    def _update_iteration_metadata(self, metadata):
+        """
+        Add the use of the Anderson acceleration history to the iteration statistics.
+
+        Parameters
+        ----------
+        metadata : dict
+            Metadata of the iteration being recorded.
+        """
+        if self._anderson is not None:
+            metadata['solver_stats'] = self._anderson.stats.copy()
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -52,3 +144,15 @@ class NonlinearBlockJac(NonlinearSolver):
                 super()._run_apply()
         else:
             super()._run_apply()
+
+
+def _solve_nonlinear(subsys):
+    """
+    Run the nonlinear solve of a subsystem.
+
+    Parameters
+    ----------
+    subsys : System
+        The subsystem.
+    """
+    subsys._solve_nonlinear()
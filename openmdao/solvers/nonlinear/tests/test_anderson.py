@@ -0,0 +1,68 @@
+"""Test the AndersonAcceleration class."""
+
+import unittest
+
+import numpy as np
+
+from openmdao.solvers.nonlinear.anderson import AndersonAcceleration
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class TestAndersonAcceleration(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.M = rng.uniform(-0.3, 0.3, (6, 6))
+        self.c = rng.uniform(-1.0, 1.0, 6)
+        self.solution = np.linalg.solve(np.eye(6) - self.M, self.c)
+
+    def iterate(self, anderson, niter):
+        x = np.zeros(6)
+        for i in range(niter):
+            x = anderson.update(x, self.M.dot(x) + self.c)
+        return x
+
+    def test_linear(self):
+        # with a full history, Anderson acceleration of a linear fixed-point iteration is
+        # equivalent to GMRES and converges in as many iterations as there are unknowns
+        for beta in (1.0, 0.5):
+            with self.subTest(beta=beta):
+                anderson = AndersonAcceleration(depth=6, beta=beta)
+                x = self.iterate(anderson, 7)
+
+                assert_near_equal(x, self.solution, 1e-10)
+                self.assertEqual(anderson.stats['anderson_depth'], 6)
+
+    def test_depth(self):
+        errors = []
+        for depth in (1, 3):
+            anderson = AndersonAcceleration(depth=depth)
+            x = self.iterate(anderson, 6)
+
+            self.assertEqual(anderson.stats['anderson_depth'], depth)
+            errors.append(np.linalg.norm(x - self.solution))
+
+        x = np.zeros(6)
+        for i in range(6):
+            x = self.M.dot(x) + self.c
+
+        self.assertLess(errors[1], errors[0])
+        self.assertLess(errors[0], np.linalg.norm(x - self.solution))
+
+    def test_dependent_history(self):
+        anderson = AndersonAcceleration(depth=3)
+        x = np.ones(6)
+
+        # the fixed-point residual doesn't change, so its change can't be used
+        anderson.update(x, x + 1.0)
+        x_new = anderson.update(x + 1.0, x + 2.0)
+
+        assert_near_equal(x_new, x + 2.0, 1e-15)
+        self.assertEqual(anderson.stats, {'anderson_depth': 0, 'anderson_dropped': 1})
+
+        anderson.reset()
+        self.assertEqual(anderson.stats, {'anderson_depth': 0, 'anderson_dropped': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
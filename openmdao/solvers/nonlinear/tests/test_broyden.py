@@ -732,6 +732,130 @@ class TestBryoden(unittest.TestCase):
         assert_check_totals(totals)
 
 
+class TestBroydenLimitedMemory(unittest.TestCase):
+
+    def build_mixed(self, limited_memory, compute_jacobian):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+        model.add_subsystem('mixed', MixedEquation())
+
+        model.connect('p1.c', 'mixed.c')
+
+        model.nonlinear_solver = om.BroydenSolver(maxiter=20, limited_memory=limited_memory,
+                                                  compute_jacobian=compute_jacobian)
+        model.nonlinear_solver.options['state_vars'] = ['mixed.x12', 'mixed.x3', 'mixed.x45']
+        model.nonlinear_solver.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def build_spedicato_huang(self, limited_memory):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', np.array([0, 20.0])))
+        model.add_subsystem('comp', SpedicatoHuang())
+
+        model.connect('p1.x', 'comp.x')
+
+        model.nonlinear_solver = om.BroydenSolver(maxiter=20, limited_memory=limited_memory,
+                                                  diverge_limit=0.5)
+        model.nonlinear_solver.options['state_vars'] = ['comp.y']
+        model.nonlinear_solver.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def test_same_as_dense(self):
+        # with enough memory to keep every update, the limited memory inverse Jacobian is the
+        # same as the dense one
+        for compute_jacobian in (False, True):
+            with self.subTest(compute_jacobian=compute_jacobian):
+                dense = self.build_mixed(0, compute_jacobian)
+                prob = self.build_mixed(20, compute_jacobian)
+
+                self.assertIsNone(prob.model.nonlinear_solver.Gm)
+                self.assertEqual(prob.model.nonlinear_solver._iter_count,
+                                 dense.model.nonlinear_solver._iter_count)
+                for name in ('mixed.x12', 'mixed.x3', 'mixed.x45'):
+                    assert_near_equal(prob[name], dense[name], 1e-10)
+
+        with self.subTest(model='SpedicatoHuang'):
+            dense = self.build_spedicato_huang(0)
+            prob = self.build_spedicato_huang(20)
+
+            solver = prob.model.nonlinear_solver
+            self.assertIsNone(solver.Gm)
+            self.assertEqual(solver._iter_count, dense.model.nonlinear_solver._iter_count)
+            self.assertEqual(solver._computed_jacobians,
+                             dense.model.nonlinear_solver._computed_jacobians)
+            assert_near_equal(prob['comp.y'], dense['comp.y'], 1e-8)
+
+    def test_short_memory(self):
+        prob = self.build_spedicato_huang(2)
+
+        self.assertLessEqual(len(prob.model.nonlinear_solver._lm_updates), 2)
+        assert_near_equal(prob['comp.y'], np.array([-36.26230985, 10.20857237, -54.17658612]),
+                          1e-6)
+
+    def test_full_model_iterative_linear_solver(self):
+        # only solves with the linear solver are needed, so it doesn't have to be DirectSolver
+        prob = om.Problem()
+        model = prob.model = SellarStateConnection(nonlinear_solver=om.BroydenSolver(),
+                                                   linear_solver=om.LinearRunOnce())
+
+        prob.setup()
+
+        model.nonlinear_solver.options['limited_memory'] = 5
+        model.nonlinear_solver.linear_solver = om.ScipyKrylov(atol=1e-14, rtol=1e-14)
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
+        self.assertTrue(model.nonlinear_solver._iter_count < 5)
+
+    def test_cs_around_broyden(self):
+        prob = om.Problem()
+        model = prob.model
+        sub = model.add_subsystem('sub', om.Group(), promotes=['*'])
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        sub.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        sub.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.add_subsystem('con_cmp1', om.ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+        model.add_subsystem('con_cmp2', om.ExecComp('con2 = y2 - 24.0'), promotes=['con2', 'y2'])
+
+        sub.nonlinear_solver = om.BroydenSolver(limited_memory=3)
+        sub.linear_solver = om.DirectSolver()
+        model.linear_solver = om.DirectSolver()
+
+        prob.model.add_design_var('x', lower=-100, upper=100)
+        prob.model.add_design_var('z', lower=-100, upper=100)
+        prob.model.add_objective('obj')
+        prob.model.add_constraint('con1', upper=0.0)
+        prob.model.add_constraint('con2', upper=0.0)
+
+        prob.setup(check=False, force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+
+        prob.run_model()
+
+        totals = prob.check_totals(method='cs', out_stream=None)
+        assert_check_totals(totals)
+
+
 # Commented the following test out until we fix the broyden check
 # @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 # class TestBryodenMPI(unittest.TestCase):
@@ -10,6 +10,7 @@ from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, \
      SellarNoDerivatives, SellarDerivatives, SellarStateConnection, StateConnection, \
      SellarDis1withDerivatives, SellarDis2withDerivatives
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -826,6 +827,196 @@ class TestNewton(unittest.TestCase):
         self.assertEqual(str(context.exception), msg)
 
 
+class CountingDis1(SellarDis1withDerivatives):
+
+    def compute_partials(self, inputs, partials):
+        super().compute_partials(inputs, partials)
+        self.partials_count = getattr(self, 'partials_count', 0) + 1
+
+
+@use_tempdirs
+class TestNewtonRelinearize(unittest.TestCase):
+
+    def build(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('d1', CountingDis1(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=30,
+                                                 atol=1e-10, rtol=1e-10, **options)
+        model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        return prob
+
+    def test_policies(self):
+        expected = self.build()
+        expected.run_model()
+
+        cases = {
+            # policy: (linearizations, reused jacobians)
+            'always': (3, 0),
+            'interval': (2, 2),
+            'contraction': (2, 2),
+            'once': (1, 9),
+        }
+        for policy, (nlin, nreused) in cases.items():
+            with self.subTest(relinearize=policy):
+                prob = self.build(relinearize=policy, relinearize_interval=2,
+                                  relinearize_ratio=0.1)
+                prob.run_model()
+
+                newton = prob.model.nonlinear_solver
+                self.assertEqual(newton._jac_stats['linearizations'], nlin)
+                self.assertEqual(newton._jac_stats['reused_jacobians'], nreused)
+                self.assertEqual(newton._iter_count, nlin + nreused)
+                self.assertEqual(prob.model.d1.partials_count, nlin)
+
+                assert_near_equal(prob.get_val('y1'), expected.get_val('y1'), 1e-9)
+                assert_near_equal(prob.get_val('y2'), expected.get_val('y2'), 1e-9)
+
+    def test_each_solve_relinearizes(self):
+        prob = self.build(relinearize='once')
+        prob.run_model()
+
+        prob.set_val('x', 2.)
+        prob.run_model()
+
+        self.assertEqual(prob.model.nonlinear_solver._jac_stats['linearizations'], 1)
+        self.assertEqual(prob.model.d1.partials_count, 2)
+
+        prob.set_val('x', 1.)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, 1e-6)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, 1e-6)
+
+    def test_iteration_metadata(self):
+        prob = self.build(relinearize='once')
+        newton = prob.model.nonlinear_solver
+
+        newton.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        cases = cr.get_cases('root.nonlinear_solver')
+
+        self.assertEqual([case.solver_stats for case in cases[1:]],
+                         [{'linearizations': 1, 'reused_jacobians': i}
+                          for i in range(newton._iter_count)])
+
+
+class TestNewtonJacobianFree(unittest.TestCase):
+
+    def build(self, linear_solver, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('d1', CountingDis1(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_design_var('x')
+        model.add_design_var('z')
+        model.add_constraint('y1', upper=0.)
+        model.add_constraint('y2', upper=0.)
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-10, rtol=1e-10,
+                                                 **options)
+        model.linear_solver = linear_solver
+
+        prob.setup()
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        return prob
+
+    def test_sellar(self):
+        expected = self.build(om.DirectSolver())
+        expected.run_model()
+
+        prob = self.build(om.ScipyKrylov(rtol=1e-6), jacobian_free=True)
+        prob.run_model()
+
+        self.assertEqual(getattr(prob.model.d1, 'partials_count', 0), 0)
+        self.assertEqual(prob.model.nonlinear_solver._iter_count,
+                         expected.model.nonlinear_solver._iter_count)
+
+        # without a preconditioner there is no Jacobian to compute or reuse
+        self.assertEqual(prob.model.nonlinear_solver._jac_stats,
+                         {'linearizations': 0, 'reused_jacobians': 0})
+
+        assert_near_equal(prob.get_val('y1'), expected.get_val('y1'), 1e-10)
+        assert_near_equal(prob.get_val('y2'), expected.get_val('y2'), 1e-10)
+
+        # the linear solver uses the partials again outside of the Newton solve
+        assert_near_equal(prob.compute_totals(return_format='array'),
+                          expected.compute_totals(return_format='array'), 1e-9)
+
+    def test_implicit(self):
+        def build(jacobian_free):
+            prob = om.Problem(model=DoubleSellarImplicit())
+            model = prob.model
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-10,
+                                                     rtol=1e-10, jacobian_free=jacobian_free)
+            model.linear_solver = om.ScipyKrylov(rtol=1e-6)
+            prob.setup()
+            prob.run_model()
+            return prob
+
+        expected = build(False)
+        prob = build(True)
+
+        self.assertEqual(prob.model.nonlinear_solver._iter_count,
+                         expected.model.nonlinear_solver._iter_count)
+
+        for name in ('g1.y1', 'g1.y2', 'g2.y1', 'g2.y2'):
+            assert_near_equal(prob.get_val(name), expected.get_val(name), 1e-10)
+
+    def test_precon(self):
+        linear_solver = om.ScipyKrylov(rtol=1e-6)
+        linear_solver.precon = om.DirectSolver()
+        prob = self.build(linear_solver, jacobian_free=True, relinearize='once')
+        prob.run_model()
+
+        # the preconditioner is the only user of the partials
+        self.assertEqual(prob.model.d1.partials_count, 1)
+
+        newton = prob.model.nonlinear_solver
+        self.assertEqual(newton._jac_stats,
+                         {'linearizations': 1, 'reused_jacobians': newton._iter_count - 1})
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, 1e-6)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, 1e-6)
+
+    def test_requires_krylov(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+        prob.model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, jacobian_free=True)
+        prob.model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NewtonSolver in <model> <class Group>: jacobian_free requires a Krylov "
+                         "linear solver such as ScipyKrylov or PETScKrylov, but the linear solver "
+                         "is LN: Direct.")
+
+
 class TestNewtonFeatures(unittest.TestCase):
 
     def test_feature_maxiter(self):
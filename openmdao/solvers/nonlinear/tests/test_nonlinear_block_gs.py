@@ -10,6 +10,7 @@ from openmdao.test_suite.components.sellar import SellarDerivatives, \
     SellarDis1withDerivatives, SellarDis2withDerivatives, \
     SellarDis1, SellarDis2
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 
 from openmdao.utils.mpi import MPI
 try:
@@ -401,6 +402,72 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+        expected = {
+            # (anderson options, use_apply_nonlinear): iterations
+            ((), False): 9,
+            ((('use_anderson', True),), False): 6,
+            ((('use_anderson', True), ('anderson_depth', 1)), False): 6,
+            ((('use_anderson', True), ('anderson_beta', 0.8)), False): 7,
+            ((('use_anderson', True),), True): 5,
+        }
+        for (options, use_apply_nonlinear), niter in expected.items():
+            with self.subTest(options=options, use_apply_nonlinear=use_apply_nonlinear):
+                prob = om.Problem(model=SellarDerivatives())
+                prob.model.nonlinear_solver = om.NonlinearBlockGS(
+                    atol=1e-12, rtol=1e-12, use_apply_nonlinear=use_apply_nonlinear,
+                    **dict(options))
+
+                prob.setup()
+                prob.run_model()
+
+                self.assertEqual(prob.model.nonlinear_solver._iter_count, niter)
+                assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+                assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+    def test_NLBGS_Anderson_double_sellar(self):
+        for use_anderson, niter in ((False, 15), (True, 9)):
+            with self.subTest(use_anderson=use_anderson):
+                prob = om.Problem(model=DoubleSellar())
+                prob.model.nonlinear_solver = om.NonlinearBlockGS(maxiter=50, atol=1e-12,
+                                                                  rtol=1e-12,
+                                                                  use_anderson=use_anderson)
+                prob.setup()
+                prob.run_model()
+
+                self.assertEqual(prob.model.nonlinear_solver._iter_count, niter)
+                assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-9)
+                assert_near_equal(prob.get_val('g2.y2'), 0.80, 1e-9)
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS))
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Aitken_Anderson(self):
+        prob = om.Problem(model=SellarDerivatives())
+        prob.model.nonlinear_solver = om.NonlinearBlockGS(use_aitken=True, use_anderson=True)
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: use_aitken and "
+                         "use_anderson can't both be True.")
+
     def test_aitken_bug(self):
         class Spring(om.ExplicitComponent):
             def setup(self):
@@ -541,6 +608,39 @@ class TestNLBGaussSeidel(unittest.TestCase):
         assert_near_equal(prob['x'], 0.67883021, 1e-5)
 
 
+@use_tempdirs
+class TestNLBGSAndersonRecording(unittest.TestCase):
+
+    def test_anderson_stats(self):
+        prob = om.Problem(model=SellarDerivatives())
+        nlbgs = prob.model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True,
+                                                                  anderson_depth=2,
+                                                                  atol=1e-12, rtol=1e-12)
+        nlbgs.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        cases = cr.get_cases('root.nonlinear_solver')
+
+        self.assertEqual([case.solver_stats['anderson_depth'] for case in cases],
+                         [1, 2, 2, 2, 2])
+        self.assertEqual(cases[-1].solver_stats['anderson_dropped'], 0)
+
+    def test_no_anderson(self):
+        prob = om.Problem(model=SellarDerivatives())
+        nlbgs = prob.model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+        nlbgs.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        for case in cr.get_cases('root.nonlinear_solver'):
+            self.assertIsNone(case.solver_stats)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class ProcTestCase1(unittest.TestCase):
 
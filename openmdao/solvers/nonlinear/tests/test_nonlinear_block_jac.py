@@ -1,14 +1,17 @@
 """Test the Nonlinear Block Jacobi solver. """
 
+import threading
 import unittest
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.test_suite.components.ae_tests import AEComp, AEDriver
+from openmdao.test_suite.components.double_sellar import DoubleSellar
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -138,6 +141,197 @@ class TestNLBlockJacobi(unittest.TestCase):
 
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class TestNLBlockJacobiAnderson(unittest.TestCase):
+
+    def test_anderson(self):
+        for use_anderson, niter in ((False, 15), (True, 6)):
+            with self.subTest(use_anderson=use_anderson):
+                prob = om.Problem()
+                model = prob.model
+
+                model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+                model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+
+                model.nonlinear_solver = om.NonlinearBlockJac(maxiter=50, atol=1e-12,
+                                                              rtol=1e-12,
+                                                              use_anderson=use_anderson)
+
+                prob.setup()
+
+                prob.set_val('x', 1.)
+                prob.set_val('z', np.array([5.0, 2.0]))
+
+                prob.run_model()
+
+                self.assertEqual(model.nonlinear_solver._iter_count, niter)
+                assert_near_equal(prob['y1'], 25.58830273, .00001)
+                assert_near_equal(prob['y2'], 12.05848819, .00001)
+
+    def test_anderson_threads(self):
+        prob = om.Problem(model=DoubleSellar())
+        prob.model.nonlinear_solver = om.NonlinearBlockJac(maxiter=50, atol=1e-12, rtol=1e-12,
+                                                           use_anderson=True, num_threads=2)
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 6)
+        self.assertEqual(prob.model.nonlinear_solver._anderson.stats,
+                         {'anderson_depth': 5, 'anderson_dropped': 0})
+        assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-9)
+        assert_near_equal(prob.get_val('g2.y2'), 0.80, 1e-9)
+
+
+@use_tempdirs
+class TestNLBlockJacobiAndersonRecording(unittest.TestCase):
+
+    def test_anderson_stats(self):
+        prob = om.Problem(model=DoubleSellar())
+        nlbj = prob.model.nonlinear_solver = om.NonlinearBlockJac(maxiter=50, atol=1e-12,
+                                                                  rtol=1e-12, use_anderson=True,
+                                                                  anderson_depth=3)
+        nlbj.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        cases = cr.get_cases('root.nonlinear_solver', recurse=False)
+
+        self.assertEqual(len(cases), nlbj._iter_count)
+        # near convergence, the older iterations become linearly dependent and are dropped
+        self.assertEqual([(case.solver_stats['anderson_depth'],
+                           case.solver_stats['anderson_dropped']) for case in cases],
+                         [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 4)])
+
+
+class FailingComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+
+    def compute(self, inputs, outputs):
+        raise om.AnalysisError('failed')
+
+
+class StackComp(om.ExplicitComponent):
+    """Component that saves the recording iteration stack seen by its compute in a thread."""
+
+    def initialize(self):
+        self.options.declare('barrier', recordable=False)
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+        self.stacks = []
+
+    def compute(self, inputs, outputs):
+        if threading.current_thread() is not threading.main_thread():
+            # make all of the threads push their coordinates before any of them looks
+            self.options['barrier'].wait(timeout=10.)
+            self.stacks.append([name for name, _ in self._recording_iter.stack])
+        outputs['y'] = 2.0 * inputs['x']
+
+
+@use_tempdirs
+class TestNLBlockJacobiThreads(unittest.TestCase):
+
+    def build(self, num_threads, nested_threads=1):
+        prob = om.Problem()
+        model = prob.model
+
+        for i in range(3):
+            sellar = model.add_subsystem(f'sellar{i}', om.Group())
+            sellar.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            sellar.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+            sellar.nonlinear_solver = om.NonlinearBlockJac(num_threads=nested_threads,
+                                                           atol=1e-12, rtol=1e-12, maxiter=100)
+            sellar.set_input_defaults('x', 1.0 + i)
+
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=num_threads)
+
+        prob.setup()
+        prob.run_model()
+        return prob
+
+    def test_threads(self):
+        expected = self.build(1)
+
+        for num_threads, nested_threads in ((3, 1), (2, 1), (3, 3)):
+            with self.subTest(num_threads=num_threads, nested_threads=nested_threads):
+                prob = self.build(num_threads, nested_threads)
+
+                self.assertEqual(prob.model.nonlinear_solver._num_threads, num_threads)
+                for i in range(3):
+                    for name in ('y1', 'y2'):
+                        assert_near_equal(prob.get_val(f'sellar{i}.{name}'),
+                                          expected.get_val(f'sellar{i}.{name}'), 1e-15)
+                    self.assertEqual(getattr(prob.model, f"sellar{i}").nonlinear_solver._iter_count,
+                                     getattr(expected.model, f"sellar{i}").nonlinear_solver._iter_count)
+
+    def test_recording_stack(self):
+        prob = om.Problem()
+        model = prob.model
+        barrier = threading.Barrier(3)
+        for i in range(3):
+            model.add_subsystem(f'c{i}', StackComp(barrier=barrier))
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=3)
+
+        prob.setup()
+        prob.run_model()
+
+        # each thread sees the stack of the caller plus its own coordinates
+        main_stack = model.c0.stacks[-1][:-1]
+        self.assertEqual(main_stack[-1], 'NonlinearBlockJac')
+        for i in range(3):
+            comp = getattr(model, f'c{i}')
+            self.assertEqual(len(comp.stacks), model.nonlinear_solver._iter_count)
+            for stack in comp.stacks:
+                self.assertEqual(stack[-1], f'c{i}._solve_nonlinear')
+                self.assertEqual(stack[:-1], main_stack)
+
+        self.assertEqual(prob._recording_iter.stack, [])
+
+    def test_analysis_error(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('c1', om.ExecComp('y = 2.0 * x'))
+        model.add_subsystem('c2', FailingComp())
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=2)
+
+        prob.setup()
+
+        with self.assertRaises(om.AnalysisError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception), "'c2' <class FailingComp>: Error calling compute(), failed")
+
+    def test_recorder_fallback(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=2)
+        model.d1.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+
+        msg = ("NonlinearBlockJac in <model> <class Group>: 'num_threads' is ignored because "
+               "'d1' or its nonlinear solver has a recorder.")
+        with assert_warning(om.SolverWarning, msg):
+            prob.final_setup()
+
+        self.assertEqual(model.nonlinear_solver._num_threads, 1)
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['y2'], 12.05848819, .00001)
+
+
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
 
     N_PROCS = 2
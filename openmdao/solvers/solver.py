@@ -3,14 +3,17 @@
 import os
 import pprint
 import sys
+import threading
 import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import numpy as np
 
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.core.constants import _UNDEFINED
 from openmdao.recorders.recording_iteration_stack import Recording
-from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.recorders.recording_manager import RecordingManager, _declare_policy_options
+from openmdao.solvers.linear.linear_warm_start import LinearWarmStart
 from openmdao.utils.file_utils import _get_outputs_dir
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
@@ -19,6 +22,105 @@ from openmdao.utils.om_warnings import issue_warning, SolverWarning
 from openmdao.utils.general_utils import SolverMetaclass, is_undefined
 
 
+# thread pools shared by the solvers that run subsystems concurrently, keyed by size
+_thread_pools = {}
+
+# marks the threads of those pools
+_pool_thread = threading.local()
+
+
+def _get_num_threads(solver, system):
+    """
+    Return the number of threads that a block Jacobi solver can use to run its subsystems.
+
+    Parameters
+    ----------
+    solver : Solver
+        The solver with the 'num_threads' option.
+    system : System
+        The system that owns the solver.
+
+    Returns
+    -------
+    int
+        The number of threads, or 1 if the subsystems must be run one after the other.
+    """
+    num_threads = solver.options['num_threads']
+    if num_threads < 2:
+        return 1
+
+    if system.comm.size > 1:
+        issue_warning(f"{solver.msginfo}: 'num_threads' is ignored under MPI.",
+                      category=SolverWarning)
+        return 1
+
+    # recorders and their case counters can't be used from several threads at once
+    for subsys in system.system_iter(recurse=True):
+        nl_solver = subsys._nonlinear_solver
+        if subsys._rec_mgr.has_recorders() or \
+                (nl_solver is not None and nl_solver._rec_mgr.has_recorders()):
+            issue_warning(f"{solver.msginfo}: 'num_threads' is ignored because '{subsys.pathname}' "
+                          "or its nonlinear solver has a recorder.", category=SolverWarning)
+            return 1
+
+    return num_threads
+
+
+def _run_subsystems(system, func, args, num_threads):
+    """
+    Call func for each tuple of arguments, using a pool of threads if num_threads > 1.
+
+    The calls must only touch the vectors of their own subsystem. They run one after the other
+    when called from a thread of a pool, so nested solvers don't wait on threads that their
+    callers occupy. Each thread starts from the relevance state and recording iteration stack of
+    the calling thread, and keeps its own copy of them while it runs.
+
+    Parameters
+    ----------
+    system : System
+        The system whose subsystems are run.
+    func : callable
+        Function that runs a subsystem.
+    args : list of tuple
+        Arguments of each call to func.
+    num_threads : int
+        Number of threads in the pool.
+    """
+    if num_threads < 2 or len(args) < 2 or getattr(_pool_thread, 'active', False):
+        for arg in args:
+            func(*arg)
+        return
+
+    try:
+        pool = _thread_pools[num_threads]
+    except KeyError:
+        pool = _thread_pools[num_threads] = ThreadPoolExecutor(num_threads,
+                                                               thread_name_prefix='om_solver')
+
+    relevance = system._relevance
+    rel_state = relevance._get_state()
+    rec_iter = system._recording_iter
+    stack = rec_iter.stack
+
+    def run(arg):
+        _pool_thread.active = True
+        saved = rec_iter.stack
+        rec_iter.stack = list(stack)
+        try:
+            with relevance.thread_state(rel_state):
+                func(*arg)
+        finally:
+            rec_iter.stack = saved
+            _pool_thread.active = False
+
+    futures = [pool.submit(run, arg) for arg in args]
+    wait(futures)
+
+    # raise the error of the first failed subsystem, as running them in order would
+    for future in futures:
+        future.result()
+
+
 class SolverInfo(object):
     """
     Communal object for storing some formatting for solver iprint.
@@ -192,6 +294,7 @@ class Solver(object, metaclass=SolverMetaclass):
                                        Paths are relative to solver's Group. \
                                        Uses fnmatch wildcards"
                                        )
+        _declare_policy_options(self.recording_options)
         # Case recording related
         self._filtered_vars_to_record = {}
         self._norm0 = 0.0
@@ -313,6 +416,28 @@ class Solver(object, metaclass=SolverMetaclass):
         """
         pass
 
+    def _get_restart_state(self):
+        """
+        Return the warm start data of the solver to be saved in a checkpoint.
+
+        Returns
+        -------
+        dict or None
+            The data needed to warm start this solver, or None if it has none.
+        """
+        return None
+
+    def _set_restart_state(self, state):
+        """
+        Restore the warm start data of the solver from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            The data returned by _get_restart_state when the checkpoint was saved.
+        """
+        pass
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -486,10 +611,21 @@ class Solver(object, metaclass=SolverMetaclass):
         **kwargs : dict
             Keyword arguments (used for abs and rel error).
         """
-        if not self._rec_mgr._recorders:
-            return
+        if self._rec_mgr._recorders and \
+                self._rec_mgr._check_policy(self, self._system().comm, **kwargs):
+            self._record_iteration(**kwargs)
 
+    def _record_iteration(self, **kwargs):
+        """
+        Gather and record the data for the current iteration of the Solver.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Keyword arguments (used for abs and rel error).
+        """
         metadata = create_local_meta(self.SOLVER)
+        self._update_iteration_metadata(metadata)
 
         # Get the data
         data = {
@@ -517,6 +653,20 @@ class Solver(object, metaclass=SolverMetaclass):
 
         self._rec_mgr.record_iteration(self, data, metadata)
 
+    def _update_iteration_metadata(self, metadata):
+        """
+        Add solver specific entries to the metadata of the iteration being recorded.
+
+        Statistics added as a dict under the 'solver_stats' key are saved by the SqliteRecorder
+        and are available as the solver_stats attribute of the recorded solver cases.
+
+        Parameters
+        ----------
+        metadata : dict
+            Metadata of the iteration being recorded.
+        """
+        pass
+
     def cleanup(self):
         """
         Clean up resources prior to exit.
@@ -692,16 +842,49 @@ class NonlinearSolver(Solver):
                 # reset to False so we won't waste memory allocating a cache array
                 self.options['restart_from_successful'] = False
 
+    def _get_restart_state(self):
+        """
+        Return the warm start data of the solver to be saved in a checkpoint.
+
+        Returns
+        -------
+        dict or None
+            The data needed to warm start this solver, or None if it has none.
+        """
+        if self._output_cache is None:
+            return None
+        return {'output_cache': self._output_cache.copy()}
+
+    def _set_restart_state(self, state):
+        """
+        Restore the warm start data of the solver from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            The data returned by _get_restart_state when the checkpoint was saved.
+        """
+        cache = state.get('output_cache')
+        if cache is not None and self.options['restart_from_successful']:
+            self._output_cache = cache.copy()
+
     def solve(self):
         """
         Run the solver.
         """
+        rec_mgr = self._rec_mgr
+        if rec_mgr._recorders:
+            rec_mgr._start_solve()
+
         try:
             self._solve()
         except Exception as err:
             if self.options['debug_print']:
                 self._print_exc_debug_info()
             raise err
+        finally:
+            if rec_mgr._recorders:
+                rec_mgr._record_pending(self)
 
     def _iter_initialize(self):
         """
@@ -955,6 +1138,9 @@ class LinearSolver(Solver):
     ----------
     _assembled_jac : AssembledJacobian or None
         If not None, the AssembledJacobian instance used by this solver.
+    _jac_free_op : callable or None
+        Function that replaces apply_linear in the matrix vector products of the solver, set by
+        a NewtonSolver in Jacobian-free mode.
     _scope_in : set or None or _UNDEFINED
         Relevant input variables for the current matrix vector product.
     _scope_out : set or None or _UNDEFINED
@@ -966,6 +1152,7 @@ class LinearSolver(Solver):
         Initialize all attributes.
         """
         self._assembled_jac = None
+        self._jac_free_op = None
         self._scope_out = _UNDEFINED
         self._scope_in = _UNDEFINED
 
@@ -994,6 +1181,28 @@ class LinearSolver(Solver):
         if self.options['assemble_jac']:
             yield self
 
+    def _get_cache_state(self):
+        """
+        Return the state of the data that this solver keeps from one solve to the next.
+
+        Returns
+        -------
+        object
+            The state, which _set_cache_state uses to undo the changes of later solves.
+        """
+        return None
+
+    def _set_cache_state(self, state):
+        """
+        Restore the data that this solver keeps from one solve to the next.
+
+        Parameters
+        ----------
+        state : object
+            The state returned by _get_cache_state.
+        """
+        pass
+
     def add_recorder(self, recorder):
         """
         Add a recorder to the solver's RecordingManager.
@@ -1013,6 +1222,9 @@ class LinearSolver(Solver):
                              desc='Activates use of assembled jacobian by this solver.')
 
         self.supports.declare('assembled_jac', types=bool, default=True)
+        self.supports.declare('multi_rhs', types=bool, default=False)
+        self.supports.declare('multi_column', types=bool, default=False)
+        self.supports.declare('jacobian_free', types=bool, default=False)
 
     def _setup_solvers(self, system, depth):
         """
@@ -1129,6 +1341,10 @@ class BlockLinearSolver(LinearSolver):
     _rhs_vec : ndarray
         Contains the values of the linear resids (fwd) or outputs (rev) saved at the beginning
         of the linear solve.
+    _warm_start : LinearWarmStart or None
+        Object that keeps the solutions of derivative seeds for use as initial guesses.
+    _warm_started : bool
+        True if the current solve started from the solution of a previous compute_totals.
     """
 
     def __init__(self, **kwargs):
@@ -1137,12 +1353,21 @@ class BlockLinearSolver(LinearSolver):
         """
         super().__init__(**kwargs)
         self._rhs_vec = None
+        self._warm_start = None
+        self._warm_started = False
 
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
         """
         super()._declare_options()
+
+        self.options.declare('warm_start', types=(bool, dict), default=False,
+                             desc="If True, start the solve of each derivative seed from its "
+                             "solution in the previous call to compute_totals. Can also be set to "
+                             "a dict of options for the LinearWarmStart to allow finer control "
+                             f"over it. Allowed options are: {LinearWarmStart.options}")
+
         self.supports['assembled_jac'] = False
 
     def does_recursive_applies(self):
@@ -1171,6 +1396,9 @@ class BlockLinearSolver(LinearSolver):
         """
         super()._setup_solvers(system, depth)
         self._rhs_vec = None
+        self.supports['multi_column'] = True
+        if 'warm_start' in self.options:
+            self._warm_start = LinearWarmStart.create(system, self.options['warm_start'])
 
     def _create_rhs_vec(self):
         system = self._system()
@@ -1180,7 +1408,9 @@ class BlockLinearSolver(LinearSolver):
             self._rhs_vec = system._doutputs.asarray(True)
 
     def _update_rhs_vec(self):
-        if self._rhs_vec is None:
+        # the shape changes when the linear vectors hold a column for each seed of a
+        # vectorized derivative solve
+        if self._rhs_vec is None or self._rhs_vec.shape != self._system()._doutputs._data.shape:
             self._create_rhs_vec()
 
         if self._mode == 'fwd':
@@ -1266,11 +1496,20 @@ class BlockLinearSolver(LinearSolver):
         self._update_rhs_vec()
 
         if self.options['maxiter'] > 1:
+            if self._warm_started:
+                # measure convergence relative to the residual of a solve from zero, which is the
+                # right-hand side
+                if self._mode == 'fwd':
+                    norm0 = self._system()._dresiduals.get_norm()
+                else:
+                    norm0 = self._system()._doutputs.get_norm()
             self._run_apply()
             norm = self._iter_get_norm()
         else:
             return 1.0, 1.0
-        norm0 = norm if norm != 0.0 else 1.0
+        if not self._warm_started:
+            norm0 = norm
+        norm0 = norm0 if norm0 != 0.0 else 1.0
         return norm0, norm
 
     def _iter_get_norm(self):
@@ -1328,7 +1567,17 @@ class BlockLinearSolver(LinearSolver):
             Set of names of relevant systems based on the current linear solve.  Deprecated.
         """
         self._mode = mode
+
+        if self._warm_start is not None:
+            system = self._system()
+            x_vec = system._doutputs if mode == 'fwd' else system._dresiduals
+            self._warm_started = self._warm_start.start(system, x_vec)
+
         try:
             self._solve()
         finally:
             self._scope_out = self._scope_in = _UNDEFINED  # reset after solve is done
+            self._warm_started = False
+
+        if self._warm_start is not None:
+            self._warm_start.finish(system, x_vec, self._iter_count)
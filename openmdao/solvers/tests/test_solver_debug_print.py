@@ -38,24 +38,24 @@ class TestNonlinearSolvers(unittest.TestCase):
             "# Inputs and outputs at start of iteration '%s':" % coord,
             "",
             "# nonlinear inputs",
-            "{'circuit.D1.V_in': array([ 1.+0.j]),",
-            " 'circuit.D1.V_out': array([ 0.+0.j]),",
-            " 'circuit.R1.V_in': array([ 1.+0.j]),",
-            " 'circuit.R1.V_out': array([ 0.+0.j]),",
-            " 'circuit.R2.V_in': array([ 1.+0.j]),",
-            " 'circuit.R2.V_out': array([ 1.+0.j]),",
-            " 'circuit.n1.I_in:0': array([ 0.1+0.j]),",
-            " 'circuit.n1.I_out:0': array([ 1.+0.j]),",
-            " 'circuit.n1.I_out:1': array([ 1.+0.j]),",
-            " 'circuit.n2.I_in:0': array([ 1.+0.j]),",
-            " 'circuit.n2.I_out:0': array([ 1.+0.j])}",
+            "{'circuit.D1.V_in': array([ 1.]),",
+            " 'circuit.D1.V_out': array([ 0.]),",
+            " 'circuit.R1.V_in': array([ 1.]),",
+            " 'circuit.R1.V_out': array([ 0.]),",
+            " 'circuit.R2.V_in': array([ 1.]),",
+            " 'circuit.R2.V_out': array([ 1.]),",
+            " 'circuit.n1.I_in:0': array([ 0.1]),",
+            " 'circuit.n1.I_out:0': array([ 1.]),",
+            " 'circuit.n1.I_out:1': array([ 1.]),",
+            " 'circuit.n2.I_in:0': array([ 1.]),",
+            " 'circuit.n2.I_out:0': array([ 1.])}",
             "",
             "# nonlinear outputs",
-            "{'circuit.D1.I': array([ 1.+0.j]),",
-            " 'circuit.R1.I': array([ 1.+0.j]),",
-            " 'circuit.R2.I': array([ 1.+0.j]),",
-            " 'circuit.n1.V': array([ 10.+0.j]),",
-            " 'circuit.n2.V': array([ 0.001+0.j])}",
+            "{'circuit.D1.I': array([ 1.]),",
+            " 'circuit.R1.I': array([ 1.]),",
+            " 'circuit.R2.I': array([ 1.]),",
+            " 'circuit.n1.V': array([ 10.]),",
+            " 'circuit.n2.V': array([ 0.001])}",
             ""
         ])
 
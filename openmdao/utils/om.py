@@ -66,6 +66,7 @@ from openmdao.utils.reports_system import _list_reports_setup_parser, _list_repo
     _view_reports_setup_parser, _view_reports_cmd
 from openmdao.visualization.graph_viewer import _graph_setup_parser, _graph_cmd
 from openmdao.recorders.view_cases import _view_cases_setup_parser, _view_cases_cmd
+from openmdao.recorders.merge_cases import _merge_cases_setup_parser, _merge_cases_cmd
 
 
 def _view_connections_setup_parser(parser):
@@ -634,6 +635,11 @@ _command_map = {
         _mempost_exec,
         "Post-process memory profile output.",
     ),
+    "merge_cases": (
+        _merge_cases_setup_parser,
+        _merge_cases_cmd,
+        "Merge the case recorder files written by each rank of a parallel run.",
+    ),
     "n2": (
         _n2_setup_parser,
         _n2_cmd,
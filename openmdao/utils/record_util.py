@@ -5,6 +5,7 @@ from fnmatch import fnmatchcase
 import os
 import re
 import json
+import zlib
 import numpy as np
 
 
@@ -74,6 +75,9 @@ _coord_split_re = re.compile('\\|\\d+\\|*')
 # regular expression used to determine if a node in an iteration coordinate represents a system
 _coord_system_re = re.compile('(\\._solve_nonlinear|\\._apply_nonlinear)$')
 
+# regular expression used to remove the iteration counts from newline separated coordinates
+_coord_count_re = re.compile('\\|\\d+(?=\\||$)', re.MULTILINE)
+
 
 def get_source_system(iteration_coordinate):
     """
@@ -105,6 +109,35 @@ def get_source_system(iteration_coordinate):
     return 'root'
 
 
+def strip_iteration_counts(iteration_coordinates):
+    """
+    Remove the iteration counts from each of a list of iteration coordinates.
+
+    Coordinates that only differ in their iteration counts come from the same source, so the
+    result can be used to parse the source of each distinct kind of coordinate only once.
+
+    Parameters
+    ----------
+    iteration_coordinates : list of str
+        The iteration coordinates.
+
+    Returns
+    -------
+    list of str
+        The iteration coordinates without their iteration counts.
+    """
+    if not iteration_coordinates:
+        return []
+
+    # process all of the coordinates in a single pass of the regular expression
+    stripped = _coord_count_re.sub('|', '\n'.join(iteration_coordinates)).split('\n')
+    if len(stripped) != len(iteration_coordinates):
+        # a coordinate contains a newline, so fall back to doing them one at a time
+        stripped = [_coord_count_re.sub('|', coord) for coord in iteration_coordinates]
+
+    return stripped
+
+
 def check_valid_sqlite3_db(filename):
     """
     Raise an IOError if the given filename does not reference a valid SQLite3 database file.
@@ -190,17 +223,17 @@ def has_match(pattern, names):
     return False
 
 
-def deserialize(json_data, abs2meta, prom2abs, conns):
+def deserialize(json_data, abs2meta, prom2abs, conns, var_layouts=None):
     """
-    Deserialize recorded data from a JSON formatted string.
+    Deserialize recorded data from a JSON formatted string or a packed binary blob.
 
     If all data values are arrays then a numpy structured array will be returned,
     otherwise a dictionary mapping variable names to values will be returned.
 
     Parameters
     ----------
-    json_data : str
-        JSON encoded data.
+    json_data : str or bytes or dict or ndarray
+        JSON encoded data, a binary blob of packed float64 values, or already decoded data.
     abs2meta : dict
         Dictionary mapping absolute variable names to variable metadata.
     prom2abs : dict
@@ -208,12 +241,24 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
         that are recorded with their promoted input name.
     conns : dict
         Dictionary of all model connections.
+    var_layouts : dict or None
+        Dictionary mapping variable layout ids to structured array dtypes. Required to
+        decode binary blobs.
 
     Returns
     -------
     array or dict
-        Variable names and values parsed from the JSON string.
+        Variable names and values parsed from the JSON string or binary blob.
     """
+    if isinstance(json_data, bytes):
+        return blob_to_structured_array(json_data, var_layouts)
+
+    if json_data is None or isinstance(json_data, np.ndarray):
+        return json_data
+
+    if isinstance(json_data, dict):
+        return json_data if json_data else None
+
     values = json.loads(json_data)
     if not values:
         return None
@@ -264,3 +309,97 @@ def dict_to_structured_array(values):
         return array
     else:
         return None
+
+
+def layout_to_dtype(layout):
+    """
+    Convert a recorded variable layout into numpy structured dtypes.
+
+    Parameters
+    ----------
+    layout : list
+        List of [name, offset, shape, dtype] entries, with offsets given in number of float64
+        values. The dtype is the original dtype of the variable and may be omitted for float64.
+
+    Returns
+    -------
+    numpy.dtype
+        Structured dtype whose fields map each variable onto its slice of the packed buffer.
+    numpy.dtype or None
+        Structured dtype with the original dtype of each variable, or None if all variables
+        are float64.
+    """
+    names = []
+    formats = []
+    value_formats = []
+    offsets = []
+    size = 0
+    for name, offset, shape, *dtype in layout:
+        shape = tuple(shape)
+        names.append(name)
+        formats.append(f'{shape}f8')
+        value_formats.append((shape, np.dtype(dtype[0] if dtype else 'f8')))
+        offsets.append(offset * 8)
+        size = offset + int(np.prod(shape))
+
+    dtype = np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                      'itemsize': size * 8})
+
+    if all(vdtype == np.float64 for _, vdtype in value_formats):
+        return dtype, None
+
+    return dtype, np.dtype([(name, vdtype, shape)
+                            for name, (shape, vdtype) in zip(names, value_formats)])
+
+
+def blob_to_structured_array(blob, var_layouts):
+    """
+    Convert a packed binary blob into a numpy structured array.
+
+    The blob consists of an int64 layout id followed by the float64 values of all variables.
+    Variables that were not recorded as float64 are converted back to their original dtype.
+
+    Parameters
+    ----------
+    blob : bytes
+        The packed binary data.
+    var_layouts : dict
+        Dictionary mapping variable layout ids to the structured array dtypes of the packed
+        buffer and of the original variable values.
+
+    Returns
+    -------
+    array
+        Numpy structured array holding a writable copy of the data in the blob.
+    """
+    layout_id = int(np.frombuffer(blob, dtype=np.int64, count=1)[0])
+    dtype, value_dtype = var_layouts[layout_id]
+
+    if value_dtype is None:
+        return np.frombuffer(bytearray(blob), dtype=dtype, count=1, offset=8)
+
+    return np.frombuffer(blob, dtype=dtype, count=1, offset=8).astype(value_dtype)
+
+
+def get_var_layouts(cur):
+    """
+    Load the variable layouts recorded in a case recorder file.
+
+    Parameters
+    ----------
+    cur : sqlite3.Cursor
+        Database cursor to use for reading the data.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping variable layout ids to the structured array dtypes of the packed
+        buffer and of the original variable values.
+    """
+    cur.execute("SELECT count(name) FROM sqlite_master WHERE type='table' AND name='var_layouts'")
+    if cur.fetchone()[0] == 0:
+        return {}
+
+    cur.execute("SELECT id, layout FROM var_layouts")
+    return {row[0]: layout_to_dtype(json.loads(zlib.decompress(row[1]).decode('ascii')))
+            for row in cur.fetchall()}
@@ -1,6 +1,7 @@
 """
 Class definitions for Relevance and related classes.
 """
+import threading
 from contextlib import contextmanager
 from collections import defaultdict
 
@@ -50,6 +51,41 @@ def get_relevance(model, of, wrt):
     return relevance
 
 
+class _RelevanceState(threading.local):
+    """
+    The part of the state of a Relevance that is switched by its context managers.
+
+    Each thread has its own copy, so solvers running subsystems in a pool of threads can switch
+    relevance on and off, or change the active seeds, without affecting each other.
+
+    Parameters
+    ----------
+    active : bool or None
+        Initial value of active in each thread.
+
+    Attributes
+    ----------
+    active : bool or None
+        If True, relevance is active.  If False, relevance is inactive.  If None, relevance is
+        uninitialized.
+    seed_vars : dict
+        Maps direction to currently active seed variable names.
+    rel_varray : ndarray or None
+        Array representing the variable relevance for the currently active seeds.
+    rel_sarray : ndarray or None
+        Array representing the system relevance for the currently active seeds.
+    """
+
+    def __init__(self, active):
+        """
+        Initialize all attributes.
+        """
+        self.active = active
+        self.seed_vars = {'fwd': (), 'rev': ()}
+        self.rel_varray = None
+        self.rel_sarray = None
+
+
 class Relevance(object):
     """
     Class that computes relevance based on a data flow graph.
@@ -88,6 +124,8 @@ class Relevance(object):
     _sys2idx : dict
         dict of all systems in the graph mapped to the row index into the system
         relevance array.
+    _state : _RelevanceState
+        The active flag, active seeds and current relevance arrays of each thread.
     _seed_vars : dict
         Maps direction to currently active seed variable names.
     _all_seed_vars : dict
@@ -134,8 +172,11 @@ class Relevance(object):
         """
         assert model.pathname == '', "Relevance can only be initialized on the top level Group."
 
-        # permanently disable relevance if _no_relevance is True
-        self._active = False if _no_relevance else None
+        # setting active to False here will permanantly disable relevance checking for this
+        # relevance object.  The only way to *temporarily* disable relevance is to use the
+        # active() context manager.
+        self._state = _RelevanceState(False if _no_relevance or not (fwd_meta and rev_meta)
+                                      else None)
         self._rel_array_cache = rel_array_cache
         self._graph = model._dataflow_graph
         self._rel_array_cache = {}
@@ -144,16 +185,11 @@ class Relevance(object):
         self._seed_cache = {}
         self.empty = False
 
-        # seed var(s) for the current derivative operation
-        self._seed_vars = {'fwd': (), 'rev': ()}
         # all seed vars for the entire derivative computation
         self._all_seed_vars = {'fwd': (), 'rev': ()}
 
         self._set_all_seeds(model, fwd_meta, rev_meta)
 
-        self._current_rel_varray = None
-        self._current_rel_sarray = None
-
         self._setup_nonlinear_relevance(model, fwd_meta, rev_meta)
 
         # _pre_components and _post_components will be empty unless the user has set the
@@ -163,12 +199,6 @@ class Relevance(object):
         else:
             self._nonlinear_sets = {}
 
-        # setting _active to False here will permanantly disable relevance checking for this
-        # relevance object.  The only way to *temporarily* disable relevance is to use the
-        # active() context manager.
-        if not (fwd_meta and rev_meta):
-            self._active = False
-
     def __repr__(self):
         """
         Return a string representation of the Relevance.
@@ -180,6 +210,155 @@ class Relevance(object):
         """
         return f"Relevance({self._seed_vars}, active={self._active})"
 
+    @property
+    def _active(self):
+        """
+        Return the active flag of the calling thread.
+
+        Returns
+        -------
+        bool or None
+            If True, relevance is active.  If False, relevance is inactive.  If None, relevance
+            is uninitialized.
+        """
+        return self._state.active
+
+    @_active.setter
+    def _active(self, active):
+        """
+        Set the active flag of the calling thread.
+
+        Parameters
+        ----------
+        active : bool or None
+            The new active flag.
+        """
+        self._state.active = active
+
+    @property
+    def _seed_vars(self):
+        """
+        Return the active seed variable names of the calling thread.
+
+        Returns
+        -------
+        dict
+            Maps direction to currently active seed variable names.
+        """
+        return self._state.seed_vars
+
+    @_seed_vars.setter
+    def _seed_vars(self, seed_vars):
+        """
+        Set the active seed variable names of the calling thread.
+
+        Parameters
+        ----------
+        seed_vars : dict
+            Maps direction to active seed variable names.
+        """
+        self._state.seed_vars = seed_vars
+
+    @property
+    def _current_rel_varray(self):
+        """
+        Return the variable relevance array of the calling thread.
+
+        Returns
+        -------
+        ndarray or None
+            Array representing the variable relevance for the currently active seeds.
+        """
+        return self._state.rel_varray
+
+    @_current_rel_varray.setter
+    def _current_rel_varray(self, rel_varray):
+        """
+        Set the variable relevance array of the calling thread.
+
+        Parameters
+        ----------
+        rel_varray : ndarray or None
+            Array representing the variable relevance for the active seeds.
+        """
+        self._state.rel_varray = rel_varray
+
+    @property
+    def _current_rel_sarray(self):
+        """
+        Return the system relevance array of the calling thread.
+
+        Returns
+        -------
+        ndarray or None
+            Array representing the system relevance for the currently active seeds.
+        """
+        return self._state.rel_sarray
+
+    @_current_rel_sarray.setter
+    def _current_rel_sarray(self, rel_sarray):
+        """
+        Set the system relevance array of the calling thread.
+
+        Parameters
+        ----------
+        rel_sarray : ndarray or None
+            Array representing the system relevance for the active seeds.
+        """
+        self._state.rel_sarray = rel_sarray
+
+    def _get_state(self):
+        """
+        Return a copy of the relevance state of the calling thread.
+
+        Returns
+        -------
+        tuple
+            The active flag, active seeds, and variable and system relevance arrays.
+        """
+        state = self._state
+        return state.active, dict(state.seed_vars), state.rel_varray, state.rel_sarray
+
+    @contextmanager
+    def thread_state(self, state):
+        """
+        Context manager where the calling thread uses the given relevance state.
+
+        This is used by the threads that run subsystems for a solver, so they see the relevance
+        of the thread that called the solver.
+
+        Parameters
+        ----------
+        state : tuple
+            Relevance state returned by _get_state.
+
+        Yields
+        ------
+        None
+        """
+        save = self._get_state()
+        self._set_state(state)
+        try:
+            yield
+        finally:
+            self._set_state(save)
+
+    def _set_state(self, state):
+        """
+        Set the relevance state of the calling thread.
+
+        Parameters
+        ----------
+        state : tuple
+            Relevance state returned by _get_state.
+        """
+        active, seed_vars, rel_varray, rel_sarray = state
+        st = self._state
+        st.active = active
+        st.seed_vars = dict(seed_vars)
+        st.rel_varray = rel_varray
+        st.rel_sarray = rel_sarray
+
     def _to_seed(self, names):
         """
         Return the seed from the given iter of names.
@@ -850,10 +1029,11 @@ class Relevance(object):
         bool
             True if the given variable is relevant.
         """
-        if not self._active:
+        state = self._state
+        if not state.active:
             return True
 
-        return self._current_rel_varray[self._var2idx[name]]
+        return state.rel_varray[self._var2idx[name]]
 
     def any_relevant(self, names):
         """
@@ -871,11 +1051,12 @@ class Relevance(object):
         """
         if self.empty:
             return False
-        if not self._active:
+        state = self._state
+        if not state.active:
             return True
 
         for n in names:
-            if self._current_rel_varray[self._var2idx[n]]:
+            if state.rel_varray[self._var2idx[n]]:
                 return True
         return False
 
@@ -895,11 +1076,12 @@ class Relevance(object):
         bool
             True if the given system is relevant.
         """
-        if not self._active:
+        state = self._state
+        if not state.active:
             return True
 
         try:
-            return self._current_rel_sarray[self._sys2idx[name]]
+            return state.rel_sarray[self._sys2idx[name]]
         except KeyError:
             return False
 
@@ -919,7 +1101,7 @@ class Relevance(object):
         System
             Relevant system.
         """
-        if self._active:
+        if self._state.active:
             for system in systems:
                 if relevant == self.is_relevant_system(system.pathname):
                     yield system
@@ -9,6 +9,47 @@ from openmdao.vectors.transfer import Transfer
 from openmdao.utils.array_utils import _global2local_offsets
 
 
+# Minimum average number of entries per contiguous run for a transfer to be done using slices
+# rather than fancy indexing.  Each slice copy has a fixed Python overhead, so many short runs
+# are faster to transfer with a single fancy-indexed copy.
+_MIN_AVG_RUN_SIZE = 16
+
+
+def _get_slice_runs(in_inds, out_inds):
+    """
+    Compress matching input and output index arrays into contiguous runs.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        Input indices for the transfer.
+    out_inds : int ndarray
+        Output indices for the transfer.
+
+    Returns
+    -------
+    list of (slice, slice) or None
+        List of (input slice, output slice) tuples, one for each run of indices that are
+        contiguous in both the input and output arrays, or None if the indices are too
+        irregular for slices to be faster than fancy indexing.
+    """
+    size = len(in_inds)
+    if size == 0:
+        return None
+
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    if len(breaks) > 0 and size < (len(breaks) + 1) * _MIN_AVG_RUN_SIZE:
+        return None
+
+    starts = np.concatenate(([0], breaks)).tolist()
+    ends = np.concatenate((breaks, [size])).tolist()
+    in_starts = in_inds[starts].tolist()
+    out_starts = out_inds[starts].tolist()
+
+    return [(slice(istart, istart + end - start), slice(ostart, ostart + end - start))
+            for start, end, istart, ostart in zip(starts, ends, in_starts, out_starts)]
+
+
 def _fill(arr, indices_iter):
     """
     Fill the given array with the given list of indices.
@@ -119,8 +160,21 @@ class DefaultTransfer(Transfer):
         Input indices for the transfer.
     out_inds : int ndarray
         Output indices for the transfer.
+
+    Attributes
+    ----------
+    _slices : list of (slice, slice) or None
+        Contiguous runs of (input, output) indices, used instead of fancy indexing when the
+        transfer consists of a small number of contiguous runs.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds):
+        """
+        Initialize all attributes.
+        """
+        super().__init__(in_vec, out_vec, in_inds, out_inds)
+        self._slices = _get_slice_runs(in_inds, out_inds)
+
     @staticmethod
     def _setup_transfers(group):
         """
@@ -294,10 +348,33 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
+        slices = self._slices
+
         if mode == 'fwd':
-            # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec.set_val(out_vec.asarray()[self._out_inds.flat], self._in_inds)
+            if slices is None:
+                # this works whether the vecs have multi columns or not due to broadcasting
+                in_vec.set_val(out_vec.asarray()[self._out_inds.flat], self._in_inds)
+            else:
+                # use _data so that the imaginary part is reset when not under complex step
+                in_data = in_vec._data
+                out_data = out_vec.asarray()
+                for in_slice, out_slice in slices:
+                    in_data[in_slice] = out_data[out_slice]
 
         else:  # rev
-            out_vec.iadd(np.bincount(self._out_inds, in_vec._get_data()[self._in_inds],
-                                     minlength=out_vec._data.size))
+            if slices is None:
+                in_data = in_vec._get_data()[self._in_inds]
+                if in_data.ndim > 1:
+                    # bincount only works on 1D arrays, so add the columns of a vectorized
+                    # derivative solve directly
+                    np.add.at(out_vec.asarray(), self._out_inds, in_data)
+                else:
+                    out_vec.iadd(np.bincount(self._out_inds, in_data,
+                                             minlength=out_vec._data.size))
+            else:
+                # only the output ranges affected by the transfer are updated. Runs from
+                # different inputs may overlap in the output, so they're added one at a time.
+                in_data = in_vec._get_data()
+                out_data = out_vec.asarray()
+                for in_slice, out_slice in slices:
+                    out_data[out_slice] += in_data[in_slice]
@@ -24,6 +24,8 @@ class DefaultVector(Vector):
         Pointer to the vector owned by the root system.
     alloc_complex : bool
         Whether to allocate any imaginary storage to perform complex step. Default is False.
+    lazy_complex : bool
+        Whether to allocate imaginary storage only while in complex step mode. Default is False.
 
     Attributes
     ----------
@@ -33,12 +35,14 @@ class DefaultVector(Vector):
 
     TRANSFER = DefaultTransfer
 
-    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False):
+    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False,
+                 lazy_complex=False):
         """
         Initialize all attributes.
         """
         self._views_rel = None
-        super().__init__(name, kind, system, root_vector=root_vector, alloc_complex=alloc_complex)
+        super().__init__(name, kind, system, root_vector=root_vector, alloc_complex=alloc_complex,
+                         lazy_complex=lazy_complex)
 
     def __getitem__(self, name):
         """
@@ -116,8 +120,28 @@ class DefaultVector(Vector):
         """
         system = self._system()
         size = np.sum(system._var_sizes[self._typ][system.comm.rank, :])
-        dtype = complex if self._alloc_complex else float
-        return np.zeros(size, dtype=dtype)
+        return np.zeros(size, dtype=self._get_data_dtype())
+
+    def _get_data_dtype(self):
+        """
+        Return the dtype of the root data array based on the problem's 'vector_precision' option.
+
+        Vectors that need complex storage are always double precision, since complex step
+        steps are too small to be represented in single precision.
+
+        Returns
+        -------
+        dtype
+            The dtype of the data array.
+        """
+        if self._alloc_complex:
+            return complex
+
+        precision = self._system()._problem_meta['vector_precision']
+        if precision == 'single' or (precision == 'mixed' and self._name == 'nonlinear'):
+            return np.float32
+
+        return float
 
     def _extract_root_data(self):
         """
@@ -168,22 +192,26 @@ class DefaultVector(Vector):
 
             if self._do_scaling:
                 data = self._data
+                # scaling vectors have the same precision as the data they scale
+                dtype = data.real.dtype
                 if self._name == 'nonlinear':
                     if self._do_adder:
-                        self._scaling = (np.zeros(data.size), np.ones(data.size))
+                        self._scaling = (np.zeros(data.size, dtype=dtype),
+                                         np.ones(data.size, dtype=dtype))
                     else:
-                        self._scaling = (None, np.ones(data.size))
+                        self._scaling = (None, np.ones(data.size, dtype=dtype))
                 elif self._name == 'linear':
-                    if self._has_solver_ref:
+                    nlvec = self._system()._root_vecs[self._kind]['nonlinear']
+                    if self._has_solver_ref or nlvec._scaling[1].dtype != dtype:
                         # We only allocate an extra scaling vector when we have output scaling
-                        # somewhere in the model.
-                        self._scaling = (None, np.ones(data.size))
+                        # somewhere in the model or the nonlinear vectors have a different
+                        # precision.
+                        self._scaling = (None, np.ones(data.size, dtype=dtype))
                     else:
                         # Reuse the nonlinear scaling vecs since they're the same as ours.
-                        nlvec = self._system()._root_vecs[self._kind]['nonlinear']
                         self._scaling = (None, nlvec._scaling[1])
                 else:
-                    self._scaling = (None, np.ones(data.size))
+                    self._scaling = (None, np.ones(data.size, dtype=dtype))
 
         else:
             self._data, self._scaling = self._extract_root_data()
@@ -216,7 +244,12 @@ class DefaultVector(Vector):
             end = start + meta['size']
             shape = meta['shape']
             views_flat[abs_name] = v = self._data[start:end]
-            if shape != v.shape and shape != ():
+            if v.ndim > 1:
+                # a column for each seed of a vectorized derivative solve
+                if shape != v.shape[:1] and shape != ():
+                    v = v.view()
+                    v.shape = shape + v.shape[1:]
+            elif shape != v.shape and shape != ():
                 v = v.view()
                 v.shape = shape
 
@@ -261,6 +294,93 @@ class DefaultVector(Vector):
         self._names = frozenset(views) if islinear else views
         self._len = end
 
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        If the complex storage of this vector is allocated lazily, a complex copy of the data is
+        made when complex step mode is turned on, and the real part is copied back when it is
+        turned off. The vectors of subsystems use views into the complex array of the highest
+        system in complex step mode, so only that part of the model gets complex storage.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        if self._lazy_complex and active != self._under_complex_step:
+            root_vec = self._root_vector
+            start = self._root_offset
+
+            if active:
+                self._real_data = self._data
+                root_cplx = root_vec._lazy_complex_data
+                if root_cplx is None:
+                    data = self._data.astype(complex)
+                    root_vec._lazy_complex_data = (start, data)
+                else:
+                    # we're a subsystem of a system that's already in complex step mode
+                    offset = start - root_cplx[0]
+                    data = root_cplx[1][offset:offset + self._data.size]
+            else:
+                data = self._real_data
+                self._real_data = None
+                root_cplx = root_vec._lazy_complex_data
+                if root_cplx is not None and root_cplx[1] is self._data:
+                    # we own the complex array, so copy the result back into the real data
+                    data[:] = self._data.real
+                    root_vec._lazy_complex_data = None
+
+            self._set_data(data)
+
+        self._under_complex_step = active
+
+    def _set_data(self, data):
+        """
+        Replace the data array and update the variable views into it.
+
+        Parameters
+        ----------
+        data : ndarray
+            The new data array.
+        """
+        names = self._names if self._in_matvec_context() else None
+        self._data = data
+        self._initialize_views()
+        if names is not None:
+            self._names = names
+
+    def _set_columns(self, ncols):
+        """
+        Give this vector a column for each seed of a vectorized derivative solve.
+
+        The columns of all vectors are views into a Fortran ordered array allocated by the root
+        vector, so each column of a vector is contiguous, like its single column data array.
+
+        Parameters
+        ----------
+        ncols : int or None
+            Number of columns. If None, the single column data array is restored.
+        """
+        if ncols is None:
+            if self._col_data is not None:
+                data = self._col_data
+                self._col_data = None
+                self._set_data(data)
+            return
+
+        if self._col_data is None:
+            self._col_data = self._data
+
+        root_vec = self._root_vector
+        cols = root_vec._multi_col_data
+        if cols is None or cols.shape[1] < ncols:
+            cols = root_vec._multi_col_data = np.zeros((len(root_vec), ncols),
+                                                       dtype=self._col_data.dtype, order='F')
+
+        start = self._root_offset
+        self._set_data(cols[start:start + self._col_data.size, :ncols])
+
     def _in_matvec_context(self):
         """
         Return True if this vector is inside of a matvec_context.
@@ -423,6 +543,8 @@ class DefaultVector(Vector):
             Vector of additive scaling factors.
         """
         data = self.asarray()
+        if data.ndim > 1:
+            scaler = scaler[:, np.newaxis]
         if adder is not None:  # nonlinear only
             data -= adder
         data /= scaler
@@ -439,6 +561,8 @@ class DefaultVector(Vector):
             Vector of additive scaling factors.
         """
         data = self.asarray()
+        if data.ndim > 1:
+            scaler = scaler[:, np.newaxis]
         data *= scaler
         if adder is not None:  # nonlinear only
             data += adder
@@ -538,7 +662,11 @@ class DefaultVector(Vector):
         float
             The computed dot product value.
         """
-        return np.dot(self.asarray(), vec.asarray())
+        arr = self.asarray()
+        if arr.dtype == np.float32:
+            # accumulate in double precision
+            return np.dot(arr, vec.asarray().astype(float))
+        return np.dot(arr, vec.asarray())
 
     def get_norm(self):
         """
@@ -549,7 +677,12 @@ class DefaultVector(Vector):
         float
             Norm of this vector.
         """
-        return np.linalg.norm(self.asarray())
+        arr = self.asarray()
+        if arr.dtype == np.float32:
+            # compute the norm in double precision so that solver convergence checks are not
+            # limited by the precision of the vector data
+            arr = arr.astype(float)
+        return np.linalg.norm(arr)
 
     def get_slice_dict(self):
         """
@@ -564,7 +697,7 @@ class DefaultVector(Vector):
             slices = {}
             start = end = 0
             for name, arr in self._views_flat.items():
-                end += arr.size
+                end += arr.shape[0]
                 slices[name] = slice(start, end)
                 start = end
             self._slices = slices
@@ -39,6 +39,9 @@ else:
             Pointer to the vector owned by the root system.
         alloc_complex : bool
             Whether to allocate any imaginary storage to perform complex step. Default is False.
+        lazy_complex : bool
+            Whether complex storage may be allocated lazily. PETSc vectors always allocate it
+            up front instead. Default is False.
 
         Attributes
         ----------
@@ -56,16 +59,31 @@ else:
         cite = CITATION
         distributed = True
 
-        def __init__(self, name, kind, system, root_vector=None, alloc_complex=False):
+        def __init__(self, name, kind, system, root_vector=None, alloc_complex=False,
+                     lazy_complex=False):
             """
             Initialize all attributes.
             """
+            # PETSc vectors wrap the data array, so it can't be swapped for a complex one.
             super().__init__(name, kind, system, root_vector=root_vector,
-                             alloc_complex=alloc_complex)
+                             alloc_complex=alloc_complex or lazy_complex)
 
             self._dup_inds = None
             self._dup_scratch = None
 
+        def _get_data_dtype(self):
+            """
+            Return the dtype of the root data array.
+
+            PETSc vectors wrap the data array, so it is always double precision.
+
+            Returns
+            -------
+            dtype
+                The dtype of the data array.
+            """
+            return complex if self._alloc_complex else float
+
         def _initialize_data(self, root_vector):
             """
             Internally allocate vectors.
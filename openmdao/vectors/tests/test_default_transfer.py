@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.core.constants import INT_DTYPE
+from openmdao.vectors.default_transfer import _get_slice_runs
+from openmdao.utils.assert_utils import assert_check_totals, assert_near_equal
+
+
+def _build_model(size, src_indices=None):
+    p = om.Problem()
+    model = p.model
+    model.add_subsystem('src', om.IndepVarComp('x', np.arange(size, dtype=float) + 1.))
+    model.add_subsystem('c1', om.ExecComp('y = 2.0 * x', x=np.ones(size), y=np.ones(size)))
+    model.add_subsystem('c2', om.ExecComp('y = 3.0 * x', x=np.ones(size), y=np.ones(size)))
+    model.connect('src.x', 'c1.x')
+    model.connect('src.x', 'c2.x', src_indices=src_indices)
+    model.add_subsystem('sum', om.ExecComp('z = sum(a) + sum(b)', a=np.ones(size),
+                                           b=np.ones(size)))
+    model.connect('c1.y', 'sum.a')
+    model.connect('c2.y', 'sum.b')
+
+    model.add_design_var('src.x')
+    model.add_objective('sum.z')
+    return p
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def test_slice_runs(self):
+        in_inds = np.arange(40, dtype=INT_DTYPE)
+        out_inds = np.concatenate((np.arange(100, 120), np.arange(20))).astype(INT_DTYPE)
+        self.assertEqual(_get_slice_runs(in_inds, out_inds),
+                         [(slice(0, 20), slice(100, 120)), (slice(20, 40), slice(0, 20))])
+
+        # irregular indices fall back to fancy indexing
+        self.assertIsNone(_get_slice_runs(in_inds, out_inds[::-1].copy()))
+        self.assertIsNone(_get_slice_runs(in_inds[:0], out_inds[:0]))
+
+        # a single run is always transferred as a slice, however short
+        self.assertEqual(_get_slice_runs(in_inds[:2], out_inds[:2]),
+                         [(slice(0, 2), slice(100, 102))])
+
+    def test_transfer_slices(self):
+        size = 50
+        for mode in ('fwd', 'rev'):
+            for src_indices in (None, np.arange(size)[::-1]):
+                with self.subTest(mode=mode, irregular=src_indices is not None):
+                    p = _build_model(size, src_indices)
+                    p.setup(mode=mode, force_alloc_complex=True)
+                    p.run_model()
+
+                    # fwd transfers are keyed by target subsystem, rev by source subsystem
+                    transfers = p.model._transfers[mode]
+                    regular, xfer = ('c1', 'c2') if mode == 'fwd' else ('c1', 'src')
+                    self.assertIsNotNone(transfers[regular]._slices)
+                    if src_indices is None:
+                        self.assertIsNotNone(transfers[xfer]._slices)
+                    else:
+                        self.assertIsNone(transfers[xfer]._slices)
+
+                    x = np.arange(size) + 1.
+                    xc2 = x if src_indices is None else x[src_indices]
+                    assert_near_equal(p.get_val('c1.x'), x)
+                    assert_near_equal(p.get_val('c2.x'), xc2)
+                    assert_near_equal(p.get_val('sum.z'), 2. * x.sum() + 3. * xc2.sum())
+
+                    totals = p.compute_totals()
+                    assert_near_equal(totals['sum.z', 'src.x'], np.full((1, size), 5.))
+                    assert_check_totals(p.check_totals(method='cs', out_stream=None))
+
+
+if __name__ == '__main__':
+    unittest.main()
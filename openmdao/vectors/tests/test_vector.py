@@ -6,6 +6,8 @@ import openmdao.api as om
 from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+    SellarDis2withDerivatives
 
 try:
     from openmdao.parallel_api import PETScVector
@@ -84,6 +86,198 @@ class TestVector(unittest.TestCase):
 A = np.array([[1.0, 8.0, 0.0], [-1.0, 10.0, 2.0], [3.0, 100.5, 1.0]])
 
 
+class DoubleComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(3), units='cm')
+        self.add_output('y', np.ones(3), units='cm')
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=2.0)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 2.0 * inputs['x']
+
+
+class TestVectorPrecision(unittest.TestCase):
+
+    def build_problem(self, vector_precision, **setup_kwargs):
+        p = om.Problem(vector_precision=vector_precision)
+        model = p.model
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+        model.add_subsystem('obj', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                               z=np.zeros(2), x=0.0), promotes=['*'])
+        model.set_input_defaults('x', 1.)
+        model.set_input_defaults('z', np.array([5., 2.]))
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-10, rtol=1e-10,
+                                                 iprint=-1)
+        model.linear_solver = om.DirectSolver()
+
+        model.add_design_var('x')
+        model.add_design_var('z')
+        model.add_objective('obj')
+
+        p.setup(mode='rev', **setup_kwargs)
+        return p
+
+    def test_precision(self):
+        expected = {
+            'double': (np.float64, np.float64),
+            'single': (np.float32, np.float32),
+            'mixed': (np.float32, np.float64),
+        }
+
+        for precision, (nl_dtype, ln_dtype) in expected.items():
+            with self.subTest(precision=precision):
+                p = self.build_problem(precision)
+                p.run_model()
+
+                model = p.model
+                for vec in model.get_nonlinear_vectors():
+                    self.assertEqual(vec.asarray().dtype, nl_dtype)
+                for vec in model.get_linear_vectors():
+                    self.assertEqual(vec.asarray().dtype, ln_dtype)
+
+                # views share the precision of the root vectors
+                self.assertEqual(model.d1._outputs.asarray().dtype, nl_dtype)
+                self.assertEqual(model.d1._doutputs.asarray().dtype, ln_dtype)
+
+                # norms are always double precision
+                self.assertIsInstance(model._residuals.get_norm(), np.float64)
+
+                tol = 1e-8 if precision == 'double' else 1e-6
+                assert_near_equal(p.get_val('y1'), 25.58830237, tol)
+                assert_near_equal(p.get_val('y2'), 12.05848815, tol)
+
+                totals = p.compute_totals()
+                assert_near_equal(totals['obj', 'x'], [[2.98061391]], tol)
+                assert_near_equal(totals['obj', 'z'], [[9.61001056, 1.78448534]], tol)
+
+    def test_precision_unit_conversion(self):
+        p = om.Problem(vector_precision='mixed')
+        p.model.add_subsystem('src', om.IndepVarComp('x', np.ones(3), units='m'))
+        p.model.add_subsystem('tgt', DoubleComp())
+        p.model.connect('src.x', 'tgt.x')
+        p.setup()
+        p.set_val('src.x', [1., 2., 3.])
+        p.run_model()
+
+        # unit conversion factors have the precision of the vectors they apply to
+        self.assertEqual(p.model._inputs._scaling[1].dtype, np.float32)
+        self.assertEqual(p.model._dinputs._scaling[1].dtype, np.float64)
+        assert_near_equal(p.get_val('tgt.x'), [100., 200., 300.], 1e-6)
+        assert_near_equal(p.get_val('tgt.y'), [200., 400., 600.], 1e-6)
+
+    def test_precision_complex_step(self):
+        # vectors that need complex storage stay double precision
+        p = self.build_problem('single', force_alloc_complex=True)
+        p.run_model()
+
+        for vec in p.model.get_nonlinear_vectors() + p.model.get_linear_vectors():
+            self.assertEqual(vec._data.dtype, np.complex128)
+        assert_near_equal(p.get_val('y1'), 25.58830237, 1e-6)
+
+
+class CSQuadratic(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', method='cs')
+        self.cs_dtypes = []
+
+    def compute(self, inputs, outputs):
+        if self.under_complex_step:
+            self.cs_dtypes.append((inputs.asarray().dtype.name, self._outputs._data.size))
+        outputs['y'] = inputs['x'] ** 2
+
+
+class TestLazyComplexVector(unittest.TestCase):
+
+    def build_problem(self, **setup_kwargs):
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('big', om.IndepVarComp('v', np.ones(1000)))
+        model.add_subsystem('x', om.IndepVarComp('x', np.array([1., 2., 3.])))
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('cs1', CSQuadratic())
+        sub.add_subsystem('cs2', CSQuadratic())
+        sub.connect('cs1.y', 'cs2.x')
+        model.connect('x.x', 'sub.cs1.x')
+
+        model.add_design_var('x.x')
+        model.add_constraint('sub.cs2.y', lower=0.)
+        p.setup(**setup_kwargs)
+        p.run_model()
+        return p
+
+    def test_lazy_component(self):
+        p = self.build_problem()
+        model = p.model
+
+        # the root vectors stay real until complex step is used
+        for vec in model.get_nonlinear_vectors():
+            self.assertEqual(vec._data.dtype, np.float64)
+            self.assertTrue(vec._can_complex_step())
+
+        totals = p.compute_totals()
+        assert_near_equal(totals['sub.cs2.y', 'x.x'], np.diag(4. * np.array([1., 2., 3.]) ** 3))
+
+        # complex storage was only allocated for the component being complex stepped
+        self.assertEqual(set(model.sub.cs1.cs_dtypes), {('complex128', 3)})
+        for vec in model.get_nonlinear_vectors():
+            self.assertEqual(vec._data.dtype, np.float64)
+            self.assertIsNone(vec._lazy_complex_data)
+
+        assert_near_equal(p.get_val('sub.cs2.y'), np.array([1., 16., 81.]))
+
+    def test_lazy_group(self):
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('big', om.IndepVarComp('v', np.ones(1000)))
+        model.add_subsystem('x', om.IndepVarComp('x', np.array([1., 2., 3.])))
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('c1', om.ExecComp('y = x ** 2', x=np.ones(3), y=np.ones(3),
+                                            has_diag_partials=True))
+        sub.add_subsystem('c2', CSQuadratic())
+        sub.connect('c1.y', 'c2.x')
+        sub.approx_totals(method='cs')
+        model.connect('x.x', 'sub.c1.x')
+
+        model.add_design_var('x.x')
+        model.add_constraint('sub.c2.y', lower=0.)
+        p.setup()
+        p.run_model()
+
+        totals = p.compute_totals()
+        assert_near_equal(totals['sub.c2.y', 'x.x'], np.diag(4. * np.array([1., 2., 3.]) ** 3),
+                          1e-12)
+
+        # the subsystems of the complex stepped group share its complex storage
+        self.assertEqual(set(model.sub.c2.cs_dtypes), {('complex128', 3)})
+        self.assertEqual(model._outputs._data.dtype, np.float64)
+        assert_near_equal(p.get_val('sub.c2.y'), np.array([1., 16., 81.]))
+
+        data = p.check_totals(method='cs', out_stream=None)
+        assert_near_equal(data['sub.c2.y', 'x.x']['J_fd'],
+                          np.diag(4. * np.array([1., 2., 3.]) ** 3), 1e-12)
+
+    def test_check_partials_cs(self):
+        p = self.build_problem()
+        data = p.check_partials(method='cs', step=1e-25, out_stream=None)
+        assert_near_equal(data['sub.cs1']['y', 'x']['J_fd'], np.diag([2., 4., 6.]), 1e-12)
+        self.assertEqual(p.model._outputs._data.dtype, np.float64)
+
+    def test_force_alloc_complex(self):
+        p = self.build_problem(force_alloc_complex=True)
+        for vec in p.model.get_nonlinear_vectors():
+            self.assertEqual(vec._data.dtype, np.complex128)
+            self.assertFalse(vec._lazy_complex)
+
+        totals = p.compute_totals()
+        assert_near_equal(totals['sub.cs2.y', 'x.x'], np.diag(4. * np.array([1., 2., 3.]) ** 3))
+
+
 class DistribQuadtric(om.ImplicitComponent):
     def initialize(self):
         self.options.declare('size', types=int, default=1,
@@ -42,6 +42,8 @@ class Vector(object):
         Pointer to the vector owned by the root system.
     alloc_complex : bool
         Whether to allocate any imaginary storage to perform complex step. Default is False.
+    lazy_complex : bool
+        Whether to allocate imaginary storage only while in complex step mode. Default is False.
 
     Attributes
     ----------
@@ -65,6 +67,20 @@ class Vector(object):
         Offset of this vector into the root vector.
     _alloc_complex : bool
         If True, then space for the complex vector is also allocated.
+    _lazy_complex : bool
+        If True, complex storage is allocated when complex step mode is turned on and released
+        when it is turned off.
+    _lazy_complex_data : ndarray or None
+        In the root vector, the complex array allocated by the highest system currently in
+        complex step mode. Vectors of its subsystems use views into it.
+    _real_data : ndarray or None
+        The real data array, saved while lazily allocated complex storage is in use.
+    _col_data : ndarray or None
+        The single column data array, saved while the data has a column for each seed of a
+        vectorized derivative solve.
+    _multi_col_data : ndarray or None
+        In the root vector, the array of columns used for vectorized derivative solves. Vectors
+        of all systems use views into it while they have several columns.
     _data : ndarray
         Actual allocated data.
     _slices : dict
@@ -93,7 +109,8 @@ class Vector(object):
     # Indicator whether a vector class is MPI-distributed
     distributed = False
 
-    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False):
+    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False,
+                 lazy_complex=False):
         """
         Initialize all attributes.
         """
@@ -118,8 +135,15 @@ class Vector(object):
 
         # Support for Complex Step
         self._alloc_complex = alloc_complex
+        self._lazy_complex = lazy_complex and not alloc_complex
+        self._lazy_complex_data = None
+        self._real_data = None
         self._under_complex_step = False
 
+        # Support for vectorized derivative solves
+        self._col_data = None
+        self._multi_col_data = None
+
         self._do_scaling = ((kind == 'input' and system._has_input_scaling) or
                             (kind == 'output' and system._has_output_scaling) or
                             (kind == 'residual' and system._has_resid_scaling))
@@ -702,6 +726,17 @@ class Vector(object):
         raise NotImplementedError('_in_matvec_context not defined for vector type '
                                   f'{type(self).__name__}')
 
+    def _can_complex_step(self):
+        """
+        Return True if this vector has, or can allocate, storage for complex step.
+
+        Returns
+        -------
+        bool
+            True if this vector supports complex step mode.
+        """
+        return self._alloc_complex or self._lazy_complex
+
     def set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
@@ -713,6 +748,20 @@ class Vector(object):
         """
         self._under_complex_step = active
 
+    def _set_columns(self, ncols):
+        """
+        Give this vector a column for each seed of a vectorized derivative solve.
+
+        Must be implemented by the subclass.
+
+        Parameters
+        ----------
+        ncols : int or None
+            Number of columns. If None, the single column data array is restored.
+        """
+        raise NotImplementedError('_set_columns not defined for vector type '
+                                  f'{type(self).__name__}')
+
     def get_hash(self, alg=hashlib.sha1):
         """
         Return a hash string for the array contained in this Vector.